@@ -143,8 +143,11 @@ class CPUIdle(ClassHelpers.SimpleCloseContext):
 
         self._sysfs_base = Path("/sys/devices/system/cpu")
 
-        # Cache for C-state directory names (state0, state1, etc.).
+        # Cache for C-state directory names (state0, state1, etc.) and C-state name to index maps.
         self._lsdir_cache = _PerCPUCache.PerCPUCache(self._cpuinfo, enable_cache=self._enable_cache)
+        # The C-state name to index maps, one per distinct C-states layout. Shared by all CPUs with
+        # the same C-states layout: {((name, index), ...): {name: index}}.
+        self._csindex_maps: dict[tuple[tuple[str, int], ...], dict[str, int]] = {}
 
     def close(self):
         """Uninitialize the class instance."""
@@ -275,11 +278,10 @@ class CPUIdle(ClassHelpers.SimpleCloseContext):
             return
 
         # Fetch uncached CPUs via remote script.
-        python_path = self._pman.get_python_path()
         sysfs_base_str = str(self._sysfs_base)
         cpus_str = ",".join(str(cpu) for cpu in uncached_cpus)
 
-        cmd = f"""{python_path} -c '
+        script = f"""
 import os, stat
 
 sysfs_base = "{sysfs_base_str}"
@@ -320,10 +322,10 @@ try:
 except Exception as err:
     print("Unexpected error: %s" % err)
     raise SystemExit(1)
-'"""
+"""
 
         try:
-            stdout, stderr = self._pman.run_verify_nojoin(cmd)
+            stdout, stderr = self._pman.run_python_verify_nojoin(script)
         except Error as err:
             errmsg = err.indent(2)
             raise type(err)(f"Failed to list C-state directories{self._pman.hostmsg}:\n"
@@ -547,6 +549,53 @@ except Exception as err:
             for cpu in cpus:
                 yield cpu, {}
 
+    def _get_csindex_maps(self,
+                          cpus: Sequence[int]) -> \
+                                Generator[tuple[int, dict[str, int]], None, None]:
+        """
+        Yield C-state name to index maps for the specified CPUs. Read only the C-state 'name' files.
+
+        Args:
+            cpus: CPU numbers to yield the C-state name to index maps for.
+
+        Yields:
+            Tuples of (CPU number, C-state name to index map). CPUs with the same C-states layout
+            share the same map object, which must not be modified.
+        """
+
+        uncached_cpus = []
+        for cpu in cpus:
+            if not self._enable_cache or not self._lsdir_cache.is_cached("csindex_map", cpu):
+                uncached_cpus.append(cpu)
+
+        # The C-state names of the uncached CPUs: {cpu: [(name, index), ...]}.
+        cpus_names: dict[int, list[tuple[str, int]]] = {cpu: [] for cpu in uncached_cpus}
+
+        if uncached_cpus:
+            paths_iter = (state_dir_path / "name"
+                          for state_dir_path in self._get_cstate_dirs(uncached_cpus))
+
+            for path, val in self._sysfs_io.read_paths(paths_iter, what="C-state name"):
+                # Path format: /sys/devices/system/cpu/cpu{cpu}/cpuidle/state{index}/name
+                index = int(path.parent.name[5:])
+                cpu = int(path.parent.parent.parent.name[3:])
+                cpus_names[cpu].append((self._normalize_csname(val), index))
+
+        for cpu in cpus:
+            if cpu not in cpus_names:
+                yield cpu, self._lsdir_cache.get("csindex_map", cpu)
+                continue
+
+            layout = tuple(cpus_names[cpu])
+            csindex_map = self._csindex_maps.get(layout)
+            if csindex_map is None:
+                csindex_map = self._csindex_maps[layout] = dict(layout)
+
+            if self._enable_cache:
+                self._lsdir_cache.add("csindex_map", cpu, csindex_map)
+
+            yield cpu, csindex_map
+
     def _get_cstates_info(self,
                           cpus: Sequence[int],
                           csnames: Iterable[str] | Literal["all"]) -> \
@@ -766,15 +815,33 @@ except Exception as err:
         toggled: ReqCStateToggleResultType = {}
         paths = []
 
-        for cpu, csinfo in self._get_cstates_info(cpus, csnames):
-            for csname, cstate in csinfo.items():
-                path = self._sysfs_base / f"cpu{cpu}/cpuidle/state{cstate['index']}/disable"
-                paths.append(path)
+        # The C-state names and indices to toggle, resolved once per distinct C-states layout:
+        # {id(csindex_map): [(name, index), ...]}.
+        resolved: dict[int, list[tuple[str, int]]] = {}
 
-                _LOG.debug("%s C-state: CPU %d, state %d", action.upper(), cpu, cstate["index"])
+        for cpu, csindex_map in self._get_csindex_maps(cpus):
+            cstates = resolved.get(id(csindex_map))
+            if cstates is None:
+                if csnames == "all":
+                    cstates = list(csindex_map.items())
+                else:
+                    cstates = []
+                    for csname in csnames:
+                        if csname not in csindex_map:
+                            csnames_str = ", ".join(csindex_map)
+                            raise Error(f"Bad C-state name '{csname}' for CPU {cpu}, valid names "
+                                        f"are: {csnames_str}")
+                        cstates.append((csname, csindex_map[csname]))
+                resolved[id(csindex_map)] = cstates
+
+            if not cstates:
+                continue
 
-                if cpu not in toggled:
-                    toggled[cpu] = {"csnames": []}
+            cpu_path = self._sysfs_base / f"cpu{cpu}" / "cpuidle"
+            toggled[cpu] = {"csnames": []}
+            for csname, index in cstates:
+                _LOG.debug("%s C-state: CPU %d, state %d", action.upper(), cpu, index)
+                paths.append(cpu_path / f"state{index}" / "disable")
                 toggled[cpu]["csnames"].append(csname)
 
         if paths:
@@ -24,7 +24,7 @@ from pepclibs._DieInfo import AGENT_TYPES
 # pylint: enable=unused-import
 
 if typing.TYPE_CHECKING:
-    from typing import Iterable, Literal
+    from typing import Iterable, Literal, Sequence
     from pepclibs import _DieInfo
     from pepclibs.CPUInfoTypes import HybridCPUKeyType, ScopeNameType, AbsNumsType, RelNumsType
     from pepclibs.CPUInfoTypes import DieInfoTypedDict, AgentTypes
@@ -112,6 +112,8 @@ class CPUInfo(_CPUInfoBase.CPUInfoBase):
         - 'cpus_to_str()' - turn a collection of CPU numbers into a string.
         - 'dies_to_str()' - turn a die numbers dictionary into a string.
         - 'cpus_hotplugged()' - invalidate cached topology data after CPU hotplug.
+        - 'get_hotplug_count()' - get the number of CPU hotplug events so far.
+        - 'get_scope_group_keys()' - get scope element identifiers for all CPUs.
     """
 
     def __init__(self,
@@ -546,32 +548,15 @@ class CPUInfo(_CPUInfoBase.CPUInfoBase):
         if not snames:
             snames = SCOPE_NAMES
         else:
+            snames = tuple(snames)
             for sname in snames:
                 self._validate_sname(sname, name="topology scope name")
 
-        # Use cached topology line if available and contains all requested scopes.
-        if cpu in self._cpu_to_tline:
-            cached_tline = self._cpu_to_tline[cpu]
-            if all(sname in cached_tline for sname in snames):
-                return {sname: cached_tline[sname] for sname in snames}
-
-        # Cache miss or incomplete - build topology for requested scopes.
-        tline = None
-        for tline in self._get_topology(snames):
-            if cpu == tline["CPU"]:
-                break
-        else:
+        topo_table = self._get_topology_table(snames)
+        if not topo_table.has_cpu(cpu):
             raise Error(f"CPU {cpu} is not available{self._pman.hostmsg}")
 
-        # Update cache with the topology line for this CPU.
-        if cpu not in self._cpu_to_tline:
-            self._cpu_to_tline[cpu] = {}
-        self._cpu_to_tline[cpu].update(tline)
-
-        result = {}
-        for sname in snames:
-            result[sname] = tline[sname]
-        return result
+        return topo_table.get_tline(cpu, snames)
 
     def get_cpu_siblings(self, cpu: int, sname: ScopeNameType | Literal["global"]) -> list[int]:
         """
@@ -600,19 +585,44 @@ class CPUInfo(_CPUInfoBase.CPUInfoBase):
         if sname == "global":
             return self.get_cpus()
 
-        tline = self.get_tline_by_cpu(cpu, snames=(sname, "package"))
-        if sname == "package":
-            return self.package_to_cpus(tline[sname])
-        if sname == "node":
-            return self.nodes_to_cpus((tline[sname],))
-        if sname == "die":
-            return self.dies_to_cpus(dies=(tline[sname],), packages=(tline["package"],))
-        if sname == "module":
-            return self.modules_to_cpus((tline[sname],))
-        if sname == "core":
-            return self.cores_to_cpus(cores=(tline[sname],), packages=(tline["package"],))
+        if sname not in ("package", "node", "die", "module", "core"):
+            raise Error(f"Unsupported scope name \"{sname}\"")
+
+        cpu = Trivial.str_to_int(cpu, what="CPU number")
+        topo_table = self._get_topology_table((sname, "package"))
+        if not topo_table.has_cpu(cpu):
+            raise Error(f"CPU {cpu} is not available{self._pman.hostmsg}")
+
+        return topo_table.get_siblings(cpu, sname)
+
+    def get_scope_group_keys(self,
+                             sname: ScopeNameType | Literal["global"]) -> \
+                                                    Sequence[tuple[int, ...] | None]:
+        """
+        Return identifiers of the scope elements (e.g., cores) containing each CPU.
+
+        The identifiers are hashable keys that are equal for CPUs sharing the same scope element,
+        and stay the same across CPU hotplug events. This is useful for storing one value per scope
+        element, instead of one value per CPU.
 
-        raise Error(f"Unsupported scope name \"{sname}\"")
+        Args:
+            sname: Scope name to return the identifiers for. Supported values include all
+                   'SCOPE_NAMES' except for "CPU", plus "global".
+
+        Returns:
+            A sequence indexed by CPU number. The elements are scope element identifiers, or 'None'
+            for offline CPUs. The sequence must not be modified.
+        """
+
+        if sname == "global":
+            cpus = self._get_online_cpus_set()
+            return [() if cpu in cpus else None for cpu in range(max(cpus) + 1)]
+
+        if sname not in ("package", "node", "die", "module", "core"):
+            raise Error(f"Unsupported scope name \"{sname}\"")
+
+        topo_table = self._get_topology_table((sname, "package"))
+        return topo_table.get_group_keys(sname)
 
     def cpu_to_die(self, cpu: int) -> int:
         """
@@ -981,13 +991,13 @@ class CPUInfo(_CPUInfoBase.CPUInfoBase):
 
         cpus = self.normalize_cpus(cpus, offline_ok=True)
 
-        # Get or build the core sibling index cache.
-        cpu_to_index = self._get_cpu_to_core_index_cache()
+        topo_table = self._get_topology_table(("core", "package"))
 
         result = []
         indexes = set(indexes)
         for cpu in cpus:
-            if cpu in cpu_to_index and cpu_to_index[cpu] in indexes:
+            index = topo_table.get_sibling_index(cpu, "core")
+            if index >= 0 and index in indexes:
                 result.append(cpu)
 
         return result
@@ -1030,13 +1040,13 @@ class CPUInfo(_CPUInfoBase.CPUInfoBase):
 
         cpus = self.normalize_cpus(cpus, offline_ok=True)
 
-        # Get or build the module sibling index cache.
-        cpu_to_index = self._get_cpu_to_module_index_cache()
+        topo_table = self._get_topology_table(("module", "package"))
 
         result = []
         indexes = set(indexes)
         for cpu in cpus:
-            if cpu in cpu_to_index and cpu_to_index[cpu] in indexes:
+            index = topo_table.get_sibling_index(cpu, "module")
+            if index >= 0 and index in indexes:
                 result.append(cpu)
 
         return result
@@ -1082,17 +1092,14 @@ class CPUInfo(_CPUInfoBase.CPUInfoBase):
         cores: dict[int, list[int]] = {}
         rem_cpus: list[int] = []
 
-        core_to_cpus = self._get_core_to_cpus_cache()
+        topo_table = self._get_topology_table(("core", "package"))
 
-        for pkg in self.get_packages():
-            for core in self.get_package_cores(package=pkg):
-                siblings_set = core_to_cpus[pkg][core]
-
-                if siblings_set.issubset(cpus_set):
-                    if pkg not in cores:
-                        cores[pkg] = []
-                    cores[pkg].append(core)
-                    cpus_set -= siblings_set
+        for (pkg, core), siblings in topo_table.iter_groups("core"):
+            if cpus_set.issuperset(siblings):
+                if pkg not in cores:
+                    cores[pkg] = []
+                cores[pkg].append(core)
+                cpus_set.difference_update(siblings)
 
         # Return the remaining CPUs in the order of the input 'cpus'.
         for cpu in cpus:
@@ -1141,17 +1148,14 @@ class CPUInfo(_CPUInfoBase.CPUInfoBase):
         dies: dict[int, list[int]] = {}
         rem_cpus: list[int] = []
 
-        die_to_cpus = self._get_die_to_cpus_cache()
-
-        for pkg in self.get_packages():
-            for die in self.get_package_dies(package=pkg):
-                siblings_set = die_to_cpus[pkg][die]
+        topo_table = self._get_topology_table(("die", "package"))
 
-                if siblings_set.issubset(cpus_set):
-                    if pkg not in dies:
-                        dies[pkg] = []
-                    dies[pkg].append(die)
-                    cpus_set -= siblings_set
+        for (pkg, die), siblings in topo_table.iter_groups("die"):
+            if cpus_set.issuperset(siblings):
+                if pkg not in dies:
+                    dies[pkg] = []
+                dies[pkg].append(die)
+                cpus_set.difference_update(siblings)
 
         # Return the remaining CPUs in the order of the input 'cpus'.
         for cpu in cpus:
@@ -1195,14 +1199,15 @@ class CPUInfo(_CPUInfoBase.CPUInfoBase):
 
         cpus_set = set(cpus)
 
-        package_to_cpus = self._get_package_to_cpus_cache()
+        topo_table = self._get_topology_table(("package",))
+        package_to_cpus = {key[0]: pkg_cpus for key, pkg_cpus in topo_table.iter_groups("package")}
 
         for pkg in self.normalize_packages(packages):
-            pkg_cpus_set = package_to_cpus[pkg]
+            pkg_cpus = package_to_cpus[pkg]
 
-            if pkg_cpus_set.issubset(cpus_set):
+            if cpus_set.issuperset(pkg_cpus):
                 pkgs.append(pkg)
-                cpus_set -= pkg_cpus_set
+                cpus_set.difference_update(pkg_cpus)
 
         # Return the remaining CPUs in the order of the input 'cpus'.
         for cpu in cpus:
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2020-2025 Intel Corporation
+# Copyright (C) 2020-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -15,8 +15,9 @@ from __future__ import annotations # Remove when switching to Python 3.10+.
 import typing
 from pathlib import Path
 from pepclibs.helperlibs import Logging, LocalProcessManager, ClassHelpers
-from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound, ErrorNotSupported
-from pepclibs import CPUInfo
+from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound, ErrorNotSupported, ErrorPath
+from pepclibs.helperlibs.Exceptions import ErrorPermissionDenied
+from pepclibs import CPUInfo, _SysfsIO
 
 if typing.TYPE_CHECKING:
     from typing import Iterable, Literal
@@ -57,15 +58,20 @@ class CPUOnline(ClassHelpers.SimpleCloseContext):
 
         self._cpuinfo = cpuinfo
 
+        # The CPU online state is changed outside of 'SysfsIO', so disable caching.
+        self._sysfs_io = _SysfsIO.SysfsIO(pman=self._pman, enable_cache=False)
+
         self._close_pman = pman is None
         self._close_cpuinfo = cpuinfo is None
+        self._close_sysfs_io = True
 
         self._sysfs_base = Path("/sys/devices/system/cpu")
+        self._smt_control_path = self._sysfs_base / "smt" / "control"
 
     def close(self):
         """Uninitialize the class instance."""
 
-        ClassHelpers.close(self, close_attrs=("_cpuinfo", "_pman",))
+        ClassHelpers.close(self, close_attrs=("_sysfs_io", "_cpuinfo", "_pman",))
 
     def _get_cpuinfo(self) -> CPUInfo.CPUInfo:
         """
@@ -152,6 +158,115 @@ class CPUOnline(ClassHelpers.SimpleCloseContext):
 
         return self._sysfs_base / f"cpu{cpu}" / "online"
 
+    def _get_smt_control(self) -> str:
+        """
+        Read the SMT control sysfs file.
+
+        Returns:
+            The SMT control state (e.g., "on", "off", "notsupported"), or an empty string if the
+            SMT control sysfs file does not exist.
+        """
+
+        return self._sysfs_io.read(self._smt_control_path, what="SMT control",
+                                   val_if_not_found="")
+
+    def _set_smt_control(self, state: str):
+        """
+        Write the SMT control sysfs file and refresh the CPU online state information.
+
+        Args:
+            state: The SMT control state to write ("on" or "off").
+        """
+
+        self._sysfs_io.write(self._smt_control_path, state, what="SMT control", su=True)
+        self._get_cpuinfo().cpus_hotplugged()
+
+    def _offline_smt_siblings(self, cpus: list[int]) -> bool:
+        """
+        Offline CPUs by disabling SMT via the SMT control sysfs file, if possible.
+
+        Offlining all CPUs except for the first CPU of every core (all non-first SMT siblings) is
+        what the kernel does when SMT is disabled via '/sys/devices/system/cpu/smt/control', and it
+        does it in one operation.
+
+        Args:
+            cpus: CPU numbers to offline.
+
+        Returns:
+            True if all the CPUs were offlined, False if they have to be offlined one by one.
+        """
+
+        cpuinfo = self._get_cpuinfo()
+        if self._get_smt_control() != "on" or cpuinfo.get_offline_cpus_count():
+            return False
+
+        allcpus = cpuinfo.get_cpus()
+        siblings = set(allcpus) - set(cpuinfo.select_core_siblings(allcpus, (0,)))
+        if not siblings or set(cpus) != siblings:
+            return False
+
+        _LOG.log(self._loglevel, "Offlining CPUs %s by disabling SMT", cpuinfo.cpus_to_str(cpus))
+        self._set_smt_control("off")
+
+        if set(cpuinfo.get_offline_cpus()) != siblings:
+            # The kernel's idea of the first SMT sibling differs from the one of 'CPUInfo'.
+            _LOG.debug("Disabling SMT offlined CPUs %s, expected %s, enabling SMT back",
+                       cpuinfo.cpus_to_str(cpuinfo.get_offline_cpus()), cpuinfo.cpus_to_str(cpus))
+            self._set_smt_control("on")
+            return False
+
+        return True
+
+    def _online_smt_siblings(self, cpus: list[int]) -> bool:
+        """
+        Online CPUs by enabling SMT via the SMT control sysfs file.
+
+        The kernel refuses to online non-first SMT siblings one by one while SMT is disabled via
+        '/sys/devices/system/cpu/smt/control'. Offline CPUs have no topology information, so whether
+        'cpus' include such siblings is known only after the kernel refused to online them. Enable
+        SMT in this case, offline the CPUs that got onlined but were not requested, and online the
+        remaining requested CPUs one by one.
+
+        Args:
+            cpus: CPU numbers to online.
+
+        Returns:
+            True if all the CPUs were onlined, False if SMT is not disabled, all the CPUs are
+            already online, or SMT could not be enabled.
+        """
+
+        if self._get_smt_control() != "off":
+            return False
+
+        cpuinfo = self._get_cpuinfo()
+        # Some of the CPUs may have been onlined before the kernel refused to online a sibling.
+        cpuinfo.cpus_hotplugged()
+        offline_cpus = set(cpuinfo.get_offline_cpus())
+        if not offline_cpus.intersection(cpus):
+            return False
+
+        _LOG.log(self._loglevel, "Enabling SMT")
+        try:
+            self._set_smt_control("on")
+        except Error as err:
+            _LOG.debug("Failed to enable SMT:\n%s", err.indent(2))
+            return False
+
+        # Enabling SMT onlines the SMT siblings, offline the ones that were not requested.
+        still_offline = set(cpuinfo.get_offline_cpus())
+        not_requested = offline_cpus - still_offline - set(cpus)
+        if not_requested:
+            self._toggle(sorted(not_requested), False, False)
+
+        # Some of the requested CPUs may have been offlined individually, rather than by disabling
+        # SMT. They have to be onlined one by one.
+        paths = [self._get_path(cpu) for cpu in sorted(still_offline.intersection(cpus))]
+        if paths:
+            self._sysfs_io.write_paths(paths, "1", what="CPU online state", su=True)
+            cpuinfo.cpus_hotplugged()
+
+        return True
+
     def _toggle(self, cpus: Iterable[int] | Literal["all"], online: bool, skip_unsupported: bool):
         """
         Toggle the online or offline state of specified CPUs.
@@ -172,12 +287,10 @@ class CPUOnline(ClassHelpers.SimpleCloseContext):
             data = "1"
             state_str = "online"
             action_str = "Onlining"
-            ready_cpus = set(cpuinfo.get_cpus())
         else:
             data = "0"
             state_str = "offline"
             action_str = "Offlining"
-            ready_cpus = set(cpuinfo.get_offline_cpus())
 
         if cpus == "all":
             skip_unsupported = True
@@ -194,33 +307,69 @@ class CPUOnline(ClassHelpers.SimpleCloseContext):
 
         _LOG.debug("CPUs to %s: %s", state_str, ", ".join([str(cpu) for cpu in cpus]))
 
-        toggled = []
+        if not online and self._offline_smt_siblings(cpus):
+            return
+
+        if online:
+            ready_cpus = set(cpuinfo.get_cpus())
+        else:
+            ready_cpus = set(cpuinfo.get_offline_cpus())
+
+        path_to_cpu: dict[Path, int] = {}
         for cpu in cpus:
             if cpu in ready_cpus:
                 _LOG.log(self._loglevel, "CPU%d is already %s, skipping", cpu, state_str)
                 continue
-
-            path = self._get_path(cpu)
-            try:
-                self._verify_path(cpu, path)
-            except ErrorNotSupported as err:
-                if not skip_unsupported:
-                    raise
-                _LOG.info(err)
-                continue
+            path_to_cpu[self._get_path(cpu)] = cpu
+
+        if not path_to_cpu:
+            return
+
+        # Check that the 'online' files exist by reading all of them in one go. Check the missing
+        # ones individually to figure out whether the CPU does not exist or does not support
+        # hotplugging.
+        paths: list[Path] = []
+        for path, val in self._sysfs_io.read_paths(path_to_cpu, what="CPU online state",
+                                                   val_if_not_found=""):
+            cpu = path_to_cpu[path]
+            if not val:
+                try:
+                    self._verify_path(cpu, path)
+                except ErrorNotSupported as err:
+                    if not skip_unsupported:
+                        raise
+                    _LOG.info(err)
+                    continue
 
             _LOG.log(self._loglevel, "%s CPU%d", action_str, cpu)
+            paths.append(path)
 
-            try:
-                with self._pman.open(path, "r+", su=True) as fobj:
-                    fobj.write(data)
-            except Error as err:
-                raise type(err)(f"Failed to {state_str} CPU{cpu}:\n{err.indent(2)}") from err
-            toggled.append(cpu)
+        if not paths:
+            return
 
-        if toggled:
-            cpuinfo.cpus_hotplugged()
-            self._validate_hotplugged_cpus(toggled, online)
+        toggled_cpus = [path_to_cpu[path] for path in paths]
+
+        try:
+            self._sysfs_io.write_paths(paths, data, what="CPU online state", su=True)
+        except Error as err:
+            # The kernel refuses to online SMT siblings with '-EPERM' while SMT is disabled.
+            if not online or not isinstance(err, ErrorPermissionDenied) or \
+               not self._online_smt_siblings(toggled_cpus):
+                path = getattr(err, "path", None)
+                if path in path_to_cpu:
+                    cpus_str = f"CPU{path_to_cpu[path]}"
+                else:
+                    cpus_str = f"CPUs {cpuinfo.cpus_to_str(toggled_cpus)}"
+                errmsg = f"Failed to {state_str} {cpus_str}:\n{err.indent(2)}"
+                if isinstance(err, ErrorPath):
+                    raise type(err)(errmsg, path=err.path) from err
+                raise type(err)(errmsg) from err
+
+            _LOG.debug("Onlined CPUs %s by enabling SMT after an error:\n%s",
+                       cpuinfo.cpus_to_str(toggled_cpus), err.indent(2))
+
+        cpuinfo.cpus_hotplugged()
+        self._validate_hotplugged_cpus(toggled_cpus, online)
 
     def online(self, cpus: Iterable[int] | Literal["all"] = "all", skip_unsupported: bool = False):
         """
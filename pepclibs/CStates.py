@@ -82,9 +82,10 @@ class CStates(_PropsClassBase.PropsClassBase):
             An instance of the 'CPUIdle' class.
         """
 
-        if not self._cpuidle:
-            self._cpuidle = CPUIdle.CPUIdle(self._pman, cpuinfo=self._cpuinfo,
-                                            enable_cache=self._enable_cache)
+        with self._init_lock:
+            if not self._cpuidle:
+                self._cpuidle = CPUIdle.CPUIdle(self._pman, cpuinfo=self._cpuinfo,
+                                                enable_cache=self._enable_cache)
         return self._cpuidle
 
     def _get_powerctl(self) -> PowerCtl.PowerCtl:
@@ -95,9 +96,10 @@ class CStates(_PropsClassBase.PropsClassBase):
             An instance of the 'PowerCtl' class.
         """
 
-        if not self._powerctl:
-            msr = self._get_msr()
-            self._powerctl = PowerCtl.PowerCtl(pman=self._pman, cpuinfo=self._cpuinfo, msr=msr)
+        with self._init_lock:
+            if not self._powerctl:
+                msr = self._get_msr()
+                self._powerctl = PowerCtl.PowerCtl(pman=self._pman, cpuinfo=self._cpuinfo, msr=msr)
 
         return self._powerctl
 
@@ -109,10 +111,11 @@ class CStates(_PropsClassBase.PropsClassBase):
             An instance of the 'PCStateConfigCtl' class.
         """
 
-        if not self._pcstatectl:
-            msr = self._get_msr()
-            self._pcstatectl = PCStateConfigCtl.PCStateConfigCtl(pman=self._pman,
-                                                                 cpuinfo=self._cpuinfo, msr=msr)
+        with self._init_lock:
+            if not self._pcstatectl:
+                msr = self._get_msr()
+                self._pcstatectl = PCStateConfigCtl.PCStateConfigCtl(pman=self._pman,
+                                                                     cpuinfo=self._cpuinfo, msr=msr)
         return self._pcstatectl
 
     def get_cstates_info(self,
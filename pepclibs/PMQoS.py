@@ -20,6 +20,7 @@ from pepclibs.helperlibs.Exceptions import Error
 
 if typing.TYPE_CHECKING:
     from typing import cast, Generator, Sequence
+    from pathlib import Path
     from pepclibs import _SysfsIO, CPUInfo, _LinuxPMQoS
     from pepclibs.msr import MSR
     from pepclibs.helperlibs.ProcessManager import ProcessManagerType
@@ -63,14 +64,25 @@ class PMQoS(_PropsClassBase.PropsClassBase):
            The cached or newly created 'LinuxPMQos' object.
         """
 
-        if not self._linux_pmqos_obj:
-            from pepclibs import _LinuxPMQoS # pylint: disable=import-outside-toplevel
+        with self._init_lock:
+            if not self._linux_pmqos_obj:
+                from pepclibs import _LinuxPMQoS # pylint: disable=import-outside-toplevel
 
-            sysfs_io = self._get_sysfs_io()
-            self._linux_pmqos_obj = _LinuxPMQoS.LinuxPMQoS(pman=self._pman, sysfs_io=sysfs_io,
-                                                           enable_cache=self._enable_cache)
+                sysfs_io = self._get_sysfs_io()
+                self._linux_pmqos_obj = _LinuxPMQoS.LinuxPMQoS(pman=self._pman, sysfs_io=sysfs_io,
+                                                               enable_cache=self._enable_cache)
         return self._linux_pmqos_obj
 
+    def _get_prefetch_paths(self,
+                            pname: str,
+                            cpus: AbsNumsType,
+                            mname: MechanismNameType) -> Generator[Path, None, None]:
+        """Refer to 'PropsClassBase._get_prefetch_paths()'."""
+
+        if pname == "latency_limit" and mname == "sysfs":
+            linux_pmqos_obj = self._get_linux_pmqos_obj()
+            yield from linux_pmqos_obj.get_prefetch_paths(pname, cpus)
+
     def _get_prop_cpus(self,
                        pname: str,
                        cpus: AbsNumsType,
@@ -26,6 +26,7 @@ from pepclibs._PropsClassBase import ErrorTryAnotherMechanism
 
 if typing.TYPE_CHECKING:
     from typing import Generator, cast, Sequence, NoReturn, Union
+    from pathlib import Path
     from pepclibs.msr import MSR, FSBFreq, PlatformInfo
     from pepclibs import _CPUFreqSysfs, _CPPCSysfs, _HWPCapMSR, _HWPPerf
     from pepclibs import _SysfsIO, EPP, EPB, CPUInfo
@@ -83,12 +84,13 @@ class PStates(_PropsClassBase.PropsClassBase):
             An instance of 'FSBFreq.FSBFreq'.
         """
 
-        if not self._fsbfreq:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs.msr import FSBFreq
+        with self._init_lock:
+            if not self._fsbfreq:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs.msr import FSBFreq
 
-            msr = self._get_msr()
-            self._fsbfreq = FSBFreq.FSBFreq(pman=self._pman, cpuinfo=self._cpuinfo, msr=msr)
+                msr = self._get_msr()
+                self._fsbfreq = FSBFreq.FSBFreq(pman=self._pman, cpuinfo=self._cpuinfo, msr=msr)
 
         return self._fsbfreq
 
@@ -100,13 +102,14 @@ class PStates(_PropsClassBase.PropsClassBase):
             An instance of 'PlatformInfo.PlatformInfo'.
         """
 
-        if not self._platinfo:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs.msr import PlatformInfo
+        with self._init_lock:
+            if not self._platinfo:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs.msr import PlatformInfo
 
-            msr = self._get_msr()
-            self._platinfo = PlatformInfo.PlatformInfo(pman=self._pman, cpuinfo=self._cpuinfo,
-                                                       msr=msr)
+                msr = self._get_msr()
+                self._platinfo = PlatformInfo.PlatformInfo(pman=self._pman, cpuinfo=self._cpuinfo,
+                                                           msr=msr)
 
         return self._platinfo
 
@@ -118,13 +121,14 @@ class PStates(_PropsClassBase.PropsClassBase):
             An instance of 'EPP.EPP'.
         """
 
-        if not self._eppobj:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import EPP
+        with self._init_lock:
+            if not self._eppobj:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import EPP
 
-            msr = self._get_msr()
-            self._eppobj = EPP.EPP(pman=self._pman, cpuinfo=self._cpuinfo, msr=msr,
-                                   enable_cache=self._enable_cache)
+                msr = self._get_msr()
+                self._eppobj = EPP.EPP(pman=self._pman, cpuinfo=self._cpuinfo, msr=msr,
+                                       enable_cache=self._enable_cache)
 
         return self._eppobj
 
@@ -136,13 +140,14 @@ class PStates(_PropsClassBase.PropsClassBase):
             An instance of 'EPB.EPB'.
         """
 
-        if not self._epbobj:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import EPB
+        with self._init_lock:
+            if not self._epbobj:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import EPB
 
-            msr = self._get_msr()
-            self._epbobj = EPB.EPB(pman=self._pman, cpuinfo=self._cpuinfo, msr=msr,
-                                   enable_cache=self._enable_cache)
+                msr = self._get_msr()
+                self._epbobj = EPB.EPB(pman=self._pman, cpuinfo=self._cpuinfo, msr=msr,
+                                       enable_cache=self._enable_cache)
 
         return self._epbobj
 
@@ -154,16 +159,17 @@ class PStates(_PropsClassBase.PropsClassBase):
             An instance of '_CPUFreqSysfs.CPUFreqSysfs'.
         """
 
-        if not self._cpufreq_sysfs_obj:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import _CPUFreqSysfs
+        with self._init_lock:
+            if not self._cpufreq_sysfs_obj:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import _CPUFreqSysfs
 
-            msr = self._get_msr()
-            sysfs_io = self._get_sysfs_io()
-            self._cpufreq_sysfs_obj = _CPUFreqSysfs.CPUFreqSysfs(cpuinfo=self._cpuinfo,
-                                                                 pman=self._pman,
-                                                                 msr=msr, sysfs_io=sysfs_io,
-                                                                 enable_cache=self._enable_cache)
+                msr = self._get_msr()
+                sysfs_io = self._get_sysfs_io()
+                obj = _CPUFreqSysfs.CPUFreqSysfs(cpuinfo=self._cpuinfo, pman=self._pman, msr=msr,
+                                                 sysfs_io=sysfs_io,
+                                                 enable_cache=self._enable_cache)
+                self._cpufreq_sysfs_obj = obj
         return self._cpufreq_sysfs_obj
 
     def _get_cppc_sysfs_obj(self) -> _CPPCSysfs.CPPCSysfs:
@@ -174,14 +180,15 @@ class PStates(_PropsClassBase.PropsClassBase):
             An instance of '_CPPCSysfs.CPPCSysfs'.
         """
 
-        if not self._cppc_sysfs_obj:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import _CPPCSysfs
+        with self._init_lock:
+            if not self._cppc_sysfs_obj:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import _CPPCSysfs
 
-            sysfs_io = self._get_sysfs_io()
-            self._cppc_sysfs_obj = _CPPCSysfs.CPPCSysfs(cpuinfo=self._cpuinfo, pman=self._pman,
-                                                        sysfs_io=sysfs_io,
-                                                        enable_cache=self._enable_cache)
+                sysfs_io = self._get_sysfs_io()
+                self._cppc_sysfs_obj = _CPPCSysfs.CPPCSysfs(cpuinfo=self._cpuinfo, pman=self._pman,
+                                                            sysfs_io=sysfs_io,
+                                                            enable_cache=self._enable_cache)
         return self._cppc_sysfs_obj
 
     def _get_hwp_msr_obj(self) -> _HWPCapMSR.HWPCapMSR:
@@ -192,14 +199,15 @@ class PStates(_PropsClassBase.PropsClassBase):
             An instance of '_HWPCapMSR.HWPCapMSR'.
         """
 
-        if not self._hwp_msr_obj:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import _HWPCapMSR
+        with self._init_lock:
+            if not self._hwp_msr_obj:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import _HWPCapMSR
 
-            msr = self._get_msr()
-            self._hwp_msr_obj = _HWPCapMSR.HWPCapMSR(cpuinfo=self._cpuinfo, pman=self._pman,
-                                                     msr=msr,
-                                                     enable_cache=self._enable_cache)
+                msr = self._get_msr()
+                self._hwp_msr_obj = _HWPCapMSR.HWPCapMSR(cpuinfo=self._cpuinfo, pman=self._pman,
+                                                         msr=msr,
+                                                         enable_cache=self._enable_cache)
         return self._hwp_msr_obj
 
     def _get_hwp_perf_obj(self) -> _HWPPerf.HWPPerf:
@@ -210,13 +218,14 @@ class PStates(_PropsClassBase.PropsClassBase):
             An instance of '_HWPPerf.HWPPerf'.
         """
 
-        if not self._hwp_perf_obj:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import _HWPPerf
+        with self._init_lock:
+            if not self._hwp_perf_obj:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import _HWPPerf
 
-            msr = self._get_msr()
-            self._hwp_perf_obj = _HWPPerf.HWPPerf(cpuinfo=self._cpuinfo, pman=self._pman,
-                                                   msr=msr, enable_cache=self._enable_cache)
+                msr = self._get_msr()
+                self._hwp_perf_obj = _HWPPerf.HWPPerf(cpuinfo=self._cpuinfo, pman=self._pman,
+                                                       msr=msr, enable_cache=self._enable_cache)
         return self._hwp_perf_obj
 
     def _get_bclks_cpus(self, cpus: AbsNumsType) -> Generator[tuple[int, int], None, None]:
@@ -793,6 +802,26 @@ class PStates(_PropsClassBase.PropsClassBase):
         cpufreq_obj = self._get_cpufreq_sysfs_obj()
         yield from cpufreq_obj.get_available_governors(cpus)
 
+    def _get_prefetch_paths(self,
+                            pname: str,
+                            cpus: AbsNumsType,
+                            mname: MechanismNameType) -> Generator[Path, None, None]:
+        """Refer to 'PropsClassBase._get_prefetch_paths()'."""
+
+        if mname != "sysfs":
+            return
+
+        if pname in {"min_freq", "max_freq", "min_freq_limit", "max_freq_limit", "governor"}:
+            cpufreq_obj = self._get_cpufreq_sysfs_obj()
+            yield from cpufreq_obj.get_prefetch_paths(pname, cpus)
+        elif pname == "governors":
+            cpufreq_obj = self._get_cpufreq_sysfs_obj()
+            yield from cpufreq_obj.get_prefetch_paths("available_governors", cpus)
+        elif pname in {"cppc_lowest_perf", "cppc_lowest_nonlinear_perf", "cppc_guaranteed_perf",
+                       "cppc_nominal_perf", "cppc_highest_perf", "cppc_nominal_freq"}:
+            cppc_sysfs_obj = self._get_cppc_sysfs_obj()
+            yield from cppc_sysfs_obj.get_prefetch_paths(pname[len("cppc_"):], cpus)
+
     def _get_prop_cpus(self,
                        pname: str,
                        cpus: AbsNumsType,
@@ -53,64 +53,148 @@ if typing.TYPE_CHECKING:
         flags: dict[int, frozenset[str]]
         topology: dict[int, dict[int, list[int]]]
 
-def _parse_cpuinfo_block(block: str,
-                         info: ProcCpuinfoTypedDict,
-                         percpu_info: ProcCpuinfoPerCPUTypedDict):
+class _CpuinfoParser:
     """
-    Parse a single CPU information block from '/proc/cpuinfo' and update the provided information
-    dictionaries.
+    Parse '/proc/cpuinfo' in a single pass.
+
+    Notes:
+        - Identical flag sets are shared between CPUs: the 'flags' line of every CPU is converted to
+          a set only once, and CPUs with identical 'flags' lines refer to the same 'frozenset'
+          object.
+    """
+
+    def __init__(self, first_only: bool = False):
+        """
+        Initialize a class instance.
+
+        Args:
+            first_only: If True, parse only the first CPU information block, which is enough for
+                        collecting general CPU information.
+        """
+
+        self._first_only = first_only
+
+        self.info: ProcCpuinfoTypedDict = {}
+        self.percpu_info: ProcCpuinfoPerCPUTypedDict = {"flags": {}, "topology": {}}
+
+        # Interned flag sets: {'flags' line value: flags set}.
+        self._flagsets: dict[str, frozenset[str]] = {}
+
+    def _get_flagset(self, val: str) -> frozenset[str]:
+        """
+        Return the flags set for a 'flags' line value.
+
+        Args:
+            val: The 'flags' line value.
+
+        Returns:
+            The interned flags set.
+        """
+
+        flagset = self._flagsets.get(val)
+        if flagset is None:
+            flagset = self._flagsets[val] = frozenset(val.split())
+        return flagset
+
+    def _parse_block(self, lines: list[str]):
+        """
+        Parse a single CPU information block from '/proc/cpuinfo' and update the information
+        dictionaries.
+
+        Args:
+            lines: Lines of the CPU information block to parse.
+        """
+
+        cpu = core = package = -1
+        flags = ""
+
+        # General (static) CPU information is the same for all CPUs, parse it only once.
+        parse_general = "vendor" not in self.info
+
+        for line in lines:
+            key, _, val = line.partition(":")
+            key = key.strip()
+
+            what = f"value of '{key}' from '/proc/cpuinfo'"
+            if key == "processor":
+                cpu = Trivial.str_to_int(val.strip(), what=what)
+            elif key == "core id":
+                core = Trivial.str_to_int(val.strip(), what=what)
+            elif key == "physical id":
+                package = Trivial.str_to_int(val.strip(), what=what)
+            elif key == "flags":
+                flags = val.strip()
+            elif parse_general:
+                if key == "vendor_id":
+                    val = val.strip()
+                    self.info["vendor_name"] = val
+                    self.info["vendor"] = CPUModels.vendor_name_to_id(val)
+                elif key == "cpu family":
+                    self.info["family"] = Trivial.str_to_int(val.strip(), what=what)
+                elif key == "model":
+                    self.info["model"] = Trivial.str_to_int(val.strip(), what=what)
+                elif key == "model name":
+                    self.info["modelname"] = val.strip()
+
+        if cpu == -1 or core == -1 or package == -1:
+            block = "\n".join(lines)
+            raise Error(f"Incomplete CPU information block in '/proc/cpuinfo': 'processor', "
+                        f"'core id', or 'physical id' is missing:\n{block}")
+
+        topology = self.percpu_info["topology"]
+        if package not in topology:
+            topology[package] = {}
+        if core not in topology[package]:
+            topology[package][core] = []
+        topology[package][core].append(cpu)
+        self.percpu_info["flags"][cpu] = self._get_flagset(flags)
+
+    def parse(self, text: str):
+        """
+        Parse '/proc/cpuinfo' contents.
+
+        Args:
+            text: The '/proc/cpuinfo' contents.
+        """
+
+        lines: list[str] = []
+        for line in text.splitlines():
+            if line.strip():
+                lines.append(line)
+                continue
+
+            if lines:
+                self._parse_block(lines)
+                lines = []
+                if self._first_only:
+                    return
+
+        if lines:
+            self._parse_block(lines)
+
+def _read_proc_cpuinfo(pman: ProcessManagerType | None, first_only: bool) -> _CpuinfoParser:
+    """
+    Read and parse '/proc/cpuinfo'.
 
     Args:
-        block: The CPU information block to parse.
-        info: The dictionary to update with general CPU information.
-        percpu_info: The dictionary to update with per-CPU information.
+        pman: The process manager object for the target host. If not provided, a local process
+              manager is created.
+        first_only: If True, parse only the first CPU information block.
+
+    Returns:
+        The parser object holding the parsed information.
     """
 
-    cpu = core = package = -1
-    flags = set()
-
-    # General (static) CPU information is the same for all CPUs, parse it only once.
-    parse_general = "vendor" not in info
-
-    for line in block.split("\n"):
-        key, val = line.split(":")
-        key = key.strip()
-        val = val.strip()
-
-        what = f"value of '{key}' from '/proc/cpuinfo'"
-        if key == "processor":
-            cpu = Trivial.str_to_int(val, what=what)
-        elif key == "core id":
-            core = Trivial.str_to_int(val, what=what)
-        elif key == "physical id":
-            package = Trivial.str_to_int(val, what=what)
-        elif key == "flags":
-            # Collect flags for each CPU.
-            flags = set(val.split())
-
-        if not parse_general:
-            continue
-
-        if key == "vendor_id":
-            info["vendor_name"] = val
-            info["vendor"] = CPUModels.vendor_name_to_id(val)
-        elif key == "cpu family":
-            info["family"] = Trivial.str_to_int(val, what=what)
-        elif key == "model":
-            info["model"] = Trivial.str_to_int(val, what=what)
-        elif key == "model name":
-            info["modelname"] = val
-
-    if cpu == -1 or core == -1 or package == -1:
-        raise Error(f"Incomplete CPU information block in '/proc/cpuinfo': 'processor', 'core id', "
-                    f"or 'physical id' is missing:\n{block}")
-
-    if package not in percpu_info["topology"]:
-        percpu_info["topology"][package] = {}
-    if core not in percpu_info["topology"][package]:
-        percpu_info["topology"][package][core] = []
-    percpu_info["topology"][package][core].append(cpu)
-    percpu_info["flags"][cpu] = frozenset(flags)
+    parser = _CpuinfoParser(first_only=first_only)
+    with ProcessManager.pman_or_local(pman) as wpman:
+        parser.parse(wpman.read_file("/proc/cpuinfo"))
+
+        if "vendor" not in parser.info:
+            raise Error(f"No CPU information found in '/proc/cpuinfo'{wpman.hostmsg}")
+
+    parser.info["vfm"] = CPUModels.make_vfm(parser.info["vendor"], parser.info["family"],
+                                            parser.info["model"])
+    return parser
 
 def get_proc_cpuinfo(pman: ProcessManagerType | None = None) -> ProcCpuinfoTypedDict:
     """
@@ -127,18 +211,7 @@ def get_proc_cpuinfo(pman: ProcessManagerType | None = None) -> ProcCpuinfoTyped
         The general '/proc/cpuinfo' information dictionary.
     """
 
-    proc_cpuinfo: ProcCpuinfoTypedDict = {}
-    proc_percpuinfo: ProcCpuinfoPerCPUTypedDict = {"flags": {}, "topology": {}}
-
-    with ProcessManager.pman_or_local(pman) as wpman:
-        for block in wpman.read_file("/proc/cpuinfo").strip().split("\n\n"):
-            _parse_cpuinfo_block(block, proc_cpuinfo, proc_percpuinfo)
-            # We only need general CPU information from one block.
-            break
-
-    proc_cpuinfo["vfm"] = CPUModels.make_vfm(proc_cpuinfo["vendor"], proc_cpuinfo["family"],
-                                             proc_cpuinfo["model"])
-    return proc_cpuinfo
+    return _read_proc_cpuinfo(pman, True).info
 
 def get_proc_percpuinfo(pman: ProcessManagerType | None = None) -> ProcCpuinfoPerCPUTypedDict:
     """
@@ -155,11 +228,23 @@ def get_proc_percpuinfo(pman: ProcessManagerType | None = None) -> ProcCpuinfoPe
         The per-CPU '/proc/cpuinfo' topology information dictionary.
     """
 
-    proc_cpuinfo: ProcCpuinfoTypedDict = {}
-    proc_percpuinfo: ProcCpuinfoPerCPUTypedDict = {"flags": {}, "topology": {}}
+    return _read_proc_cpuinfo(pman, False).percpu_info
 
-    with ProcessManager.pman_or_local(pman) as wpman:
-        for block in wpman.read_file("/proc/cpuinfo").strip().split("\n\n"):
-            _parse_cpuinfo_block(block, proc_cpuinfo, proc_percpuinfo)
+def get_proc_cpuinfo_all(pman: ProcessManagerType | None = None) -> \
+                            tuple[ProcCpuinfoTypedDict, ProcCpuinfoPerCPUTypedDict]:
+    """
+    Collect and return both general and per-CPU information from '/proc/cpuinfo', reading it only
+    once.
+
+    Args:
+        pman: The process manager object for the target host. If not provided, a local process
+              manager is created.
+
+    Returns:
+        A tuple of the general '/proc/cpuinfo' information dictionary (refer to
+        'get_proc_cpuinfo()') and the per-CPU '/proc/cpuinfo' information dictionary (refer to
+        'get_proc_percpuinfo()').
+    """
 
-    return proc_percpuinfo
+    parser = _read_proc_cpuinfo(pman, False)
+    return parser.info, parser.percpu_info
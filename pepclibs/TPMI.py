@@ -75,11 +75,19 @@ Terminology:
 #             'mem_dump'. mdmap is a two-level dictionary: first indexed by instance number, then by
 #             TPMI memory offset. The value is the file position in 'mem_dump'. Use mdmap to quickly
 #             locate the file position for a given instance and register offset.
+#   - snapshot - mem_dump snapshot. All register values parsed from 'mem_dump' in one go.
+#                Similarly to mdmap, a two-level dictionary first indexed by instance number, then
+#                by TPMI memory offset, but the value is the register value. Used in snapshot mode
+#                to serve register reads without re-reading 'mem_dump'.
 #   - cmap - Clusters map. Map UFS clusters IDs to their offsets relative to the start of the TPMI
 #            instance memory space.
+#   - pamap - Physical addresses map. Map instance numbers to physical addresses of the instance
+#             memory space, as reported in 'mem_dump' instance headers. Used in MMIO mode to access
+#             TPMI registers directly via memory-mapped PCI BARs instead of debugfs.
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+import io
 import os
 import re
 import stat
@@ -87,7 +95,7 @@ import typing
 import contextlib
 from pathlib import Path
 import yaml
-from pepclibs import CPUModels
+from pepclibs import CPUModels, _TPMISpecCache, _TPMIMMIO
 from pepclibs.helperlibs import Logging, YAML, ClassHelpers, FSHelpers, ProjectFiles, Trivial, Human
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound, ErrorNotSupported
 from pepclibs.helperlibs.Exceptions import ErrorPermissionDenied
@@ -157,6 +165,12 @@ if typing.TYPE_CHECKING:
     # in 'mem_dump'.
     _MDMapType = dict[int, dict[int, int]]
 
+    # Type for the mem_dump snapshot dictionary: {instance: {offset: register_value}}.
+    _SnapshotType = dict[int, dict[int, int]]
+
+    # Type for the physical addresses map: {instance: physical_address}.
+    _PAMapType = dict[int, int]
+
     class _AddrMDMapTypedDict(TypedDict, total=False):
         """
         A typed dictionary for used in fmap, mapping a PCI address to TPMI device information.
@@ -269,17 +283,42 @@ def _find_spec_dirs() -> list[Path]:
     specdirs.append(specdir.parent)
     return specdirs
 
+def _read_spec_file(path: Path, what: str) -> tuple[str, str]:
+    """
+    Read a TPMI spec file or a spec directory index file.
+
+    Args:
+        path: Path to the file to read.
+        what: Description of the file for error messages.
+
+    Returns:
+        A tuple of the file contents and the file contents hash for the spec files cache.
+    """
+
+    try:
+        with open(path, "rb") as fobj:
+            data = fobj.read()
+    except OSError as err:
+        msg = Error(str(err)).indent(2)
+        raise Error(f"Failed to read {what} '{path}':\n{msg}") from err
+
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as err:
+        msg = Error(str(err)).indent(2)
+        raise Error(f"Bad {what} '{path}':\n{msg}") from err
+
+    return text, _TPMISpecCache.get_hash(data)
+
 def _load_sdict(specpath: Path) -> SDictTypedDict:
     """
     Partially load spec file at 'specpath', just enough to get feature name, description, and ID.
     Create and return the spec dictionary for the spec file.
 
-    The implementation is optimized to avoid loading the entire spec file and instead, only look at
-    the beginning of the file.
+    The implementation is optimized to avoid parsing the entire spec file and instead, only look at
+    the beginning of the file. The result is cached in the spec files cache.
     """
 
-    fobj = None
-
     # Basic spec file validation.
     try:
         st = specpath.stat()
@@ -294,14 +333,15 @@ def _load_sdict(specpath: Path) -> SDictTypedDict:
     if not stat.S_ISREG(st.st_mode):
         raise Error(f"'{specpath}' is not a regular file")
 
-    try:
-        try:
-            fobj = open(specpath, "r", encoding="utf-8") # pylint: disable=consider-using-with
-        except OSError as err:
-            msg = Error(str(err)).indent(2)
-            raise Error(f"Failed to open spec file '{specpath}':\n{msg}") from err
+    text, srchash = _read_spec_file(specpath, "spec file")
+
+    sdict: SDictTypedDict = _TPMISpecCache.load(specpath, "sdict", srchash)
+    if sdict is not None:
+        sdict["path"] = specpath
+        return sdict
 
-        loader = yaml.SafeLoader(fobj)
+    loader = YAML.SafeLoader(text)
+    try:
         event = None
         while True:
             event = loader.peek_event()
@@ -313,7 +353,7 @@ def _load_sdict(specpath: Path) -> SDictTypedDict:
 
         # The first 3 keys must be: name, desc, and feature_id.
         left_keys = list(_SDICT_KEYS)
-        sdict: SDictTypedDict = {}
+        sdict = {}
         while len(sdict) < len(_SDICT_KEYS):
             event = loader.get_event()
             if not event:
@@ -343,8 +383,9 @@ def _load_sdict(specpath: Path) -> SDictTypedDict:
 
             left_keys.remove(vkey)
     finally:
-        if fobj:
-            fobj.close()
+        loader.dispose()
+
+    _TPMISpecCache.save(specpath, "sdict", srchash, sdict)
 
     sdict["path"] = specpath
     return sdict
@@ -406,12 +447,19 @@ def _parse_index_file(specpath: Path) -> SDDTypedDict:
 
     idxpath = specpath / "index.yml"
 
-    _LOG.debug("Parsing TPMI spec index file '%s'", idxpath)
+    text, srchash = _read_spec_file(idxpath, "index file")
 
-    if typing.TYPE_CHECKING:
-        idxdict: IdxDictTypedDict = cast(IdxDictTypedDict, YAML.load(idxpath))
+    idxdict: IdxDictTypedDict = _TPMISpecCache.load(idxpath, "idxdict", srchash)
+    if idxdict is None:
+        _LOG.debug("Parsing TPMI spec index file '%s'", idxpath)
+
+        if typing.TYPE_CHECKING:
+            idxdict = cast(IdxDictTypedDict, YAML.load(idxpath, fobj=io.StringIO(text)))
+        else:
+            idxdict = YAML.load(idxpath, fobj=io.StringIO(text))
+        cache_idxdict = True
     else:
-        idxdict = YAML.load(idxpath)
+        cache_idxdict = False
 
     if _LOG.getEffectiveLevel() == Logging.DEBUG:
         # pylint: disable-next=import-outside-toplevel
@@ -441,6 +489,9 @@ def _parse_index_file(specpath: Path) -> SDDTypedDict:
         if msg:
             _raise_exc(msg)
 
+    if cache_idxdict:
+        _TPMISpecCache.save(idxpath, "idxdict", srchash, idxdict)
+
     return sdd
 
 def _match_vfm_in_index(sdd: SDDTypedDict, vfm: int) -> SDDTypedDict:
@@ -641,8 +692,13 @@ class TPMI(ClassHelpers.SimpleCloseContext):
         - 'write_ufs_register()' - write a value to a UFS TPMI register or a specific bit field.
         - 'write_register_cluster()' - write a value to a TPMI register or a specific bit field,
                                        specifying the cluster.
-    5. Miscellaneous.
+    5. Transactions.
+        - 'start_transaction()' - start a transaction.
+        - 'flush_transaction()' - flush the transaction buffer.
+        - 'commit_transaction()' - commit the transaction.
+    6. Miscellaneous.
         - 'get_bitfield()' - extract the value of a bit field from a register value.
+        - 'drop_snapshots()' - drop all 'mem_dump' snapshots (snapshot mode only).
         - 'close()' - uninitialize the class object.
     """
 
@@ -650,7 +706,10 @@ class TPMI(ClassHelpers.SimpleCloseContext):
                  vfm: int = -1,
                  specdirs: Iterable[Path] = (),
                  base: Path | None = None,
-                 pman: ProcessManagerType | None = None):
+                 pman: ProcessManagerType | None = None,
+                 snapshot: bool = False,
+                 mmio: bool = False,
+                 pci_path: Path | None = None):
         """
         Initialize a class instance.
 
@@ -665,11 +724,23 @@ class TPMI(ClassHelpers.SimpleCloseContext):
                   live system defined by 'pman'.
             pman: The Process manager object that defines the host to access TPMI registers on. If
                   not provided, a local process manager will be used.
+            snapshot: If 'True', enable the snapshot mode. In this mode, the 'mem_dump' file of a
+                      TPMI feature and device is read and parsed once, and all subsequent register
+                      reads are served from the parsed values until the snapshot is dropped or a
+                      register of the feature and device is written.
+            mmio: If 'True', enable the MMIO mode. In this mode, TPMI registers are read and written
+                  directly via memory-mapped PCI BARs of TPMI devices, instead of the debugfs
+                  'mem_dump' and 'mem_write' files. The 'mem_dump' files are still read once per
+                  feature and device to discover TPMI instances and their physical addresses.
+            pci_path: Path to the sysfs PCI devices directory to use in MMIO mode. Defaults to
+                      '/sys/bus/pci/devices'. Use it together with 'base' to access TPMI registers
+                      in a copy of PCI BAR contents.
 
         Raises:
             ErrorNotSupported: If the CPU vendor is not Intel, if no TPMI spec files are found,
-                               if no TPMI-related sub-directories are found in debugfs, or if no
-                               TPMI features are found on the system.
+                               if no TPMI-related sub-directories are found in debugfs, if no
+                               TPMI features are found on the system, or if the MMIO mode is
+                               requested for a remote or emulated host.
 
         Notes:
             - TPMI is designed to be forward-compatible. If VFM is not provided, a default VFM
@@ -677,6 +748,10 @@ class TPMI(ClassHelpers.SimpleCloseContext):
               which is compatible with later generations like Sierra Forest Xeon.
             - When 'base' is provided, all TPMI accesses are done against the debugfs dump located
               at 'base' instead of the live system defined by 'pman'.
+            - In snapshot mode, register value changes made by hardware or other programs after
+              the snapshot was taken are not visible until 'drop_snapshots()' is called.
+            - The MMIO mode is supported only on the local host. Refer to the '_TPMIMMIO' module
+              for details.
         """
 
         self._close_pman = pman is None
@@ -704,6 +779,23 @@ class TPMI(ClassHelpers.SimpleCloseContext):
         # Whether the TPMI interface is read-only.
         self._readonly = False
 
+        # Whether the snapshot mode is enabled.
+        self._snapshot = snapshot
+        # The 'mem_dump' snapshots: {feature_name: {addr: snapshot}}.
+        self._snapshots: dict[str, dict[str, _SnapshotType]] = {}
+
+        # Whether there is an ongoing transaction.
+        self._in_transaction = False
+        # The transaction buffer: {addr: {feature_name: {instance: {offset: 32-bit word}}}}.
+        self._transaction_buffer: dict[str, dict[str, dict[int, dict[int, int]]]] = {}
+
+        # The MMIO mode TPMI registers access object ('None' if the MMIO mode is disabled).
+        self._mmio: _TPMIMMIO.TPMIMMIO | None = None
+        # The physical addresses maps: {feature_name: {addr: pamap}}.
+        self._pamaps: dict[str, dict[str, _PAMapType]] = {}
+        if mmio:
+            self._mmio = _TPMIMMIO.TPMIMMIO(self._pman, pci_path=pci_path)
+
         # The features dictionary, maps feature name to the fdict (feature dictionary).
         self._fdicts: dict[str, dict[str, RegDictTypedDict]] = {}
 
@@ -781,7 +873,7 @@ class TPMI(ClassHelpers.SimpleCloseContext):
             with contextlib.suppress(Error):
                 self._pman.run(f"unmount {self._debugfs_mnt}")
 
-        ClassHelpers.close(self, close_attrs=("_pman",))
+        ClassHelpers.close(self, close_attrs=("_mmio", "_pman",))
 
     def _get_debugfs_tpmi_dirs(self) -> list[Path]:
         """
@@ -991,6 +1083,10 @@ class TPMI(ClassHelpers.SimpleCloseContext):
 
             To read the register at offset 8 for instance 1, seek to position 95 in the
             corresponding 'mem_dump' debugfs file.
+
+        Notes:
+            In snapshot mode, the parsed register values are saved as the snapshot of the 'mem_dump'
+            file.
         """
 
         path = self._get_debugfs_feature_path(addr, fname)
@@ -999,6 +1095,7 @@ class TPMI(ClassHelpers.SimpleCloseContext):
         _LOG.debug("Reading 'mem_dump' of feature '%s' at '%s'", fname, path)
 
         mdmap: _MDMapType = {}
+        pamap: _PAMapType = {}
         pos = 0
 
         # Values for all the instances and offsets found in the 'mem_dump' file.
@@ -1016,6 +1113,9 @@ class TPMI(ClassHelpers.SimpleCloseContext):
                     instance = Trivial.str_to_int(match.group(1), what="instance number")
                     mdmap[instance] = {}
                     vals[instance] = {}
+                    if self._mmio:
+                        pamap[instance] = Trivial.str_to_int(match.group(2), base=16,
+                                                             what="TPMI instance address")
                 else:
                     if instance == -1:
                         raise Error(f"BUG: unexpected line in TPMI 'mem_dump' file '{path}' "
@@ -1049,6 +1149,13 @@ class TPMI(ClassHelpers.SimpleCloseContext):
             raise Error(f"No valid TPMI instances found for feature '{fname}' at '{path}'"
                         f"{self._pman.hostmsg}.")
 
+        if self._snapshot:
+            # The register values were parsed anyway, keep them as the snapshot.
+            self._snapshots.setdefault(fname, {})[addr] = vals
+
+        if self._mmio:
+            self._pamaps.setdefault(fname, {})[addr] = pamap
+
         return mdmap
 
     def get_dummy_tpmi_info(self, addr: str, addrs: frozenset[str]) -> tuple[_MDMapType, int]:
@@ -1188,7 +1295,8 @@ class TPMI(ClassHelpers.SimpleCloseContext):
 
     def _load_and_format_fdict(self, fname: str, specpath: Path) -> dict[str, RegDictTypedDict]:
         """
-        Load and validate a TPMI spec file, then return the fdict.
+        Load and validate a TPMI spec file, then return the fdict. Use the spec files cache to avoid
+        parsing the spec file if it did not change since it was parsed last time.
 
         Args:
             fname: Name of the TPMI feature whose spec file is being loaded.
@@ -1210,7 +1318,15 @@ class TPMI(ClassHelpers.SimpleCloseContext):
             pfx = f"Bad TPMI feature '{fname}' spec file '{specpath}'"
             raise Error(f"{pfx}:\n{Error(msg).indent(2)}")
 
-        spec: dict[str, dict[str, dict[str, dict[str, dict[str, str]]]]] = YAML.load(specpath)
+        text, srchash = _read_spec_file(specpath, "spec file")
+
+        cached: dict[str, RegDictTypedDict] | None = _TPMISpecCache.load(specpath, "fdict",
+                                                                          srchash)
+        if cached is not None:
+            return cached
+
+        spec: dict[str, dict[str, dict[str, dict[str, dict[str, str]]]]] = \
+                                                    YAML.load(specpath, fobj=io.StringIO(text))
         if "registers" not in spec:
             _raise_exc("The 'registers' top-level key was not found")
 
@@ -1315,6 +1431,8 @@ class TPMI(ClassHelpers.SimpleCloseContext):
             else:
                 regdict["readonly"] = not all_fields_rw
 
+        _TPMISpecCache.save(specpath, "fdict", srchash, fdict)
+
         if typing.TYPE_CHECKING:
             return cast(dict[str, RegDictTypedDict], fdict)
         return fdict
@@ -1503,7 +1621,8 @@ class TPMI(ClassHelpers.SimpleCloseContext):
                 offset: int,
                 mdmap: _MDMapType) -> int:
         """
-        Read a 32-bit TPMI register value from the TPMI debugfs 'mem_dump' file.
+        Read a 32-bit TPMI register value from the TPMI debugfs 'mem_dump' file, or via MMIO in
+        MMIO mode.
 
         Args:
             fname: Name of the TPMI feature.
@@ -1526,6 +1645,17 @@ class TPMI(ClassHelpers.SimpleCloseContext):
         if cluster > 0:
             offset = self._adjust_ufs_offset(addr, instance, cluster, offset)
 
+        if self._in_transaction:
+            val = self._get_transaction_word(fname, addr, instance, offset)
+            if val is not None:
+                return val
+
+        if self._snapshot:
+            return self._get_snapshot(fname, addr)[instance][offset]
+
+        if self._mmio:
+            return self._mmio.read32(addr, self._get_physaddr(fname, addr, instance, offset))
+
         with self._pman.open(path, "r", su=self._use_su) as fobj:
             fobj.seek(mdmap[instance][offset])
             val = fobj.read(8)
@@ -1542,7 +1672,8 @@ class TPMI(ClassHelpers.SimpleCloseContext):
                 offset: int,
                 mdmap: _MDMapType) -> int:
         """
-        Read a 64-bit TPMI register value from the TPMI debugfs 'mem_dump' file.
+        Read a 64-bit TPMI register value from the TPMI debugfs 'mem_dump' file, or via MMIO in
+        MMIO mode.
 
         Args:
             fname: Name of the TPMI feature.
@@ -1565,6 +1696,22 @@ class TPMI(ClassHelpers.SimpleCloseContext):
         if cluster > 0:
             offset = self._adjust_ufs_offset(addr, instance, cluster, offset)
 
+        if self._in_transaction:
+            val_low = self._get_transaction_word(fname, addr, instance, offset)
+            val_high = self._get_transaction_word(fname, addr, instance, offset + 4)
+            if val_low is not None and val_high is not None:
+                return val_low + (val_high << 32)
+
+        if self._snapshot:
+            snapshot = self._get_snapshot(fname, addr)
+            return snapshot[instance][offset] + (snapshot[instance][offset + 4] << 32)
+
+        if self._mmio:
+            physaddr = self._get_physaddr(fname, addr, instance, offset)
+            val_low = self._mmio.read32(addr, physaddr)
+            val_high = self._mmio.read32(addr, physaddr + 4)
+            return val_low + (val_high << 32)
+
         file_offset0 = mdmap[instance][offset]
         file_offset1 = mdmap[instance][offset + 4]
         read_len = file_offset1 - file_offset0 + 8
@@ -1679,9 +1826,6 @@ class TPMI(ClassHelpers.SimpleCloseContext):
         mdmap = self._get_mdmap(fname, addr)
         self._validate_instance_offset(fname, addr, instance, regname, offset, mdmap)
 
-        path = self._get_debugfs_feature_path(addr, fname)
-        path = path / "mem_write"
-
         _LOG.debug("Writing %#x to '%s' register '%s', instance '%d' at offset %#x of TPMI "
                    "device '%s'", value, fname, regname, instance, offset, addr)
 
@@ -1710,22 +1854,159 @@ class TPMI(ClassHelpers.SimpleCloseContext):
         if cluster > 0:
             offset = self._adjust_ufs_offset(addr, instance, cluster, offset)
 
-        # Unfortunately, the TPMI debugfs interface does not support writing 64-bit values in one
-        # go, even for registers that are 64 bits wide. Instead, the value needs to be split into
-        # 32-bit parts and written sequentially, starting with the least significant part.
-        with self._pman.open(path, "r+", su=self._use_su) as fobj:
-            while True:
-                writeval = value & 0xffffffff
-                data = f"{instance},{offset},{writeval:#x}"
-                _LOG.debug("Writing '%s' to '%s'", data, path)
-
-                fobj.write(data)
-                width -= 32
-                offset += 4
-                value >>= 32
-                if width <= 0:
-                    break
-                fobj.seek(0)
+        # Unfortunately, TPMI registers can only be written 32 bits at a time, even the ones that
+        # are 64 bits wide. Split the value into 32-bit words, starting with the least significant
+        # one. Words are written in the ascending offset order.
+        words: dict[int, int] = {}
+        for idx in range(width // 32):
+            words[offset + idx * 4] = (value >> (idx * 32)) & 0xffffffff
+
+        if self._in_transaction:
+            self._add_for_transaction(fname, addr, instance, words)
+        else:
+            self._write_words(fname, addr, {instance: words})
+
+    def _write_words(self, fname: str, addr: str, iwords: dict[int, dict[int, int]]):
+        """
+        Write 32-bit words to the memory space of TPMI feature instances.
+
+        Args:
+            fname: Name of the TPMI feature.
+            addr: PCI address of the TPMI device.
+            iwords: The words to write: {instance: {offset: word}}.
+        """
+
+        if self._mmio:
+            for instance, words in iwords.items():
+                for offset, word in words.items():
+                    physaddr = self._get_physaddr(fname, addr, instance, offset)
+                    _LOG.debug("Writing %#x to physical address %#x", word, physaddr)
+                    self._mmio.write32(addr, physaddr, word)
+        else:
+            path = self._get_debugfs_feature_path(addr, fname)
+            path = path / "mem_write"
+
+            # The 'mem_write' file accepts one "<instance>,<offset>,<value>" write at a time. Keep
+            # the file open and rewind it between writes.
+            with self._pman.open(path, "r+", su=self._use_su) as fobj:
+                first = True
+                for instance, words in iwords.items():
+                    for offset, word in words.items():
+                        if not first:
+                            fobj.seek(0)
+                        first = False
+
+                        data = f"{instance},{offset},{word:#x}"
+                        _LOG.debug("Writing '%s' to '%s'", data, path)
+                        fobj.write(data)
+
+        if self._snapshot and addr in self._snapshots.get(fname, {}):
+            _LOG.debug("Dropping 'mem_dump' snapshot of TPMI feature '%s', device '%s'",
+                       fname, addr)
+            del self._snapshots[fname][addr]
+
+    def _add_for_transaction(self, fname: str, addr: str, instance: int, words: dict[int, int]):
+        """
+        Add 32-bit words to the transaction buffer. Words written to the same offset are merged
+        (the last write wins).
+
+        Args:
+            fname: Name of the TPMI feature.
+            addr: PCI address of the TPMI device.
+            instance: The instance number of the TPMI feature.
+            words: The words to write: {offset: word}.
+        """
+
+        fbuf = self._transaction_buffer.setdefault(addr, {}).setdefault(fname, {})
+        fbuf.setdefault(instance, {}).update(words)
+
+    def _get_transaction_word(self, fname: str, addr: str, instance: int, offset: int) -> int | None:
+        """
+        Return a 32-bit word from the transaction buffer.
+
+        Args:
+            fname: Name of the TPMI feature.
+            addr: PCI address of the TPMI device.
+            instance: The instance number of the TPMI feature.
+            offset: The offset of the word within the instance memory space.
+
+        Returns:
+            The buffered word, or 'None' if the word is not in the transaction buffer.
+        """
+
+        try:
+            return self._transaction_buffer[addr][fname][instance][offset]
+        except KeyError:
+            return None
+
+    def start_transaction(self):
+        """
+        Begin a transaction to buffer TPMI register writes and merge multiple writes to the same
+        register.
+
+        When a transaction is active, all TPMI register writes are buffered and only written to
+        hardware upon calling 'commit_transaction()' or 'flush_transaction()'. Register reads return
+        the buffered values, so read-modify-write operations, such as writing several bit fields of
+        the same register, are merged into a single register write. The buffered writes are
+        flushed using a single 'mem_write' file session per TPMI feature and device. Transactions
+        do not provide atomicity or rollback. They are intended solely for optimizing I/O by
+        batching and merging writes.
+        """
+
+        if self._in_transaction:
+            raise Error("Cannot start a new TPMI transaction: A transaction is already in progress")
+
+        self._in_transaction = True
+
+    def flush_transaction(self) -> bool:
+        """
+        Flush the transaction buffer and write all buffered data to the TPMI registers. The
+        transaction does not stop after flushing.
+
+        Returns:
+            True if there was data to flush and the operation was performed, False if there was no
+            transaction data to flush or there is no transaction in progress.
+        """
+
+        if not self._in_transaction:
+            return False
+        if not self._transaction_buffer:
+            return False
+
+        _LOG.debug("Flushing the TPMI transaction buffer")
+
+        # Clear the buffer before writing, so that a write failure does not leave stale data in the
+        # buffer.
+        transaction_buffer = self._transaction_buffer
+        self._transaction_buffer = {}
+
+        for addr, fbufs in transaction_buffer.items():
+            for fname, iwords in fbufs.items():
+                self._write_words(fname, addr, iwords)
+
+        return True
+
+    def commit_transaction(self):
+        """
+        Commit the current TPMI transaction by flushing all buffered data to the TPMI registers and
+        closing the transaction.
+
+        This method does not provide atomicity guarantees. It is intended as an optimization to
+        reduce the number of TPMI I/O operations.
+        """
+
+        if not self._in_transaction:
+            raise Error("Cannot commit TPMI transaction: no transaction is currently in progress")
+
+        try:
+            flushed = self.flush_transaction()
+        finally:
+            self._in_transaction = False
+
+        if flushed:
+            _LOG.debug("TPMI transaction has been committed")
+        else:
+            _LOG.debug("TPMI transaction has been committed, but it was empty")
 
     def _get_mdmap(self, fname: str, addr: str) -> _MDMapType:
         """
@@ -1744,6 +2025,49 @@ class TPMI(ClassHelpers.SimpleCloseContext):
             fmap[addr]["mdmap"] = self._build_mdmap(addr, fname)
         return fmap[addr]["mdmap"]
 
+    def _get_physaddr(self, fname: str, addr: str, instance: int, offset: int) -> int:
+        """
+        Return the physical address of a TPMI register (MMIO mode only).
+
+        Args:
+            fname: Name of the TPMI feature.
+            addr: PCI address of the TPMI device.
+            instance: The instance number of the TPMI feature.
+            offset: The offset of the register within the instance memory space.
+
+        Returns:
+            The physical address of the register.
+        """
+
+        if fname not in self._pamaps or addr not in self._pamaps[fname]:
+            # The physical addresses map is built together with the mdmap.
+            self._get_mdmap(fname, addr)
+
+        return self._pamaps[fname][addr][instance] + offset
+
+    def _get_snapshot(self, fname: str, addr: str) -> _SnapshotType:
+        """
+        Retrieve or take the 'mem_dump' snapshot for a TPMI feature.
+
+        Args:
+            fname: Name of the TPMI feature.
+            addr: PCI address of the TPMI device.
+
+        Returns:
+            The snapshot corresponding to the given feature and address.
+        """
+
+        fsnapshots = self._snapshots.get(fname, {})
+        if addr not in fsnapshots:
+            # Building the mdmap takes the snapshot.
+            mdmap = self._build_mdmap(addr, fname)
+            fmap = self._fmaps[fname]
+            if not fmap[addr]["mdmap"]:
+                fmap[addr]["mdmap"] = mdmap
+            fsnapshots = self._snapshots[fname]
+
+        return fsnapshots[addr]
+
     def _format_addrs(self, addrs: Sequence[str]) -> str:
         """
         Format a list of TPMI device PCI addresses as a string.
@@ -2364,6 +2688,15 @@ class TPMI(ClassHelpers.SimpleCloseContext):
         self._validate_fname(fname)
         return self._get_bitfield(regval, fname, regname, bfname)
 
+    def drop_snapshots(self):
+        """
+        Drop all 'mem_dump' snapshots, so that subsequent register reads re-read the 'mem_dump'
+        files. Does nothing if the snapshot mode is disabled.
+        """
+
+        _LOG.debug("Dropping all TPMI 'mem_dump' snapshots")
+        self._snapshots = {}
+
     def write_register(self,
                        value: int,
                        fname: str,
@@ -75,22 +75,23 @@ class Uncore(_PropsClassBase.PropsClassBase):
             An instance of '_UncoreFreqSysfs.UncoreFreqSysfs'.
         """
 
-        if self._uncfreq_sysfs_err:
-            raise ErrorNotSupported(self._uncfreq_sysfs_err)
-
-        if not self._uncfreq_sysfs_obj:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import _UncoreFreqSysfs
-
-            sysfs_io = self._get_sysfs_io()
-            try:
-                obj = _UncoreFreqSysfs.UncoreFreqSysfs(self._cpuinfo, pman=self._pman,
-                                                       sysfs_io=sysfs_io,
-                                                       enable_cache=self._enable_cache)
-                self._uncfreq_sysfs_obj = obj
-            except ErrorNotSupported as err:
-                self._uncfreq_sysfs_err = str(err)
-                raise
+        with self._init_lock:
+            if self._uncfreq_sysfs_err:
+                raise ErrorNotSupported(self._uncfreq_sysfs_err)
+
+            if not self._uncfreq_sysfs_obj:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import _UncoreFreqSysfs
+
+                sysfs_io = self._get_sysfs_io()
+                try:
+                    obj = _UncoreFreqSysfs.UncoreFreqSysfs(self._cpuinfo, pman=self._pman,
+                                                           sysfs_io=sysfs_io,
+                                                           enable_cache=self._enable_cache)
+                    self._uncfreq_sysfs_obj = obj
+                except ErrorNotSupported as err:
+                    self._uncfreq_sysfs_err = str(err)
+                    raise
 
         return self._uncfreq_sysfs_obj
 
@@ -102,19 +103,20 @@ class Uncore(_PropsClassBase.PropsClassBase):
             An instance of '_UncoreFreqTPMI.UncoreFreqTpmi'.
         """
 
-        if self._uncfreq_tpmi_err:
-            raise ErrorNotSupported(self._uncfreq_tpmi_err)
+        with self._init_lock:
+            if self._uncfreq_tpmi_err:
+                raise ErrorNotSupported(self._uncfreq_tpmi_err)
 
-        if not self._uncfreq_tpmi_obj:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import _UncoreFreqTPMI
+            if not self._uncfreq_tpmi_obj:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import _UncoreFreqTPMI
 
-            try:
-                obj = _UncoreFreqTPMI.UncoreFreqTpmi(self._cpuinfo, pman=self._pman)
-                self._uncfreq_tpmi_obj = obj
-            except ErrorNotSupported as err:
-                self._uncfreq_tpmi_err = str(err)
-                raise
+                try:
+                    obj = _UncoreFreqTPMI.UncoreFreqTpmi(self._cpuinfo, pman=self._pman)
+                    self._uncfreq_tpmi_obj = obj
+                except ErrorNotSupported as err:
+                    self._uncfreq_tpmi_err = str(err)
+                    raise
 
         return self._uncfreq_tpmi_obj
 
@@ -50,6 +50,8 @@ class CPPCSysfs(ClassHelpers.SimpleCloseContext):
         - 'get_highest_perf()' - get highest performance level for CPUs.
     2. Frequency read methods.
         - 'get_nominal_freq()' - get nominal frequency for CPUs.
+    3. Read planning.
+        - 'get_prefetch_paths()' - get sysfs file paths a getter method will read.
 
     Notes:
         - Methods do not validate the 'cpus' argument. The caller must validate CPU numbers.
@@ -191,6 +193,27 @@ class CPPCSysfs(ClassHelpers.SimpleCloseContext):
             cpu = self._extract_cpu_from_path(err.path)
             raise ErrorPerCPUPath(str(err), cpu=cpu, path=err.path) from err
 
+    def get_prefetch_paths(self, getter: str, cpus: Sequence[int]) -> Generator[Path, None, None]:
+        """
+        Yield the sysfs file paths a getter method will read for the specified CPUs. The paths can
+        be passed to 'SysfsIO.prefetch()' to read them in advance in a single I/O operation.
+
+        Args:
+            getter: Name of the getter method without the "get_" prefix (e.g., "nominal_perf" for
+                    'get_nominal_perf()').
+            cpus: CPU numbers to yield the sysfs file paths for.
+
+        Yields:
+            Sysfs file paths.
+        """
+
+        plname, _, kind = getter.rpartition("_")
+        if plname not in _PERF_LEVEL_NAMES or kind not in ("perf", "freq"):
+            raise Error(f"BUG: Unsupported getter '{getter}'")
+
+        for cpu in cpus:
+            yield self._get_sysfs_path(cpu, getter)
+
     def _get_perf_level(self,
                         plname: PerfLevelNameType,
                         cpus: Sequence[int]) -> Generator[tuple[int, int], None, None]:
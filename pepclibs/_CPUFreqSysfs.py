@@ -37,6 +37,10 @@ if typing.TYPE_CHECKING:
     #   - "current": a current CPU frequency file
     _SysfsFileType = Literal["min", "max", "current"]
 
+    # Names of the getter methods (without the "get_" prefix) supporting prefetching.
+    _PrefetchGetterType = Literal["min_freq", "max_freq", "min_freq_limit", "max_freq_limit",
+                                  "governor", "available_governors"]
+
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
 
 class CPUFreqSysfs(ClassHelpers.SimpleCloseContext):
@@ -66,6 +70,8 @@ class CPUFreqSysfs(ClassHelpers.SimpleCloseContext):
         - 'get_governor()' - get CPU frequency governor.
         - 'get_available_governors()' - get available governors.
         - 'set_governor()' - set CPU frequency governor.
+    5. Read planning.
+        - 'get_prefetch_paths()' - get sysfs file paths a getter method will read.
 
     Notes:
         - Methods do not validate the 'cpus' argument. The caller must validate CPU numbers.
@@ -330,6 +336,36 @@ class CPUFreqSysfs(ClassHelpers.SimpleCloseContext):
             cpu = self._extract_cpu_from_path(err.path, "policy")
             raise ErrorPerCPUPath(str(err), cpu=cpu, path=err.path) from err
 
+    def get_prefetch_paths(self,
+                           getter: _PrefetchGetterType,
+                           cpus: Sequence[int]) -> Generator[Path, None, None]:
+        """
+        Yield the sysfs file paths a getter method will read for the specified CPUs. The paths can
+        be passed to 'SysfsIO.prefetch()' to read them in advance in a single I/O operation.
+
+        Args:
+            getter: Name of the getter method without the "get_" prefix (e.g., "min_freq" for
+                    'get_min_freq()').
+            cpus: CPU numbers to yield the sysfs file paths for.
+
+        Yields:
+            Sysfs file paths.
+        """
+
+        if getter in ("min_freq", "max_freq", "min_freq_limit", "max_freq_limit"):
+            ftype: _SysfsFileType = "min" if getter.startswith("min") else "max"
+            limit = getter.endswith("_limit")
+            for cpu in cpus:
+                yield self._get_cpu_freq_sysfs_path(ftype, cpu, limit=limit)
+        elif getter == "governor":
+            for cpu in cpus:
+                yield self._get_policy_sysfs_path(cpu, "scaling_governor")
+        elif getter == "available_governors":
+            for cpu in cpus:
+                yield self._get_policy_sysfs_path(cpu, "scaling_available_governors")
+        else:
+            raise Error(f"BUG: Unsupported getter '{getter}'")
+
     def get_min_freq(self, cpus: Sequence[int]) -> Generator[tuple[int, int], None, None]:
         """
         Retrieve and yield the minimum CPU frequency for specified CPUs.
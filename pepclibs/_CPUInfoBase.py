@@ -14,16 +14,17 @@ Provide the base class for the 'CPUInfo.CPUInfo' class.
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import typing
+import threading
 import contextlib
 from pathlib import Path
-from pepclibs import CPUModels, ProcCpuinfo
+from pepclibs import CPUModels, ProcCpuinfo, _TopologyCache, _TopologyTable
 from pepclibs.helperlibs import Logging, LocalProcessManager, ClassHelpers, Trivial
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported, ErrorNotFound
 
 from pepclibs.CPUInfoVars import SCOPE_NAMES
 
 if typing.TYPE_CHECKING:
-    from typing import Iterable, Literal
+    from typing import Any, Iterable, Literal
     from pepclibs import _DieInfo, _SysfsIO
     from pepclibs.ProcCpuinfo import ProcCpuinfoTypedDict, ProcCpuinfoPerCPUTypedDict
     from pepclibs.helperlibs.ProcessManager import ProcessManagerType
@@ -52,6 +53,10 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
 
         _LOG.debug("Initializing the '%s' class object", self.__class__.__name__)
 
+        # Serializes building and clearing of the lazily built CPU information (topology, online
+        # CPUs, etc.), so that the object can be used from multiple threads.
+        self._lock = threading.RLock()
+
         self._cpudescr = ""
         self._is_hybrid: bool | None = None
         self._hybrid_cpus: dict[HybridCPUKeyType, list[int]] = {}
@@ -74,29 +79,14 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
         self._cpu_sysfs_base = Path("/sys/devices/system/cpu")
         self._sysfs_io: _SysfsIO.SysfsIO | None = None
 
-        # The topology dictionary.
-        self._topology: dict[ScopeNameType, list[dict[ScopeNameType, int]]] = {}
+        # The columnar topology table, the primary storage of the CPU topology information.
+        self._topo_table: _TopologyTable.TopologyTable | None = None
 
         # Topology scopes that have been already initialized.
         self._initialized_snames: set[ScopeNameType] = set()
 
-        # CPU to topology line cache for O(1) lookups.
-        self._cpu_to_tline: dict[int, dict[ScopeNameType, int]] = {}
-
-        # Sibling index caches: CPU -> sibling index within core/module.
-        self._cpu_to_core_index: dict[int, int] = {}
-        self._cpu_to_module_index: dict[int, int] = {}
-
-        # Core and die to CPU numbers caches: package -> core/die -> frozenset of CPU numbers.
-        # Core and die numbers are not globally unique, they are per-package.
-        self._core_to_cpus: dict[int, dict[int, frozenset[int]]] = {}
-        self._die_to_cpus: dict[int, dict[int, frozenset[int]]] = {}
-
-        # Module, node, and package to CPU numbers caches: module/node/package -> frozenset of
-        # CPU numbers. Module, node, and package numbers are globally unique.
-        self._module_to_cpus: dict[int, frozenset[int]] = {}
-        self._node_to_cpus: dict[int, frozenset[int]] = {}
-        self._package_to_cpus: dict[int, frozenset[int]] = {}
+        # The topology dictionary, derived from the topology table on demand.
+        self._topology: dict[ScopeNameType, list[dict[ScopeNameType, int]]] = {}
 
         # Scope name to its index number.
         self._sname2idx: dict[ScopeNameType, int]
@@ -137,11 +127,27 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
         self._proc_cpuinfo: ProcCpuinfoTypedDict = {}
         self._proc_percpuinfo: ProcCpuinfoPerCPUTypedDict = {}
 
+        # Count of CPU hotplug events reported via 'cpus_hotplugged()'. Lets users holding per-CPU
+        # resources (e.g., open MSR device file descriptors) detect that CPUs may have come and
+        # gone.
+        self._hotplug_count = 0
+
+        # The on-disk topology cache object. Stays 'None' if the cache is disabled, not loaded yet,
+        # or not usable.
+        self._topo_cache: _TopologyCache.TopologyCache | None = None
+        # Whether an attempt to load the on-disk topology cache has already been made.
+        self._topo_cache_loaded = False
+        # The data loaded from the on-disk topology cache.
+        self._topo_cache_data: dict[str, Any] = {}
+
     def close(self):
         """Uninitialize the class instance."""
 
         _LOG.debug("Closing the '%s' class object", self.__class__.__name__)
 
+        if self._topo_cache:
+            self._save_topology_cache()
+
         ClassHelpers.close(self, close_attrs=("_sysfs_io", "_dieinfo", "_pman"))
 
     def _validate_sname(self, sname: ScopeNameType, name: str = "scope name") -> None:
@@ -165,15 +171,146 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             An instance of '_SysfsIO.SysfsIO'.
         """
 
-        if not self._sysfs_io:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import _SysfsIO
+        with self._lock:
+            if not self._sysfs_io:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import _SysfsIO
+
+                # No writes are expected, and reads do not need caching because every file is read
+                # at most once.
+                self._sysfs_io = _SysfsIO.SysfsIO(self._pman, enable_cache=False, read_only=True)
+
+            return self._sysfs_io
+
+    def _import_topology_cache(self, data: dict[str, Any]):
+        """
+        Initialize the internal data structures from the on-disk topology cache data.
+
+        Args:
+            data: The data loaded from the on-disk topology cache.
+
+        Notes:
+            - The data is converted first, and the internal data structures are updated only if
+              the conversion succeeded.
+        """
+
+        proc_cpuinfo: ProcCpuinfoTypedDict = {}
+        proc_percpuinfo: ProcCpuinfoPerCPUTypedDict = {}
+        snames: list[ScopeNameType] = []
+        topo_table: _TopologyTable.TopologyTable | None = None
+
+        if "proc_cpuinfo" in data:
+            proc_cpuinfo = data["proc_cpuinfo"]
+
+        if "proc_percpuinfo" in data:
+            cached = data["proc_percpuinfo"]
+            # Flags are usually the same for all CPUs, so they are stored as a list of unique flag
+            # sets and a CPU to flag set index map.
+            flagsets = [frozenset(flags) for flags in cached["flagsets"]]
+            proc_percpuinfo["flags"] = {int(cpu): flagsets[idx]
+                                        for cpu, idx in cached["flags"].items()}
+            proc_percpuinfo["topology"] = {int(pkg): {int(core): cpus
+                                                      for core, cpus in cores.items()}
+                                           for pkg, cores in cached["topology"].items()}
+
+        if "topology" in data:
+            snames = data["topology"]["snames"]
+            for sname in snames:
+                self._validate_sname(sname)
+            topo_table = _TopologyTable.TopologyTable(data["topology"]["tlines"], snames)
+
+        if proc_cpuinfo:
+            self._proc_cpuinfo = proc_cpuinfo
+        if proc_percpuinfo:
+            self._proc_percpuinfo = proc_percpuinfo
+        if topo_table:
+            self._initialized_snames = set(topo_table.snames)
+            self._topo_table = topo_table
+
+        if self._dieinfo and "dieinfo" in data:
+            self._dieinfo.set_cache_data(data["dieinfo"])
+
+    def _load_topology_cache(self):
+        """
+        Load the on-disk topology cache, if it is enabled and valid for the target host. Do nothing
+        if the cache has already been loaded.
+        """
+
+        with self._lock:
+            if self._topo_cache_loaded:
+                return
+
+            self._topo_cache_loaded = True
+
+            cache_dir = _TopologyCache.get_cache_dir()
+            if not cache_dir:
+                return
+
+            topo_cache = _TopologyCache.TopologyCache(self._pman, self._get_sysfs_io(), cache_dir)
+
+            try:
+                data = topo_cache.load()
+            except Error as err:
+                _LOG.debug("Topology cache is not available%s:\n%s",
+                           self._pman.hostmsg, err.indent(2))
+                return
+
+            self._topo_cache = topo_cache
+
+            # The online CPUs list is a part of the cache validation key, no need to read it again.
+            if not self._cpus:
+                what = f"online CPUs list{self._pman.hostmsg}"
+                self._cpus = Trivial.split_csv_line_int(topo_cache.key["online"], what=what)
+
+            if not data:
+                return
+
+            try:
+                self._import_topology_cache(data)
+            except (Error, KeyError, TypeError, ValueError, IndexError, AttributeError) as err:
+                _LOG.debug("Ignoring bad topology cache data: %s", err)
+                return
 
-            # No writes are expected, and reads do not need caching because every file is read at
-            # most once.
-            self._sysfs_io = _SysfsIO.SysfsIO(self._pman, enable_cache=False, read_only=True)
+            self._topo_cache_data = data
 
-        return self._sysfs_io
+    def _save_topology_cache(self):
+        """Save the information built so far to the on-disk topology cache."""
+
+        with self._lock:
+            if not self._topo_cache:
+                return
+
+            # Start with the loaded data to preserve the parts that were not needed this time.
+            data = dict(self._topo_cache_data)
+
+            if self._proc_cpuinfo:
+                data["proc_cpuinfo"] = dict(self._proc_cpuinfo)
+
+            if self._proc_percpuinfo:
+                flagsets: dict[frozenset[str], int] = {}
+                flags: dict[str, int] = {}
+                for cpu, cpu_flags in self._proc_percpuinfo["flags"].items():
+                    flags[str(cpu)] = flagsets.setdefault(cpu_flags, len(flagsets))
+
+                data["proc_percpuinfo"] = {
+                    "flagsets": [sorted(cpu_flags) for cpu_flags in flagsets],
+                    "flags": flags,
+                    "topology": {str(pkg): {str(core): cpus for core, cpus in cores.items()}
+                                 for pkg, cores in self._proc_percpuinfo["topology"].items()},
+                }
+
+            if self._topo_table:
+                snames = [sname for sname in SCOPE_NAMES if sname in self._topo_table.snames]
+                data["topology"] = {"snames": snames,
+                                    "tlines": self._topo_table.get_tlines(snames)}
+
+            if self._dieinfo:
+                dieinfo_data = self._dieinfo.get_cache_data()
+                if dieinfo_data:
+                    data["dieinfo"] = dieinfo_data
+
+            if data != self._topo_cache_data:
+                self._topo_cache.save(data)
 
     def get_proc_cpuinfo(self) -> ProcCpuinfoTypedDict:
         """
@@ -183,9 +320,18 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             The general '/proc/cpuinfo' information dictionary.
         """
 
-        if not self._proc_cpuinfo:
-            self._proc_cpuinfo = ProcCpuinfo.get_proc_cpuinfo(self._pman)
-        return self._proc_cpuinfo
+        with self._lock:
+            self._load_topology_cache()
+
+            if not self._proc_cpuinfo:
+                if not self._proc_percpuinfo:
+                    # Per-CPU information is needed in most cases too, read '/proc/cpuinfo' only
+                    # once.
+                    self._proc_cpuinfo, self._proc_percpuinfo = \
+                                                ProcCpuinfo.get_proc_cpuinfo_all(self._pman)
+                else:
+                    self._proc_cpuinfo = ProcCpuinfo.get_proc_cpuinfo(self._pman)
+            return self._proc_cpuinfo
 
     def get_proc_percpuinfo(self) -> ProcCpuinfoPerCPUTypedDict:
         """
@@ -195,9 +341,16 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             The per-CPU '/proc/cpuinfo' topology information dictionary.
         """
 
-        if not self._proc_percpuinfo:
-            self._proc_percpuinfo = ProcCpuinfo.get_proc_percpuinfo(self._pman)
-        return self._proc_percpuinfo
+        with self._lock:
+            self._load_topology_cache()
+
+            if not self._proc_percpuinfo:
+                if not self._proc_cpuinfo:
+                    self._proc_cpuinfo, self._proc_percpuinfo = \
+                                                ProcCpuinfo.get_proc_cpuinfo_all(self._pman)
+                else:
+                    self._proc_percpuinfo = ProcCpuinfo.get_proc_percpuinfo(self._pman)
+            return self._proc_percpuinfo
 
     def get_dieinfo(self) -> _DieInfo.DieInfo:
         """
@@ -207,27 +360,33 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             An instance of '_DieInfo.DieInfo' object.
         """
 
-        if self._dieinfo:
-            return self._dieinfo
+        with self._lock:
+            self._load_topology_cache()
+
+            if self._dieinfo:
+                return self._dieinfo
 
-        if self._dieinfo_errmsg:
-            raise ErrorNotSupported(self._dieinfo_errmsg)
+            if self._dieinfo_errmsg:
+                raise ErrorNotSupported(self._dieinfo_errmsg)
 
-        _LOG.debug("Creating an instance of '_DieInfo.DieInfo'")
+            _LOG.debug("Creating an instance of '_DieInfo.DieInfo'")
 
-        # pylint: disable-next=import-outside-toplevel
-        from pepclibs import _DieInfo
+            # pylint: disable-next=import-outside-toplevel
+            from pepclibs import _DieInfo
 
-        proc_cpuinfo = self.get_proc_cpuinfo()
+            proc_cpuinfo = self.get_proc_cpuinfo()
 
-        try:
-            self._dieinfo = _DieInfo.DieInfo(pman=self._pman, proc_cpuinfo=proc_cpuinfo)
-        except Exception as err:
-            self._dieinfo_errmsg = str(err)
-            _LOG.debug(self._dieinfo_errmsg)
-            raise
+            try:
+                self._dieinfo = _DieInfo.DieInfo(pman=self._pman, proc_cpuinfo=proc_cpuinfo)
+            except Exception as err:
+                self._dieinfo_errmsg = str(err)
+                _LOG.debug(self._dieinfo_errmsg)
+                raise
 
-        return self._dieinfo
+            if "dieinfo" in self._topo_cache_data:
+                self._dieinfo.set_cache_data(self._topo_cache_data["dieinfo"])
+
+            return self._dieinfo
 
     def _add_cores_and_packages(self,
                                 cpu_tdict: dict[int, dict[ScopeNameType, int]],
@@ -418,18 +577,6 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
                 with contextlib.suppress(KeyError):
                     cpu_tdict[cpu]["node"] = node
 
-    def _sort_topology(self, tlines: list[dict[ScopeNameType, int]], order: ScopeNameType):
-        """
-        Sort and save the topology list by 'order' in sorting map.
-
-        Args:
-            tlines: List of topology line dictionaries to sort.
-            order: Scope name to use for sorting order.
-        """
-
-        skeys = self._sorting_map[order]
-        self._topology[order] = sorted(tlines, key=lambda tline: tuple(tline[s] for s in skeys))
-
     def _get_topology(self,
                       snames: Iterable[ScopeNameType],
                       order: ScopeNameType = "CPU") -> list[dict[ScopeNameType, int]]:
@@ -447,50 +594,26 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             - The topology table is a list of topology lines.
             - Each topology line is a dictionary where keys are scope names and values are the
               corresponding scope numbers (e.g., CPU numbers, core numbers, etc.).
+            - The list is derived from the columnar topology table, which is the primary storage.
         """
 
-        snames_set = set(snames)
-        snames_set.update(set(self._sorting_map[order]))
-        snames_set -= self._initialized_snames
-
-        if not snames_set:
-            # The topology for the necessary scopes has already been built, just return it.
-            return self._topology[order]
-
-        _LOG.debug("Building CPU topology for scopes %s, order '%s'", ", ".join(snames), order)
-
-        # A preliminary CPU topology dictionary. The keys are CPU numbers, and the values are the
-        # topology lines.
-        cpu_tdict: dict[int, dict[ScopeNameType, int]]
-
-        cpus = self._get_online_cpus()
-
-        if not self._topology:
-            cpu_tdict = {cpu: {"CPU": cpu} for cpu in cpus}
-        else:
-            cpu_tdict = {}
-            for tline in self._topology["CPU"]:
-                cpu_tdict[tline["CPU"]] = tline
-
-        tlines = list(cpu_tdict.values())
-
-        if "CPU" not in self._initialized_snames or "core" not in self._initialized_snames or \
-           "package" not in self._initialized_snames:
-            self._add_cores_and_packages(cpu_tdict, cpus)
-            snames_set.update({"CPU", "core", "package"})
+        with self._lock:
+            skeys = self._sorting_map[order]
+            topo_table = self._get_topology_table(set(snames) | set(skeys))
 
-        if "module" in snames_set:
-            self._add_modules(cpu_tdict, cpus)
-        if "die" in snames_set:
-            self._add_compute_dies(cpu_tdict)
-        if "node" in snames_set:
-            self._add_nodes(cpu_tdict)
+            if order in self._topology:
+                return self._topology[order]
 
-        self._initialized_snames.update(snames_set)
-        for level in self._initialized_snames:
-            self._sort_topology(tlines, level)
+            # Topology lines are shared between the lists of different orders.
+            if self._topology:
+                tlines = next(iter(self._topology.values()))
+            else:
+                tlines = topo_table.get_tlines([sname for sname in SCOPE_NAMES
+                                                if sname in topo_table.snames])
 
-        return self._topology[order]
+            self._topology[order] = sorted(tlines,
+                                           key=lambda tline: tuple(tline[s] for s in skeys))
+            return self._topology[order]
 
     def _get_scope_nums_cache(self,
                               sname: ScopeNameType,
@@ -516,39 +639,43 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             When order="package", the list would be [0, 2, 4, 6, 1, 3, 5, 7] instead.
         """
 
-        if sname in self._scope_nums_cache:
-            if parent_sname in self._scope_nums_cache[sname]:
-                if order in self._scope_nums_cache[sname][parent_sname]:
-                    # Already cached.
-                    return self._scope_nums_cache[sname][parent_sname][order]
+        with self._lock:
+            if sname in self._scope_nums_cache:
+                if parent_sname in self._scope_nums_cache[sname]:
+                    if order in self._scope_nums_cache[sname][parent_sname]:
+                        # Already cached.
+                        return self._scope_nums_cache[sname][parent_sname][order]
 
-        # Build the cache by walking topology once.
-        parent_to_child_dict: dict[int, dict[int, None]] = {}
-        all_nums_dict: dict[int, None] = {}  # To deduplicate while preserving order.
+            # Build the cache by walking the topology table once. The table sorts CPUs the same way
+            # as the sorting map does.
+            parent_to_child_dict: dict[int, dict[int, None]] = {}
+            all_nums_dict: dict[int, None] = {}  # To deduplicate while preserving order.
 
-        for tline in self._get_topology((parent_sname, sname), order=order):
-            parent_num = tline[parent_sname]
-            child_num = tline[sname]
+            topo_table = self._get_topology_table((parent_sname, sname, order))
+            for cpu in topo_table.get_cpus(order):
+                tline = topo_table.get_tline(cpu, (parent_sname, sname))
+                parent_num = tline[parent_sname]
+                child_num = tline[sname]
 
-            if parent_num not in parent_to_child_dict:
-                parent_to_child_dict[parent_num] = {}
-            parent_to_child_dict[parent_num][child_num] = None
-            all_nums_dict[child_num] = None
+                if parent_num not in parent_to_child_dict:
+                    parent_to_child_dict[parent_num] = {}
+                parent_to_child_dict[parent_num][child_num] = None
+                all_nums_dict[child_num] = None
 
-        # Convert to final format.
-        parent_to_child: dict[int, list[int]] = {}
-        for parent_num, children_dict in parent_to_child_dict.items():
-            parent_to_child[parent_num] = list(children_dict.keys())
+            # Convert to final format.
+            parent_to_child: dict[int, list[int]] = {}
+            for parent_num, children_dict in parent_to_child_dict.items():
+                parent_to_child[parent_num] = list(children_dict.keys())
 
-        all_nums = list(all_nums_dict.keys())
+            all_nums = list(all_nums_dict.keys())
 
-        if sname not in self._scope_nums_cache:
-            self._scope_nums_cache[sname] = {}
-        if parent_sname not in self._scope_nums_cache[sname]:
-            self._scope_nums_cache[sname][parent_sname] = {}
-        self._scope_nums_cache[sname][parent_sname][order] = (parent_to_child, all_nums)
+            if sname not in self._scope_nums_cache:
+                self._scope_nums_cache[sname] = {}
+            if parent_sname not in self._scope_nums_cache[sname]:
+                self._scope_nums_cache[sname][parent_sname] = {}
+            self._scope_nums_cache[sname][parent_sname][order] = (parent_to_child, all_nums)
 
-        return (parent_to_child, all_nums)
+            return (parent_to_child, all_nums)
 
     def _get_scope_nums(self,
                         sname: ScopeNameType,
@@ -651,170 +778,62 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
         # Filter all_nums to only include valid children (preserves order).
         return [num for num in all_nums if num in valid_children]
 
-    def _get_cpu_to_core_index_cache(self) -> dict[int, int]:
-        """
-        Get or build the CPU-to-core-sibling-index cache.
-
-        Returns:
-            Dictionary mapping CPU numbers to their core sibling index.
-        """
-
-        if self._cpu_to_core_index:
-            return self._cpu_to_core_index
-
-        self._get_topology(("CPU", "core", "package"), order="core")
-
-        core = pkg = index = -1
-
-        for tline in self._topology["core"]:
-            cpu = tline["CPU"]
-            if tline["core"] != core or tline["package"] != pkg:
-                core = tline["core"]
-                pkg = tline["package"]
-                index = 0
-            self._cpu_to_core_index[cpu] = index
-            index += 1
-
-        return self._cpu_to_core_index
-
-    def _get_cpu_to_module_index_cache(self) -> dict[int, int]:
-        """
-        Get or build the CPU-to-module-sibling-index cache.
-
-        Returns:
-            Dictionary mapping CPU numbers to their module sibling index.
-        """
-
-        if self._cpu_to_module_index:
-            return self._cpu_to_module_index
-
-        self._get_topology(("CPU", "module", "package"), order="module")
-
-        module = pkg = index = -1
-
-        for tline in self._topology["module"]:
-            cpu = tline["CPU"]
-            if tline["module"] != module or tline["package"] != pkg:
-                module = tline["module"]
-                pkg = tline["package"]
-                index = 0
-            self._cpu_to_module_index[cpu] = index
-            index += 1
-
-        return self._cpu_to_module_index
-
-    def _get_core_to_cpus_cache(self) -> dict[int, dict[int, frozenset[int]]]:
-        """
-        Get or build the core-to-CPU-numbers cache.
-
-        Returns:
-            Dictionary mapping package numbers to dictionaries that map core numbers to
-            frozensets of CPU numbers.
-        """
-
-        if self._core_to_cpus:
-            return self._core_to_cpus
-
-        self._get_topology(("CPU", "core", "package"), order="core")
-
-        for tline in self._topology["core"]:
-            pkg = tline["package"]
-            core = tline["core"]
-            if pkg not in self._core_to_cpus:
-                self._core_to_cpus[pkg] = {}
-            if core not in self._core_to_cpus[pkg]:
-                self._core_to_cpus[pkg][core] = frozenset()
-            self._core_to_cpus[pkg][core] |= {tline["CPU"]}
-
-        return self._core_to_cpus
-
-    def _get_die_to_cpus_cache(self) -> dict[int, dict[int, frozenset[int]]]:
-        """
-        Get or build the die-to-CPU-numbers cache.
-
-        Returns:
-            Dictionary mapping package numbers to dictionaries that map die numbers to
-            frozensets of CPU numbers.
-        """
-
-        if self._die_to_cpus:
-            return self._die_to_cpus
-
-        self._get_topology(("CPU", "die", "package"), order="die")
-
-        for tline in self._topology["die"]:
-            pkg = tline["package"]
-            die = tline["die"]
-            if pkg not in self._die_to_cpus:
-                self._die_to_cpus[pkg] = {}
-            if die not in self._die_to_cpus[pkg]:
-                self._die_to_cpus[pkg][die] = frozenset()
-            self._die_to_cpus[pkg][die] |= {tline["CPU"]}
-
-        return self._die_to_cpus
-
-    def _get_module_to_cpus_cache(self) -> dict[int, frozenset[int]]:
-        """
-        Get or build the module-to-CPU-numbers cache.
-
-        Returns:
-            Dictionary mapping module numbers to frozensets of CPU numbers.
+    def _get_topology_table(self,
+                            snames: Iterable[ScopeNameType]) -> _TopologyTable.TopologyTable:
         """
+        Build and return the columnar topology table including the specified scopes.
 
-        if self._module_to_cpus:
-            return self._module_to_cpus
-
-        self._get_topology(("CPU", "module"), order="module")
-
-        for tline in self._topology["module"]:
-            module = tline["module"]
-            if module not in self._module_to_cpus:
-                self._module_to_cpus[module] = frozenset()
-            self._module_to_cpus[module] |= {tline["CPU"]}
-
-        return self._module_to_cpus
-
-    def _get_node_to_cpus_cache(self) -> dict[int, frozenset[int]]:
-        """
-        Get or build the node-to-CPU-numbers cache.
+        Args:
+            snames: Scope names that the table should include.
 
         Returns:
-            Dictionary mapping node numbers to frozensets of CPU numbers.
+            The columnar topology table.
         """
 
-        if self._node_to_cpus:
-            return self._node_to_cpus
-
-        self._get_topology(("CPU", "node"), order="node")
-
-        for tline in self._topology["node"]:
-            node = tline["node"]
-            if node not in self._node_to_cpus:
-                self._node_to_cpus[node] = frozenset()
-            self._node_to_cpus[node] |= {tline["CPU"]}
+        with self._lock:
+            self._load_topology_cache()
 
-        return self._node_to_cpus
+            snames_set = set(snames)
+            if self._topo_table and self._topo_table.snames.issuperset(snames_set):
+                return self._topo_table
 
-    def _get_package_to_cpus_cache(self) -> dict[int, frozenset[int]]:
-        """
-        Get or build the package-to-CPU-numbers cache.
+            snames_set -= self._initialized_snames
 
-        Returns:
-            Dictionary mapping package numbers to frozensets of CPU numbers.
-        """
+            _LOG.debug("Building CPU topology for scopes %s", ", ".join(sorted(snames_set)))
 
-        if self._package_to_cpus:
-            return self._package_to_cpus
+            # A preliminary CPU topology dictionary. The keys are CPU numbers, and the values are
+            # the topology lines.
+            cpu_tdict: dict[int, dict[ScopeNameType, int]]
 
-        self._get_topology(("CPU", "package"), order="package")
+            cpus = self._get_online_cpus()
 
-        for tline in self._topology["package"]:
-            package = tline["package"]
-            if package not in self._package_to_cpus:
-                self._package_to_cpus[package] = frozenset()
-            self._package_to_cpus[package] |= {tline["CPU"]}
-
-        return self._package_to_cpus
+            if not self._topo_table:
+                cpu_tdict = {cpu: {"CPU": cpu} for cpu in cpus}
+            else:
+                tlines = self._topo_table.get_tlines(self._topo_table.snames)
+                cpu_tdict = {tline["CPU"]: tline for tline in tlines}
+
+            # The '_add_*()' methods may add offline CPUs to 'cpu_tdict', include only the online
+            # CPUs to the table.
+            tlines = list(cpu_tdict.values())
+
+            if "CPU" not in self._initialized_snames or "core" not in self._initialized_snames or \
+               "package" not in self._initialized_snames:
+                self._add_cores_and_packages(cpu_tdict, cpus)
+                snames_set.update({"CPU", "core", "package"})
+
+            if "module" in snames_set:
+                self._add_modules(cpu_tdict, cpus)
+            if "die" in snames_set:
+                self._add_compute_dies(cpu_tdict)
+            if "node" in snames_set:
+                self._add_nodes(cpu_tdict)
+
+            self._initialized_snames.update(snames_set)
+            self._topo_table = _TopologyTable.TopologyTable(tlines, self._initialized_snames)
+            # The topology lists lack the newly added scopes, they will be re-derived on demand.
+            self._topology = {}
+            return self._topo_table
 
     def _read_range(self, path: Path | str) -> list[int]:
         """
@@ -843,10 +862,11 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             A list containing the online CPU numbers sorted in ascending order.
         """
 
-        if not self._cpus:
-            self._cpus = self._read_range(f"{self._cpu_sysfs_base}/online")
+        with self._lock:
+            if not self._cpus:
+                self._cpus = self._read_range(f"{self._cpu_sysfs_base}/online")
 
-        return self._cpus
+            return self._cpus
 
     def _get_online_cpus_set(self) -> set[int]:
         """
@@ -856,10 +876,11 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             A set containing the online CPU numbers.
         """
 
-        if not self._cpus_set:
-            self._cpus_set = set(self._get_online_cpus())
+        with self._lock:
+            if not self._cpus_set:
+                self._cpus_set = set(self._get_online_cpus())
 
-        return self._cpus_set
+            return self._cpus_set
 
     def _get_all_cpus(self) -> list[int]:
         """
@@ -869,10 +890,11 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             A list containing all CPU numbers present in the system, sorted in ascending order.
         """
 
-        if not self._all_cpus:
-            self._all_cpus = self._read_range(f"{self._cpu_sysfs_base}/present")
+        with self._lock:
+            if not self._all_cpus:
+                self._all_cpus = self._read_range(f"{self._cpu_sysfs_base}/present")
 
-        return self._all_cpus
+            return self._all_cpus
 
     def _get_all_cpus_set(self) -> set[int]:
         """
@@ -882,10 +904,11 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             A set containing all CPU numbers present in the system.
         """
 
-        if not self._all_cpus_set:
-            self._all_cpus_set = set(self._get_all_cpus())
+        with self._lock:
+            if not self._all_cpus_set:
+                self._all_cpus_set = set(self._get_all_cpus())
 
-        return self._all_cpus_set
+            return self._all_cpus_set
 
     def _probe_lpe_cores_l3(self):
         """
@@ -946,19 +969,20 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             - For supported Intel CPUs, includes the codename.
         """
 
-        if not self._cpudescr:
-            proc_cpuinfo = self.get_proc_cpuinfo()
-            vendor, _, _ = CPUModels.split_vfm(proc_cpuinfo["vfm"])
-            if vendor == CPUModels.VENDOR_INTEL:
-                cpudescr = f"Intel processor model {proc_cpuinfo['model']:#x}"
-                for info in CPUModels.MODELS.values():
-                    if info["vfm"] == proc_cpuinfo["vfm"]:
-                        cpudescr += f" (codename: {info['codename']})"
-                        break
-            else:
-                cpudescr = proc_cpuinfo["modelname"]
-            self._cpudescr = cpudescr
-        return self._cpudescr
+        with self._lock:
+            if not self._cpudescr:
+                proc_cpuinfo = self.get_proc_cpuinfo()
+                vendor, _, _ = CPUModels.split_vfm(proc_cpuinfo["vfm"])
+                if vendor == CPUModels.VENDOR_INTEL:
+                    cpudescr = f"Intel processor model {proc_cpuinfo['model']:#x}"
+                    for info in CPUModels.MODELS.values():
+                        if info["vfm"] == proc_cpuinfo["vfm"]:
+                            cpudescr += f" (codename: {info['codename']})"
+                            break
+                else:
+                    cpudescr = proc_cpuinfo["modelname"]
+                self._cpudescr = cpudescr
+            return self._cpudescr
 
     def is_hybrid(self) -> bool:
         """
@@ -968,9 +992,10 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             True if the CPU is a hybrid processor, False otherwise.
         """
 
-        if self._is_hybrid is None:
-            self._is_hybrid = self._pman.exists("/sys/devices/cpu_atom/cpus")
-        return self._is_hybrid
+        with self._lock:
+            if self._is_hybrid is None:
+                self._is_hybrid = self._pman.exists("/sys/devices/cpu_atom/cpus")
+            return self._is_hybrid
 
     def _get_hybrid_cpus(self) -> dict[HybridCPUKeyType, list[int]]:
         """
@@ -984,21 +1009,23 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             - Dictionary values are the corresponding CPU numbers.
         """
 
-        if self._hybrid_cpus:
-            return self._hybrid_cpus
+        with self._lock:
+            if self._hybrid_cpus:
+                return self._hybrid_cpus
 
-        _LOG.debug("Reading hybrid CPUs information from sysfs")
+            _LOG.debug("Reading hybrid CPUs information from sysfs")
 
-        iterator: dict[HybridCPUKeyType, str] = {"ecore": "atom", "pcore": "core",
-                                                 "lpecore": "lowpower"}
-        for hybrid_type, arch in iterator.items():
-            with contextlib.suppress(ErrorNotFound):
-                self._hybrid_cpus[hybrid_type] = self._read_range(f"/sys/devices/cpu_{arch}/cpus")
+            iterator: dict[HybridCPUKeyType, str] = {"ecore": "atom", "pcore": "core",
+                                                     "lpecore": "lowpower"}
+            for hybrid_type, arch in iterator.items():
+                with contextlib.suppress(ErrorNotFound):
+                    path = f"/sys/devices/cpu_{arch}/cpus"
+                    self._hybrid_cpus[hybrid_type] = self._read_range(path)
 
-        if "lpecore" not in self._hybrid_cpus:
-            self._probe_lpe_cores_l3()
+            if "lpecore" not in self._hybrid_cpus:
+                self._probe_lpe_cores_l3()
 
-        return self._hybrid_cpus
+            return self._hybrid_cpus
 
     def cpus_hotplugged(self):
         """
@@ -1012,22 +1039,32 @@ class CPUInfoBase(ClassHelpers.SimpleCloseContext):
             only the affected parts should be updated.
         """
 
-        _LOG.debug("Clearing cached CPU information")
-        self._cpus = []
-        self._cpus_set = set()
-        self._hybrid_cpus = {}
-        self._initialized_snames = set()
-        self._topology = {}
-        self._cpu_to_tline = {}
-        self._cpu_to_core_index = {}
-        self._cpu_to_module_index = {}
-        self._core_to_cpus = {}
-        self._die_to_cpus = {}
-        self._module_to_cpus = {}
-        self._node_to_cpus = {}
-        self._package_to_cpus = {}
-        self._scope_nums_cache = {}
-        self._proc_percpuinfo = {}
-
-        if self._dieinfo:
-            self._dieinfo.cpus_hotplugged()
+        with self._lock:
+            _LOG.debug("Clearing cached CPU information")
+            self._cpus = []
+            self._cpus_set = set()
+            self._hybrid_cpus = {}
+            self._initialized_snames = set()
+            self._topo_table = None
+            self._topology = {}
+            self._scope_nums_cache = {}
+            self._proc_percpuinfo = {}
+            self._hotplug_count += 1
+
+            # The on-disk topology cache data corresponds to the state before the hotplug event.
+            self._topo_cache = None
+            self._topo_cache_data = {}
+
+            if self._dieinfo:
+                self._dieinfo.cpus_hotplugged()
+
+    def get_hotplug_count(self) -> int:
+        """
+        Return the number of CPU hotplug events reported via 'cpus_hotplugged()'.
+
+        Returns:
+            The CPU hotplug event count. Users caching per-CPU resources may compare it to a
+            previously saved value to find out whether the resources should be re-acquired.
+        """
+
+        return self._hotplug_count
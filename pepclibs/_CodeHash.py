@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Provide a hash of the source code of Python modules.
+
+On-disk caches store data produced by 'pepc' code. When the code changes, for example when 'pepc' is
+upgraded, the cached data may become incompatible with it. Storing the hash of the code that
+produced the data in the cache allows for detecting this and ignoring the stale cached data.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import typing
+import inspect
+import hashlib
+import importlib
+import threading
+from pepclibs.helperlibs import Logging
+
+if typing.TYPE_CHECKING:
+    from typing import Iterable
+
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
+
+# The already calculated hashes, indexed by module names tuple.
+_HASHES: dict[tuple[str, ...], str | None] = {}
+_LOCK = threading.Lock()
+
+def get_code_hash(modnames: Iterable[str]) -> str | None:
+    """
+    Return the hash of the source code of Python modules.
+
+    Args:
+        modnames: Names of the modules to hash the source code of (e.g., 'pepclibs.TPMI').
+
+    Returns:
+        The hash as a hexadecimal string, or 'None' if the source code of a module is not available.
+    """
+
+    key = tuple(modnames)
+
+    with _LOCK:
+        if key in _HASHES:
+            return _HASHES[key]
+
+        hasher = hashlib.sha256()
+        codehash: str | None = None
+        try:
+            for modname in key:
+                source = inspect.getsource(importlib.import_module(modname))
+                hasher.update(source.encode("utf-8"))
+        except (OSError, TypeError) as err:
+            _LOG.debug("Failed to get source code of module '%s': %s", modname, err)
+        else:
+            codehash = hasher.hexdigest()
+
+        _HASHES[key] = codehash
+        return codehash
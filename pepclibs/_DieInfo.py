@@ -31,6 +31,7 @@ Scaling) - each UFS cluster without a "core" agent is considered a non-compute d
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import typing
+import threading
 from pathlib import Path
 
 from pepclibs import CPUModels
@@ -38,7 +39,7 @@ from pepclibs.helperlibs import Logging, ClassHelpers, LocalProcessManager, Triv
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported, ErrorPermissionDenied
 
 if typing.TYPE_CHECKING:
-    from typing import TypedDict, Literal, Final
+    from typing import TypedDict, Literal, Final, Any
     from pepclibs import TPMI
     from pepclibs.ProcCpuinfo import ProcCpuinfoTypedDict, ProcCpuinfoPerCPUTypedDict
     from pepclibs.helperlibs.ProcessManager import ProcessManagerType
@@ -86,6 +87,8 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
         - get_all_dies() - return all dies (compute and non-compute).
         - get_all_dies_info() - return detailed information about all dies.
         - cpus_hotplugged() - handle CPU hotplug events.
+        - get_cache_data() - return discovered die information in a JSON-serializable form.
+        - set_cache_data() - restore die information previously returned by 'get_cache_data()'.
     """
 
     def __init__(self,
@@ -107,6 +110,10 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
         self._close_pman = pman is None
         self._close_tpmi = tpmi is None
 
+        # Serializes die discovery and clearing of the discovered die information, so that the
+        # object can be used from multiple threads.
+        self._lock = threading.RLock()
+
         if pman:
             self._pman = pman
         else:
@@ -172,27 +179,28 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             ErrorNotSupported: if TPMI is not supported on the target system.
         """
 
-        if self._tpmi:
-            return self._tpmi
+        with self._lock:
+            if self._tpmi:
+                return self._tpmi
 
-        if self._tpmi_errmsg:
-            raise ErrorNotSupported(self._tpmi_errmsg)
+            if self._tpmi_errmsg:
+                raise ErrorNotSupported(self._tpmi_errmsg)
 
-        _LOG.debug("Creating an instance of 'TPMI.TPMI'")
+            _LOG.debug("Creating an instance of 'TPMI.TPMI'")
 
-        # pylint: disable-next=import-outside-toplevel
-        from pepclibs import TPMI
+            # pylint: disable-next=import-outside-toplevel
+            from pepclibs import TPMI
 
-        proc_cpuinfo = self._get_proc_cpuinfo()
+            proc_cpuinfo = self._get_proc_cpuinfo()
 
-        try:
-            self._tpmi = TPMI.TPMI(pman=self._pman, vfm=proc_cpuinfo["vfm"])
-        except Exception as err:
-            self._tpmi_errmsg = str(err)
-            _LOG.debug(self._tpmi_errmsg)
-            raise
+            try:
+                self._tpmi = TPMI.TPMI(pman=self._pman, vfm=proc_cpuinfo["vfm"])
+            except Exception as err:
+                self._tpmi_errmsg = str(err)
+                _LOG.debug(self._tpmi_errmsg)
+                raise
 
-        return self._tpmi
+            return self._tpmi
 
     def _use_domain_ids_for_compute_dies(self) -> bool:
         """
@@ -706,10 +714,11 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             and CPUs are sorted in ascending order.
         """
 
-        if not self._compute_discovered:
-            self._discover_compute_dies(proc_percpuinfo)
+        with self._lock:
+            if not self._compute_discovered:
+                self._discover_compute_dies(proc_percpuinfo)
 
-        return self._compute_dies_cpus
+            return self._compute_dies_cpus
 
     def get_compute_dies(self, proc_percpuinfo: ProcCpuinfoPerCPUTypedDict) -> dict[int, list[int]]:
         """
@@ -723,10 +732,11 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             in ascending order.
         """
 
-        if not self._compute_discovered:
-            self._discover_compute_dies(proc_percpuinfo)
+        with self._lock:
+            if not self._compute_discovered:
+                self._discover_compute_dies(proc_percpuinfo)
 
-        return self._compute_dies
+            return self._compute_dies
 
     def get_noncomp_dies(self, proc_percpuinfo: ProcCpuinfoPerCPUTypedDict) -> dict[int, list[int]]:
         """
@@ -740,10 +750,11 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             sorted in ascending order.
         """
 
-        if not self._noncomp_discovered:
-            self._discover_noncomp_dies(proc_percpuinfo)
+        with self._lock:
+            if not self._noncomp_discovered:
+                self._discover_noncomp_dies(proc_percpuinfo)
 
-        return self._noncomp_dies
+            return self._noncomp_dies
 
     def get_all_dies(self, proc_percpuinfo: ProcCpuinfoPerCPUTypedDict) -> dict[int, list[int]]:
         """
@@ -758,22 +769,23 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             ascending order.
         """
 
-        if not self._compute_discovered:
-            self._discover_compute_dies(proc_percpuinfo)
-        if not self._noncomp_discovered:
-            self._discover_noncomp_dies(proc_percpuinfo)
+        with self._lock:
+            if not self._compute_discovered:
+                self._discover_compute_dies(proc_percpuinfo)
+            if not self._noncomp_discovered:
+                self._discover_noncomp_dies(proc_percpuinfo)
 
-        if self._all_dies:
-            return self._all_dies
+            if self._all_dies:
+                return self._all_dies
 
-        all_dies_sets: dict[int, set[int]] = {}
-        for pkg, dies in self._compute_dies.items():
-            all_dies_sets.setdefault(pkg, set()).update(dies)
-        for pkg, dies in self._noncomp_dies.items():
-            all_dies_sets.setdefault(pkg, set()).update(dies)
+            all_dies_sets: dict[int, set[int]] = {}
+            for pkg, dies in self._compute_dies.items():
+                all_dies_sets.setdefault(pkg, set()).update(dies)
+            for pkg, dies in self._noncomp_dies.items():
+                all_dies_sets.setdefault(pkg, set()).update(dies)
 
-        self._all_dies = {pkg: sorted(dies) for pkg, dies in all_dies_sets.items()}
-        return self._all_dies
+            self._all_dies = {pkg: sorted(dies) for pkg, dies in all_dies_sets.items()}
+            return self._all_dies
 
     def get_compute_dies_info(self, proc_percpuinfo: ProcCpuinfoPerCPUTypedDict) -> \
                                                         dict[int, dict[int, DieInfoTypedDict]]:
@@ -788,10 +800,11 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             Packages and dies are sorted in ascending order.
         """
 
-        if not self._compute_discovered:
-            self._discover_compute_dies(proc_percpuinfo)
+        with self._lock:
+            if not self._compute_discovered:
+                self._discover_compute_dies(proc_percpuinfo)
 
-        return self._compute_dies_info
+            return self._compute_dies_info
 
     def get_noncomp_dies_info(self,
                               proc_percpuinfo: ProcCpuinfoPerCPUTypedDict) -> \
@@ -807,10 +820,11 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             Packages and dies are sorted in ascending order.
         """
 
-        if not self._noncomp_discovered:
-            self._discover_noncomp_dies(proc_percpuinfo)
+        with self._lock:
+            if not self._noncomp_discovered:
+                self._discover_noncomp_dies(proc_percpuinfo)
 
-        return self._noncomp_dies_info
+            return self._noncomp_dies_info
 
     def get_all_dies_info(self,
                           proc_percpuinfo: ProcCpuinfoPerCPUTypedDict) -> \
@@ -826,20 +840,21 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             Packages and dies are sorted in ascending order.
         """
 
-        if not self._compute_discovered:
-            self._discover_compute_dies(proc_percpuinfo)
-        if not self._noncomp_discovered:
-            self._discover_noncomp_dies(proc_percpuinfo)
+        with self._lock:
+            if not self._compute_discovered:
+                self._discover_compute_dies(proc_percpuinfo)
+            if not self._noncomp_discovered:
+                self._discover_noncomp_dies(proc_percpuinfo)
 
-        if self._all_dies_info:
-            return self._all_dies_info
+            if self._all_dies_info:
+                return self._all_dies_info
 
-        for pkg, dies_info in self._compute_dies_info.items():
-            self._all_dies_info.setdefault(pkg, {}).update(dies_info)
-        for pkg, dies_info in self._noncomp_dies_info.items():
-            self._all_dies_info.setdefault(pkg, {}).update(dies_info)
+            for pkg, dies_info in self._compute_dies_info.items():
+                self._all_dies_info.setdefault(pkg, {}).update(dies_info)
+            for pkg, dies_info in self._noncomp_dies_info.items():
+                self._all_dies_info.setdefault(pkg, {}).update(dies_info)
 
-        return self._all_dies_info
+            return self._all_dies_info
 
     def cpus_hotplugged(self):
         """
@@ -850,14 +865,115 @@ class DieInfo(ClassHelpers.SimpleCloseContext):
             Ideally, only the affected parts should be updated.
         """
 
-        _LOG.debug("Clearing cached die information")
+        with self._lock:
+            _LOG.debug("Clearing cached die information")
 
-        self._compute_discovered = False
-        self._compute_dies = {}
-        self._compute_dies_cpus = {}
-        self._compute_dies_info = {}
-        self._noncomp_discovered = False
-        self._noncomp_dies = {}
-        self._noncomp_dies_info = {}
-        self._all_dies = {}
-        self._all_dies_info = {}
+            self._compute_discovered = False
+            self._compute_dies = {}
+            self._compute_dies_cpus = {}
+            self._compute_dies_info = {}
+            self._noncomp_discovered = False
+            self._noncomp_dies = {}
+            self._noncomp_dies_info = {}
+            self._all_dies = {}
+            self._all_dies_info = {}
+
+    @staticmethod
+    def _dies_info_to_cache(dies_info: dict[int, dict[int, DieInfoTypedDict]]) -> \
+                                                            dict[str, dict[str, dict[str, Any]]]:
+        """
+        Convert a dies information dictionary to a JSON-serializable form.
+
+        Args:
+            dies_info: The dies information dictionary to convert.
+
+        Returns:
+            The converted dictionary, where package and die numbers are strings and agent types
+            are sorted lists.
+        """
+
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for pkg, pkg_dies_info in dies_info.items():
+            result[str(pkg)] = {}
+            for die, die_info in pkg_dies_info.items():
+                cached: dict[str, Any] = dict(die_info)
+                if "agent_types" in die_info:
+                    cached["agent_types"] = sorted(die_info["agent_types"])
+                result[str(pkg)][str(die)] = cached
+
+        return result
+
+    @staticmethod
+    def _dies_info_from_cache(cached: dict[str, dict[str, dict[str, Any]]]) -> \
+                                                            dict[int, dict[int, DieInfoTypedDict]]:
+        """
+        Convert a dies information dictionary produced by '_dies_info_to_cache()' back.
+
+        Args:
+            cached: The dictionary to convert.
+
+        Returns:
+            The dies information dictionary.
+        """
+
+        result: dict[int, dict[int, DieInfoTypedDict]] = {}
+        for pkg, pkg_dies_info in cached.items():
+            result[int(pkg)] = {}
+            for die, cached_info in pkg_dies_info.items():
+                die_info: DieInfoTypedDict = {}
+                die_info.update(cached_info) # type: ignore
+                if "agent_types" in cached_info:
+                    die_info["agent_types"] = frozenset(cached_info["agent_types"])
+                result[int(pkg)][int(die)] = die_info
+
+        return result
+
+    def get_cache_data(self) -> dict[str, Any]:
+        """
+        Return the discovered die information in a JSON-serializable form, suitable for the on-disk
+        topology cache.
+
+        Returns:
+            The die information dictionary. Only discovered information is included.
+        """
+
+        with self._lock:
+            data: dict[str, Any] = {}
+
+            if self._compute_discovered:
+                data["compute_dies"] = {str(pkg): dies for pkg, dies in self._compute_dies.items()}
+                data["compute_dies_cpus"] = {str(pkg): {str(die): cpus
+                                                        for die, cpus in dies.items()}
+                                             for pkg, dies in self._compute_dies_cpus.items()}
+                data["compute_dies_info"] = self._dies_info_to_cache(self._compute_dies_info)
+
+            if self._noncomp_discovered:
+                data["noncomp_dies"] = {str(pkg): dies for pkg, dies in self._noncomp_dies.items()}
+                data["noncomp_dies_info"] = self._dies_info_to_cache(self._noncomp_dies_info)
+
+            return data
+
+    def set_cache_data(self, data: dict[str, Any]):
+        """
+        Restore die information previously returned by 'get_cache_data()'. The caller is
+        responsible for making sure the data corresponds to the current state of the target host.
+
+        Args:
+            data: The die information dictionary returned by 'get_cache_data()'.
+        """
+
+        with self._lock:
+            if "compute_dies" in data and not self._compute_discovered:
+                self._compute_dies = {int(pkg): dies for pkg, dies in data["compute_dies"].items()}
+                self._compute_dies_cpus = {int(pkg): {int(die): cpus for die, cpus in dies.items()}
+                                           for pkg, dies in data["compute_dies_cpus"].items()}
+                self._compute_dies_info = self._dies_info_from_cache(data["compute_dies_info"])
+                self._compute_discovered = True
+
+            if "noncomp_dies" in data and not self._noncomp_discovered:
+                self._noncomp_dies = {int(pkg): dies for pkg, dies in data["noncomp_dies"].items()}
+                self._noncomp_dies_info = self._dies_info_from_cache(data["noncomp_dies_info"])
+                self._noncomp_discovered = True
+
+            self._all_dies = {}
+            self._all_dies_info = {}
@@ -137,11 +137,13 @@ class HWPPerf(ClassHelpers.SimpleCloseContext):
                                                            msr=msr)
         return self._hwpreq_pkg
 
-    def _get_perf_remote(self,
-                         fname: HWPPerfNameType,
-                         cpus: Sequence[int]) -> Generator[tuple[int, int], None, None]:
+    def _get_perf_bulk(self,
+                       fname: HWPPerfNameType,
+                       cpus: Sequence[int]) -> Generator[tuple[int, int], None, None]:
         """
-        Implement '_get_perf()' for a remote host, where it is more optimal to read MSRs in bulk.
+        Implement '_get_perf()' by reading MSRs for all CPUs in bulk: read 'MSR_HWP_REQUEST' once
+        for all CPUs, including the package control bits, then read 'MSR_HWP_REQUEST_PKG' for the
+        package-controlled CPUs.
 
         Args:
             fname: Name of the performance feature to read ("min_perf" or "max_perf").
@@ -154,22 +156,16 @@ class HWPPerf(ClassHelpers.SimpleCloseContext):
 
         hwpreq = self._get_hwpreq()
 
-        # Separate CPUs into package-controlled and per-CPU controlled.
         cpus_list: list[int] = []
         pkg_controlled_cpus: list[int] = []
-        percpu_controlled_cpus: list[int] = []
+        perf_vals: dict[int, int] = {}
 
-        for cpu, pkg_controlled in hwpreq.is_feature_pkg_controlled(fname, cpus=cpus):
+        for cpu, pkg_controlled, vals in hwpreq.read_features_pkg_controlled(fname, [fname],
+                                                                             cpus=cpus):
             cpus_list.append(cpu)
             if pkg_controlled:
                 pkg_controlled_cpus.append(cpu)
             else:
-                percpu_controlled_cpus.append(cpu)
-
-        # Read from per-CPU MSR for CPUs not controlled by package MSR.
-        perf_vals: dict[int, int] = {}
-        if percpu_controlled_cpus:
-            for cpu, vals in hwpreq.read_features([fname], cpus=percpu_controlled_cpus):
                 perf_vals[cpu] = int(vals[fname])
 
         # Read from package MSR for CPUs controlled by package MSR.
@@ -182,26 +178,6 @@ class HWPPerf(ClassHelpers.SimpleCloseContext):
         for cpu in cpus_list:
             yield cpu, perf_vals[cpu]
 
-    def _read_cpu_perf(self, fname: HWPPerfNameType, cpu: int) -> int:
-        """
-        Read the HWP performance level for a specific CPU from MSR.
-
-        Args:
-            fname: Name of the performance feature to read ("min_perf" or "max_perf").
-            cpu: CPU number to read the performance level for.
-
-        Returns:
-            The performance level value.
-        """
-
-        hwpreq_union: HWPRequest.HWPRequest | HWPRequestPkg.HWPRequestPkg
-        hwpreq_union = hwpreq = self._get_hwpreq()
-
-        if hwpreq.is_cpu_feature_pkg_controlled(fname, cpu):
-            hwpreq_union = self._get_hwpreq_pkg()
-
-        return hwpreq_union.read_cpu_feature_int(fname, cpu)
-
     def _get_perf(self,
                   fname: HWPPerfNameType,
                   cpus: Sequence[int]) -> Generator[tuple[int, int], None, None]:
@@ -220,11 +196,7 @@ class HWPPerf(ClassHelpers.SimpleCloseContext):
             ErrorNotSupported: If HWP is not supported or disabled.
         """
 
-        if self._pman.is_remote:
-            yield from self._get_perf_remote(fname, cpus)
-        else:
-            for cpu in cpus:
-                yield cpu, self._read_cpu_perf(fname, cpu)
+        yield from self._get_perf_bulk(fname, cpus)
 
     def get_min_perf(self, cpus: Sequence[int]) -> Generator[tuple[int, int], None, None]:
         """
@@ -16,7 +16,7 @@ import typing
 from pathlib import Path
 from pepclibs import _SysfsIO
 from pepclibs.helperlibs import LocalProcessManager, ClassHelpers, Trivial
-from pepclibs.helperlibs.Exceptions import ErrorNotFound, ErrorNotSupported
+from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound, ErrorNotSupported
 from pepclibs.helperlibs.Exceptions import ErrorPath, ErrorPerCPUPath
 from pepclibs.helperlibs.Exceptions import ErrorVerifyFailedPath, ErrorVerifyFailedPerCPUPath
 
@@ -37,7 +37,9 @@ class LinuxPMQoS(ClassHelpers.SimpleCloseContext):
         - 'set_latency_limit()' - set per-CPU latency limits.
     2. Global latency limit.
         - 'get_global_latency_limit()' - read global latency limit.
-    3. Miscellaneous.
+    3. Read planning.
+        - 'get_prefetch_paths()' - get sysfs file paths a getter method will read.
+    4. Miscellaneous.
         - 'close()' - uninitialize the class object.
 
     Notes:
@@ -119,6 +121,26 @@ class LinuxPMQoS(ClassHelpers.SimpleCloseContext):
         cpu_str = dir_name.replace("cpu", "")
         return Trivial.str_to_int(cpu_str, what=f"CPU number from path '{path}'")
 
+    def get_prefetch_paths(self, getter: str, cpus: Sequence[int]) -> Generator[Path, None, None]:
+        """
+        Yield the sysfs file paths a getter method will read for the specified CPUs. The paths can
+        be passed to 'SysfsIO.prefetch()' to read them in advance in a single I/O operation.
+
+        Args:
+            getter: Name of the getter method without the "get_" prefix (e.g., "latency_limit" for
+                    'get_latency_limit()').
+            cpus: CPU numbers to yield the sysfs file paths for.
+
+        Yields:
+            Sysfs file paths.
+        """
+
+        if getter != "latency_limit":
+            raise Error(f"BUG: Unsupported getter '{getter}'")
+
+        for cpu in cpus:
+            yield self._get_latency_limit_sysfs_path(cpu)
+
     def __get_latency_limit(self, cpus: Sequence[int]) -> Generator[tuple[int, float], None, None]:
         """Implement 'get_latency_limit()'. Arguments are the same."""
 
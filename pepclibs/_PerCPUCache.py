@@ -11,16 +11,21 @@
 """
 Implement per-CPU data caching, indexed by data element key and CPU number. The cache accounts for
 CPU scope (e.g., global, package, core) and uses a write-through policy to ensure consistency.
+
+A value is stored once per scope element (e.g., once per package for package-scope data), rather
+than once per CPU. CPU numbers are mapped to scope elements using the CPU-indexed scope group keys
+provided by 'CPUInfo.get_scope_group_keys()'.
 """
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import typing
+import threading
 from pepclibs.helperlibs import ClassHelpers
-from pepclibs.helperlibs.Exceptions import ErrorNotFound
+from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound
 
 if typing.TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Iterable, Sequence
     from collections.abc import Hashable
     from pepclibs import CPUInfo
     from pepclibs.CPUInfoTypes import ScopeNameType
@@ -30,6 +35,15 @@ class PerCPUCache:
     Implement per-CPU data caching, indexed by data element key and CPU number. The cache accounts
     for CPU scope (e.g., global, package, core) and uses a write-through policy to ensure
     consistency.
+
+    Public methods overview.
+        - 'get()' - get a cached entry for a CPU.
+        - 'get_many()' - get cached entries for multiple CPUs.
+        - 'is_cached()' - check if an entry is cached for a CPU.
+        - 'split_cached()' - split CPUs into cached, uncached, and uncached siblings.
+        - 'add()' - add an entry for a CPU and all CPUs sharing the same scope.
+        - 'add_many()' - add entries for multiple CPUs.
+        - 'remove()' - remove an entry for a CPU and all CPUs sharing the same scope.
     """
 
     def __init__(self,
@@ -49,13 +63,93 @@ class PerCPUCache:
         self._enable_cache = enable_cache
         self._enable_scope = enable_scope
 
-        self._cache: dict[Hashable, dict[int, Any]] = {}
+        # The cache: {key: (sname, {group key: entry})}. For the "CPU" scope, the group key is the
+        # CPU number.
+        self._cache: dict[Hashable, tuple[ScopeNameType, dict[Hashable, Any]]] = {}
+
+        # CPU-indexed scope group keys: {sname: [group key or None, ...]}.
+        self._group_keys: dict[ScopeNameType, Sequence[Hashable | None]] = {}
+        # The CPU hotplug event count at the time the scope group keys were fetched.
+        self._hotplug_count = cpuinfo.get_hotplug_count()
+
+        # Serializes cache access, so that the cache can be used from multiple threads. Some
+        # operations, such as converting an entry to the "CPU" scope, change the cache layout.
+        self._lock = threading.RLock()
 
     def close(self):
         """Uninitialize the class instance."""
 
         ClassHelpers.close(self, unref_attrs=("_cpuinfo",))
 
+    def _get_group_keys(self, sname: ScopeNameType) -> Sequence[Hashable | None]:
+        """
+        Return the CPU-indexed scope group keys for a scope.
+
+        Args:
+            sname: The scope name. Must not be "CPU".
+
+        Returns:
+            A sequence indexed by CPU number, containing scope group keys, or 'None' for offline
+            CPUs.
+        """
+
+        hotplug_count = self._cpuinfo.get_hotplug_count()
+        if hotplug_count != self._hotplug_count:
+            # Group keys are stable, but the set of online CPUs may have changed.
+            self._group_keys = {}
+            self._hotplug_count = hotplug_count
+
+        group_keys = self._group_keys.get(sname)
+        if group_keys is None:
+            group_keys = self._cpuinfo.get_scope_group_keys(sname)
+            self._group_keys[sname] = group_keys
+
+        return group_keys
+
+    def _get_group_key(self, cpu: int, sname: ScopeNameType) -> Hashable | None:
+        """
+        Return the scope group key for a CPU.
+
+        Args:
+            cpu: The CPU number.
+            sname: The scope name.
+
+        Returns:
+            The scope group key, or 'None' if the CPU is offline.
+        """
+
+        if sname == "CPU":
+            return cpu
+
+        group_keys = self._get_group_keys(sname)
+        if cpu < len(group_keys):
+            return group_keys[cpu]
+        return None
+
+    def _to_cpu_scope(self, key: Hashable) -> dict[Hashable, Any]:
+        """
+        Convert cached entries of a key to per-CPU entries. Used when entries of the same key are
+        added with different scopes.
+
+        Args:
+            key: The key of the cache entries to convert.
+
+        Returns:
+            The per-CPU entries dictionary of the key.
+        """
+
+        sname, entries = self._cache[key]
+        if sname == "CPU":
+            return entries
+
+        cpu_entries: dict[Hashable, Any] = {}
+        for cpu, group_key in enumerate(self._get_group_keys(sname)):
+            if group_key is not None and group_key in entries:
+                cpu_entries[cpu] = entries[group_key]
+
+        self._cache[key] = ("CPU", cpu_entries)
+        return cpu_entries
+
     def get(self, key: Hashable, cpu: int) -> Any:
         """
         Retrieve the cached entry for the specified key and CPU.
@@ -71,13 +165,48 @@ class PerCPUCache:
             ErrorNotFound: If caching is disabled or the item is not found in the cache.
         """
 
-        if not self._enable_cache:
-            raise ErrorNotFound("Caching is disabled")
+        with self._lock:
+            if not self._enable_cache:
+                raise ErrorNotFound("Caching is disabled")
+
+            try:
+                sname, entries = self._cache[key]
+                return entries[self._get_group_key(cpu, sname)]
+            except KeyError:
+                raise ErrorNotFound(f"'{key}' is not cached for CPU {cpu}") from None
+
+    def get_many(self, key: Hashable, cpus: Iterable[int]) -> list[Any]:
+        """
+        Retrieve the cached entries for the specified key and multiple CPUs.
+
+        Args:
+            key: The key of the cache entries to retrieve.
+            cpus: CPU numbers of the cache entries to retrieve.
+
+        Returns:
+            List of the retrieved cache entries, in the order of 'cpus'.
+
+        Raises:
+            ErrorNotFound: If caching is disabled or the entry is not cached for any of the CPUs.
+        """
+
+        with self._lock:
+            if not self._enable_cache:
+                raise ErrorNotFound("Caching is disabled")
+
+            if key not in self._cache:
+                raise ErrorNotFound(f"'{key}' is not cached")
+
+            sname, entries = self._cache[key]
+
+            try:
+                if sname == "CPU":
+                    return [entries[cpu] for cpu in cpus]
 
-        try:
-            return self._cache[key][cpu]
-        except KeyError:
-            raise ErrorNotFound(f"'{key}' is not cached for CPU {cpu}") from None
+                group_keys = self._get_group_keys(sname)
+                return [entries[group_keys[cpu]] for cpu in cpus]
+            except (KeyError, IndexError):
+                raise ErrorNotFound(f"'{key}' is not cached for some of the CPUs") from None
 
     def is_cached(self, key: Hashable, cpu: int) -> bool:
         """
@@ -91,9 +220,72 @@ class PerCPUCache:
             True if the entry is present in the cache, False otherwise.
         """
 
-        if key not in self._cache or cpu not in self._cache[key]:
-            return False
-        return True
+        with self._lock:
+            if key not in self._cache:
+                return False
+
+            sname, entries = self._cache[key]
+            return self._get_group_key(cpu, sname) in entries
+
+    def split_cached(self,
+                     key: Hashable,
+                     cpus: Iterable[int],
+                     sname: ScopeNameType = "CPU") -> tuple[list[int], list[int], list[int]]:
+        """
+        Split CPUs into three groups: CPUs that have the entry cached, one CPU per scope element
+        among the CPUs that do not have the entry cached, and the rest of the CPUs.
+
+        This is useful for reading data for many CPUs: only the CPUs in the second group have to be
+        read, and the data for CPUs of the third group becomes available once the second group
+        CPUs data is added to the cache.
+
+        Args:
+            key: The key of the cache entries to check.
+            cpus: CPU numbers to split.
+            sname: The scope of the cache entries.
+
+        Returns:
+            A tuple of (cached, uncached, uncached_siblings) lists of CPU numbers. CPUs in each
+            list are in the order of 'cpus'.
+        """
+
+        with self._lock:
+            if not self._enable_scope:
+                sname = "CPU"
+
+            cached: list[int] = []
+            uncached: list[int] = []
+            uncached_siblings: list[int] = []
+
+            entries: dict[Hashable, Any] = {}
+            if self._enable_cache and key in self._cache:
+                if self._cache[key][0] != sname:
+                    entries = self._to_cpu_scope(key)
+                    sname = "CPU"
+                else:
+                    entries = self._cache[key][1]
+
+            if sname == "CPU":
+                for cpu in cpus:
+                    if cpu in entries:
+                        cached.append(cpu)
+                    else:
+                        uncached.append(cpu)
+                return cached, uncached, uncached_siblings
+
+            group_keys = self._get_group_keys(sname)
+            seen: set[Hashable] = set()
+            for cpu in cpus:
+                group_key = group_keys[cpu] if cpu < len(group_keys) else None
+                if group_key in entries:
+                    cached.append(cpu)
+                elif group_key is None or group_key not in seen:
+                    seen.add(group_key)
+                    uncached.append(cpu)
+                else:
+                    uncached_siblings.append(cpu)
+
+            return cached, uncached, uncached_siblings
 
     def remove(self, key: Hashable, cpu: int, sname: ScopeNameType = "CPU"):
         """
@@ -105,22 +297,49 @@ class PerCPUCache:
             sname: The scope of the cache entry.
         """
 
-        if not self._enable_cache:
-            return
+        with self._lock:
+            if not self._enable_cache:
+                return
+
+            if not self._enable_scope:
+                sname = "CPU"
+            elif sname == "global":
+                self._cache.pop(key, None)
+                return
+
+            if key not in self._cache:
+                return
+
+            cached_sname, entries = self._cache[key]
+            if cached_sname == sname:
+                entries.pop(self._get_group_key(cpu, sname), None)
+                return
+
+            entries = self._to_cpu_scope(key)
+            for rmcpu in self._cpuinfo.get_cpu_siblings(cpu, sname):
+                entries.pop(rmcpu, None)
+
+    def _get_entries(self, key: Hashable, sname: ScopeNameType) -> \
+                                            tuple[ScopeNameType, dict[Hashable, Any]]:
+        """
+        Return the scope and the entries dictionary to add entries of a key to.
+
+        Args:
+            key: The key of the cache entries.
+            sname: The scope of the entries to add.
 
-        if not self._enable_scope:
-            if key in self._cache and cpu in self._cache[key]:
-                del self._cache[key][cpu]
-            return
+        Returns:
+            A tuple of (sname, entries), where 'sname' is the scope the entries dictionary is
+            indexed by, which is "CPU" if the key was cached with a different scope before.
+        """
 
-        if sname == "global":
-            del self._cache[key]
-            return
+        # Use 'setdefault()' rather than check-and-assign, which is atomic and therefore safe when
+        # properties are read from multiple threads.
+        cached_sname, entries = self._cache.setdefault(key, (sname, {}))
+        if cached_sname == sname:
+            return sname, entries
 
-        cpus = self._cpuinfo.get_cpu_siblings(cpu, sname)
-        for rmcpu in cpus:
-            if key in self._cache and rmcpu in self._cache[key]:
-                del self._cache[key][rmcpu]
+        return "CPU", self._to_cpu_scope(key)
 
     def add(self, key: Hashable, cpu: int, entry: Any, sname: ScopeNameType = "CPU") -> Any:
         """
@@ -142,17 +361,57 @@ class PerCPUCache:
               determined by 'sname'.
         """
 
-        if not self._enable_cache:
+        with self._lock:
+            if not self._enable_cache:
+                return entry
+
+            if not self._enable_scope:
+                sname = "CPU"
+
+            entries_sname, entries = self._get_entries(key, sname)
+
+            if entries_sname == sname:
+                group_key = self._get_group_key(cpu, sname)
+                if group_key is None:
+                    raise Error(f"CPU {cpu} is not available")
+                entries[group_key] = entry
+            else:
+                for addcpu in self._cpuinfo.get_cpu_siblings(cpu, sname):
+                    entries[addcpu] = entry
+
             return entry
 
-        if self._enable_scope:
-            cpus = self._cpuinfo.get_cpu_siblings(cpu, sname)
-        else:
-            cpus = [cpu]
+    def add_many(self, key: Hashable, cpus_entries: Iterable[tuple[int, Any]],
+                 sname: ScopeNameType = "CPU"):
+        """
+        Add entries to the cache for a specific key and multiple CPUs, and propagate them to all
+        CPUs sharing the same scope.
 
-        if key not in self._cache:
-            self._cache[key] = {}
-        for addcpu in cpus:
-            self._cache[key][addcpu] = entry
+        Args:
+            key: The key of the cache entries to add.
+            cpus_entries: Tuples of (cpu, entry) to add.
+            sname: The scope of the cache entries.
+        """
 
-        return entry
+        with self._lock:
+            if not self._enable_cache:
+                return
+
+            if not self._enable_scope:
+                sname = "CPU"
+
+            entries_sname, entries = self._get_entries(key, sname)
+
+            if entries_sname == "CPU" and sname == "CPU":
+                entries.update(cpus_entries)
+            elif entries_sname == sname:
+                group_keys = self._get_group_keys(sname)
+                for cpu, entry in cpus_entries:
+                    group_key = group_keys[cpu] if cpu < len(group_keys) else None
+                    if group_key is None:
+                        raise Error(f"CPU {cpu} is not available")
+                    entries[group_key] = entry
+            else:
+                for cpu, entry in cpus_entries:
+                    for addcpu in self._cpuinfo.get_cpu_siblings(cpu, sname):
+                        entries[addcpu] = entry
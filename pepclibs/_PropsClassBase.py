@@ -36,6 +36,7 @@ Naming conventions:
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import copy
+import threading
 import typing
 
 from pepclibs import CPUInfo, CPUModels
@@ -43,7 +44,8 @@ from pepclibs.helperlibs import Logging, Trivial, Human, ClassHelpers
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Sequence, Literal, Generator, Final, cast
+    from typing import Any, Sequence, Literal, Generator, Final, Iterable, cast
+    from pathlib import Path
     from pepclibs import _SysfsIO
     from pepclibs.msr import MSR
     from pepclibs.helperlibs.ProcessManager import ProcessManagerType
@@ -155,6 +157,7 @@ class PropsClassBase(ClassHelpers.SimpleCloseContext):
     Miscellaneous Methods:
         - get_sname(): Return the scope name for a property.
         - get_mechanism_descr(): Return a description string for a mechanism.
+        - prefetch_props(): Read sysfs files needed for multiple properties in advance.
     """
 
     def __init__(self,
@@ -179,6 +182,10 @@ class PropsClassBase(ClassHelpers.SimpleCloseContext):
         self._msr = msr
         self._sysfs_io = sysfs_io
 
+        # Serializes lazy creation of helper objects (e.g., 'MSR.MSR') in the '_get_*()' methods, so
+        # that properties can be read from multiple threads without creating duplicate objects.
+        self._init_lock = threading.RLock()
+
         self._close_pman = pman is None
         self._close_cpuinfo = cpuinfo is None
         self._close_msr = msr is None
@@ -670,11 +677,12 @@ class PropsClassBase(ClassHelpers.SimpleCloseContext):
             An instance of 'MSR.MSR'.
         """
 
-        if not self._msr:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs.msr import MSR
+        with self._init_lock:
+            if not self._msr:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs.msr import MSR
 
-            self._msr = MSR.MSR(self._cpuinfo, pman=self._pman, enable_cache=self._enable_cache)
+                self._msr = MSR.MSR(self._cpuinfo, pman=self._pman, enable_cache=self._enable_cache)
 
         return self._msr
 
@@ -686,11 +694,12 @@ class PropsClassBase(ClassHelpers.SimpleCloseContext):
             An instance of '_SysfsIO.SysfsIO'.
         """
 
-        if not self._sysfs_io:
-            # pylint: disable-next=import-outside-toplevel
-            from pepclibs import _SysfsIO
+        with self._init_lock:
+            if not self._sysfs_io:
+                # pylint: disable-next=import-outside-toplevel
+                from pepclibs import _SysfsIO
 
-            self._sysfs_io = _SysfsIO.SysfsIO(self._pman, enable_cache=self._enable_cache)
+                self._sysfs_io = _SysfsIO.SysfsIO(self._pman, enable_cache=self._enable_cache)
 
         return self._sysfs_io
 
@@ -986,6 +995,72 @@ class PropsClassBase(ClassHelpers.SimpleCloseContext):
             return cast(int, val)
         return val
 
+    def _get_prefetch_paths(self,
+                            pname: str,
+                            cpus: AbsNumsType,
+                            mname: MechanismNameType) -> Generator[Path, None, None]:
+        """
+        Yield the sysfs file paths that will be read when getting property 'pname' for CPUs 'cpus'
+        using mechanism 'mname'. Sub-classes override this method for the properties that are read
+        from sysfs. The default implementation yields nothing.
+
+        Args:
+            pname: Name of the property to yield the sysfs file paths for.
+            cpus: CPU numbers the property will be read for.
+            mname: Name of the mechanism that will be used for reading the property.
+
+        Yields:
+            Sysfs file paths.
+        """
+
+        yield from ()
+
+    def prefetch_props(self,
+                       pnames: Iterable[str],
+                       cpus: AbsNumsType | Literal["all"] = "all",
+                       mnames: Sequence[MechanismNameType] = ()):
+        """
+        Read the sysfs files needed for getting multiple properties in advance. Collect the sysfs
+        file paths of all the properties and read them into the sysfs cache in one go, so that the
+        following 'get_prop_*()' calls do not have to access the target host for every property
+        separately. This mostly benefits remote hosts.
+
+        Args:
+            pnames: Names of the properties that are going to be read.
+            cpus: CPU numbers the properties are going to be read for. Special value 'all' means
+                  "all CPUs".
+            mnames: Mechanisms that are going to be used for reading the properties. By default,
+                    all mechanisms supported by a property are assumed.
+
+        Notes:
+            - Only the first mechanism of every property is considered, because this is the
+              mechanism that will be tried first when getting the property.
+            - This method is an optimization. It does not raise exceptions for unsupported
+              properties or unreadable files. Errors are reported when the properties are read.
+        """
+
+        if not self._enable_cache:
+            return
+
+        _cpus = self._cpuinfo.normalize_cpus(cpus)
+        if not _cpus:
+            return
+
+        pnames = list(pnames)
+        paths: list[Path] = []
+        for pname in pnames:
+            self._validate_pname(pname)
+            try:
+                pmnames = self._normalize_mnames(mnames, pname=pname, allow_readonly=True)
+                paths += self._get_prefetch_paths(pname, _cpus, pmnames[0])
+            except Error as err:
+                _LOG.debug("Not prefetching property '%s':\n%s", pname, err.indent(2))
+
+        if paths:
+            _LOG.debug("Prefetching %d sysfs files for %d properties%s",
+                       len(paths), len(pnames), self._pman.hostmsg)
+            self._get_sysfs_io().prefetch(paths)
+
     def get_prop_cpus(self,
                       pname: str,
                       cpus: AbsNumsType | Literal["all"] = "all",
@@ -19,6 +19,7 @@ from __future__ import annotations # Remove when switching to Python 3.10+.
 import re
 import time
 import typing
+import threading
 from pathlib import Path
 from pepclibs.helperlibs import Logging, LocalProcessManager, ClassHelpers
 from pepclibs.helperlibs import Trivial
@@ -72,6 +73,7 @@ class SysfsIO(ClassHelpers.SimpleCloseContext):
     2. Read multiple files.
         - 'read_paths()' - read multiple files, return strings.
         - 'read_paths_int()' - read multiple files, return integers.
+        - 'prefetch()' - read multiple files into the cache in as few operations as possible.
     3. Write multiple files.
         - 'write_paths()' - write a string to multiple files.
         - 'write_paths_int()' - write an integer to multiple files.
@@ -85,6 +87,7 @@ class SysfsIO(ClassHelpers.SimpleCloseContext):
         - 'start_transaction()' - start a transaction.
         - 'flush_transaction()' - flush the transaction buffer.
         - 'commit_transaction()' - commit the transaction.
+        - 'in_transaction()' - check whether a transaction is in progress.
 
     Notes:
         - Methods do not normalize input paths. The caller should normalize paths for efficient
@@ -139,6 +142,9 @@ class SysfsIO(ClassHelpers.SimpleCloseContext):
         self._transaction_buffer: dict[Path, _TransactionItemTypedDict] = {}
         # Whether there is an ongoing transaction.
         self._in_transaction = False
+        # Serializes access to the cache, the transaction buffer, and the transaction state, so that
+        # the object can be used from multiple threads.
+        self._lock = threading.RLock()
 
     def close(self):
         """Uninitialize the class instance."""
@@ -158,11 +164,12 @@ class SysfsIO(ClassHelpers.SimpleCloseContext):
             The cached value.
         """
 
-        if not self._enable_cache:
-            return val
+        with self._lock:
+            if not self._enable_cache:
+                return val
 
-        self._cache[path] = val
-        return val
+            self._cache[path] = val
+            return val
 
     def cache_remove(self, path: Path):
         """
@@ -173,24 +180,26 @@ class SysfsIO(ClassHelpers.SimpleCloseContext):
             path: Path of the sysfs file whose cached value should be removed.
         """
 
-        if not self._enable_cache:
-            return
+        with self._lock:
+            if not self._enable_cache:
+                return
 
-        if path in self._cache:
-            del self._cache[path]
+            if path in self._cache:
+                del self._cache[path]
 
     def cache_flush(self):
         """
         Flush the entire cache, removing all cached values.
         """
 
-        if not self._enable_cache:
-            return
+        with self._lock:
+            if not self._enable_cache:
+                return
 
-        if self._in_transaction:
-            raise Error("Cannot flush cache while a transaction is in progress")
+            if self._in_transaction:
+                raise Error("Cannot flush cache while a transaction is in progress")
 
-        self._cache.clear()
+            self._cache.clear()
 
     def _add_for_transaction(self,
                              path: Path,
@@ -213,37 +222,38 @@ class SysfsIO(ClassHelpers.SimpleCloseContext):
             su: If 'True', write as superuser (root).
         """
 
-        if not self._enable_cache:
-            raise Error("Transactions support requires caching to be enabled")
-
-        if path not in self._transaction_buffer:
-            self._transaction_buffer[path] = {}
-
-        _LOG.debug("Adding for transaction: path='%s', val='%s', what='%s', verify='%s', "
-                   "retries='%d', sleep='%s'", path, str(val), what, verify, retries, sleep)
-        tinfo = self._transaction_buffer[path]
-        if "what" in tinfo and tinfo["what"] != what:
-            raise Error(f"BUG: Inconsistent description for file '{path}':\n"
-                        f"  old: {tinfo['what']}, new: {what}.")
-        if "verify" in tinfo and tinfo["verify"] != verify:
-            raise Error(f"BUG: Inconsistent verification flag value for file '{path}':\n"
-                        f"  old: {tinfo['verify']}, new: {verify}.")
-        if "retries" in tinfo and tinfo["retries"] != retries:
-            raise Error(f"BUG: Inconsistent verification re-tries count for file '{path}':\n"
-                        f"  old: {tinfo['retries']}, new: {retries}.")
-        if "sleep" in tinfo and tinfo["sleep"] != sleep:
-            raise Error(f"BUG: Inconsistent verification sleep value for file '{path}':\n"
-                        f"  old: {tinfo['sleep']}, new: {sleep}.")
-        if "su" in tinfo and tinfo["su"] != su:
-            raise Error(f"BUG: Inconsistent 'su' flag value for file '{path}':\n"
-                        f"  old: {tinfo['su']}, new: {su}.")
-
-        tinfo["val"] = val
-        tinfo["what"] = what
-        tinfo["verify"] = verify
-        tinfo["retries"] = retries
-        tinfo["sleep"] = sleep
-        tinfo["su"] = su
+        with self._lock:
+            if not self._enable_cache:
+                raise Error("Transactions support requires caching to be enabled")
+
+            if path not in self._transaction_buffer:
+                self._transaction_buffer[path] = {}
+
+            _LOG.debug("Adding for transaction: path='%s', val='%s', what='%s', verify='%s', "
+                       "retries='%d', sleep='%s'", path, str(val), what, verify, retries, sleep)
+            tinfo = self._transaction_buffer[path]
+            if "what" in tinfo and tinfo["what"] != what:
+                raise Error(f"BUG: Inconsistent description for file '{path}':\n"
+                            f"  old: {tinfo['what']}, new: {what}.")
+            if "verify" in tinfo and tinfo["verify"] != verify:
+                raise Error(f"BUG: Inconsistent verification flag value for file '{path}':\n"
+                            f"  old: {tinfo['verify']}, new: {verify}.")
+            if "retries" in tinfo and tinfo["retries"] != retries:
+                raise Error(f"BUG: Inconsistent verification re-tries count for file '{path}':\n"
+                            f"  old: {tinfo['retries']}, new: {retries}.")
+            if "sleep" in tinfo and tinfo["sleep"] != sleep:
+                raise Error(f"BUG: Inconsistent verification sleep value for file '{path}':\n"
+                            f"  old: {tinfo['sleep']}, new: {sleep}.")
+            if "su" in tinfo and tinfo["su"] != su:
+                raise Error(f"BUG: Inconsistent 'su' flag value for file '{path}':\n"
+                            f"  old: {tinfo['su']}, new: {su}.")
+
+            tinfo["val"] = val
+            tinfo["what"] = what
+            tinfo["verify"] = verify
+            tinfo["retries"] = retries
+            tinfo["sleep"] = sleep
+            tinfo["su"] = su
 
     def start_transaction(self):
         """
@@ -255,17 +265,18 @@ class SysfsIO(ClassHelpers.SimpleCloseContext):
         operation.
         """
 
-        if self._read_only:
-            raise Error("Cannot start a transaction in read-only mode")
+        with self._lock:
+            if self._read_only:
+                raise Error("Cannot start a transaction in read-only mode")
 
-        if not self._enable_cache:
-            _LOG.debug("Transactions support requires caching to be enabled")
-            return
+            if not self._enable_cache:
+                _LOG.debug("Transactions support requires caching to be enabled")
+                return
 
-        if self._in_transaction:
-            raise Error("Cannot start a transaction, it has already started")
+            if self._in_transaction:
+                raise Error("Cannot start a transaction, it has already started")
 
-        self._in_transaction = True
+            self._in_transaction = True
 
     def _write(self, path: Path, val: str, what: str, su: bool = False):
         """
@@ -384,12 +395,10 @@ class SysfsIO(ClassHelpers.SimpleCloseContext):
                                    path information (this is what's actually raised).
         """
 
-        python_path = self._pman.get_python_path()
-
         _LOG.debug("Optimized: Write: %d sysfs files with verification%s",
                    len(batch_info), self._pman.hostmsg)
 
-        cmd = f"""{python_path} -c '
+        script = f"""
 import time
 winfo = {{{winfo}}}
 for path, (val, verify, retries, sleep) in winfo.items():
@@ -426,10 +435,10 @@ for path, (val, verify, retries, sleep) in winfo.items():
             raise SystemExit(0)
 
         time.sleep(sleep)
-'"""
+"""
 
         try:
-            stdout, stderr = self._pman.run_verify_join(cmd, su=su)
+            stdout, stderr = self._pman.run_python_verify_join(script, su=su)
         except Error as err:
             errmsg = err.indent(2)
             raise type(err)(f"Failed to write sysfs files{self._pman.hostmsg}:\n"
@@ -569,39 +578,40 @@ for path, (val, verify, retries, sleep) in winfo.items():
         Flush the transaction buffer and write all buffered data to sysfs files.
         """
 
-        if not self._enable_cache:
-            return
-        if not self._in_transaction:
-            return
+        with self._lock:
+            if not self._enable_cache:
+                return
+            if not self._in_transaction:
+                return
 
-        if self._transaction_buffer:
-            _LOG.debug("Flushing SysfsIO transaction buffer")
+            if self._transaction_buffer:
+                _LOG.debug("Flushing SysfsIO transaction buffer")
 
-        for path in self._transaction_buffer:
-            self.cache_remove(path)
+            for path in self._transaction_buffer:
+                self.cache_remove(path)
 
-        su_operations_present = any(item["su"] for item in self._transaction_buffer.values())
-        use_sudo = not self._pman.is_superuser() and self._pman.has_passwdless_sudo()
-        optimize = self._optimize_io or (su_operations_present and use_sudo)
-        if optimize:
-            self._write_paths_vals_optimized(self._transaction_buffer)
-        else:
-            for path, val_info in self._transaction_buffer.items():
-                val = val_info["val"]
-                su = val_info["su"]
+            su_operations_present = any(item["su"] for item in self._transaction_buffer.values())
+            use_sudo = not self._pman.is_superuser() and self._pman.has_passwdless_sudo()
+            optimize = self._optimize_io or (su_operations_present and use_sudo)
+            if optimize:
+                self._write_paths_vals_optimized(self._transaction_buffer)
+            else:
+                for path, val_info in self._transaction_buffer.items():
+                    val = val_info["val"]
+                    su = val_info["su"]
 
-                self._write(path, val, val_info["what"], su=su)
+                    self._write(path, val, val_info["what"], su=su)
 
-                if val_info["verify"]:
-                    what = val_info["what"]
-                    retries = val_info["retries"]
-                    sleep = val_info["sleep"]
-                    self._verify(path, val, what, retries=retries, sleep=sleep)
+                    if val_info["verify"]:
+                        what = val_info["what"]
+                        retries = val_info["retries"]
+                        sleep = val_info["sleep"]
+                        self._verify(path, val, what, retries=retries, sleep=sleep)
 
-        for path, val_info in self._transaction_buffer.items():
-            self.cache_add(path, val_info["val"])
+            for path, val_info in self._transaction_buffer.items():
+                self.cache_add(path, val_info["val"])
 
-        self._transaction_buffer.clear()
+            self._transaction_buffer.clear()
 
     def commit_transaction(self):
         """
@@ -611,12 +621,23 @@ for path, (val, verify, retries, sleep) in winfo.items():
         number of sysfs I/O operations.
         """
 
-        if not self._in_transaction:
-            raise Error("Cannot commit a transaction, it did not start")
+        with self._lock:
+            if not self._in_transaction:
+                raise Error("Cannot commit a transaction, it did not start")
 
-        self.flush_transaction()
-        self._in_transaction = False
-        _LOG.debug("Transaction in SysfsIO has been committed")
+            self.flush_transaction()
+            self._in_transaction = False
+            _LOG.debug("Transaction in SysfsIO has been committed")
+
+    def in_transaction(self) -> bool:
+        """
+        Check whether a transaction is in progress.
+
+        Returns:
+            'True' if a transaction has been started and not yet committed, 'False' otherwise.
+        """
+
+        return self._in_transaction
 
     def read(self,
              path: Path,
@@ -642,9 +663,11 @@ for path, (val, verify, retries, sleep) in winfo.items():
             ErrorPath: An I/O error occurred while reading the file (includes path information).
         """
 
-        if path in self._cache:
+        with self._lock:
+            cached_val = self._cache.get(path)
+        if cached_val is not None:
             _LOG.debug("Cached: Read: Sysfs file '%s'%s", path, self._pman.hostmsg)
-            return self._cache[path]
+            return cached_val
 
         if _LOG.getEffectiveLevel() == Logging.DEBUG:
             if isinstance(self._pman, LocalProcessManager.LocalProcessManager):
@@ -724,9 +747,12 @@ for path, (val, verify, retries, sleep) in winfo.items():
         """
 
         _file_not_found_val = "pepc_file_not_found"
-        python_path = self._pman.get_python_path()
 
-        read_paths = [path for path in paths if path not in self._cache]
+        # Take a snapshot of the cached values, because another thread may modify the cache.
+        with self._lock:
+            cached = {path: self._cache[path] for path in paths if path in self._cache}
+
+        read_paths = [path for path in paths if path not in cached]
 
         if read_paths:
             if _LOG.getEffectiveLevel() == Logging.DEBUG:
@@ -736,7 +762,7 @@ for path, (val, verify, retries, sleep) in winfo.items():
 
             paths_str = ",\n".join(f"\"{str(path)}\"" for path in read_paths)
 
-            cmd = f"""{python_path} -c '
+            script = f"""
 paths = [{paths_str}]
 for path in paths:
     try:
@@ -751,10 +777,10 @@ for path in paths:
         print("ERROR: General: Read: Path: %s: Error: %s" % (path, err))
         raise SystemExit(0)
     print(val)
-'"""
+"""
 
             try:
-                stdout, stderr = self._pman.run_verify_nojoin(cmd, su=su)
+                stdout, stderr = self._pman.run_python_verify_nojoin(script, su=su)
             except Error as err:
                 errmsg = err.indent(2)
                 raise type(err)(f"Failed to read sysfs files{self._pman.hostmsg}:\n"
@@ -803,7 +829,7 @@ for path in paths:
             if path in read_results:
                 yield path, read_results[path]
             else:
-                yield path, self._cache[path]
+                yield path, cached[path]
 
     def _read_paths_optimized(self,
                               paths: Iterable[Path],
@@ -904,6 +930,95 @@ for path in paths:
             yield from self._read_paths(paths, what=what, val_if_not_found=val_if_not_found,
                                         su=su)
 
+    def _prefetch_optimized_helper(self, paths: list[Path], su: bool = False):
+        """
+        Read the specified list of paths in a single optimized I/O operation and add the contents
+        of the successfully read files to the cache. The arguments are the same as for
+        'prefetch()'.
+        """
+
+        _read_failed_val = "pepc_read_failed"
+
+        if _LOG.getEffectiveLevel() == Logging.DEBUG:
+            paths_range = Trivial.rangify(list(range(len(paths))))
+            _LOG.debug("Optimized: Prefetch: %d sysfs files (indices %s)%s",
+                       len(paths), paths_range, self._pman.hostmsg)
+
+        paths_str = ",\n".join(f"\"{str(path)}\"" for path in paths)
+
+        script = f"""
+paths = [{paths_str}]
+for path in paths:
+    try:
+        with open(path, "r") as fobj:
+            val = fobj.read().strip()
+    except Exception:
+        val = "{_read_failed_val}"
+    print(val)
+"""
+
+        try:
+            stdout, stderr = self._pman.run_python_verify_nojoin(script, su=su)
+        except Error as err:
+            _LOG.debug("Failed to prefetch sysfs files%s:\n%s", self._pman.hostmsg, err.indent(2))
+            return
+
+        if stderr or len(stdout) != len(paths):
+            _LOG.debug("Unexpected output while prefetching sysfs files%s, ignoring it",
+                       self._pman.hostmsg)
+            return
+
+        for path, val in zip(paths, stdout):
+            val = val.strip()
+            if val != _read_failed_val:
+                self.cache_add(path, val)
+
+    def prefetch(self, paths: Iterable[Path], su: bool = False):
+        """
+        Read multiple sysfs files and add their contents to the cache, so that subsequent reads are
+        served from the cache.
+
+        Args:
+            paths: Paths to the sysfs files to prefetch.
+            su: If 'True', read as superuser (root).
+
+        Notes:
+            - The files are read only if caching is enabled and optimized I/O is used (e.g., for
+              remote hosts), since this is where reading many files at once pays off. Otherwise,
+              do nothing.
+            - Errors are not reported. Files that could not be read are not cached, so errors are
+              reported when the files are read using the regular methods, like 'read()'.
+        """
+
+        if not self._enable_cache:
+            return
+
+        use_sudo = su and not self._pman.is_superuser() and self._pman.has_passwdless_sudo()
+        if not self._optimize_io and not use_sudo:
+            return
+
+        with self._lock:
+            paths = [path for path in dict.fromkeys(paths) if path not in self._cache]
+
+        read_paths: list[Path] = []
+        read_paths_len = 0
+
+        for path in paths:
+            path_len = len(str(path))
+            if path_len > _MAX_PATHS_LEN:
+                continue
+
+            if read_paths_len + path_len >= _MAX_PATHS_LEN:
+                self._prefetch_optimized_helper(read_paths, su=su)
+                read_paths = []
+                read_paths_len = 0
+
+            read_paths_len += path_len
+            read_paths.append(path)
+
+        if read_paths:
+            self._prefetch_optimized_helper(read_paths, su=su)
+
     def read_paths_int(self,
                        paths: Iterable[Path],
                        what: str = "",
@@ -1106,13 +1221,11 @@ for path in paths:
             su: If 'True', run the script as superuser (root).
         """
 
-        python_path = self._pman.get_python_path()
-
         _LOG.debug("Optimized: Write: Value '%s' to %d sysfs files%s",
                    val, len(paths), self._pman.hostmsg)
 
         paths_str = ",\n".join(f"\"{str(path)}\"" for path in paths)
-        cmd = f"""{python_path} -c '
+        script = f"""
 paths = [{paths_str}]
 for path in paths:
     try:
@@ -1124,10 +1237,10 @@ for path in paths:
     except Exception as err:
         print("ERROR: Write: Path: %s: Error: %s" % (path, err))
         break
-'"""
+"""
 
         try:
-            stdout, stderr = self._pman.run_verify_join(cmd, su=su)
+            stdout, stderr = self._pman.run_python_verify_join(script, su=su)
         except Error as err:
             what = "" if not what else f" {what}"
             errmsg = err.indent(2)
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Provide the 'TPMIMMIO' class for accessing TPMI registers directly via memory-mapped I/O (MMIO).
+
+The TPMI debugfs interface is text-based: register values are read by parsing hexadecimal numbers
+from the 'mem_dump' file and written by formatting and writing text to the 'mem_write' file, one
+32-bit value per write. This module bypasses debugfs for register access. It memory-maps the PCI
+BARs (Base Address Registers) of TPMI PCI devices via the sysfs PCI 'resource<N>' files (e.g.,
+'/sys/bus/pci/devices/0000:00:03.1/resource0') and accesses TPMI registers directly.
+
+The physical addresses of TPMI feature instances are taken from the 'mem_dump' file headers (e.g.,
+"TPMI Instance:1 offset:0x1010ffa16000"). The BAR containing a physical address is found using the
+'resource' file of the TPMI PCI device, which lists the physical address ranges of all BARs.
+
+Notes:
+    - The memory-mapped access is supported only on the local host.
+    - On kernels with 'CONFIG_IO_STRICT_DEVMEM' enabled, mapping a BAR claimed by a driver (which is
+      the case for TPMI PCI devices) requires the 'iomem=relaxed' kernel boot parameter.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import os
+import mmap
+import typing
+import threading
+from pathlib import Path
+from pepclibs.helperlibs import ClassHelpers, Logging, Trivial
+from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported
+
+if typing.TYPE_CHECKING:
+    from typing import Final, TypedDict
+    from pepclibs.helperlibs.ProcessManager import ProcessManagerType
+
+    class _BARTypedDict(TypedDict):
+        """
+        A memory-mapped PCI BAR.
+
+        Attributes:
+            start: The physical address of the first byte of the BAR.
+            end: The physical address of the last byte of the BAR.
+            path: Path to the sysfs 'resource<N>' file of the BAR.
+            mm: The memory map of the BAR, or 'None' if the BAR has not been mapped yet.
+            mv: 32-bit integer view of the memory map ('None' if the BAR has not been mapped yet).
+            writable: Whether the BAR is mapped for writing.
+        """
+
+        start: int
+        end: int
+        path: Path
+        mm: mmap.mmap | None
+        mv: memoryview | None
+        writable: bool
+
+# The default path to the sysfs PCI devices directory.
+PCI_DEVICES_PATH: Final[Path] = Path("/sys/bus/pci/devices")
+
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
+
+class TPMIMMIO(ClassHelpers.SimpleCloseContext):
+    """
+    Access TPMI registers of TPMI PCI devices directly via memory-mapped PCI BARs.
+
+    Public methods overview.
+        - 'read32()' - read a 32-bit value at a physical address of a TPMI PCI device.
+        - 'write32()' - write a 32-bit value at a physical address of a TPMI PCI device.
+        - 'close()' - unmap all the mapped BARs.
+    """
+
+    def __init__(self, pman: ProcessManagerType, pci_path: Path | None = None):
+        """
+        Initialize a class instance.
+
+        Args:
+            pman: The process manager object that defines the host to access TPMI registers on.
+            pci_path: Path to the sysfs PCI devices directory. Defaults to '/sys/bus/pci/devices'.
+
+        Raises:
+            ErrorNotSupported: If 'pman' defines a remote or an emulated host.
+        """
+
+        if pman.is_remote or pman.is_emulated:
+            raise ErrorNotSupported(f"Memory-mapped TPMI access is not supported{pman.hostmsg}: "
+                                    f"Supported only on the local host")
+
+        self._pman = pman
+        self._close_pman = False
+
+        if pci_path:
+            self._pci_path = pci_path
+        else:
+            self._pci_path = PCI_DEVICES_PATH
+
+        # The BARs of TPMI PCI devices: {addr: [bar1, bar2, ...]}. The BARs are mapped lazily.
+        self._bars: dict[str, list[_BARTypedDict]] = {}
+        # Protects '_bars' and the BAR mappings when TPMI registers are accessed from multiple
+        # threads.
+        self._bars_lock = threading.RLock()
+
+    def close(self):
+        """Unmap all the mapped BARs."""
+
+        if hasattr(self, "_bars"):
+            with self._bars_lock:
+                for bars in self._bars.values():
+                    for bar in bars:
+                        self._unmap_bar(bar)
+
+        ClassHelpers.close(self, close_attrs=("_pman",))
+
+    @staticmethod
+    def _unmap_bar(bar: _BARTypedDict):
+        """
+        Unmap a BAR, if it is mapped.
+
+        Args:
+            bar: The BAR to unmap.
+        """
+
+        if bar["mv"] is not None:
+            bar["mv"].release()
+            bar["mv"] = None
+
+        if bar["mm"] is not None:
+            try:
+                bar["mm"].close()
+            except (OSError, BufferError) as err:
+                _LOG.debug("Failed to unmap '%s': %s", bar["path"], err)
+            bar["mm"] = None
+
+    def _get_bars(self, addr: str) -> list[_BARTypedDict]:
+        """
+        Return the memory BARs of a TPMI PCI device, reading the PCI 'resource' file on first call.
+
+        Args:
+            addr: PCI address of the TPMI device.
+
+        Returns:
+            The list of memory BARs of the PCI device.
+        """
+
+        if addr in self._bars:
+            return self._bars[addr]
+
+        devpath = self._pci_path / addr
+        path = devpath / "resource"
+
+        bars: list[_BARTypedDict] = []
+
+        # Every line of the 'resource' file describes a PCI resource and has the following format:
+        # "<start> <end> <flags>". The first 6 lines describe BARs 0-5. Unused BARs have all zeroes.
+        with self._pman.open(path, "r") as fobj:
+            for barnum, line in enumerate(fobj):
+                if barnum > 5:
+                    break
+
+                split = line.split()
+                if len(split) != 3:
+                    raise Error(f"Unexpected line in PCI resource file '{path}':\n{line}")
+
+                start = Trivial.str_to_int(split[0], base=16, what="PCI resource start address")
+                end = Trivial.str_to_int(split[1], base=16, what="PCI resource end address")
+                if not start or end <= start:
+                    continue
+
+                bars.append({"start": start, "end": end, "path": devpath / f"resource{barnum}",
+                             "mm": None, "mv": None, "writable": False})
+
+        self._bars[addr] = bars
+        return bars
+
+    def _map_bar(self, bar: _BARTypedDict, write: bool):
+        """
+        Memory-map a BAR.
+
+        Args:
+            bar: The BAR to map.
+            write: If 'True', map the BAR for writing.
+        """
+
+        self._unmap_bar(bar)
+
+        _LOG.debug("Mapping '%s' for %s", bar["path"], "writing" if write else "reading")
+
+        try:
+            fd = os.open(bar["path"], os.O_RDWR if write else os.O_RDONLY)
+        except OSError as err:
+            errmsg = Error(str(err)).indent(2)
+            raise Error(f"Failed to open '{bar['path']}':\n{errmsg}") from err
+
+        try:
+            prot = mmap.PROT_READ
+            if write:
+                prot |= mmap.PROT_WRITE
+            mm = mmap.mmap(fd, bar["end"] - bar["start"] + 1, flags=mmap.MAP_SHARED, prot=prot)
+        except (OSError, ValueError) as err:
+            errmsg = Error(str(err)).indent(2)
+            raise Error(f"Failed to memory-map '{bar['path']}':\n{errmsg}") from err
+        finally:
+            os.close(fd)
+
+        bar["mm"] = mm
+        # Access the registers via a 32-bit integer view, which guarantees 32-bit wide MMIO reads
+        # and writes.
+        bar["mv"] = memoryview(mm).cast("I")
+        bar["writable"] = write
+
+    def _get_mv(self, addr: str, physaddr: int, write: bool) -> tuple[memoryview, int]:
+        """
+        Return the 32-bit integer view of the BAR containing a physical address, mapping the BAR if
+        necessary. Must be called with '_bars_lock' held, and the view must be accessed before
+        releasing the lock, because a concurrent write may re-map the BAR and release the view.
+
+        Args:
+            addr: PCI address of the TPMI device.
+            physaddr: The physical address to access.
+            write: If 'True', the BAR must be mapped for writing.
+
+        Returns:
+            A tuple of the 32-bit integer view of the BAR and the index of 'physaddr' in the view.
+        """
+
+        if physaddr % 4:
+            raise Error(f"BUG: unaligned TPMI register physical address {physaddr:#x}")
+
+        for bar in self._get_bars(addr):
+            if bar["start"] <= physaddr and physaddr + 3 <= bar["end"]:
+                break
+        else:
+            raise Error(f"Physical address {physaddr:#x} does not belong to any BAR of TPMI "
+                        f"PCI device '{addr}'{self._pman.hostmsg}")
+
+        if bar["mv"] is None or (write and not bar["writable"]):
+            self._map_bar(bar, write)
+
+        if typing.TYPE_CHECKING:
+            assert bar["mv"] is not None
+        return bar["mv"], (physaddr - bar["start"]) // 4
+
+    def read32(self, addr: str, physaddr: int) -> int:
+        """
+        Read a 32-bit value at a physical address of a TPMI PCI device.
+
+        Args:
+            addr: PCI address of the TPMI device.
+            physaddr: The physical address to read from. Must be aligned to 4.
+
+        Returns:
+            The read value.
+        """
+
+        with self._bars_lock:
+            mv, idx = self._get_mv(addr, physaddr, False)
+            return mv[idx]
+
+    def write32(self, addr: str, physaddr: int, value: int):
+        """
+        Write a 32-bit value at a physical address of a TPMI PCI device.
+
+        Args:
+            addr: PCI address of the TPMI device.
+            physaddr: The physical address to write to. Must be aligned to 4.
+            value: The 32-bit value to write.
+        """
+
+        with self._bars_lock:
+            mv, idx = self._get_mv(addr, physaddr, True)
+            mv[idx] = value
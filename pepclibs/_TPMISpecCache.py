@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Cache parsed TPMI spec files and spec directory index files.
+
+Parsing YAML is slow, and TPMI spec files do not change between 'pepc' runs. Store the parsed and
+validated data (sdicts, fdicts, and index dictionaries) in pickle files in the user cache directory,
+and use them instead of parsing the YAML files again.
+
+A cache entry is keyed by the path of the source file and the kind of the cached data, and is valid
+only if the SHA-256 hash of the source file contents and the hash of the code that parsed the source
+file match the hashes stored in the entry. The latter makes sure that cache entries created by a
+different version of 'pepc' are not used. Cache errors are never fatal: a missing, stale, corrupted,
+or inaccessible cache entry just causes the source file to be parsed.
+
+The cache is stored in '$XDG_CACHE_HOME/pepc/tpmi' or '~/.cache/pepc/tpmi' by default. Set the
+'PEPC_TPMI_CACHE_DIR' environment variable to a directory path to use a different directory, or to
+an empty string to disable the cache.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import os
+import pickle
+import typing
+import hashlib
+import tempfile
+import contextlib
+from pathlib import Path
+from pepclibs import _CodeHash
+from pepclibs.helperlibs import Logging
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Final, Literal
+
+    CacheKindType = Literal["sdict", "fdict", "idxdict"]
+
+# Users can define this environment variable to change the cache directory. An empty value disables
+# the cache.
+CACHE_DIR_ENVVAR: Final[str] = "PEPC_TPMI_CACHE_DIR"
+
+# Version of the cache entry format. Cache entries of other versions are ignored. Bump it whenever
+# the format of the cached data changes.
+_FORMAT_VERSION: Final[int] = 1
+
+# Names of the modules producing the cached data. Cache entries created by a different code are
+# ignored.
+_CODE_MODNAMES: Final[tuple[str, ...]] = ("pepclibs.TPMI", "pepclibs._TPMISpecCache")
+
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
+
+def get_cache_dir() -> Path | None:
+    """
+    Return the TPMI spec files cache directory path.
+
+    Returns:
+        The cache directory path, or 'None' if the cache is disabled. The cache is disabled if the
+        source code of 'pepc' is not available, because then stale cache entries cannot be
+        detected.
+    """
+
+    val = os.getenv(CACHE_DIR_ENVVAR)
+    if val is not None:
+        if not val:
+            return None
+        cache_dir = Path(val).expanduser()
+    else:
+        val = os.getenv("XDG_CACHE_HOME")
+        if val:
+            cache_dir = Path(val) / "pepc" / "tpmi"
+        else:
+            cache_dir = Path.home() / ".cache" / "pepc" / "tpmi"
+
+    if not _CodeHash.get_code_hash(_CODE_MODNAMES):
+        _LOG.debug("TPMI spec cache is disabled: the source code of 'pepc' is not available")
+        return None
+
+    return cache_dir
+
+def get_hash(data: bytes) -> str:
+    """
+    Return the hash of a source file contents to use for cache entry validation.
+
+    Args:
+        data: The source file contents.
+
+    Returns:
+        The hash as a hexadecimal string.
+    """
+
+    return hashlib.sha256(data).hexdigest()
+
+def _get_entry_path(cache_dir: Path, path: Path, kind: CacheKindType) -> Path:
+    """
+    Return path to the cache entry file for a source file.
+
+    Args:
+        cache_dir: The cache directory path.
+        path: Path to the source file.
+        kind: Kind of the cached data.
+
+    Returns:
+        The cache entry file path.
+    """
+
+    name = hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:32]
+    return cache_dir / f"{name}-{kind}.pickle"
+
+def load(path: Path, kind: CacheKindType, srchash: str) -> Any:
+    """
+    Load cached data for a source file.
+
+    Args:
+        path: Path to the source file.
+        kind: Kind of the cached data.
+        srchash: Hash of the current source file contents (refer to 'get_hash()').
+
+    Returns:
+        The cached data, or 'None' if there is no valid cache entry for the source file.
+    """
+
+    cache_dir = get_cache_dir()
+    if not cache_dir:
+        return None
+
+    entry_path = _get_entry_path(cache_dir, path, kind)
+
+    try:
+        with open(entry_path, "rb") as fobj:
+            # Do not load cache entries created by other users.
+            if os.fstat(fobj.fileno()).st_uid != os.geteuid():
+                _LOG.debug("Ignoring TPMI spec cache entry '%s': not owned by the current user",
+                           entry_path)
+                return None
+            entry = pickle.load(fobj)
+    except FileNotFoundError:
+        return None
+    except Exception as err: # pylint: disable=broad-except
+        _LOG.debug("Failed to load TPMI spec cache entry '%s': %s", entry_path, err)
+        return None
+
+    if not isinstance(entry, dict) or entry.get("format") != _FORMAT_VERSION or \
+       entry.get("path") != str(path) or entry.get("hash") != srchash or \
+       entry.get("code") != _CodeHash.get_code_hash(_CODE_MODNAMES):
+        _LOG.debug("Stale TPMI spec cache entry '%s' for '%s'", entry_path, path)
+        return None
+
+    _LOG.debug("Loaded '%s' %s from TPMI spec cache entry '%s'", path, kind, entry_path)
+    return entry["data"]
+
+def save(path: Path, kind: CacheKindType, srchash: str, data: Any):
+    """
+    Save data parsed from a source file to the cache.
+
+    Args:
+        path: Path to the source file.
+        kind: Kind of the cached data.
+        srchash: Hash of the source file contents the data was parsed from (refer to
+                 'get_hash()').
+        data: The data to cache.
+    """
+
+    cache_dir = get_cache_dir()
+    if not cache_dir:
+        return
+
+    entry_path = _get_entry_path(cache_dir, path, kind)
+    entry = {"format": _FORMAT_VERSION, "path": str(path), "hash": srchash,
+             "code": _CodeHash.get_code_hash(_CODE_MODNAMES), "data": data}
+
+    tmppath = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename it, so that concurrent 'pepc' processes never see a
+        # partially written cache entry.
+        fd, tmpname = tempfile.mkstemp(dir=cache_dir, prefix=f".{entry_path.name}.")
+        tmppath = Path(tmpname)
+        with os.fdopen(fd, "wb") as fobj:
+            pickle.dump(entry, fobj, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmppath, entry_path)
+        tmppath = None
+    except (OSError, pickle.PicklingError) as err:
+        _LOG.debug("Failed to save TPMI spec cache entry '%s': %s", entry_path, err)
+    else:
+        _LOG.debug("Saved '%s' %s to TPMI spec cache entry '%s'", path, kind, entry_path)
+    finally:
+        if tmppath:
+            with contextlib.suppress(OSError):
+                tmppath.unlink(missing_ok=True)
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Provide an on-disk cache for CPU topology information.
+
+Building CPU topology requires parsing '/proc/cpuinfo', reading many sysfs files, and sometimes
+reading MSRs and TPMI registers. This takes noticeable time on large systems and on remote hosts.
+The cache stores the results in a local directory, one file per target host. A cache file is used
+only if the boot ID, the online CPUs list, and the kernel version of the target host match the ones
+recorded in the file, and if the file was created by the same 'pepc' code (e.g., not by a different
+version of 'pepc'). Otherwise, the topology is rebuilt and the cache file is re-written.
+
+The cache is disabled by default. Set the 'PEPC_TOPOLOGY_CACHE_DIR' environment variable to a
+directory path to enable it.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import os
+import re
+import json
+import typing
+import tempfile
+from pathlib import Path
+from pepclibs import _CodeHash
+from pepclibs.helperlibs import Logging
+from pepclibs.helperlibs.Exceptions import Error
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Final
+    from pepclibs import _SysfsIO
+    from pepclibs.helperlibs.ProcessManager import ProcessManagerType
+
+# Users can define this environment variable to enable the on-disk topology cache.
+CACHE_DIR_ENVVAR: Final[str] = "PEPC_TOPOLOGY_CACHE_DIR"
+
+# Version of the cache file format. Cache files of other versions are ignored.
+_FORMAT_VERSION: Final[int] = 1
+
+# Names of the modules producing the cached data. Cache files created by different code are
+# ignored.
+_CODE_MODNAMES: Final[tuple[str, ...]] = ("pepclibs.CPUInfo", "pepclibs._CPUInfoBase",
+                                          "pepclibs._DieInfo", "pepclibs.ProcCpuinfo",
+                                          "pepclibs._TopologyCache", "pepclibs._TopologyTable")
+
+# Files on the target host that the cache is validated against.
+_KEY_PATHS: Final[dict[str, Path]] = {
+    "boot_id": Path("/proc/sys/kernel/random/boot_id"),
+    "online": Path("/sys/devices/system/cpu/online"),
+    "osrelease": Path("/proc/sys/kernel/osrelease"),
+}
+
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
+
+def get_cache_dir() -> Path | None:
+    """
+    Return the topology cache directory path specified by the user.
+
+    Returns:
+        The cache directory path, or 'None' if the topology cache is not enabled. The cache is not
+        enabled if the source code of 'pepc' is not available, because then stale cache files cannot
+        be detected.
+    """
+
+    val = os.getenv(CACHE_DIR_ENVVAR)
+    if not val:
+        return None
+
+    if not _CodeHash.get_code_hash(_CODE_MODNAMES):
+        _LOG.debug("Topology cache is disabled: the source code of 'pepc' is not available")
+        return None
+
+    return Path(val).expanduser()
+
+class TopologyCache:
+    """
+    Load and save topology cache files for a target host.
+
+    Public methods overview.
+        - 'load()' - read the validation key from the target host and load the cached data.
+        - 'save()' - save data to the cache file.
+    """
+
+    def __init__(self, pman: ProcessManagerType, sysfs_io: _SysfsIO.SysfsIO, cache_dir: Path):
+        """
+        Initialize a class instance.
+
+        Args:
+            pman: The process manager object that defines the target host.
+            sysfs_io: The sysfs access object to use for reading the validation key files on the
+                      target host.
+            cache_dir: Path to the local directory to store cache files in.
+        """
+
+        self._pman = pman
+        self._sysfs_io = sysfs_io
+
+        hostname = re.sub(r"[^\w.-]", "_", pman.hostname)
+        self._path = cache_dir / f"topology-{hostname}.json"
+
+        # The validation key read from the target host by 'load()'.
+        self.key: dict[str, str] = {}
+
+    def _read_key(self) -> dict[str, str]:
+        """
+        Read the cache validation key from the target host.
+
+        Returns:
+            The validation key dictionary: {key name: file contents}.
+        """
+
+        key: dict[str, str] = {}
+        paths_iter = self._sysfs_io.read_paths(_KEY_PATHS.values(), what="topology cache key")
+        for name, (_, val) in zip(_KEY_PATHS, paths_iter):
+            key[name] = val.strip()
+
+        return key
+
+    def load(self) -> dict[str, Any] | None:
+        """
+        Read the validation key from the target host and load the cache file.
+
+        Returns:
+            The cached data dictionary, or 'None' if there is no valid cache file for the target
+            host. The validation key is available via the 'key' attribute in both cases, unless it
+            could not be read.
+
+        Raises:
+            Error: The validation key could not be read from the target host.
+        """
+
+        self.key = self._read_key()
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as fobj:
+                cdata = json.load(fobj)
+        except FileNotFoundError:
+            _LOG.debug("No topology cache file '%s'", self._path)
+            return None
+        except (OSError, ValueError) as err:
+            _LOG.debug("Failed to load topology cache file '%s': %s", self._path, err)
+            return None
+
+        if not isinstance(cdata, dict) or cdata.get("version") != _FORMAT_VERSION:
+            _LOG.debug("Ignoring topology cache file '%s': unsupported format", self._path)
+            return None
+
+        if cdata.get("code") != _CodeHash.get_code_hash(_CODE_MODNAMES):
+            _LOG.debug("Ignoring topology cache file '%s': created by a different version of pepc",
+                       self._path)
+            return None
+
+        if cdata.get("key") != self.key:
+            _LOG.debug("Ignoring stale topology cache file '%s'%s", self._path, self._pman.hostmsg)
+            return None
+
+        _LOG.debug("Loaded topology cache file '%s'", self._path)
+        data: dict[str, Any] = cdata.get("data", {})
+        return data
+
+    def save(self, data: dict[str, Any]):
+        """
+        Save data to the cache file. Do nothing if the target host validation key changed since
+        'load()' was called, because the data may not correspond to the current state of the
+        target host.
+
+        Args:
+            data: The data dictionary to save. Must be JSON-serializable.
+
+        Notes:
+            - The cache file is replaced atomically, so concurrent pepc processes never observe a
+              partially written file.
+            - Errors are logged and otherwise ignored, because the cache is an optimization.
+        """
+
+        if not self.key:
+            return
+
+        try:
+            if self._read_key() != self.key:
+                _LOG.debug("Target system state changed%s, not saving topology cache",
+                           self._pman.hostmsg)
+                return
+        except Error as err:
+            _LOG.debug("Failed to re-read the topology cache key%s:\n%s",
+                       self._pman.hostmsg, err.indent(2))
+            return
+
+        cdata = {"version": _FORMAT_VERSION, "code": _CodeHash.get_code_hash(_CODE_MODNAMES),
+                 "key": self.key, "data": data}
+
+        tmppath = None
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmpname = tempfile.mkstemp(prefix=f".{self._path.name}.", dir=self._path.parent)
+            tmppath = Path(tmpname)
+            with os.fdopen(fd, "w", encoding="utf-8") as fobj:
+                json.dump(cdata, fobj, separators=(",", ":"))
+            os.replace(tmppath, self._path)
+            tmppath = None
+        except (OSError, TypeError, ValueError) as err:
+            _LOG.warning("Failed to save topology cache file '%s': %s", self._path, err)
+        else:
+            _LOG.debug("Saved topology cache file '%s'", self._path)
+        finally:
+            if tmppath:
+                tmppath.unlink(missing_ok=True)
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Provide a compact, columnar representation of the CPU topology table.
+
+A list of per-CPU topology dictionaries is convenient, but slow to query and memory-hungry on
+systems with thousands of CPUs. This module stores one integer array per scope, indexed by CPU
+number, and groups CPUs sharing the same core, die, module, node, or package into contiguous slices
+of a single array. Sibling lookups, sibling index lookups, and "divide CPUs by scope" operations
+become array lookups and slices.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import typing
+from array import array
+
+if typing.TYPE_CHECKING:
+    from typing import Final, Iterable, Generator
+    from pepclibs.CPUInfoTypes import ScopeNameType
+
+# The value used in the per-scope arrays for CPUs that are not in the table (e.g., offline CPUs).
+_NA: Final[int] = -1
+
+# Scope names that make up the sibling group key for every scope. Core and die numbers are relative
+# to the package, so their groups are keyed by the package number too.
+_GROUP_KEYS: Final[dict[ScopeNameType, tuple[ScopeNameType, ...]]] = {
+    "core": ("package", "core"),
+    "module": ("module",),
+    "die": ("package", "die"),
+    "node": ("node",),
+    "package": ("package",),
+}
+
+class TopologyTable:
+    """
+    A columnar CPU topology table.
+
+    Public methods overview.
+        - 'has_cpu()' - check whether a CPU is in the table.
+        - 'get_cpus()' - return CPUs in the table, sorted by a scope.
+        - 'get_tline()' - return the topology line for a CPU.
+        - 'get_tlines()' - return topology lines for all CPUs.
+        - 'get_siblings()' - return CPUs sharing the same scope element with a CPU.
+        - 'get_sibling_index()' - return the index of a CPU within its scope element.
+        - 'iter_groups()' - iterate over scope elements and their CPUs.
+        - 'get_group_keys()' - return the sibling group keys of all CPUs.
+    """
+
+    def __init__(self,
+                 tlines: Iterable[dict[ScopeNameType, int]],
+                 snames: Iterable[ScopeNameType]):
+        """
+        Initialize a class instance.
+
+        Args:
+            tlines: The topology lines to build the table from.
+            snames: Scope names to include in the table. All topology lines must include all of
+                    them, and the "CPU" scope is always included.
+        """
+
+        self.snames: frozenset[ScopeNameType] = frozenset(snames) | {"CPU"}
+
+        tlines = list(tlines)
+        size = max((tline["CPU"] for tline in tlines), default=-1) + 1
+
+        # Per-scope arrays indexed by CPU number: {sname: array of scope element numbers}.
+        self._columns: dict[ScopeNameType, array[int]] = {}
+        for sname in self.snames:
+            column = array("i", [_NA]) * size
+            for tline in tlines:
+                column[tline["CPU"]] = tline[sname]
+            self._columns[sname] = column
+
+        # CPU numbers ordered by sibling group, and CPU number within the group:
+        # {sname: array of CPU numbers}.
+        self._group_cpus: dict[ScopeNameType, array[int]] = {}
+        # Sibling group key to slice boundaries in '_group_cpus': {sname: {key: (start, stop)}}.
+        # The dictionary is ordered by the group key.
+        self._group_slices: dict[ScopeNameType, dict[tuple[int, ...], tuple[int, int]]] = {}
+        # Per-scope arrays indexed by CPU number: {sname: array of sibling indexes}.
+        self._sibling_index: dict[ScopeNameType, array[int]] = {}
+        # Per-scope lists of sibling group keys indexed by CPU number, built on demand.
+        self._group_keys: dict[ScopeNameType, list[tuple[int, ...] | None]] = {}
+
+        for sname, key_snames in _GROUP_KEYS.items():
+            if not self.snames.issuperset(key_snames):
+                continue
+
+            columns = [self._columns[key_sname] for key_sname in key_snames]
+            keyed = sorted((tuple(column[tline["CPU"]] for column in columns), tline["CPU"])
+                           for tline in tlines)
+
+            group_cpus = array("i", (cpu for _, cpu in keyed))
+            sibling_index = array("i", [_NA]) * size
+            slices: dict[tuple[int, ...], tuple[int, int]] = {}
+
+            start = 0
+            for pos, (key, cpu) in enumerate(keyed):
+                if pos and key != keyed[pos - 1][0]:
+                    slices[keyed[pos - 1][0]] = (start, pos)
+                    start = pos
+                sibling_index[cpu] = pos - start
+            if keyed:
+                slices[keyed[-1][0]] = (start, len(keyed))
+
+            self._group_cpus[sname] = group_cpus
+            self._group_slices[sname] = slices
+            self._sibling_index[sname] = sibling_index
+
+    def has_cpu(self, cpu: int) -> bool:
+        """
+        Check whether a CPU is in the table.
+
+        Args:
+            cpu: The CPU number to check.
+
+        Returns:
+            True if the CPU is in the table, False otherwise.
+        """
+
+        column = self._columns["CPU"]
+        return 0 <= cpu < len(column) and column[cpu] != _NA
+
+    def get_cpus(self, order: ScopeNameType = "CPU") -> list[int]:
+        """
+        Return CPUs in the table, sorted by a scope.
+
+        Args:
+            order: The scope to sort the CPUs by. CPUs are sorted by the sibling group key of the
+                   scope (refer to 'iter_groups()'), then by CPU number. Defaults to "CPU".
+
+        Returns:
+            List of CPU numbers.
+        """
+
+        if order == "CPU":
+            return [cpu for cpu in self._columns["CPU"] if cpu != _NA]
+        return self._group_cpus[order].tolist()
+
+    def get_tline(self, cpu: int, snames: Iterable[ScopeNameType]) -> dict[ScopeNameType, int]:
+        """
+        Return the topology line for a CPU.
+
+        Args:
+            cpu: The CPU number to return the topology line for. Must be in the table.
+            snames: Scope names to include in the topology line.
+
+        Returns:
+            The topology line dictionary: {sname: scope element number}.
+        """
+
+        return {sname: self._columns[sname][cpu] for sname in snames}
+
+    def get_tlines(self, snames: Iterable[ScopeNameType]) -> list[dict[ScopeNameType, int]]:
+        """
+        Return topology lines for all CPUs in the table.
+
+        Args:
+            snames: Scope names to include in the topology lines.
+
+        Returns:
+            List of topology line dictionaries sorted by CPU number.
+        """
+
+        columns = [(sname, self._columns[sname]) for sname in snames]
+        return [{sname: column[cpu] for sname, column in columns} for cpu in self.get_cpus()]
+
+    def _get_group_key(self, cpu: int, sname: ScopeNameType) -> tuple[int, ...]:
+        """
+        Return the sibling group key of a CPU for a scope.
+
+        Args:
+            cpu: The CPU number. Must be in the table.
+            sname: The scope name.
+
+        Returns:
+            The sibling group key.
+        """
+
+        return tuple(self._columns[key_sname][cpu] for key_sname in _GROUP_KEYS[sname])
+
+    def get_siblings(self, cpu: int, sname: ScopeNameType) -> list[int]:
+        """
+        Return CPUs that share the same scope element (e.g., core) with a CPU.
+
+        Args:
+            cpu: The CPU number to return siblings for. Must be in the table.
+            sname: The scope name. Must not be "CPU".
+
+        Returns:
+            Sibling CPU numbers, including 'cpu', sorted in ascending order.
+        """
+
+        start, stop = self._group_slices[sname][self._get_group_key(cpu, sname)]
+        return self._group_cpus[sname][start:stop].tolist()
+
+    def get_sibling_index(self, cpu: int, sname: ScopeNameType) -> int:
+        """
+        Return the index of a CPU among CPUs that share the same scope element.
+
+        Args:
+            cpu: The CPU number.
+            sname: The scope name. Must not be "CPU".
+
+        Returns:
+            The sibling index, or -1 if the CPU is not in the table.
+        """
+
+        sibling_index = self._sibling_index[sname]
+        if 0 <= cpu < len(sibling_index):
+            return sibling_index[cpu]
+        return _NA
+
+    def iter_groups(self, sname: ScopeNameType) -> \
+                            Generator[tuple[tuple[int, ...], array[int]], None, None]:
+        """
+        Iterate over scope elements and their CPUs.
+
+        Args:
+            sname: The scope name. Must not be "CPU".
+
+        Yields:
+            Tuples of (group key, CPU numbers) sorted by the group key. The group key is
+            (package, core) for cores, (package, die) for dies, and a single scope element number
+            tuple for other scopes. CPU numbers are sorted in ascending order.
+        """
+
+        group_cpus = self._group_cpus[sname]
+        for key, (start, stop) in self._group_slices[sname].items():
+            yield key, group_cpus[start:stop]
+
+    def get_group_keys(self, sname: ScopeNameType) -> list[tuple[int, ...] | None]:
+        """
+        Return the sibling group keys of all CPUs.
+
+        Args:
+            sname: The scope name. Must not be "CPU".
+
+        Returns:
+            A list indexed by CPU number. The elements are sibling group keys (refer to
+            'iter_groups()'), or 'None' for CPUs that are not in the table. The list must not be
+            modified.
+        """
+
+        if sname in self._group_keys:
+            return self._group_keys[sname]
+
+        group_keys: list[tuple[int, ...] | None] = [None] * len(self._columns["CPU"])
+        group_cpus = self._group_cpus[sname]
+        for key, (start, stop) in self._group_slices[sname].items():
+            for cpu in group_cpus[start:stop]:
+                group_keys[cpu] = key
+
+        self._group_keys[sname] = group_keys
+        return group_keys
@@ -45,7 +45,7 @@ from pepclibs import _SysfsIO, _UncoreFreqBase, CPUModels, CPUInfo
 from pepclibs.msr import UncoreRatioLimit
 from pepclibs.helperlibs import Logging, ClassHelpers, KernelModule, FSHelpers
 from pepclibs.helperlibs import Trivial
-from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound, ErrorNotSupported
+from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported
 
 if typing.TYPE_CHECKING:
     from typing import Generator, Literal, Sequence
@@ -245,30 +245,24 @@ class UncoreFreqSysfs(_UncoreFreqBase.UncoreFreqBase):
             self._dirmap[package] = {}
         self._dirmap[package][die] = dirname
 
-    def _read_agent_types(self, path: Path) -> Sequence[str]:
+    def _parse_agent_types(self, path: Path, agent_types_str: str) -> Sequence[str]:
         """
-        Read the agent types supported by the die corresponding to the provided uncore frequency
-        sysfs sub-directory.
+        Parse the contents of the 'agent_types' uncore frequency sysfs file.
 
         Args:
-            path: The uncore frequency sysfs sub-directory path.
+            path: Path to the 'agent_types' sysfs file (used in error messages).
+            agent_types_str: The contents of the 'agent_types' sysfs file.
 
         Returns:
             A collection of agent types supported by the die.
-
-        Raises:
-            ErrorNotFound: If the 'agent_types' sysfs file does not exist.
         """
 
-        path = path / "agent_types"
-        with self._pman.open(path, "r") as fobj:
-            agent_types_str: str = fobj.read()
-            agent_types = [atype.strip() for atype in agent_types_str.strip().split(" ")]
-            for agent_type in agent_types:
-                if agent_type not in CPUInfo.AGENT_TYPES:
-                    raise Error(f"Unexpected agent type '{agent_type}' read from {path}"
-                                f"{self._pman.hostmsg}, expected one of: "
-                                f"{', '.join(CPUInfo.AGENT_TYPES)}")
+        agent_types = [atype.strip() for atype in agent_types_str.strip().split(" ")]
+        for agent_type in agent_types:
+            if agent_type not in CPUInfo.AGENT_TYPES:
+                raise Error(f"Unexpected agent type '{agent_type}' read from {path}"
+                            f"{self._pman.hostmsg}, expected one of: "
+                            f"{', '.join(CPUInfo.AGENT_TYPES)}")
 
         return agent_types
 
@@ -393,31 +387,42 @@ class UncoreFreqSysfs(_UncoreFreqBase.UncoreFreqBase):
 
             dirnames.append(dirname)
 
-        package_id_paths = (self._sysfs_base / dirname / "package_id" for dirname in dirnames)
-        package_id_iterator = self._sysfs_io.read_paths_int(package_id_paths, what="package ID",
-                                                            su=True)
+        # Read the 'package_id' and 'agent_types' files of all the directories at once.
+        paths: list[Path] = []
+        for dirname in dirnames:
+            path = self._sysfs_base / dirname
+            paths += [path / "package_id", path / "agent_types"]
+
+        vals = dict(self._sysfs_io.read_paths(paths, what="package ID or agent types",
+                                              val_if_not_found="", su=True))
 
         # Second pass: validate that sysfs package IDs and agent types match the expected package
         # IDs and agent types for each die, and save the validated data.
-        for dirname, (_, pkg_id) in zip(dirnames, package_id_iterator):
+        for dirname in dirnames:
             path = self._sysfs_base / dirname
             package, die, die_info = dirname2die_info[dirname]
 
+            pkg_id_path = path / "package_id"
+            if not vals[pkg_id_path]:
+                raise ErrorNotSupported(f"Uncore frequency sysfs file '{pkg_id_path}' does not "
+                                        f"exist{self._pman.hostmsg}")
+
+            pkg_id = Trivial.str_to_int(vals[pkg_id_path], what=f"package ID read from "
+                                                               f"'{pkg_id_path}'")
             if package != pkg_id:
-                raise Error(f"Package ID {pkg_id} read from '{path}/package_id' does not match "
+                raise Error(f"Package ID {pkg_id} read from '{pkg_id_path}' does not match "
                             f"the expected package ID {package}{self._pman.hostmsg}")
 
-            # Detect die type corresponding to this uncore directory.
-            try:
-                agent_types_sysfs = self._read_agent_types(path)
-            except ErrorNotFound:
-                # The kernel is probably old and does not provide the 'agent_types' sysfs file.
-                # Skip this sanity check.
-                pass
-            else:
+            # Detect die type corresponding to this uncore directory. If the 'agent_types' file does
+            # not exist, the kernel is probably old and does not provide it. Skip this sanity check
+            # in this case.
+            agent_types_path = path / "agent_types"
+            if vals[agent_types_path]:
+                agent_types_sysfs = self._parse_agent_types(agent_types_path,
+                                                            vals[agent_types_path])
                 agent_types = die_info["agent_types"]
                 if set(agent_types_sysfs) != set(agent_types):
-                    raise Error(f"Agent types read from '{path}/agent_types' do not match the "
+                    raise Error(f"Agent types read from '{agent_types_path}' do not match the "
                                 f"expected agent types for package {package} die {die}"
                                 f"{self._pman.hostmsg}:\nExpected: {', '.join(agent_types)}\n"
                                 f"Got: {', '.join(agent_types_sysfs)}")
@@ -665,38 +670,70 @@ class UncoreFreqSysfs(_UncoreFreqBase.UncoreFreqBase):
         # When the new sysfs API is available, the legacy sysfs API exposes sysfs files only for die
         # 0, which actually controls all dies in the package. Therefore, iterate only the packages,
         # but not dies.
-        for package, dies in self._get_dies_info().items():
-            for ftype in "min", "max":
-                # Get the frequency limit value via the legacy API.
+        dies_info = self._get_dies_info()
+
+        # Read the legacy min. and max. frequency values and their limits for all packages at once.
+        # Items are (package, ftype, legacy limit path, legacy value path).
+        legacy_items: list[tuple[int, _FreqValueType, Path, Path]] = []
+        paths_legacy: list[Path] = []
+        ftypes: tuple[_FreqValueType, ...] = ("min", "max")
+        for package in dies_info:
+            for ftype in ftypes:
                 path_legacy_limit = self._construct_legacy_freq_path(ftype, package, 0, limit=True)
-                what_limit = f"{ftype} uncore frequency limit"
-                freq_limit_legacy = self._sysfs_io.read_int(path_legacy_limit, what=what_limit)
-
-                # Get min. or max. frequency value via the legacy API.
                 path_legacy = self._construct_legacy_freq_path(ftype, package, 0, limit=False)
-                what = f"{ftype} uncore frequency"
-                freq_legacy = self._sysfs_io.read_int(path_legacy, what=what)
-                if freq_legacy == freq_limit_legacy:
-                    # Nothing to do, the legacy API won't be a limiting factor, because the min.
-                    # or max. frequency is already at its limit value.
-                    continue
-
-                # Get the current min. or max. frequency values via the new API, in order to restore
-                # them later.
-                paths_new = {}
-                freqs_new = {}
-                for die in dies:
-                    paths_new[die] = self._construct_new_freq_path(ftype, package, die,
-                                                                    limit=False)
-                    freqs_new[die] = self._sysfs_io.read_int(paths_new[die], what=what)
-
-                # Set min. or max. frequency limit via the legacy interface. This should "unlock"
-                # the new sysfs API.
-                self._sysfs_io.write_int(path_legacy, freq_limit_legacy, what=what, su=True)
-
-                # Restore the current min. or max. frequency values via the new API.
-                for die in dies:
-                    self._sysfs_io.write_int(paths_new[die], freqs_new[die], what=what, su=True)
+                legacy_items.append((package, ftype, path_legacy_limit, path_legacy))
+                paths_legacy += [path_legacy_limit, path_legacy]
+
+        freqs_legacy = dict(self._sysfs_io.read_paths_int(paths_legacy,
+                                                          what="uncore frequency or limit"))
+
+        # Find the packages and frequency types where the legacy API is a limiting factor, and
+        # read the current min. or max. frequency values via the new API, in order to restore them
+        # after unlocking. Items are (ftype, legacy value path, legacy limit value, new API paths).
+        unlock_items: list[tuple[_FreqValueType, Path, int, list[Path]]] = []
+        paths_new: list[Path] = []
+        for package, ftype, path_legacy_limit, path_legacy in legacy_items:
+            freq_limit_legacy = freqs_legacy[path_legacy_limit]
+            if freqs_legacy[path_legacy] == freq_limit_legacy:
+                # Nothing to do, the legacy API won't be a limiting factor, because the min. or
+                # max. frequency is already at its limit value.
+                continue
+
+            pkg_paths_new = [self._construct_new_freq_path(ftype, package, die, limit=False)
+                             for die in dies_info[package]]
+            unlock_items.append((ftype, path_legacy, freq_limit_legacy, pkg_paths_new))
+            paths_new += pkg_paths_new
+
+        if unlock_items:
+            # Write everything in a single transaction. Transaction writes are executed in the order
+            # of the first write to a file, so the legacy API writes happen before the corresponding
+            # new API writes. If the caller has already started a transaction, flush it first,
+            # because the writes buffered by the caller must not be re-ordered with the unlock
+            # writes. This also makes sure the new API values are read from the sysfs files, not
+            # from the buffered writes.
+            in_transaction = self._sysfs_io.in_transaction()
+            if in_transaction:
+                self._sysfs_io.flush_transaction()
+            else:
+                self._sysfs_io.start_transaction()
+
+            try:
+                freqs_new = dict(self._sysfs_io.read_paths_int(paths_new, what="uncore frequency"))
+
+                for ftype, path_legacy, freq_limit_legacy, pkg_paths_new in unlock_items:
+                    what = f"{ftype} uncore frequency"
+                    # Set min. or max. frequency limit via the legacy interface. This should
+                    # "unlock" the new sysfs API.
+                    self._sysfs_io.write_int(path_legacy, freq_limit_legacy, what=what, su=True)
+
+                    # Restore the current min. or max. frequency values via the new API.
+                    for path in pkg_paths_new:
+                        self._sysfs_io.write_int(path, freqs_new[path], what=what, su=True)
+            finally:
+                if in_transaction:
+                    self._sysfs_io.flush_transaction()
+                else:
+                    self._sysfs_io.commit_transaction()
 
         self._new_sysfs_api_unlocked = True
 
@@ -294,12 +294,17 @@ class UncoreFreqTpmi(_UncoreFreqBase.UncoreFreqBase):
         ratio = int(freq / RATIO_MULTIPLIER)
         regname, bfname = self._get_freq_regname(ftype)
 
-        for package, pkg_dies in dies.items():
-            for die in pkg_dies:
-                addr, instance, cluster = self._get_tpmi_addr(package, die)
-                self._validate_freq(freq, package, die, ftype)
-                self._tpmi.write_ufs_register(ratio, addr, instance, cluster, regname,
-                                              bfname=bfname)
+        # Batch the writes to all dies into a single TPMI transaction.
+        self._tpmi.start_transaction()
+        try:
+            for package, pkg_dies in dies.items():
+                for die in pkg_dies:
+                    addr, instance, cluster = self._get_tpmi_addr(package, die)
+                    self._validate_freq(freq, package, die, ftype)
+                    self._tpmi.write_ufs_register(ratio, addr, instance, cluster, regname,
+                                                  bfname=bfname)
+        finally:
+            self._tpmi.commit_transaction()
 
     def _set_elc_zone_freq_dies(self,
                                 freq: int,
@@ -313,12 +318,16 @@ class UncoreFreqTpmi(_UncoreFreqBase.UncoreFreqBase):
         ratio = int(freq / RATIO_MULTIPLIER)
         regname, bfname = self._get_elc_zone_freq_regname(ztype, ftype)
 
-        for package, pkg_dies in dies.items():
-            for die in pkg_dies:
-                addr, instance, cluster = self._get_tpmi_addr(package, die)
-                self._validate_freq(freq, package, die, ftype, ztype=ztype)
-                self._tpmi.write_ufs_register(ratio, addr, instance, cluster, regname,
-                                              bfname=bfname)
+        self._tpmi.start_transaction()
+        try:
+            for package, pkg_dies in dies.items():
+                for die in pkg_dies:
+                    addr, instance, cluster = self._get_tpmi_addr(package, die)
+                    self._validate_freq(freq, package, die, ftype, ztype=ztype)
+                    self._tpmi.write_ufs_register(ratio, addr, instance, cluster, regname,
+                                                  bfname=bfname)
+        finally:
+            self._tpmi.commit_transaction()
 
     @staticmethod
     def _get_elc_threshold_regname(thrtype: _ELCThresholdType,
@@ -423,13 +432,17 @@ class UncoreFreqTpmi(_UncoreFreqBase.UncoreFreqBase):
 
         regname, bfname = self._get_elc_threshold_regname(thrtype)
 
-        for package, pkg_dies in dies.items():
-            for die in pkg_dies:
-                addr, instance, cluster = self._get_tpmi_addr(package, die)
-                self._validate_elc_threshold(threshold, thrtype, package, die)
-                threshold_raw = self._elc_threshold_percent2raw(threshold)
-                self._tpmi.write_ufs_register(threshold_raw, addr, instance, cluster, regname,
-                                              bfname=bfname)
+        self._tpmi.start_transaction()
+        try:
+            for package, pkg_dies in dies.items():
+                for die in pkg_dies:
+                    addr, instance, cluster = self._get_tpmi_addr(package, die)
+                    self._validate_elc_threshold(threshold, thrtype, package, die)
+                    threshold_raw = self._elc_threshold_percent2raw(threshold)
+                    self._tpmi.write_ufs_register(threshold_raw, addr, instance, cluster, regname,
+                                                  bfname=bfname)
+        finally:
+            self._tpmi.commit_transaction()
 
     def _set_elc_threshold_status_dies(self,
                                        status: bool,
@@ -441,8 +454,12 @@ class UncoreFreqTpmi(_UncoreFreqBase.UncoreFreqBase):
 
         regname, bfname = self._get_elc_threshold_regname(thrtype, status=True)
 
-        for package, pkg_dies in dies.items():
-            for die in pkg_dies:
-                addr, instance, cluster = self._get_tpmi_addr(package, die)
-                self._tpmi.write_ufs_register(int(status), addr, instance, cluster, regname,
-                                              bfname=bfname)
+        self._tpmi.start_transaction()
+        try:
+            for package, pkg_dies in dies.items():
+                for die in pkg_dies:
+                    addr, instance, cluster = self._get_tpmi_addr(package, die)
+                    self._tpmi.write_ufs_register(int(status), addr, instance, cluster, regname,
+                                                  bfname=bfname)
+        finally:
+            self._tpmi.commit_transaction()
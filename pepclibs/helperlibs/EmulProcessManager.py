@@ -22,42 +22,51 @@ Terminology:
       just "dataset" when the context is clear.
     - Base directory: A temporary directory created at initialization. Some emulated files are
       backed by real files under this directory.
+    - Emulated filesystem index: The paths of all emulated files and directories, built at
+      initialization. Emulated file objects are created lazily, on first access.
+    - Dataset image: The parsed emulation dataset, including the emulated filesystem index (refer to
+      'EmulDataset'). The image is read-only and may be shared by multiple process managers, while
+      emulated file objects are per-process manager, so that writes do not leak between them.
 """
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import os
 import re
+import stat
 import typing
+import threading
 import contextlib
 from pathlib import Path
-from pepclibs.helperlibs import Logging, LocalProcessManager, Trivial, YAML
+from pepclibs.helperlibs import Logging, LocalProcessManager, Trivial
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound
-from pepclibs.helperlibs.emul import _EmulFile
-from pepclibs.helperlibs.emul.EmulCommon import EMUL_CONFIG_FNAME
-from pepclibs.msr._SimpleMSR import _CPU_BYTEORDER
+from pepclibs.helperlibs.emul import _EmulFile, EmulDataset
 
 if typing.TYPE_CHECKING:
-    from typing import Generator, TypedDict, IO, cast, Final
+    from typing import Generator, IO, Final
     from pepclibs.helperlibs._ProcessManagerTypes import LsdirTypedDict, LsdirSortbyType
-    from pepclibs.helperlibs.emul.EmulCommon import _EDConfMSRTypedDict, _EDConfSysfsTypedDict
-    from pepclibs.helperlibs.emul.EmulCommon import _EDConfProcfsTypedDict, _EDConfTypedDict
 
-    class _EMDTypedDict(TypedDict, total=False):
-        """
-        The main emulation data dictionary that holds all emulated resources.
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
 
-        Attributes:
-            files: Dictionary mapping absolute paths of emulated files (e.g.,
-                   "/sys/devices/system/cpu/online", "/dev/cpu/0/msr") to corresponding emulated
-                   file objects (e.g., 'EmulFile' instances).
-        """
+_DEFAULT_HOSTNAME: Final[str] = "emulated_host"
 
-        files: dict[str, _EmulFile.EmulFileType]
+# The 'lsdir()' modes of emulated directories and files.
+_DIR_MODE: Final[int] = stat.S_IFDIR | 0o755
+_FILE_MODE: Final[int] = stat.S_IFREG | 0o644
 
-_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
+def _normpath(path: str | Path) -> str:
+    """
+    Normalize an emulated filesystem path.
 
-_DEFAULT_HOSTNAME: Final[str] = "emulated_host"
+    Args:
+        path: The path to normalize. Relative paths are treated as relative to the root directory,
+              similarly to the 'path' values of 'lsdir()' entries.
+
+    Returns:
+        The normalized absolute path.
+    """
+
+    return os.path.normpath("/" + str(path).lstrip("/"))
 
 class EmulProcessManager(LocalProcessManager.LocalProcessManager):
     """
@@ -67,6 +76,10 @@ class EmulProcessManager(LocalProcessManager.LocalProcessManager):
     real SUT filesystem, files are emulated - some are served from a temporary base directory
     populated with emulation data, while others may be maintained purely in memory.
 
+    By default, the emulation dataset is only indexed at initialization, and emulated files are
+    created on first access. Read-only files and general sysfs read-write files are served from
+    memory, without writing them to the base directory.
+
     Note: After creating an instance, call 'init_emul_data()' with a dataset path to load the
           emulation data before using any other methods.
     """
@@ -90,10 +103,17 @@ class EmulProcessManager(LocalProcessManager.LocalProcessManager):
 
         self._basepath: Path = super().mkdtemp(prefix=f"emulprocs_{pid}_")
         self._basepath_removed = False
-        self._dataset_path: Path
+        self._dataset: EmulDataset.EmulDataset
 
-        # The emulation data dictionary.
-        self._emd: _EMDTypedDict = {"files": {}}
+        # Whether to serve read-only files and general sysfs read-write files from memory.
+        self._inmem = True
+
+        # Dictionary mapping absolute paths of emulated files (e.g.,
+        # "/sys/devices/system/cpu/online", "/dev/cpu/0/msr") to corresponding emulated file objects
+        # (e.g., 'EmulFile' instances). Created on first access.
+        self._files: dict[str, _EmulFile.EmulFileType] = {}
+        # Serializes creation of emulated file objects.
+        self._files_lock = threading.RLock()
 
     def __del__(self):
         """The class destructor."""
@@ -126,265 +146,97 @@ class EmulProcessManager(LocalProcessManager.LocalProcessManager):
         """Refer to 'ProcessManagerBase._check_is_root()'."""
         return True
 
-    def _get_inlinefile_lines(self, filepath: Path) -> Generator[str, None, None]:
-        """
-        Iterate over non-empty, non-comment lines in an inlinefile format data file.
-
-        Args:
-            filepath: Path to the inlinefile to read.
-
-        Yields:
-            Lines with leading/trailing whitespace stripped, excluding empty lines and comment
-            lines.
+    def _prepare_cpu_online_dirs(self):
         """
-
-        try:
-            with open(filepath, "r", encoding="utf-8") as fobj:
-                for line in fobj:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        yield line
-        except OSError as err:
-            errmsg = Error(str(err)).indent(2)
-            raise Error(f"Failed to read file '{filepath}':\n{errmsg}") from err
-
-    def _iter_files_recursive(self, dirpath: Path) -> Generator[Path, None, None]:
-        """
-        Recursively iterate over all files in a directory tree.
-
-        Args:
-            dirpath: Path to the directory to traverse.
-
-        Yields:
-            Path objects for each regular file found in the directory tree.
+        Create per-CPU directories and online files in the base directory. They are scanned by
+        'CPUOnlineEmulFile' to find out which CPUs are online.
         """
 
-        try:
-            for root, _, files in os.walk(dirpath):
-                for filename in files:
-                    yield Path(root) / filename
-        except OSError as err:
-            errmsg = Error(str(err)).indent(2)
-            raise Error(f"Failed to traverse directory '{dirpath}':\n{errmsg}") from err
+        cpus_dirpath = "/sys/devices/system/cpu"
+        for name, is_dir in self._dataset.dirs.get(cpus_dirpath, {}).items():
+            if not is_dir or not re.fullmatch(r"cpu\d+", name):
+                continue
 
-    def _process_procfs(self, yinfo: _EDConfProcfsTypedDict):
-        """
-        Create emulated procfs files from procfs emulation data.
-
-        Args:
-            yinfo: Procfs configuration dictionary.
-        """
-
-        procfs_dir_path = self._dataset_path / yinfo["dirname"]
-        rw_patterns = yinfo.get("rw_patterns", [])
-
-        # Note: Directories are automatically created by 'EmulFileBase', so iterate only files.
-        for filepath in self._iter_files_recursive(procfs_dir_path):
-            # Example path values:
-            #   filepath:   /dataset_path/proc/cpuinfo
-            #   relpath:    cpuinfo
-            #   proc_path:  /proc/cpuinfo
-            relpath = filepath.relative_to(procfs_dir_path)
-            proc_path = f"/{yinfo['dirname']}/{relpath}"
-            try:
-                with open(filepath, "r", encoding="utf-8") as fobj:
-                    data = fobj.read()
-            except OSError as err:
-                errmsg = Error(str(err)).indent(2)
-                raise Error(f"Failed to read '{filepath}':\n{errmsg}") from err
-
-            readonly = not any(re.search(regex, proc_path) for regex in rw_patterns)
-            emul_file = _EmulFile.get_emul_file(proc_path, self._basepath, data=data,
-                                                readonly=readonly)
-            self._emd["files"][proc_path] = emul_file
-
-    def _process_sysfs_inlinefiles(self, yinfo: _EDConfSysfsTypedDict):
-        """
-        Create emulated sysfs files from inline sysfs emulation data.
-
-        Args:
-            yinfo: Sysfs configuration dictionary.
-        """
-
-        inlinefile_path = self._dataset_path / yinfo["dirname"] / yinfo["inlinefiles"]
-
-        for line in self._get_inlinefile_lines(inlinefile_path):
-            # Format: <mode>|<sysfs_path>|<value>.
-            parts = line.split("|", 2)
-            if len(parts) != 3:
-                raise Error(f"Unexpected line format in file '{inlinefile_path}':\n  "
-                            f"Expected <mode>|<path>|<value>, received:\n'{line}'")
-
-            mode, path, data = parts
-            if mode not in ("ro", "rw"):
-                raise Error(f"Unexpected mode '{mode}' in file '{inlinefile_path}':\n  "
-                            f"Expected 'ro' or 'rw', received:\n'{line}'")
-
-            readonly = mode == "ro"
-
-            # Note about lstrip(): 'path' is an absolute path starting with '/'. If not stripped,
-            # joining it with the base path would ignore the base path.
-            dirpath = (self._basepath / path.lstrip("/")).parent
+            dirpath = self._basepath / cpus_dirpath.lstrip("/") / name
             try:
                 dirpath.mkdir(parents=True, exist_ok=True)
             except OSError as err:
                 errmsg = Error(str(err)).indent(2)
                 raise Error(f"Failed to create directory '{dirpath}':\n{errmsg}") from err
 
-            emul_file = _EmulFile.get_emul_file(path, self._basepath, data=data, readonly=readonly)
-            self._emd["files"][path] = emul_file
-
-    def _process_sysfs_rcopy(self, yinfo: _EDConfSysfsTypedDict):
-        """
-        Create emulated sysfs files from recursively copied sysfs directories.
-
-        Args:
-            yinfo: Sysfs configuration dictionary.
-        """
-
-        rcopy = yinfo.get("rcopy", {})
-        if not rcopy:
-            return
+            self._get_emul_file(f"{cpus_dirpath}/{name}/online")
 
-        sysfs_dir_path = self._dataset_path / yinfo["dirname"]
-        rw_patterns = rcopy.get("rw_patterns", [])
-
-        for relpath in rcopy.get("paths", []):
-            # Example path values:
-            #   relpath:        "kernel/debug/tpmi-0000:80:03.1"
-            #   rcopy_base:     "/dataset_path/sys/kernel/debug/tpmi-0000:80:03.1"
-            rcopy_base = sysfs_dir_path / relpath
-            if not rcopy_base.exists():
-                cfgfile_path = self._dataset_path / EMUL_CONFIG_FNAME
-                raise Error(f"Path '{relpath}' specified in '{cfgfile_path}' does not exist")
-
-            # Note: Directories are automatically created by 'EmulFileBase', so iterate only files.
-            for filepath in self._iter_files_recursive(rcopy_base):
-                # Example path values:
-                #   filepath:   /dataset_path/sys/kernel/debug/tpmi-0000:80:03.1/tpmi-id-0c/mem_dump
-                #   relpath:    kernel/debug/tpmi-0000:80:03.1/tpmi-id-0c/mem_dump
-                #   sysfs_path: /sys/kernel/debug/tpmi-0000:80:03.1/tpmi-id-0c/mem_dump
-                relpath = filepath.relative_to(sysfs_dir_path)
-                sysfs_path = f"/{yinfo['dirname']}/{relpath}"
-                try:
-                    with open(filepath, "r", encoding="utf-8") as fobj:
-                        data = fobj.read()
-                except OSError as err:
-                    errmsg = Error(str(err)).indent(2)
-                    raise Error(f"Failed to read '{filepath}':\n{errmsg}") from err
-
-                readonly = not any(re.search(regex, sysfs_path) for regex in rw_patterns)
-                emul_file = _EmulFile.get_emul_file(sysfs_path, self._basepath, data=data,
-                                               readonly=readonly)
-                self._emd["files"][sysfs_path] = emul_file
-
-    def _process_sysfs(self, yinfo: _EDConfSysfsTypedDict):
+    def _get_emul_file(self, path: str) -> _EmulFile.EmulFileType | None:
         """
-        Create emulated sysfs files from sysfs emulation data.
+        Return the emulated file object for a path, create it on first access.
 
         Args:
-            yinfo: Sysfs configuration dictionary.
-        """
-
-        self._process_sysfs_inlinefiles(yinfo)
-        self._process_sysfs_rcopy(yinfo)
+            path: Absolute path of the emulated file.
 
-    def _process_msrs(self, yinfo: _EDConfMSRTypedDict):
-        """
-        Create emulated MSR device files from the dataset.
-
-        Args:
-            yinfo: the 'msr' section of the emulation data configuration dictionary.
+        Returns:
+            The emulated file object, or 'None' if 'path' is not an emulated file.
         """
 
-        msr_dir_path = self._dataset_path / yinfo["dirname"]
-        if not msr_dir_path.exists():
-            return
-
-        inlinefile_path = msr_dir_path / yinfo["filename"]
-
-        # Parsed MSR data organized by CPU: {cpu: {addr: value}}.
-        cpu_addr_val: dict[int, dict[int, bytes]] = {}
-
-        for line in self._get_inlinefile_lines(inlinefile_path):
-            split = line.split(":", 1)
-            if len(split) != 2:
-                raise Error(f"Unexpected line format in file '{inlinefile_path}':\n  "
-                            f"Expected <hex_addr>:<cpu_val_pairs>, received:\n{line}")
-
-            addr = Trivial.str_to_int(split[0], base=16, what="MSR address")
-            pairs = split[1].split()
-
-            for pair in pairs:
-                cpu_str, regval_str = pair.split("|", 1)
-                cpu = Trivial.str_to_int(cpu_str, what="CPU number")
-                value = Trivial.str_to_int(regval_str, base=16, what="MSR register value")
-
-                if cpu not in cpu_addr_val:
-                    cpu_addr_val[cpu] = {}
-                elif addr in cpu_addr_val[cpu]:
-                    raise Error(f"Duplicate CPU {cpu} and MSR address {addr:#x} in file "
-                                f"'{inlinefile_path}': Line:\n{line}")
-
-                cpu_addr_val[cpu][addr] = int.to_bytes(value, 8, byteorder=_CPU_BYTEORDER)
-
-        for cpu, addr2val in cpu_addr_val.items():
-            path = f"/dev/cpu/{cpu}/msr"
-            emul_file = _EmulFile.get_emul_file(path, self._basepath, data=addr2val)
-            self._emd["files"][path] = emul_file
-
-    def _init_emul_data(self, ydict: _EDConfTypedDict):
-        """
-        Initialize the emulation data from the configuration dictionary.
-
-        Args:
-            ydict: The emulation data configuration dictionary (the YAML configuration file loaded
-                   as a Python dictionary).
-        """
-
-        if "msr" in ydict:
-            self._process_msrs(ydict["msr"])
-
-        if "sysfs" in ydict:
-            self._process_sysfs(ydict["sysfs"])
-
-        if "procfs" in ydict:
-            self._process_procfs(ydict["procfs"])
-
-    def init_emul_data(self, dspath: Path):
+        emul_file = self._files.get(path)
+        if emul_file:
+            return emul_file
+
+        with self._files_lock:
+            emul_file = self._files.get(path)
+            if emul_file:
+                return emul_file
+
+            finfo = self._dataset.files.get(path)
+            if finfo is None:
+                return None
+
+            # Some emulated files access other emulated files in the base directory, create them
+            # first.
+            if _EmulFile.is_tpmi_file(path, "mem_write"):
+                self._get_emul_file(str(Path(path).parent / "mem_dump"))
+            elif _EmulFile.is_cpu_online_file(path):
+                self._prepare_cpu_online_dirs()
+            elif _EmulFile.is_smt_control_file(path):
+                # The SMT control file changes per-CPU online files according to '/proc/cpuinfo'.
+                self._get_emul_file("/proc/cpuinfo")
+
+            data = self._dataset.get_data(path)
+            emul_file = _EmulFile.get_emul_file(path, self._basepath, data=data,
+                                                readonly=finfo["readonly"], inmem=self._inmem)
+            self._files[path] = emul_file
+
+        return emul_file
+
+    def init_emul_data(self,
+                       dspath: Path,
+                       lazy: bool = True,
+                       dataset: EmulDataset.EmulDataset | None = None):
         """
         Load an emulation dataset and initialize the emulation data.
 
         Args:
-          dspath: Path to the dataset directory to load.
-
-        Each dataset directory contains a single 'config.yml' file that describes all emulation
-        data for a System Under Test (SUT):
-            - dataset1/
-              - config.yml          # Main configuration file
-              - msr/                # MSR register data
-              - sys/                # Sysfs file data
-              - proc/               # Procfs file data
-              ...
-            - dataset2/
-              ...
-
-        The 'config.yml' file contains top-level sections ('msr', 'sysfs', 'procfs', etc.) that
-        describe how to load and configure emulated files from their respective sub-directories.
-
-        This method eagerly loads all emulation data from the configuration file and prepares the
-        emulated filesystem structure in the temporary base directory.
+          dspath: Path to the dataset directory to load. Refer to 'EmulDataset.__init__()' for
+                  the dataset directory layout.
+          lazy: If True, create emulated files on first access, and serve read-only files and
+                general sysfs read-write files from memory. If False, create all emulated files in
+                the base directory right away.
+          dataset: An already loaded image of the 'dspath' dataset to use instead of loading it
+                   again. The image is not modified, so it can be shared by multiple process
+                   managers. Writes to emulated files are visible only to this process manager.
         """
 
-        self._dataset_path = dspath
+        if dataset is None:
+            dataset = EmulDataset.EmulDataset(dspath)
+        elif dataset.path != dspath:
+            raise Error(f"BUG: Dataset image of '{dataset.path}' was provided for dataset "
+                        f"'{dspath}'")
 
-        _yml = YAML.load(self._dataset_path / EMUL_CONFIG_FNAME)
-        if typing.TYPE_CHECKING:
-            ydict = cast(_EDConfTypedDict, _yml)
-        else:
-            ydict = _yml
+        self._dataset = dataset
+        self._inmem = lazy
 
-        self._init_emul_data(ydict)
+        if not lazy:
+            for path in self._dataset.files:
+                self._get_emul_file(path)
 
     def run_async(self, *args, **kwargs):
         """Refer to 'ProcessManagerBase.run_async()'."""
@@ -414,6 +266,26 @@ class EmulProcessManager(LocalProcessManager.LocalProcessManager):
         """Refer to 'ProcessManagerBase.run_verify_nojoin()'."""
         raise NotImplementedError("EmulProcessManager.run_verify_nojoin()")
 
+    def run_python(self, *args, **kwargs):
+        """Refer to 'ProcessManagerBase.run_python()'."""
+        raise NotImplementedError("EmulProcessManager.run_python()")
+
+    def run_python_join(self, *args, **kwargs):
+        """Refer to 'ProcessManagerBase.run_python_join()'."""
+        raise NotImplementedError("EmulProcessManager.run_python_join()")
+
+    def run_python_verify(self, *args, **kwargs):
+        """Refer to 'ProcessManagerBase.run_python_verify()'."""
+        raise NotImplementedError("EmulProcessManager.run_python_verify()")
+
+    def run_python_verify_join(self, *args, **kwargs):
+        """Refer to 'ProcessManagerBase.run_python_verify_join()'."""
+        raise NotImplementedError("EmulProcessManager.run_python_verify_join()")
+
+    def run_python_verify_nojoin(self, *args, **kwargs):
+        """Refer to 'ProcessManagerBase.run_python_verify_nojoin()'."""
+        raise NotImplementedError("EmulProcessManager.run_python_verify_nojoin()")
+
     def rsync(self, *args, **kwargs):
         """Refer to 'ProcessManagerBase.rsync()'."""
         raise NotImplementedError("EmulProcessManager.rsync()")
@@ -431,9 +303,9 @@ class EmulProcessManager(LocalProcessManager.LocalProcessManager):
 
         _LOG.debug("Opening file '%s' with mode '%s'", path, mode)
 
-        path = str(path)
-        if path in self._emd["files"]:
-            return self._emd["files"][path].open(mode)
+        emul_file = self._get_emul_file(_normpath(path))
+        if emul_file:
+            return emul_file.open(mode)
 
         raise ErrorNotFound(f"File '{path}' not found in emulated filesystem{self.hostmsg}")
 
@@ -461,51 +333,50 @@ class EmulProcessManager(LocalProcessManager.LocalProcessManager):
                path: Path,
                sort_by: LsdirSortbyType,
                reverse: bool) -> Generator[LsdirTypedDict, None, None]:
-        """Same as 'ProcessManagerBase._lsdir()', but rebase 'path' to the base directory."""
+        """
+        Same as 'ProcessManagerBase._lsdir()', but list the emulated filesystem index. Entry paths
+        are relative to the root directory, and entry creation times are 0.
+        """
 
-        rebased_path = self._basepath / str(path).lstrip("/")
+        dirpath = _normpath(path)
+        entries = self._dataset.dirs.get(dirpath)
+        if entries is None:
+            raise ErrorNotFound(f"Directory '{path}' does not exist{self.hostmsg}")
 
-        for entry in super()._lsdir(rebased_path, sort_by, reverse):
-            entry["path"] = entry["path"].relative_to(self._basepath)
-            yield entry
+        relpath = Path(dirpath.lstrip("/"))
+        info: dict[str, LsdirTypedDict] = {}
+        for name, is_dir in entries.items():
+            info[name] = {"name": name,
+                          "path": relpath / name,
+                          "ctime": 0.0,
+                          "mode": _DIR_MODE if is_dir else _FILE_MODE}
 
-    def exists(self, path: str | Path) -> bool:
-        """Same as 'ProcessManagerBase.exists()', but rebase 'path' to the base directory."""
+        yield from self._sort_lsdir_result(info, sort_by, reverse)
 
-        path = str(path)
-        if path in self._emd["files"]:
-            return True
+    def exists(self, path: str | Path) -> bool:
+        """Same as 'ProcessManagerBase.exists()', but check the emulated filesystem index."""
 
-        rebased_path = self._basepath / path.lstrip("/")
-        return super().exists(rebased_path)
+        return self.is_file(path) or self.is_dir(path)
 
     def is_file(self, path: str | Path) -> bool:
-        """Same as 'ProcessManagerBase.is_file()', but rebase 'path' to the base directory."""
-
-        path = str(path)
-        if path in self._emd["files"]:
-            return True
+        """Same as 'ProcessManagerBase.is_file()', but check the emulated filesystem index."""
 
-        rebased_path = self._basepath / path.lstrip("/")
-        return super().is_file(rebased_path)
+        return _normpath(path) in self._dataset.files
 
     def is_dir(self, path: str | Path) -> bool:
-        """Same as 'ProcessManagerBase.is_dir()', but rebase 'path' to the base directory."""
+        """Same as 'ProcessManagerBase.is_dir()', but check the emulated filesystem index."""
 
-        rebased_path = self._basepath / str(path).lstrip("/")
-        return super().is_dir(rebased_path)
+        return _normpath(path) in self._dataset.dirs
 
     def is_exe(self, path: str | Path) -> bool:
-        """Same as 'ProcessManagerBase.is_exe()', but rebase 'path' to the base directory."""
+        """Same as 'ProcessManagerBase.is_exe()', but there are no executable emulated files."""
 
-        rebased_path = self._basepath / str(path).lstrip("/")
-        return super().is_exe(rebased_path)
+        return False
 
     def is_socket(self, path: str | Path) -> bool:
-        """Same as 'ProcessManagerBase.is_socket()', but rebase 'path' to the base directory."""
+        """Same as 'ProcessManagerBase.is_socket()', but there are no emulated Unix sockets."""
 
-        rebased_path = self._basepath / str(path).lstrip("/")
-        return super().is_socket(rebased_path)
+        return False
 
     def is_fifo(self, path: str | Path) -> bool:
         """Refer to 'ProcessManagerBase.is_fifo()'."""
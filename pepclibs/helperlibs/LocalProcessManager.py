@@ -23,6 +23,7 @@ import shutil
 import socket
 import typing
 import tempfile
+import selectors
 import subprocess
 from pathlib import Path
 from pepclibs.helperlibs import Logging, _ProcessManagerBase, ClassHelpers, Trivial
@@ -77,6 +78,27 @@ class LocalProcess(_ProcessManagerBase.ProcessBase):
 
         raise Error(f"Received 'EAGAIN' error {retries} times")
 
+    def _wait_for_streams(self, timeout: int | float) -> list[int]:
+        """Refer to 'ProcessBase._wait_for_streams()'."""
+
+        streamids = self._get_open_streamids()
+
+        if not self._selector:
+            self._selector = selectors.DefaultSelector()
+            for streamid in streamids:
+                self._selector.register(self._streams[streamid], selectors.EVENT_READ,
+                                        data=streamid)
+        else:
+            # Stop watching the closed streams.
+            for key in list(self._selector.get_map().values()):
+                if key.data not in streamids:
+                    self._selector.unregister(key.fileobj)
+
+        if not self._selector.get_map():
+            return []
+
+        return [key.data for key, _ in self._selector.select(timeout)]
+
     def _kill(self):
         """Refer to 'ProcessBase._kill()'."""
 
@@ -175,15 +197,9 @@ class LocalProcess(_ProcessManagerBase.ProcessBase):
             else:
                 # One of the output streams closed.
                 self._dbg("LocalProcess._wait(): Stream %d closed", streamid)
-
-                thread = self._threads[streamid]
-                self._threads[streamid] = None
                 self._streams[streamid] = None
 
-                assert thread is not None
-                thread.join()
-
-                if not self._threads[0] and not self._threads[1]:
+                if not self._streams[0] and not self._streams[1]:
                     self._dbg("LocalProcess._wait(): Both streams closed")
                     self.exitcode = self._wait_timeout(timeout)
                     break
@@ -16,6 +16,7 @@ import sys
 import types
 import typing
 import logging
+import threading
 import traceback
 from pathlib import Path
 
@@ -51,6 +52,10 @@ MAIN_LOGGER_NAME: Final[str] = "main"
 # The default prefix for debug messages.
 _DEFAULT_DBG_PREFIX: Final[str] = "[%(created)f] [%(asctime)s] [%(module)s,%(lineno)d]"
 
+# Per-thread logger data, shared by all loggers. Used for redirecting 'INFO' level messages of a
+# thread to a thread-specific stream.
+_THREAD_DATA = threading.local()
+
 def _parse_debug_modules(argv: Sequence[str]) -> set[str]:
     """
     Parse the '--debug-modules' option from 'argv' and return the module names as a set.
@@ -235,6 +240,30 @@ class _MyFilter(logging.Filter):
             return True
         return False
 
+class _InfoStreamHandler(logging.StreamHandler):
+    """
+    A stream handler for 'INFO' level messages, which writes to the per-thread info stream instead
+    of the handler stream if the former is set for the current thread.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        """
+        Emit a log record.
+
+        Args:
+            record: The log record to emit.
+        """
+
+        stream: IO[str] | None = getattr(_THREAD_DATA, "info_stream", None)
+        if stream is None:
+            super().emit(record)
+            return
+
+        try:
+            stream.write(self.format(record) + self.terminator)
+        except Exception: # pylint: disable=broad-except
+            self.handleError(record)
+
 class Logger(logging.Logger):
     """
     A custom logger class that provides the following functionality on top of the standard logger:
@@ -247,6 +276,7 @@ class Logger(logging.Logger):
         - The 'error_out()' method.
         - The 'print_stacktrace()' method.
         - The 'debug_print_stacktrace()' method.
+        - Per-thread 'INFO' level message streams ('set_thread_info_stream()').
     """
 
     def __init__(self, name: str = ""):
@@ -357,7 +387,7 @@ class Logger(logging.Logger):
         formatter = _MyFormatter(prefix=self.prefix, colors=self._colors)
         self._formatters.append(formatter)
 
-        stream_handler = logging.StreamHandler(info_stream)
+        stream_handler = _InfoStreamHandler(info_stream)
         stream_handler.setFormatter(formatter)
         stream_handler.addFilter(_MyFilter([INFO]))
         self.addHandler(stream_handler)
@@ -567,6 +597,37 @@ class Logger(logging.Logger):
         self.addHandler(handler)
         self._extra_info_handlers[stream] = handler
 
+    def set_thread_info_stream(self, stream: IO[str] | None):
+        """
+        Redirect 'INFO' level messages logged by the current thread to a stream.
+
+        Args:
+            stream: The stream to write 'INFO' level messages of the current thread to, or 'None'
+                    to stop the redirection.
+
+        Notes:
+            - The redirection applies to all loggers and replaces the info stream passed to
+              'configure()'. Streams added with 'add_info_stream()' keep receiving the messages.
+            - Messages logged by other threads, including threads started by the current thread,
+              are not affected.
+        """
+
+        _THREAD_DATA.info_stream = stream
+
+    def get_info_stream(self) -> IO[str]:
+        """
+        Return the stream for printing the output of the current thread.
+
+        Returns:
+            The per-thread info stream if set with 'set_thread_info_stream()', otherwise
+            'sys.stdout'.
+        """
+
+        stream: IO[str] | None = getattr(_THREAD_DATA, "info_stream", None)
+        if stream is None:
+            return sys.stdout
+        return stream
+
     def add_error_stream(self, stream: IO[str]):
         """
         Add an additional stream for all log levels except INFO.
@@ -20,6 +20,7 @@ from __future__ import annotations # Remove when switching to Python 3.10+.
 import os
 import re
 import glob
+import json
 import time
 import stat
 import types
@@ -27,6 +28,7 @@ import shlex
 import random
 import typing
 import logging
+import selectors
 import threading
 import contextlib
 from pathlib import Path
@@ -42,7 +44,7 @@ from pepclibs.helperlibs.Exceptions import Error, ErrorPermissionDenied, ErrorTi
 from pepclibs.helperlibs.Exceptions import ErrorNotFound, ErrorExists
 
 if typing.TYPE_CHECKING:
-    from typing import Generator, IO, Iterable, Sequence, cast
+    from typing import Generator, IO, Iterable, Sequence, Final, cast
     from pepclibs.helperlibs._ProcessManagerTypes import LsdirTypedDict, LsdirSortbyType
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
@@ -52,6 +54,45 @@ logging.getLogger("paramiko").setLevel(logging.WARNING)
 
 _FAKE_EXIT_CODE = 69696969
 
+# The default maximum number of interactive shells per SSH connection.
+INTSH_COUNT: Final[int] = 4
+# The maximum number of Python agents per SSH connection and "superuser" flag.
+PYAGENT_COUNT: Final[int] = 4
+
+# The Python agent script. The agent is a long-lived Python interpreter process on the remote host,
+# which executes Python scripts sent to it over stdin, so that the interpreter startup cost is paid
+# only once per agent. The protocol is line-based: the agent prints a 'ready' line when it
+# starts, every request is a JSON-encoded script string on a single line, every response is a
+# JSON-encoded '[stdout, stderr, exitcode]' list on a single line.
+_PYAGENT_SCRIPT: Final[str] = """
+import io, sys, json, traceback, contextlib
+sys.stdout.write("ready\\n")
+sys.stdout.flush()
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    script = json.loads(line)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exitcode = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            exec(compile(script, "<pepc-agent>", "exec"), {"__name__": "__main__"})
+        except SystemExit as err:
+            if err.code is None:
+                exitcode = 0
+            elif isinstance(err.code, int):
+                exitcode = err.code
+            else:
+                print(err.code, file=sys.stderr)
+                exitcode = 1
+        except BaseException:
+            traceback.print_exc()
+            exitcode = 1
+    sys.stdout.write(json.dumps([stdout.getvalue(), stderr.getvalue(), exitcode]) + "\\n")
+    sys.stdout.flush()
+"""
+
 class SSHProcess(_ProcessManagerBase.ProcessBase):
     """
     A remote process created and managed by 'SSHProcessManager'.
@@ -104,6 +145,9 @@ class SSHProcess(_ProcessManagerBase.ProcessBase):
 
         # Whether the process was started with a 'sudo' prefix.
         self.sudo = False
+        # Whether the interactive shell is checked out from the interactive shells pool and runs a
+        # command. Protected by the process manager's '_intsh_lock'.
+        self._intsh_busy = False
 
         self._read_pid()
 
@@ -140,7 +184,7 @@ class SSHProcess(_ProcessManagerBase.ProcessBase):
             if self.exitcode is None and self.pid != -1:
                 self._kill()
             # pylint: disable=protected-access
-            self.pman._mark_intsh_idle(self.cmd)
+            self.pman._mark_intsh_idle(self)
         else:
             super().close()
 
@@ -169,6 +213,38 @@ class SSHProcess(_ProcessManagerBase.ProcessBase):
         except BaseException as err:
             raise Error(str(err)) from err
 
+    def _wait_for_streams(self, timeout: int | float) -> list[int]:
+        """
+        Refer to 'ProcessBase._wait_for_streams()'.
+
+        Both stdout and stderr of the process are delivered over the same SSH channel, which
+        provides a single file descriptor for polling. Wait on it, and then use 'recv_ready()' and
+        'recv_stderr_ready()' to find out which of the streams have data.
+        """
+
+        chan = self.pobj
+
+        if not self._selector:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(chan, selectors.EVENT_READ)
+
+        if not chan.recv_ready() and not chan.recv_stderr_ready():
+            self._selector.select(timeout)
+
+        # The channel is readable at end of file: the reads return no data.
+        eof = chan.eof_received or chan.closed
+
+        streamids: list[int] = []
+        for streamid in self._get_open_streamids():
+            if streamid == 0:
+                ready = chan.recv_ready()
+            else:
+                ready = chan.recv_stderr_ready()
+            if ready or eof:
+                streamids.append(streamid)
+
+        return streamids
+
     def _recv_exit_status_timeout(self, timeout: int | float) -> int | None:
         """
         Wait for the exit status of a remote process with a timeout.
@@ -311,7 +387,7 @@ class SSHProcess(_ProcessManagerBase.ProcessBase):
             result = self._get_lines_to_return(lines)
             if self._process_is_done():
                 # pylint: disable=protected-access
-                self.pman._mark_intsh_idle(self.cmd)
+                self.pman._mark_intsh_idle(self)
             return result
 
         # The interactive shell ('sh -s') is started once and reused across multiple commands. Each
@@ -366,7 +442,7 @@ class SSHProcess(_ProcessManagerBase.ProcessBase):
                 # Both markers seen. The real exit code is in 'exitcode[0]' (stdout marker).
                 # 'exitcode[1]' is always '_FAKE_EXIT_CODE' and is discarded.
                 self.exitcode = exitcode[0]
-                if self._queue.empty():
+                if not self._queue:
                     self._dbg("SSHProcess._wait_intsh(): Process exited with status %d",
                               self.exitcode)
                     break
@@ -413,7 +489,7 @@ class SSHProcess(_ProcessManagerBase.ProcessBase):
         if self._process_is_done():
             # Mark the interactive shell process as vacant.
             # pylint: disable=protected-access
-            self.pman._mark_intsh_idle(self.cmd)
+            self.pman._mark_intsh_idle(self)
 
         return result
 
@@ -445,14 +521,9 @@ class SSHProcess(_ProcessManagerBase.ProcessBase):
             else:
                 self._dbg("SSHProcess._wait_nointsh(): Stream %d closed", streamid)
                 # One of the output streams closed.
+                self._streams[streamid] = None
 
-                thread = self._threads[streamid]
-                self._threads[streamid] = None
-
-                assert thread is not None
-                thread.join()
-
-                if not self._threads[0] and not self._threads[1]:
+                if not self._streams[0] and not self._streams[1]:
                     self._dbg("SSHProcess._wait_nointsh(): Both streams closed")
                     self.exitcode = self._recv_exit_status_timeout(timeout)
                     break
@@ -473,8 +544,8 @@ class SSHProcess(_ProcessManagerBase.ProcessBase):
               lines: tuple[int, int] = (0, 0)) -> list[list[str]]:
         """Refer to 'ProcessBase._wait()'."""
 
-        # pylint: disable=protected-access
-        if self.pman._intsh and self.pobj == self.pman._intsh.pobj:
+        # The marker is set only for commands running in an interactive shell.
+        if self._marker:
             method = self._wait_intsh
         else:
             method = self._wait_nointsh
@@ -533,7 +604,8 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
                  username: str = "",
                  password: str | None = None,
                  privkeypath: str | Path = "",
-                 timeout: int | float | None = None):
+                 timeout: int | float | None = None,
+                 intsh_count: int = INTSH_COUNT):
         """
         Initialize a class instance and establish SSH connection to a remote host.
 
@@ -553,6 +625,10 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
                          configuration files.
             timeout: Timeout value for the establishing the SSH connection in seconds. Defaults to
                      60 seconds.
+            intsh_count: Maximum number of interactive shells to keep open. Commands run in an
+                         idle interactive shell, so this is the number of commands that can run
+                         concurrently without opening a new SSH session. Defaults to
+                         'INTSH_COUNT'.
 
         Raises:
             ErrorConnect: If SSH connection cannot be established (e.g., authentication fails).
@@ -586,17 +662,42 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
 
         self._sftp: paramiko.SFTPClient | DummyParamiko.SFTPClient | None = None
 
-        # The interactive shell session.
-        self._intsh: SSHProcess | None = None
-        # True while a command is running in the interactive shell, False when the shell is idle.
-        # Protected by '_intsh_lock': callers must hold the lock when reading or writing this flag.
-        # The lock is released immediately after the flag is updated, so it is never held during
-        # the actual command execution.
-        self._intsh_busy = False
-        # A short-lived mutex protecting '_intsh_busy'. It is held only for the brief moment of
-        # reading and writing the flag, never for the duration of a running command.
+        if intsh_count < 1:
+            raise Error(f"Bad interactive shells count {intsh_count}, must be a positive integer")
+        self._intsh_count = intsh_count
+
+        # The pool of interactive shell sessions. A command checks out an idle shell from the pool
+        # and returns it when the command finishes, so that up to '_intsh_count' commands can run
+        # concurrently over the same SSH connection.
+        #
+        # All the open interactive shells.
+        self._intshs: list[SSHProcess] = []
+        # The idle interactive shells, a subset of '_intshs'.
+        self._intshs_idle: list[SSHProcess] = []
+        # Count of interactive shells that are being started, but not yet in '_intshs'.
+        self._intshs_starting = 0
+        # A short-lived mutex protecting the pool, including the '_intsh_busy' flag of the shells.
+        # It is held only for the brief moment of checking out or returning a shell, never for the
+        # duration of a running command.
         self._intsh_lock = threading.Lock()
 
+        # The pools of Python agent processes, indexed by the "superuser" flag. An agent executes
+        # one script at a time, so a script checks out an idle agent from the pool and returns it
+        # when it finishes, the same way commands use the interactive shells pool.
+        #
+        # All the running Python agents.
+        self._pyagents: dict[bool, list[SSHProcess]] = {False: [], True: []}
+        # The idle Python agents, a subset of '_pyagents'.
+        self._pyagents_idle: dict[bool, list[SSHProcess]] = {False: [], True: []}
+        # Count of Python agents that are being started, but not yet in '_pyagents'.
+        self._pyagents_starting: dict[bool, int] = {False: 0, True: 0}
+        # A short-lived mutex protecting the Python agent pools. It is never held while an agent
+        # executes a script.
+        self._pyagents_lock = threading.Lock()
+        # Whether a Python agent failed to start. Scripts are executed in a new Python interpreter
+        # when this is set, without trying to start an agent again.
+        self._pyagent_failed: dict[bool, bool] = {False: False, True: False}
+
         if ipaddr:
             connhost = ipaddr
             self._vhostname = f"{hostname} ({ipaddr})"
@@ -674,11 +775,18 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
         _LOG.debug("Closing SSH connection to %s (port %d, username '%s', priv. keys '%s'",
                    self._vhostname, self.port, self.username, self.privkeypaths)
 
-        if self._intsh:
-            with contextlib.suppress(BaseException):
-                self._intsh.pobj.send("exit\n".encode())
+        for intsh in getattr(self, "_intshs", []):
+            self._close_intsh(intsh)
+        self._intshs = []
+        self._intshs_idle = []
 
-        ClassHelpers.close(self, close_attrs=("_sftp", "_intsh", "ssh",))
+        for su, procs in getattr(self, "_pyagents", {}).items():
+            for proc in procs:
+                self._stop_pyagent(proc, su)
+        self._pyagents = {False: [], True: []}
+        self._pyagents_idle = {False: [], True: []}
+
+        ClassHelpers.close(self, close_attrs=("_sftp", "ssh",))
 
         super().close()
 
@@ -899,6 +1007,7 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
         return SSHProcess(self, chan, command, cmd, streams)
 
     def _run_in_intsh(self,
+                      proc: SSHProcess,
                       command: str,
                       cwd: str | Path | None = None,
                       env: dict[str, str] | None = None,
@@ -907,6 +1016,7 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
         Execute a command in an interactive shell session.
 
         Args:
+            proc: The interactive shell process to run the command in.
             command: The command to execute in the interactive shell.
             cwd: The current working directory for the command.
             env: Environment variables to set for the command.
@@ -916,12 +1026,6 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
             An SSHProcess object representing the interactive shell process running the command.
         """
 
-        if not self._intsh:
-            cmd = "sh -s"
-            _LOG.debug("Starting interactive shell%s: %s", self.hostmsg, cmd)
-            self._intsh = self._run_in_new_session(cmd)
-
-        proc = self._intsh
         cmd = self._format_cmd(command, cwd=cwd, env=env)
 
         if mix_output:
@@ -973,22 +1077,90 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
 
         return acquired
 
-    def _mark_intsh_idle(self, command: str | None = None):
+    def _checkout_intsh(self, command: str) -> SSHProcess | None:
+        """
+        Check out an idle interactive shell from the pool, starting a new one if there are no idle
+        shells and the pool is not full.
+
+        Args:
+            command: The command the interactive shell is checked out for. Used for logging
+                     purposes.
+
+        Returns:
+            The interactive shell process object, or 'None' if all interactive shells are busy.
+        """
+
+        start = False
+        acquired = self._acquire_intsh_lock(command=command)
+        if not acquired:
+            return None
+
+        try:
+            if self._intshs_idle:
+                intsh = self._intshs_idle.pop()
+                intsh._intsh_busy = True # pylint: disable=protected-access
+                return intsh
+
+            if len(self._intshs) + self._intshs_starting < self._intsh_count:
+                # Reserve a pool slot, and start the shell without holding the lock.
+                self._intshs_starting += 1
+                start = True
+        finally:
+            self._intsh_lock.release()
+
+        if not start:
+            return None
+
+        cmd = "sh -s"
+        _LOG.debug("Starting interactive shell%s: %s", self.hostmsg, cmd)
+
+        intsh = None
+        try:
+            intsh = self._run_in_new_session(cmd)
+            intsh._intsh_busy = True # pylint: disable=protected-access
+        finally:
+            with self._intsh_lock:
+                self._intshs_starting -= 1
+                if intsh:
+                    self._intshs.append(intsh)
+
+        return intsh
+
+    def _mark_intsh_idle(self, intsh: SSHProcess):
         """
-        Mark the interactive shell as idle and available for the next command.
+        Return an interactive shell to the pool and mark it as idle and available for the next
+        command.
 
         Args:
-            command: Optional command string. Used for logging purposes if the lock cannot be
-                     acquired.
+            intsh: The interactive shell process object to return to the pool.
         """
 
-        acquired = self._acquire_intsh_lock(command)
+        acquired = self._acquire_intsh_lock(intsh.cmd)
         if not acquired:
             _LOG.warning("Failed to mark the interactive shell process as free")
-        else:
-            self._intsh_busy = False
+            return
+
+        # pylint: disable=protected-access
+        try:
+            if intsh._intsh_busy and intsh in self._intshs:
+                intsh._intsh_busy = False
+                self._intshs_idle.append(intsh)
+        finally:
             self._intsh_lock.release()
 
+    def _close_intsh(self, intsh: SSHProcess):
+        """
+        Exit an interactive shell and close its SSH session.
+
+        Args:
+            intsh: The interactive shell process object to close.
+        """
+
+        with contextlib.suppress(BaseException):
+            intsh.pobj.send("exit\n".encode())
+        with contextlib.suppress(BaseException):
+            intsh.pobj.close()
+
     def _do_run_async(self,
                       command: str | Path,
                       cwd: str | Path | None = None,
@@ -1025,43 +1197,29 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
         if not intsh:
             return self._run_in_new_session(command, cwd=cwd, env=env, mix_output=mix_output)
 
-        acquired = False
-        try:
-            acquired = self._acquire_intsh_lock(command=command)
-            if not acquired or self._intsh_busy:
-                intsh = False
-
-            if intsh:
-                self._intsh_busy = True
-        finally:
-            # Release the interactive shell lock if we acquired it.
-            if acquired:
-                self._intsh_lock.release()
-
+        intsh = self._checkout_intsh(command)
         if not intsh:
-            _LOG.warning("The interactive shell is busy, running the following command in a new "
-                         "SSH session:\n%s", command)
+            _LOG.warning("All %d interactive shells are busy, running the following command in a "
+                         "new SSH session:\n%s", self._intsh_count, command)
             return self._run_in_new_session(command, cwd=cwd, env=env, mix_output=mix_output)
 
         try:
-            return self._run_in_intsh(command, cwd=cwd, env=env, mix_output=mix_output)
+            return self._run_in_intsh(intsh, command, cwd=cwd, env=env, mix_output=mix_output)
         except BaseException as err: # pylint: disable=broad-except
             msg = Error(str(err)).indent(2)
             _LOG.warning("Failed to run the following command in an interactive shell:  %s\n"
                          "The error was:\n%s", command, msg)
 
-            # Close the interactive shell and try to run in a new session.
+            # Drop the interactive shell from the pool and try to run in a new session.
+            acquired = False
             with contextlib.suppress(BaseException):
                 acquired = self._acquire_intsh_lock(command=command)
 
             if acquired:
-                self._intsh_busy = False
+                with contextlib.suppress(ValueError):
+                    self._intshs.remove(intsh)
                 self._intsh_lock.release()
-                if self._intsh:
-                    with contextlib.suppress(BaseException):
-                        self._intsh.pobj.send("exit\n".encode())
-                        self._intsh.close()
-                    self._intsh = None
+                self._close_intsh(intsh)
             else:
                 _LOG.warning("Failed to acquire the interactive shell process lock")
 
@@ -1202,6 +1360,230 @@ class SSHProcessManager(_ProcessManagerBase.ProcessManagerBase):
                                        timeout=timeout)
         raise Error(msg)
 
+    def _stop_pyagent(self, proc: SSHProcess, su: bool):
+        """
+        Stop and close a Python agent process.
+
+        Args:
+            proc: The Python agent process to stop.
+            su: The "superuser" flag of the agent.
+        """
+
+        _LOG.debug("Stopping Python agent%s (su %s)", self.hostmsg, su)
+
+        with contextlib.suppress(BaseException):
+            # Sending EOF to stdin makes the agent exit gracefully.
+            proc.pobj.shutdown_write()
+            proc.wait(timeout=1)
+        with contextlib.suppress(BaseException):
+            proc.close()
+
+    def _drop_pyagent(self, proc: SSHProcess, su: bool):
+        """
+        Remove a Python agent process from the pool, then stop and close it.
+
+        Args:
+            proc: The Python agent process to drop.
+            su: The "superuser" flag of the agent.
+        """
+
+        with self._pyagents_lock:
+            with contextlib.suppress(ValueError):
+                self._pyagents[su].remove(proc)
+
+        self._stop_pyagent(proc, su)
+
+    def _start_pyagent(self, su: bool, timeout: int | float) -> SSHProcess:
+        """
+        Start a new Python agent process.
+
+        Args:
+            su: If True, start the agent with superuser privileges.
+            timeout: Maximum amount of seconds to wait for the agent to start.
+
+        Returns:
+            The Python agent process object.
+
+        Raises:
+            Error: The agent failed to start.
+        """
+
+        python_path = self.get_python_path()
+        cmd = f"{python_path} -u -c {shlex.quote(_PYAGENT_SCRIPT)}"
+
+        _LOG.debug("Starting Python agent%s (su %s)", self.hostmsg, su)
+        proc = self._run_async(cmd, intsh=False, su=su)
+
+        # Wait for the agent to report that it is ready to execute scripts.
+        try:
+            stdout, stderr, exitcode = proc.wait_nojoin(timeout=timeout, lines=(1, 0))
+        except BaseException:
+            self._stop_pyagent(proc, su)
+            raise
+
+        if not stdout or stdout[0].strip() != "ready":
+            self._stop_pyagent(proc, su)
+            raise Error(self.get_cmd_failure_msg("Python agent", stdout, stderr, exitcode,
+                                                 timeout=timeout))
+        return proc
+
+    def _checkout_pyagent(self, su: bool, timeout: int | float) -> SSHProcess | None:
+        """
+        Check out an idle Python agent from the pool, starting a new one if there are no idle
+        agents and the pool is not full.
+
+        Args:
+            su: If True, check out an agent running with superuser privileges.
+            timeout: Maximum amount of seconds to wait for a new agent to start.
+
+        Returns:
+            The Python agent process object, or 'None' if all the agents are busy.
+
+        Raises:
+            Error: A new agent failed to start.
+        """
+
+        with self._pyagents_lock:
+            if self._pyagents_idle[su]:
+                return self._pyagents_idle[su].pop()
+
+            if len(self._pyagents[su]) + self._pyagents_starting[su] >= PYAGENT_COUNT:
+                return None
+
+            # Reserve a pool slot, and start the agent without holding the lock.
+            self._pyagents_starting[su] += 1
+
+        proc = None
+        try:
+            proc = self._start_pyagent(su, timeout)
+        finally:
+            with self._pyagents_lock:
+                self._pyagents_starting[su] -= 1
+                if proc:
+                    self._pyagents[su].append(proc)
+
+        return proc
+
+    def _mark_pyagent_idle(self, proc: SSHProcess, su: bool):
+        """
+        Return a Python agent to the pool and mark it as idle and available for the next script.
+
+        Args:
+            proc: The Python agent process to return to the pool.
+            su: The "superuser" flag of the agent.
+        """
+
+        with self._pyagents_lock:
+            if proc in self._pyagents[su]:
+                self._pyagents_idle[su].append(proc)
+
+    def _run_python_in_agent(self,
+                             proc: SSHProcess,
+                             script: str,
+                             timeout: int | float,
+                             su: bool) -> tuple[str, str, int]:
+        """
+        Execute a Python script in a Python agent process. Drop the agent from the pool if it fails.
+
+        Args:
+            proc: The Python agent process checked out from the pool (refer to
+                  '_checkout_pyagent()').
+            script: The Python script to execute.
+            timeout: Maximum amount of seconds to wait for the script to complete.
+            su: The "superuser" flag of the agent.
+
+        Returns:
+            A tuple of (stdout, stderr, exitcode) of the script.
+        """
+
+        try:
+            proc.stdin.write((json.dumps(script) + "\n").encode())
+            proc.stdin.flush()
+            stdout, _, exitcode = proc.wait_nojoin(timeout=timeout, lines=(1, 0))
+        except BaseException:
+            self._drop_pyagent(proc, su)
+            raise
+
+        if not stdout:
+            self._drop_pyagent(proc, su)
+            if exitcode is None:
+                raise ErrorTimeOut(f"Python agent did not respond within {timeout} seconds"
+                                   f"{self.hostmsg}")
+            raise Error(f"Python agent exited unexpectedly with exit code {exitcode}"
+                        f"{self.hostmsg}")
+
+        try:
+            result = json.loads(stdout[0])
+            return str(result[0]), str(result[1]), int(result[2])
+        except (ValueError, TypeError, IndexError) as err:
+            self._drop_pyagent(proc, su)
+            raise Error(f"Bad Python agent response{self.hostmsg}:\n  {stdout[0]}") from err
+
+    def run_python(self,
+                   script: str,
+                   timeout: int | float | None = None,
+                   join: bool = True,
+                   su: bool = False) -> ProcWaitResultType:
+        """
+        Refer to 'ProcessManagerBase.run_python()'.
+
+        Execute the script in a long-lived Python agent process instead of starting a new Python
+        interpreter for every script. Up to 'PYAGENT_COUNT' agents run scripts concurrently, and
+        if all of them are busy, execute the script in a new Python interpreter. Fall back to a new
+        interpreter as well if an agent cannot be started, and do not try to start agents again
+        after that. Do not fall back if the agent failed after the script was sent to it, because
+        the script may have been executed, at least partially.
+        """
+
+        if timeout is None:
+            timeout = _ProcessManagerBase.TIMEOUT
+
+        if su and self.is_superuser():
+            su = False
+
+        proc = None
+        if not self._pyagent_failed[su]:
+            try:
+                proc = self._checkout_pyagent(su, timeout)
+            except Error as err:
+                _LOG.debug("Failed to start Python agent%s, falling back to a new Python "
+                           "interpreter:\n%s", self.hostmsg, err.indent(2))
+                self._pyagent_failed[su] = True
+            else:
+                if not proc:
+                    _LOG.debug("All %d Python agents%s are busy, running the script in a new "
+                               "Python interpreter", PYAGENT_COUNT, self.hostmsg)
+
+        if not proc:
+            return super().run_python(script, timeout=timeout, join=join, su=su)
+
+        stdout, stderr, exitcode = self._run_python_in_agent(proc, script, timeout, su)
+        self._mark_pyagent_idle(proc, su)
+
+        if join:
+            return ProcWaitResultType(stdout=stdout, stderr=stderr, exitcode=exitcode)
+        return ProcWaitResultType(stdout=stdout.splitlines(keepends=True),
+                                  stderr=stderr.splitlines(keepends=True), exitcode=exitcode)
+
+    def run_python_verify(self,
+                          script: str,
+                          timeout: int | float | None = None,
+                          join: bool = True,
+                          su: bool = False) -> tuple[str | list[str], str | list[str]]:
+        """
+        Refer to 'ProcessManagerBase.run_python_verify()'.
+
+        Execute the script in a long-lived Python agent process, refer to 'run_python()'.
+        """
+
+        stdout, stderr, exitcode = self.run_python(script, timeout=timeout, join=join, su=su)
+
+        if exitcode != 0:
+            cmd = f"{self.get_python_path()} -c {shlex.quote(script)}"
+            raise Error(self.get_cmd_failure_msg(cmd, stdout, stderr, exitcode, timeout=timeout))
+
+        return stdout, stderr
+
     def get_ssh_opts(self) -> str:
         """
         Generate SSH command-line options for establishing a connection.
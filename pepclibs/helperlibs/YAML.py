@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2020-2025 Intel Corporation
+# Copyright (C) 2020-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -50,6 +50,10 @@ if typing.TYPE_CHECKING:
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
 
+# The YAML loader class to use. Prefer the libyaml-based loader, which is much faster than the pure
+# Python one, but is not available if PyYAML was built without libyaml.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def _drop_none(data: Mapping[str, Any]) -> Mapping[str, Any]:
     """
     Create a copy of the input dictionary, excluding keys with 'None' values.
@@ -248,9 +252,8 @@ def _load(fobj: IO[str],
 
     _LOG.debug("Loading YAML file at '%s'", path)
 
-    yaml.SafeLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-                                    _dict_constructor)
-    yaml.SafeLoader.add_constructor("!path", _path_constructor)
+    SafeLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
+    SafeLoader.add_constructor("!path", _path_constructor)
 
     close_fobj = False
 
@@ -270,7 +273,7 @@ def _load(fobj: IO[str],
             fobj = rendered_fobj
 
     try:
-        loaded: dict[str, Any] = yaml.safe_load(fobj)
+        loaded: dict[str, Any] = yaml.load(fobj, Loader=SafeLoader)
     except (TypeError, ValueError, yaml.YAMLError) as err:
         errmsg = Error(str(err)).indent(2)
         raise Error(f"Failed to parse YAML file {path}:\n{errmsg}") from None
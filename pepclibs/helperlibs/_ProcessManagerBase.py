@@ -14,12 +14,13 @@ the command is executed on the local or remote system.
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
-import queue
+import time
 import shlex
 import codecs
 import typing
-import threading
+import selectors
 import contextlib
+from collections import deque
 from pathlib import Path
 from operator import itemgetter
 from pepclibs.helperlibs import Logging, Human, Trivial, ClassHelpers, ToolChecker, _SudoIO
@@ -39,6 +40,11 @@ TIMEOUT: Final[int] = 24 * 60 * 60
 # Default options for the 'rsync' command.
 DEFAULT_RSYNC_OPTS: Final[str] = "-rlD"
 
+# The minimum and maximum sizes of a single process output stream read in bytes. The read size
+# starts at the minimum and adapts to the amount of data the process produces.
+_MIN_READ_SIZE: Final[int] = 4096
+_MAX_READ_SIZE: Final[int] = 1024 * 1024
+
 def get_err_prefix(fobj: IO, method_name: str) -> str:
     """
     Generate an exception message prefix for a file-like object that will be wrapped by
@@ -162,17 +168,26 @@ class ProcessBase(ClassHelpers.SimpleCloseContext):
         # message related to different processes.
         self.debug_id = ""
 
-        # The stream fetcher threads have to exit if the '_threads_exit' flag becomes 'True'.
-        self._threads_exit = False
+        # The process object cannot be used for waiting anymore if the '_closed' flag is 'True'.
+        self._closed = False
         # The output for the process that was read from 'self._queue', but not yet sent to the user
         # (separate for 'stdout' and 'stderr').
         self._output: list[list[str]] = [[], []]
         # The last partial lines of the stdout and stderr streams of the process.
         self._partial = ["", ""]
-        # The threads fetching data from the stdout/stderr streams of the process.
-        self._threads: list[threading.Thread | None] = [None, None]
-        # The queue for passing process output from stream fetcher threads.
-        self._queue: queue.Queue | None = None
+        # The queue of process output items fetched from the stdout/stderr streams, but not yet
+        # handled. Items are (streamid, data) tuples, 'data' is 'None' for the end of stream.
+        self._queue: deque[tuple[int, str | None]] | None = None
+        # The incremental decoders for the stdout/stderr streams.
+        self._decoders = [codecs.getincrementaldecoder("utf8")(errors="surrogateescape")
+                          for _ in range(2)]
+        # The current read sizes for the stdout/stderr streams.
+        self._read_sizes = [_MIN_READ_SIZE, _MIN_READ_SIZE]
+        # Whether the end of the stdout/stderr streams has been reached.
+        self._eof = [False, False]
+        # The selector for waiting for data on the stdout/stderr streams. Created and used by
+        # subclasses.
+        self._selector: selectors.BaseSelector | None = None
 
         if self.stdin:
             if not getattr(self.stdin, "name", None):
@@ -201,20 +216,26 @@ class ProcessBase(ClassHelpers.SimpleCloseContext):
         self.pid = -1
         self.exitcode = None
 
-        self._threads_exit = False
+        self._closed = False
         self._output = [[], []]
         self._partial = ["", ""]
 
+        self._queue = None
+        self._decoders = [codecs.getincrementaldecoder("utf8")(errors="surrogateescape")
+                          for _ in range(2)]
+        self._read_sizes = [_MIN_READ_SIZE, _MIN_READ_SIZE]
+        self._eof = [False, False]
+
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+
     def __del__(self):
         """Class destructor."""
 
         with contextlib.suppress(BaseException):
             self._dbg("ProcessBase.__del__()")
 
-        if hasattr(self, "_threads_exit"):
-            # Increase chances of threads exiting if something went wrong (resilience).
-            self._threads_exit = True
-
     def close(self):
         """
         Free allocated resources.
@@ -225,14 +246,17 @@ class ProcessBase(ClassHelpers.SimpleCloseContext):
 
         self._dbg("ProcessBase.close()")
 
-        if hasattr(self, "_threads_exit"):
-            # Make sure the threads exit before killing the process.
-            self._threads_exit = True
+        if hasattr(self, "_closed"):
+            self._closed = True
 
         if self.exitcode is None and self.pid != -1:
             self._kill()
 
-        unref_attrs = ("pman", "pobj", "_streams", "stdin", "_threads")
+        if getattr(self, "_selector", None):
+            with contextlib.suppress(BaseException):
+                self._selector.close()
+
+        unref_attrs = ("pman", "pobj", "_streams", "stdin", "_selector")
         ClassHelpers.close(self, unref_attrs=unref_attrs)
 
     def _kill(self):
@@ -254,86 +278,127 @@ class ProcessBase(ClassHelpers.SimpleCloseContext):
             size: Maximum number of bytes to retrieve.
 
         Returns:
-            The retrieved data as bytes (empty bytes object no data are available).
+            The retrieved data as bytes (empty bytes object if the stream was closed).
+
+        Notes:
+            - Called only for streams reported as ready by '_wait_for_streams()', so it is not
+              expected to block.
         """
 
         raise NotImplementedError("ProcessBase._fetch_stream_data()")
 
-    def _stream_fetcher(self, streamid: int):
+    def _wait_for_streams(self, timeout: int | float) -> list[int]:
+        """
+        Wait for data or end of stream on the stdout and stderr streams of the process.
+
+        Args:
+            timeout: Maximum amount of seconds to wait. If 0, do not wait, just check the streams.
+
+        Returns:
+            Identifiers of the streams that are ready for reading without blocking: the streams
+            that have data or have been closed. An empty list if the operation timed out.
         """
-        Fetch data from a stream in a separate thread.
 
-        Continuously read data from one of the output streams (stdout or stderr) of the executed
-        program and place the data into a queue. Stop when the stream is closed, no more data are
-        available, an error occurs, or the thread is signaled to exit via 'self._threads_exit'.
+        raise NotImplementedError("ProcessBase._wait_for_streams()")
+
+    def _get_open_streamids(self) -> list[int]:
+        """
+        Return identifiers of the stdout and stderr streams that may still provide data.
+
+        Returns:
+            A list of stream identifiers (0 for stdout, 1 for stderr).
+        """
+
+        return [streamid for streamid in (0, 1)
+                if self._streams[streamid] and not self._eof[streamid]]
+
+    def _fetch_streams(self, timeout: int | float):
+        """
+        Wait for the stdout and stderr streams of the process and move the available data to the
+        queue.
+
+        Read both streams in the calling thread, demultiplexing them with '_wait_for_streams()'.
+        Adapt the read size of a stream to the amount of data the process produces: grow it when a
+        read fills the buffer and shrink it when reads return little data. Place the end of stream
+        indicator to the queue when a stream is closed or a read error occurs.
 
         Args:
-            streamid: Identifier of the stream to fetch data from (0 for stdout, 1 for stderr).
+            timeout: Maximum amount of seconds to wait for data. If 0, do not wait.
         """
 
         assert self._queue is not None
 
-        try:
-            decoder = codecs.getincrementaldecoder('utf8')(errors="surrogateescape")
-            while not self._threads_exit:
-                if not self._streams[streamid]:
-                    self._dbg("ProcessBase._stream_fetcher(): streamid %d: Stream is closed",
-                              streamid)
-                    break
+        for streamid in self._wait_for_streams(timeout):
+            if self._eof[streamid]:
+                continue
 
+            size = self._read_sizes[streamid]
+            try:
+                bytes_data = self._fetch_stream_data(streamid, size)
+            except (Error, OSError) as err:
+                _LOG.error("Failed to read from streamid %d of PID %s: %s\n"
+                           "The command of the process: %s",
+                           streamid, str(self.pid), err, self.cmd)
                 bytes_data = bytes()
-                try:
-                    bytes_data = self._fetch_stream_data(streamid, 4096)
-                except Error as err:
-                    _LOG.error("Failed to read from streamid %d of PID %s: %s\n"
-                               "The command of the process: %s",
-                               streamid, str(self.pid), err, self.cmd)
-                    break
-
-                if not bytes_data:
-                    self._dbg("ProcessBase._stream_fetcher(): streamid %d: No more data", streamid)
-                    break
-
-                data = decoder.decode(bytes_data)
-                if not data:
-                    self._dbg("ProcessBase._stream_fetcher(): streamid %d: Will read more data",
-                              streamid)
-                    continue
-
-                self._dbg("ProcessBase._stream_fetcher(): streamid %d: Read data:\n%s",
-                          streamid, repr(data))
-                self._queue.put((streamid, data))
-        except BaseException as err: # pylint: disable=broad-except
-            errmsg = Error(str(err)).indent(2)
-            _LOG.error("Exception in stream fetcher for PID %s, streamid %d:\n%s",
-                       str(self.pid), streamid, errmsg)
-
-        # Place the end of stream indicator to the queue.
-        self._queue.put((streamid, None))
-        self._dbg("ProcessBase._stream_fetcher(): streamid %d: Thread exists", streamid)
+
+            decoder = self._decoders[streamid]
+
+            if not bytes_data:
+                self._dbg("ProcessBase._fetch_streams(): streamid %d: No more data", streamid)
+                data = decoder.decode(bytes(), final=True)
+                if data:
+                    self._queue.append((streamid, data))
+                # Place the end of stream indicator to the queue.
+                self._queue.append((streamid, None))
+                self._eof[streamid] = True
+                continue
+
+            if len(bytes_data) >= size:
+                self._read_sizes[streamid] = min(size * 2, _MAX_READ_SIZE)
+            elif len(bytes_data) < size // 4:
+                self._read_sizes[streamid] = max(size // 2, _MIN_READ_SIZE)
+
+            data = decoder.decode(bytes_data)
+            if not data:
+                self._dbg("ProcessBase._fetch_streams(): streamid %d: Will read more data",
+                          streamid)
+                continue
+
+            self._dbg("ProcessBase._fetch_streams(): streamid %d: Read data:\n%s",
+                      streamid, repr(data))
+            self._queue.append((streamid, data))
 
     def _get_next_queue_item(self, timeout: int | float = 0) -> tuple[int, str | None]:
         """
-        Retrieve a data item from the stream fetcher queue.
+        Retrieve a data item from the queue, fetching more data from the process output streams if
+        the queue is empty.
 
         Args:
-            timeout: Maximum amount of seconds to wait for an item. If 0, wait indefinitely.
+            timeout: Maximum amount of seconds to wait for an item. If 0, do not wait.
 
         Returns:
             The data item as a tuple in the format (streamid, data):
               - streamid: 0 for stdout, 1 for stderr.
-              - data: Stream data, which may be a partial line.
+              - data: Stream data, which may be a partial line, or 'None' if the stream was closed.
             Return '(-1, None)' if the operation times out.
         """
 
         assert self._queue is not None
 
-        try:
+        if not self._queue:
             if timeout:
-                return self._queue.get(timeout=timeout)
-            return self._queue.get(block=False)
-        except queue.Empty:
-            return (-1, None)
+                deadline = time.time() + timeout
+                while not self._queue and self._get_open_streamids():
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._fetch_streams(remaining)
+            elif self._get_open_streamids():
+                self._fetch_streams(0)
+
+        if self._queue:
+            return self._queue.popleft()
+        return (-1, None)
 
     def _handle_queue_item(self,
                            streamid: int,
@@ -424,7 +489,7 @@ class ProcessBase(ClassHelpers.SimpleCloseContext):
         return self.exitcode is not None and \
                not self._output[0] and \
                not self._output[1] and \
-               (not self._queue or self._queue.empty())
+               not self._queue
 
     def poll(self) -> int | None:
         """
@@ -521,9 +586,8 @@ class ProcessBase(ClassHelpers.SimpleCloseContext):
                   "real command:\n  %s", str(timeout), str(capture_output), str(lines), str(join),
                   self.real_cmd)
 
-        if self._threads_exit:
-            raise Error(f"The process (PID {str(self.pid)}) has 'threads_exit' flag set and cannot "
-                        f"be used")
+        if self._closed:
+            raise Error(f"The process (PID {str(self.pid)}) has been closed and cannot be used")
 
         stdout: str | list[str]
         stderr: str | list[str]
@@ -535,23 +599,10 @@ class ProcessBase(ClassHelpers.SimpleCloseContext):
         if self._process_is_done():
             return ProcWaitResultType(stdout=stdout, stderr=stderr, exitcode=self.exitcode)
 
-        if not self._queue:
-            self._queue = queue.Queue()
-            for streamid in (0, 1):
-                if self._streams[streamid]:
-                    assert self._threads[streamid] is None
-                    try:
-                        thread = threading.Thread(target=self._stream_fetcher,
-                                                  name='stream-fetcher',
-                                                  args=(streamid,), daemon=True)
-                        thread.start()
-                    except BaseException as err:
-                        errmsg = Error(str(err)).indent(2)
-                        raise Error(f"Failed to start the stream fetcher thread:\n{errmsg}\n"
-                                    f"PID: {str(self.pid)}\nCommand: {self.cmd}") from err
-                    self._threads[streamid] = thread
+        if self._queue is None:
+            self._queue = deque()
         else:
-            self._dbg("ProcessBase.wait(): Queue is empty: %s", self._queue.empty())
+            self._dbg("ProcessBase.wait(): Queue is empty: %s", not self._queue)
 
         output = self._wait(timeout=timeout, capture_output=capture_output,
                             output_fobjs=output_fobjs, lines=lines)
@@ -1101,6 +1152,116 @@ class ProcessManagerBase(ClassHelpers.SimpleCloseContext):
             return cast(tuple[list[str], list[str]], res)
         return res
 
+    def run_python(self,
+                   script: str,
+                   timeout: int | float | None = None,
+                   join: bool = True,
+                   su: bool = False) -> ProcWaitResultType:
+        """
+        Execute a Python script on the host and wait for it to finish.
+
+        Same as 'run_python_verify()', but do not verify the exit code of the script. Scripts may
+        use the exit code to report the failure reason to the caller.
+
+        Args:
+            script: The Python script to execute.
+            timeout: Maximum amount of seconds to wait for the script to complete. Defaults to
+                     'TIMEOUT'.
+            join: Return captured output as a single string if True, or as a list of lines if False.
+            su: If True, execute the script with superuser privileges.
+
+        Returns:
+            A 'ProcWaitResultType' named tuple of (stdout, stderr, exitcode) of the script.
+
+        Raises:
+            ErrorPermissionDenied: The script cannot be executed with superuser privileges.
+            ErrorTimeOut: The timeout expired before the script completed.
+        """
+
+        python_path = self.get_python_path()
+        cmd = f"{python_path} -c {shlex.quote(script)}"
+        return self.run(cmd, timeout=timeout, join=join, su=su)
+
+    def run_python_join(self,
+                        script: str,
+                        timeout: int | float | None = None,
+                        su: bool = False) -> ProcWaitResultJoinType:
+        """
+        Same as 'run_python(join=True)', provided for convenience and more deterministic return
+        type.
+        """
+
+        res = self.run_python(script, timeout=timeout, join=True, su=su)
+
+        if typing.TYPE_CHECKING:
+            stdout = cast(str, res.stdout)
+            stderr = cast(str, res.stderr)
+        else:
+            stdout = res.stdout
+            stderr = res.stderr
+
+        return ProcWaitResultJoinType(stdout=stdout, stderr=stderr, exitcode=res.exitcode)
+
+    def run_python_verify(self,
+                          script: str,
+                          timeout: int | float | None = None,
+                          join: bool = True,
+                          su: bool = False) -> tuple[str | list[str], str | list[str]]:
+        """
+        Execute a Python script on the host and verify that it succeeded.
+
+        The bulk I/O operations (reading many sysfs files, reading MSRs on many CPUs, etc) are
+        implemented as small Python scripts executed on the target host. This method runs such a
+        script by starting a new Python interpreter ('python -c <script>'). Subclasses may override
+        it to run scripts more efficiently, e.g., in a long-lived interpreter process.
+
+        Args:
+            script: The Python script to execute.
+            timeout: Maximum amount of seconds to wait for the script to complete. Defaults to
+                     'TIMEOUT'.
+            join: Return captured output as a single string if True, or as a list of lines if False.
+            su: If True, execute the script with superuser privileges.
+
+        Returns:
+            A tuple of (stdout, stderr) of the script.
+
+        Raises:
+            ErrorPermissionDenied: The script cannot be executed with superuser privileges.
+            ErrorTimeOut: The timeout expired before the script completed.
+        """
+
+        python_path = self.get_python_path()
+        cmd = f"{python_path} -c {shlex.quote(script)}"
+        return self.run_verify(cmd, timeout=timeout, join=join, su=su)
+
+    def run_python_verify_join(self,
+                               script: str,
+                               timeout: int | float | None = None,
+                               su: bool = False) -> tuple[str, str]:
+        """
+        Same as 'run_python_verify(join=True)', provided for convenience and more deterministic
+        return type.
+        """
+
+        res = self.run_python_verify(script, timeout=timeout, join=True, su=su)
+        if typing.TYPE_CHECKING:
+            return cast(tuple[str, str], res)
+        return res
+
+    def run_python_verify_nojoin(self,
+                                 script: str,
+                                 timeout: int | float | None = None,
+                                 su: bool = False) -> tuple[list[str], list[str]]:
+        """
+        Same as 'run_python_verify(join=False)', provided for convenience and more deterministic
+        return type.
+        """
+
+        res = self.run_python_verify(script, timeout=timeout, join=False, su=su)
+        if typing.TYPE_CHECKING:
+            return cast(tuple[list[str], list[str]], res)
+        return res
+
     @staticmethod
     def _rsync_add_debug_opts(opts: str) -> str:
         """
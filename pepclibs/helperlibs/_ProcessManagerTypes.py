@@ -257,6 +257,43 @@ class ProcessManagerProtocol(Protocol):
         """Refer to 'ProcessManagerBase.run_verify_nojoin()'."""
         ...
 
+    def run_python(self,
+                   script: str,
+                   timeout: int | float | None = ...,
+                   join: bool = ...,
+                   su: bool = ...) -> ProcWaitResultType:
+        """Refer to 'ProcessManagerBase.run_python()'."""
+        ...
+
+    def run_python_join(self,
+                        script: str,
+                        timeout: int | float | None = ...,
+                        su: bool = ...) -> ProcWaitResultJoinType:
+        """Refer to 'ProcessManagerBase.run_python_join()'."""
+        ...
+
+    def run_python_verify(self,
+                          script: str,
+                          timeout: int | float | None = ...,
+                          join: bool = ...,
+                          su: bool = ...) -> tuple[str | list[str], str | list[str]]:
+        """Refer to 'ProcessManagerBase.run_python_verify()'."""
+        ...
+
+    def run_python_verify_join(self,
+                               script: str,
+                               timeout: int | float | None = ...,
+                               su: bool = ...) -> tuple[str, str]:
+        """Refer to 'ProcessManagerBase.run_python_verify_join()'."""
+        ...
+
+    def run_python_verify_nojoin(self,
+                                 script: str,
+                                 timeout: int | float | None = ...,
+                                 su: bool = ...) -> tuple[list[str], list[str]]:
+        """Refer to 'ProcessManagerBase.run_python_verify_nojoin()'."""
+        ...
+
     def is_superuser(self) -> bool:
         """Refer to 'ProcessManagerBase.is_superuser()'."""
         ...
@@ -7,41 +7,92 @@
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
 
 """
-Provide 'SudoFile' - a file-like object implementing file I/O via sudo shell commands.
+Provide 'SudoFile' - a file-like object implementing file I/O via sudo.
 
-The current implementation is primitive and inefficient. Each read or write operation spawns a
-separate sudo shell command ('cat' or 'printf'), which involves significant overhead. A more
-efficient implementation would run an agent process on the SUT, which could receive commands such as
-open, read, and write via stdin and return results via stdout and errors via stderr, avoiding the
-per-operation process creation cost.
+Simple operations, such as reading an entire text file or writing a sysfs file, run a lightweight
+shell command ('cat' or 'printf') with superuser privileges. Other I/O operations run a small Python
+script with superuser privileges on the target host using the 'run_python_join()' method of the
+process manager. Process managers that keep a long-lived Python interpreter on the target host avoid
+the per-operation process creation cost.
+
+Reads and writes are positional ('os.pread()' / 'os.pwrite()'), so reading a few bytes after a
+'seek()' does not transfer the entire file, and writing does not require a read-modify-write cycle.
+Data read from the file is cached in the file object and served to subsequent reads from the cache.
 """
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import shlex
 import typing
-from collections import deque
+import textwrap
 from pathlib import Path
 from pepclibs.helperlibs import ClassHelpers, Logging
-from pepclibs.helperlibs.Exceptions import Error, ErrorPermissionDenied
+from pepclibs.helperlibs.Exceptions import Error, ErrorPermissionDenied, ErrorNotFound
 
 if typing.TYPE_CHECKING:
-    from typing import cast
+    from typing import Final, cast
     from pepclibs.helperlibs._ProcessManagerTypes import ProcessManagerProtocol
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
 
+# How many bytes to read at once when iterating over the lines of a file.
+_CHUNK_SIZE: Final[int] = 64 * 1024
+
+# Maximum size of data to write with a shell command, larger data is written with a Python script.
+_SHELL_WRITE_MAX_SIZE: Final[int] = 4096
+
+# Exit codes the I/O commands and scripts use for reporting the failure reason.
+_EXIT_NOT_FOUND: Final[int] = 2
+_EXIT_PERMISSION_DENIED: Final[int] = 3
+
+# The template for the Python scripts implementing the I/O operations. The script exits with an exit
+# code reflecting the failure reason if the I/O operation fails.
+_SCRIPT_TEMPLATE: Final[str] = """
+import os, sys, errno
+path = {path!r}
+try:
+{script}
+except OSError as err:
+    print(err, file=sys.stderr)
+    if err.errno == errno.ENOENT:
+        raise SystemExit({exit_not_found})
+    if err.errno in (errno.EACCES, errno.EPERM):
+        raise SystemExit({exit_permission_denied})
+    raise SystemExit(1)
+"""
+
+# A script that reads 'size' bytes at offset 'offset' from the file at 'path' and prints them as a
+# hexadecimal string. Reads until the end of the file if 'size' is negative.
+_PREAD_SCRIPT: Final[str] = """
+fd = os.open(path, os.O_RDONLY)
+try:
+    chunks = []
+    while size != 0:
+        chunk = os.pread(fd, size if size > 0 else 65536, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        offset += len(chunk)
+        if size > 0:
+            size -= len(chunk)
+finally:
+    os.close(fd)
+sys.stdout.write(b"".join(chunks).hex())
+"""
+
 class SudoFile(ClassHelpers.SimpleCloseContext):
     """
-    A file-like object providing read, write, and seek operations via sudo shell commands.
+    A file-like object providing read, write, and seek operations via sudo.
 
-    Instead of opening the file directly, each I/O operation runs a shell command with sudo
+    Instead of opening the file directly, each I/O operation runs a Python script with superuser
     privileges via the process manager.
 
     Notes:
-        - Binary mode ('b' in 'mode') is supported only for UTF-8 encoded text files. Arbitrary
-          binary data (e.g., executables) is not supported, because all I/O goes through a shell,
-          which operates on text.
+        - File positions and sizes are in bytes, even in text mode. In text mode, the data is
+          decoded as UTF-8, so the file position should not point to the middle of a multi-byte
+          character.
+        - The data read from the file is cached until the next write or truncation via this file
+          object. Changes made to the file by others are not visible in the cached data.
     """
 
     def __init__(self, pman: ProcessManagerProtocol, path: str | Path, mode: str):
@@ -61,53 +112,255 @@ class SudoFile(ClassHelpers.SimpleCloseContext):
         self._mode = mode
 
         self.name = Path(path).name
-        self._lines: deque[str] | deque[bytes] = deque()
+
+        # The cached file data: 'self._cache' contains file data starting at file position
+        # 'self._cache_offset'. If 'self._cache_eof' is 'True', the cached data extends to the end
+        # of the file.
+        self._cache = b""
+        self._cache_offset = 0
+        self._cache_eof = False
 
         _LOG.debug(f"Opening file '{path}' with mode '{mode}' via sudo{self._pman.hostmsg}")
 
         if "w" in mode:
             # The "w" mode always assumes truncation.
-            pman.run_verify(f"true > {shlex.quote(str(path))}", su=True)
+            if self._run_cmd(f": > {shlex.quote(str(path))}", must_exist=False) is None:
+                self._run_script("os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC))")
 
     def close(self):
         """Free allocated resources."""
 
+        self._cache = b""
         ClassHelpers.close(self, unref_attrs=("_pman",))
 
-    def read(self, size: int | None = None) -> bytes | str:
+    def _raise_error(self, cmd: str, stdout: str, stderr: str, exitcode: int | None):
         """
-        Read data from the file via sudo.
+        Raise an exception for a failed I/O command or script.
+
+        Args:
+            cmd: The command that failed.
+            stdout: Standard output of the command.
+            stderr: Standard error of the command.
+            exitcode: Exit code of the command.
+
+        Raises:
+            ErrorNotFound: The exit code indicates that the file does not exist.
+            ErrorPermissionDenied: The exit code indicates that access to the file was denied.
+            Error: The command failed for another reason.
+        """
+
+        errmsg = self._pman.get_cmd_failure_msg(cmd, stdout, stderr, exitcode)
+        if exitcode == _EXIT_NOT_FOUND:
+            raise ErrorNotFound(errmsg)
+        if exitcode == _EXIT_PERMISSION_DENIED:
+            raise ErrorPermissionDenied(errmsg)
+        raise Error(errmsg)
 
-        Read the entire file via 'cat', then return the portion starting at the current file
-        position, optionally limited to 'size' bytes or characters.
+    def _run_script(self, script: str) -> str:
+        """
+        Run a Python script operating on the file with superuser privileges.
 
         Args:
-            size: Maximum number of bytes or characters to read. If None, read until the end of the
-                  file.
+            script: The script to run. The 'os' and 'sys' modules are imported and the 'path'
+                    variable is set to the file path before the script is run.
 
         Returns:
-            The data read from the file. Return bytes in binary mode, or a string in text mode.
+            The standard output of the script.
+
+        Raises:
+            ErrorPermissionDenied: No permissions to access the file.
+            ErrorNotFound: The file does not exist.
         """
 
-        path = str(self._path)
+        script = _SCRIPT_TEMPLATE.format(path=str(self._path),
+                                         script=textwrap.indent(script.strip(), "    "),
+                                         exit_not_found=_EXIT_NOT_FOUND,
+                                         exit_permission_denied=_EXIT_PERMISSION_DENIED)
+
+        stdout, stderr, exitcode = self._pman.run_python_join(script, su=True)
+        if exitcode != 0:
+            cmd = f"{self._pman.get_python_path()} -c {shlex.quote(script)}"
+            self._raise_error(cmd, stdout, stderr, exitcode)
+
+        return stdout
+
+    def _run_cmd(self, cmd: str, must_exist: bool = True) -> str | None:
+        """
+        Run a lightweight shell command operating on the file with superuser privileges.
+
+        Args:
+            cmd: The shell command to run.
+            must_exist: If True, check that the file exists before running the command.
+
+        Returns:
+            The standard output of the command, or 'None' if the command failed.
+
+        Raises:
+            ErrorNotFound: The file does not exist.
 
-        _LOG.debug(f"Reading from file '{path}' with size {size} and mode '{self._mode}' via sudo"
+        Notes:
+            - Commands like 'cat' do not report the failure reason via the exit code. If the command
+              fails, the caller should repeat the operation with a Python script, which does.
+        """
+
+        if must_exist:
+            path_quoted = shlex.quote(str(self._path))
+            cmd = f"if [ ! -e {path_quoted} ]; then exit {_EXIT_NOT_FOUND}; fi; {cmd}"
+
+        stdout, stderr, exitcode = self._pman.run_join(cmd, su=True)
+        if exitcode == 0:
+            return stdout
+        if exitcode == _EXIT_NOT_FOUND:
+            self._raise_error(cmd, stdout, stderr, exitcode)
+
+        _LOG.debug(self._pman.get_cmd_failure_msg(cmd, stdout, stderr, exitcode))
+        return None
+
+    def _pread(self, offset: int, size: int) -> bytes:
+        """
+        Read data from the file at the specified position.
+
+        Args:
+            offset: The file position to read from.
+            size: How many bytes to read. Read until the end of the file if negative.
+
+        Returns:
+            The data read from the file. Fewer bytes than requested are returned only at the end of
+            the file.
+        """
+
+        _LOG.debug(f"Reading {size} bytes at offset {offset} from file '{self._path}' via sudo"
                    f"{self._pman.hostmsg}")
 
-        stdout, _ = self._pman.run_verify_join(f"cat {shlex.quote(path)}", su=True)
-        data = stdout[self._offset:]
-        if size is not None:
-            data = data[:size]
-        self._offset += len(data)
+        stdout = self._run_script(f"offset = {offset}\nsize = {size}\n{_PREAD_SCRIPT}")
 
-        if "b" in self._mode:
-            try:
-                return data.encode("utf-8")
-            except UnicodeEncodeError as err:
-                raise Error(f"Failed to encode data read from '{path}' as UTF-8") from err
+        try:
+            return bytes.fromhex(stdout.strip())
+        except ValueError as err:
+            raise Error(f"Unexpected output of the file read script for '{self._path}'"
+                        f"{self._pman.hostmsg}:\n{stdout}") from err
+
+    def _read_chunk(self, size: int) -> bytes:
+        """
+        Return data at the current file position, use the cached data if possible.
+
+        Args:
+            size: Maximum amount of bytes to return. Return the data until the end of the file if
+                  negative.
+
+        Returns:
+            The data, which may be shorter than requested if it is served from the cache. An empty
+            bytes object is returned only at the end of the file. The file position is not changed.
+        """
+
+        start = self._offset - self._cache_offset
+        if 0 <= start <= len(self._cache):
+            if start < len(self._cache) and (size >= 0 or self._cache_eof):
+                if size < 0:
+                    return self._cache[start:]
+                return self._cache[start:start + size]
+            if start == len(self._cache) and self._cache_eof:
+                return b""
+
+        data = self._pread(self._offset, size)
+
+        self._cache = data
+        self._cache_offset = self._offset
+        self._cache_eof = size < 0 or len(data) < size
 
         return data
 
+    def _drop_cache(self):
+        """Drop the cached file data."""
+
+        self._cache = b""
+        self._cache_offset = 0
+        self._cache_eof = False
+
+    def _decode(self, data: bytes) -> bytes | str:
+        """
+        Convert data read from the file to the type matching the file mode.
+
+        Args:
+            data: The data read from the file.
+
+        Returns:
+            The data as bytes in binary mode, or as a string in text mode.
+        """
+
+        if "b" in self._mode:
+            return data
+
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError as err:
+            raise Error(f"Failed to decode data read from '{self._path}' as UTF-8") from err
+
+    def read(self, size: int | None = None) -> bytes | str:
+        """
+        Read data from the file via sudo.
+
+        Args:
+            size: Maximum number of bytes to read. If None, read until the end of the file.
+
+        Returns:
+            The data read from the file. Return bytes in binary mode, or a string in text mode.
+        """
+
+        if size is None or size < 0:
+            if self._offset == 0 and "b" not in self._mode and not self._cache:
+                # Reading an entire text file, use the lightweight 'cat' command.
+                stdout = self._run_cmd(f"cat -- {shlex.quote(str(self._path))}")
+                if stdout is not None:
+                    self._cache = stdout.encode("utf-8")
+                    self._cache_offset = 0
+                    self._cache_eof = True
+                    self._offset = len(self._cache)
+                    return stdout
+
+            data = self._read_chunk(-1)
+            self._offset += len(data)
+            return self._decode(data)
+
+        chunks: list[bytes] = []
+        remaining = size
+        while remaining > 0:
+            chunk = self._read_chunk(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self._offset += len(chunk)
+            remaining -= len(chunk)
+
+        return self._decode(b"".join(chunks))
+
+    def readline(self) -> bytes | str:
+        """
+        Read and return one line from the file.
+
+        Returns:
+            The line, including the trailing newline character if present. Return an empty bytes
+            object or an empty string at the end of the file.
+        """
+
+        chunks: list[bytes] = []
+        while True:
+            chunk = self._read_chunk(_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            idx = chunk.find(b"\n")
+            if idx != -1:
+                chunk = chunk[:idx + 1]
+
+            chunks.append(chunk)
+            self._offset += len(chunk)
+
+            if idx != -1:
+                break
+
+        return self._decode(b"".join(chunks))
+
     def write(self, data: str | bytes) -> int:
         """
         Write data to the file via sudo.
@@ -124,51 +377,64 @@ class SudoFile(ClassHelpers.SimpleCloseContext):
         _LOG.debug(f"Writing to file '{path}' with mode '{self._mode}' via sudo"
                    f"{self._pman.hostmsg}. Data length: {len(data)}")
 
-        path_quoted = shlex.quote(path)
-
-        if isinstance(data, bytes):
+        if isinstance(data, str):
             try:
-                str_data = data.decode("utf-8")
-            except UnicodeDecodeError as err:
-                raise Error(f"Failed to decode data to write to '{path}' as UTF-8") from err
+                bytes_data = data.encode("utf-8")
+            except UnicodeEncodeError as err:
+                raise Error(f"Failed to encode data to write to '{path}' as UTF-8") from err
         else:
-            str_data = data
-
-        write_len = len(str_data)
+            bytes_data = data
 
         if "a" in self._mode:
             # Append mode: always write after the end of the file.
-            cmd = f"printf '%s' {shlex.quote(str_data)} >> {path_quoted}"
+            script = "fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND)\n" \
+                     "try:\n" \
+                     "    os.write(fd, data)\n" \
+                     "finally:\n" \
+                     "    os.close(fd)\n"
         elif path.startswith("/sys"):
-            # Sysfs files are not seekable and always expect writes from the beginning.
-            cmd = f"printf '%s' {shlex.quote(str_data)} > {path_quoted}"
+            # Sysfs files are not seekable and always expect the entire data in a single write from
+            # the beginning.
+            if len(bytes_data) <= _SHELL_WRITE_MAX_SIZE and isinstance(data, str) and \
+               "\0" not in data:
+                # Use the lightweight 'printf' command. A failed sysfs write has no effect, so if
+                # the command fails, the write is repeated with a Python script to find out the
+                # failure reason.
+                cmd = f"printf '%s' {shlex.quote(data)} > {shlex.quote(path)}"
+                if self._run_cmd(cmd) is not None:
+                    self._drop_cache()
+                    self._offset += len(bytes_data)
+                    return len(data)
+
+            script = "fd = os.open(path, os.O_WRONLY)\n" \
+                     "try:\n" \
+                     "    os.write(fd, data)\n" \
+                     "finally:\n" \
+                     "    os.close(fd)\n"
         else:
             # All other modes: write at the current offset.
-            #
-            # Read the current content, insert the new data at the current offset, and write the
-            # full modified content back.
-            stdout, _ = self._pman.run_verify_join(f"cat {path_quoted}", su=True)
-            end = self._offset + write_len
-            file_content = stdout[:self._offset] + str_data + stdout[end:]
-            cmd = f"printf '%s' {shlex.quote(file_content)} > {path_quoted}"
+            script = "fd = os.open(path, os.O_WRONLY)\n" \
+                     "try:\n" \
+                     "    while data:\n" \
+                     "        written = os.pwrite(fd, data, offset)\n" \
+                     "        data = data[written:]\n" \
+                     "        offset += written\n" \
+                     "finally:\n" \
+                     "    os.close(fd)\n"
 
-        try:
-            self._pman.run_verify(cmd, su=True)
-        except Error as err:
-            errmsg = str(err).lower()
-            if "permission denied" in errmsg or "operation not permitted" in errmsg:
-                raise ErrorPermissionDenied(str(err)) from err
-            raise
-
-        self._offset += write_len
+        script = f"data = bytes.fromhex({bytes_data.hex()!r})\noffset = {self._offset}\n{script}"
+
+        self._drop_cache()
+        self._run_script(script)
+
+        self._offset += len(bytes_data)
         return len(data)
 
     def truncate(self, size: int | None = None) -> int:
         """
-        Truncate the file to at most 'size' characters or bytes via sudo.
+        Truncate the file to at most 'size' bytes via sudo.
 
-        Read the full file content and write back only the first 'size' characters. If 'size' is
-        None, truncate at the current file position. The file position is not changed.
+        If 'size' is None, truncate at the current file position. The file position is not changed.
 
         Args:
             size: The new file length. If None, use the current file position.
@@ -188,23 +454,30 @@ class SudoFile(ClassHelpers.SimpleCloseContext):
         _LOG.debug(f"Truncating file '{path}' to size {size} with mode '{self._mode}' via sudo"
                    f"{self._pman.hostmsg}")
 
-        path_quoted = shlex.quote(path)
-
         if path.startswith("/sys"):
             raise Error(f"Truncating sysfs files is not supported, file '{path}'"
                         f"{self._pman.hostmsg}")
 
-        stdout, _ = self._pman.run_verify_join(f"cat {path_quoted}", su=True)
+        script = f"""
+size = {size}
+cur_size = os.stat(path).st_size
+if size < cur_size:
+    os.truncate(path, size)
+sys.stdout.write(str(cur_size))
+"""
 
-        if size > len(stdout):
-            raise Error(f"Extending file size is not supported: Requested size {size}, current "
-                        f"file size {len(stdout)}, file '{path}'{self._pman.hostmsg}")
+        self._drop_cache()
+        stdout = self._run_script(script)
 
-        if size == len(stdout):
-            return size
+        try:
+            cur_size = int(stdout.strip())
+        except ValueError as err:
+            raise Error(f"Unexpected output of the file truncate script for '{path}'"
+                        f"{self._pman.hostmsg}:\n{stdout}") from err
 
-        new_content = stdout[:size]
-        self._pman.run_verify(f"printf '%s' {shlex.quote(new_content)} > {path_quoted}", su=True)
+        if size > cur_size:
+            raise Error(f"Extending file size is not supported: Requested size {size}, current "
+                        f"file size {cur_size}, file '{path}'{self._pman.hostmsg}")
 
         return size
 
@@ -242,22 +515,20 @@ class SudoFile(ClassHelpers.SimpleCloseContext):
             in text mode.
         """
 
-        data = self.read()
-        return data.splitlines(keepends=True)
+        lines = list(self)
+        if typing.TYPE_CHECKING:
+            return cast(list[str] | list[bytes], lines)
+        return lines
 
     def __iter__(self) -> SudoFile:
         """Return the iterator object (self)."""
 
-        lines = self.readlines()
-        if typing.TYPE_CHECKING:
-            self._lines = deque(cast(list, lines))
-        else:
-            self._lines = deque(lines)
         return self
 
     def __next__(self) -> str | bytes:
         """Return the next line, raising 'StopIteration' when exhausted."""
 
-        if not self._lines:
+        line = self.readline()
+        if not line:
             raise StopIteration
-        return self._lines.popleft()
+        return line
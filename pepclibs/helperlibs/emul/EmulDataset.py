@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2022-2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Authors: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+#          Antti Laakso <antti.laakso@linux.intel.com>
+#          Niklas Neronin <niklas.neronin@intel.com>
+
+"""
+Provide the 'EmulDataset' class, a parsed, read-only image of an emulation dataset.
+
+The image includes the emulated filesystem index (paths of all emulated files and directories) and
+the emulation data sources of all emulated files. Dataset files are read on first access and cached.
+The image is never modified after it was built, so a single image can be shared by multiple
+'EmulProcessManager' instances. Each of them keeps its own emulated file objects, so writes through
+one of them are not visible to the others.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import os
+import re
+import typing
+import threading
+from pathlib import Path
+from pepclibs.helperlibs import Trivial, YAML
+from pepclibs.helperlibs.Exceptions import Error
+from pepclibs.helperlibs.emul.EmulCommon import EMUL_CONFIG_FNAME
+from pepclibs.msr._SimpleMSR import _CPU_BYTEORDER
+
+if typing.TYPE_CHECKING:
+    from typing import Generator, TypedDict, cast, Union
+    from pepclibs.helperlibs.emul.EmulCommon import _EDConfMSRTypedDict, _EDConfSysfsTypedDict
+    from pepclibs.helperlibs.emul.EmulCommon import _EDConfProcfsTypedDict, _EDConfTypedDict
+
+    class DatasetFileTypedDict(TypedDict, total=False):
+        """
+        The emulation data source of an emulated file.
+
+        Attributes:
+            srcpath: Path to the dataset file to read the emulated file contents from.
+            data: The emulated file contents (used if 'srcpath' is not present).
+            readonly: Whether the emulated file is read-only.
+        """
+
+        srcpath: Path
+        data: Union[str, dict[int, bytes]]
+        readonly: bool
+
+def _get_inlinefile_lines(filepath: Path) -> Generator[str, None, None]:
+    """
+    Iterate over non-empty, non-comment lines in an inlinefile format data file.
+
+    Args:
+        filepath: Path to the inlinefile to read.
+
+    Yields:
+        Lines with leading/trailing whitespace stripped, excluding empty lines and comment lines.
+    """
+
+    try:
+        with open(filepath, "r", encoding="utf-8") as fobj:
+            for line in fobj:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield line
+    except OSError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise Error(f"Failed to read file '{filepath}':\n{errmsg}") from err
+
+def _iter_files_recursive(dirpath: Path) -> Generator[Path, None, None]:
+    """
+    Recursively iterate over all files in a directory tree.
+
+    Args:
+        dirpath: Path to the directory to traverse.
+
+    Yields:
+        Path objects for each regular file found in the directory tree.
+    """
+
+    try:
+        for root, _, files in os.walk(dirpath):
+            for filename in files:
+                yield Path(root) / filename
+    except OSError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise Error(f"Failed to traverse directory '{dirpath}':\n{errmsg}") from err
+
+class EmulDataset:
+    """
+    A parsed, read-only image of an emulation dataset.
+
+    Public methods overview.
+        - 'get_data()' - return the emulated file contents.
+
+    Attributes:
+        path: Path to the dataset directory.
+        files: Dictionary mapping absolute paths of emulated files (e.g.,
+               "/sys/devices/system/cpu/online", "/dev/cpu/0/msr") to their emulation data sources.
+        dirs: Dictionary mapping absolute paths of emulated directories to their entries:
+              {entry name: True if the entry is a directory, False if it is a file}.
+
+    Notes:
+        - The 'files' and 'dirs' dictionaries must not be modified.
+    """
+
+    def __init__(self, dspath: Path):
+        """
+        Load an emulation dataset and build its image.
+
+        Args:
+            dspath: Path to the dataset directory to load.
+
+        Each dataset directory contains a single 'config.yml' file that describes all emulation
+        data for a System Under Test (SUT):
+            - dataset1/
+              - config.yml          # Main configuration file
+              - msr/                # MSR register data
+              - sys/                # Sysfs file data
+              - proc/               # Procfs file data
+              ...
+            - dataset2/
+              ...
+
+        The 'config.yml' file contains top-level sections ('msr', 'sysfs', 'procfs', etc.) that
+        describe how to load and configure emulated files from their respective sub-directories.
+        """
+
+        self.path = dspath
+        self.files: dict[str, DatasetFileTypedDict] = {}
+        self.dirs: dict[str, dict[str, bool]] = {}
+
+        # Cached contents of dataset files: {srcpath: contents}.
+        self._srcdata: dict[Path, str] = {}
+        self._srcdata_lock = threading.Lock()
+
+        _yml = YAML.load(self.path / EMUL_CONFIG_FNAME)
+        if typing.TYPE_CHECKING:
+            ydict = cast(_EDConfTypedDict, _yml)
+        else:
+            ydict = _yml
+
+        if "msr" in ydict:
+            self._process_msrs(ydict["msr"])
+
+        if "sysfs" in ydict:
+            self._process_sysfs(ydict["sysfs"])
+
+        if "procfs" in ydict:
+            self._process_procfs(ydict["procfs"])
+
+    def _add_file(self, path: str, finfo: DatasetFileTypedDict):
+        """
+        Add an emulated file to the emulated filesystem index.
+
+        Args:
+            path: Absolute path of the emulated file.
+            finfo: The emulation data source for the file.
+        """
+
+        self.files[path] = finfo
+
+        # Add the file and all its parent directories to the directories index.
+        is_dir = False
+        while path != "/":
+            dirpath, name = os.path.split(path)
+            entries = self.dirs.get(dirpath)
+            if entries is not None:
+                entries[name] = is_dir
+                break
+            self.dirs[dirpath] = {name: is_dir}
+            path = dirpath
+            is_dir = True
+
+    def _process_procfs(self, yinfo: _EDConfProcfsTypedDict):
+        """
+        Add emulated procfs files from procfs emulation data.
+
+        Args:
+            yinfo: Procfs configuration dictionary.
+        """
+
+        procfs_dir_path = self.path / yinfo["dirname"]
+        rw_patterns = yinfo.get("rw_patterns", [])
+
+        for filepath in _iter_files_recursive(procfs_dir_path):
+            # Example path values:
+            #   filepath:   /dataset_path/proc/cpuinfo
+            #   relpath:    cpuinfo
+            #   proc_path:  /proc/cpuinfo
+            relpath = filepath.relative_to(procfs_dir_path)
+            proc_path = f"/{yinfo['dirname']}/{relpath}"
+
+            readonly = not any(re.search(regex, proc_path) for regex in rw_patterns)
+            self._add_file(proc_path, {"srcpath": filepath, "readonly": readonly})
+
+    def _process_sysfs_inlinefiles(self, yinfo: _EDConfSysfsTypedDict):
+        """
+        Add emulated sysfs files from inline sysfs emulation data.
+
+        Args:
+            yinfo: Sysfs configuration dictionary.
+        """
+
+        inlinefile_path = self.path / yinfo["dirname"] / yinfo["inlinefiles"]
+
+        for line in _get_inlinefile_lines(inlinefile_path):
+            # Format: <mode>|<sysfs_path>|<value>.
+            parts = line.split("|", 2)
+            if len(parts) != 3:
+                raise Error(f"Unexpected line format in file '{inlinefile_path}':\n  "
+                            f"Expected <mode>|<path>|<value>, received:\n'{line}'")
+
+            mode, path, data = parts
+            if mode not in ("ro", "rw"):
+                raise Error(f"Unexpected mode '{mode}' in file '{inlinefile_path}':\n  "
+                            f"Expected 'ro' or 'rw', received:\n'{line}'")
+
+            self._add_file(path, {"data": data, "readonly": mode == "ro"})
+
+    def _process_sysfs_rcopy(self, yinfo: _EDConfSysfsTypedDict):
+        """
+        Add emulated sysfs files from recursively copied sysfs directories.
+
+        Args:
+            yinfo: Sysfs configuration dictionary.
+        """
+
+        rcopy = yinfo.get("rcopy", {})
+        if not rcopy:
+            return
+
+        sysfs_dir_path = self.path / yinfo["dirname"]
+        rw_patterns = rcopy.get("rw_patterns", [])
+
+        for relpath in rcopy.get("paths", []):
+            # Example path values:
+            #   relpath:        "kernel/debug/tpmi-0000:80:03.1"
+            #   rcopy_base:     "/dataset_path/sys/kernel/debug/tpmi-0000:80:03.1"
+            rcopy_base = sysfs_dir_path / relpath
+            if not rcopy_base.exists():
+                cfgfile_path = self.path / EMUL_CONFIG_FNAME
+                raise Error(f"Path '{relpath}' specified in '{cfgfile_path}' does not exist")
+
+            for filepath in _iter_files_recursive(rcopy_base):
+                # Example path values:
+                #   filepath:   /dataset_path/sys/kernel/debug/tpmi-0000:80:03.1/tpmi-id-0c/mem_dump
+                #   relpath:    kernel/debug/tpmi-0000:80:03.1/tpmi-id-0c/mem_dump
+                #   sysfs_path: /sys/kernel/debug/tpmi-0000:80:03.1/tpmi-id-0c/mem_dump
+                relpath = filepath.relative_to(sysfs_dir_path)
+                sysfs_path = f"/{yinfo['dirname']}/{relpath}"
+
+                readonly = not any(re.search(regex, sysfs_path) for regex in rw_patterns)
+                self._add_file(sysfs_path, {"srcpath": filepath, "readonly": readonly})
+
+    def _process_sysfs(self, yinfo: _EDConfSysfsTypedDict):
+        """
+        Add emulated sysfs files from sysfs emulation data.
+
+        Args:
+            yinfo: Sysfs configuration dictionary.
+        """
+
+        self._process_sysfs_inlinefiles(yinfo)
+        self._process_sysfs_rcopy(yinfo)
+
+    def _process_msrs(self, yinfo: _EDConfMSRTypedDict):
+        """
+        Add emulated MSR device files from the dataset.
+
+        Args:
+            yinfo: the 'msr' section of the emulation data configuration dictionary.
+        """
+
+        msr_dir_path = self.path / yinfo["dirname"]
+        if not msr_dir_path.exists():
+            return
+
+        inlinefile_path = msr_dir_path / yinfo["filename"]
+
+        # Parsed MSR data organized by CPU: {cpu: {addr: value}}.
+        cpu_addr_val: dict[int, dict[int, bytes]] = {}
+
+        for line in _get_inlinefile_lines(inlinefile_path):
+            split = line.split(":", 1)
+            if len(split) != 2:
+                raise Error(f"Unexpected line format in file '{inlinefile_path}':\n  "
+                            f"Expected <hex_addr>:<cpu_val_pairs>, received:\n{line}")
+
+            addr = Trivial.str_to_int(split[0], base=16, what="MSR address")
+            pairs = split[1].split()
+
+            for pair in pairs:
+                cpu_str, regval_str = pair.split("|", 1)
+                cpu = Trivial.str_to_int(cpu_str, what="CPU number")
+                value = Trivial.str_to_int(regval_str, base=16, what="MSR register value")
+
+                if cpu not in cpu_addr_val:
+                    cpu_addr_val[cpu] = {}
+                elif addr in cpu_addr_val[cpu]:
+                    raise Error(f"Duplicate CPU {cpu} and MSR address {addr:#x} in file "
+                                f"'{inlinefile_path}': Line:\n{line}")
+
+                cpu_addr_val[cpu][addr] = int.to_bytes(value, 8, byteorder=_CPU_BYTEORDER)
+
+        for cpu, addr2val in cpu_addr_val.items():
+            self._add_file(f"/dev/cpu/{cpu}/msr", {"data": addr2val, "readonly": False})
+
+    def get_data(self, path: str) -> str | dict[int, bytes]:
+        """
+        Return the initial contents of an emulated file.
+
+        Args:
+            path: Absolute path of the emulated file. Must be in the 'files' index.
+
+        Returns:
+            The emulated file contents. A '{MSR address: value}' dictionary for MSR device files,
+            a string for other files.
+        """
+
+        finfo = self.files[path]
+        if "srcpath" not in finfo:
+            return finfo["data"]
+
+        srcpath = finfo["srcpath"]
+        data = self._srcdata.get(srcpath)
+        if data is not None:
+            return data
+
+        try:
+            with open(srcpath, "r", encoding="utf-8") as fobj:
+                data = fobj.read()
+        except OSError as err:
+            errmsg = Error(str(err)).indent(2)
+            raise Error(f"Failed to read '{srcpath}':\n{errmsg}") from err
+
+        with self._srcdata_lock:
+            self._srcdata[srcpath] = data
+
+        return data
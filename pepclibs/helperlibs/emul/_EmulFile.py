@@ -11,14 +11,16 @@
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+import re
 import typing
 from pathlib import Path
 from pepclibs.helperlibs.emul import _EmulFileBase, _GeneralRWSysfsEmulFile, _CPUOnlineEmulFile
 from pepclibs.helperlibs.emul import _DevMSREmulFile, _EPBEmulFile, _ASPMPolicyEmulFile
-from pepclibs.helperlibs.emul import _TPMIEmulFile
+from pepclibs.helperlibs.emul import _TPMIEmulFile, _MemEmulFile, _SMTControlEmulFile
+from pepclibs.helperlibs.emul import _PerCPUOnlineEmulFile
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Union
+    from typing import Any, Union, Final
 
     EmulFileType = Union[_EmulFileBase.EmulFileBase,
                          _CPUOnlineEmulFile.CPUOnlineEmulFile,
@@ -26,12 +28,73 @@ if typing.TYPE_CHECKING:
                          _DevMSREmulFile.DevMSREmulFile,
                          _EPBEmulFile.EPBEmulFile,
                          _ASPMPolicyEmulFile.ASPMPolicyEmulFile,
-                         _TPMIEmulFile.TPMIEmulFile]
+                         _TPMIEmulFile.TPMIEmulFile,
+                         _SMTControlEmulFile.SMTControlEmulFile,
+                         _PerCPUOnlineEmulFile.PerCPUOnlineEmulFile,
+                         _MemEmulFile.MemEmulFile]
+
+# Regular expression matching per-CPU online files. 'CPUOnlineEmulFile' and 'SMTControlEmulFile'
+# access them directly in the base directory.
+_CPU_ONLINE_REGEX: Final[re.Pattern[str]] = re.compile(r"/sys/devices/system/cpu/cpu\d+/online$")
+
+def is_tpmi_file(path: str, fname: str) -> bool:
+    """
+    Check whether a path is a TPMI debugfs file.
+
+    Args:
+        path: Path to check.
+        fname: The TPMI debugfs file name (e.g., "mem_dump").
+
+    Returns:
+        True if 'path' is a TPMI debugfs file named 'fname', False otherwise.
+    """
+
+    return path.startswith("/sys/kernel/debug/tpmi-") and path.endswith(f"/{fname}")
+
+def is_cpu_online_file(path: str) -> bool:
+    """
+    Check whether a path is a file emulated by 'CPUOnlineEmulFile'.
+
+    Args:
+        path: Path to check.
+
+    Returns:
+        True if the file contents depend on per-CPU online files, False otherwise.
+    """
+
+    return path == "/proc/cpuinfo" or path.endswith("/sys/devices/system/cpu/online")
+
+def is_smt_control_file(path: str) -> bool:
+    """
+    Check whether a path is the SMT control sysfs file.
+
+    Args:
+        path: Path to check.
+
+    Returns:
+        True if 'path' is the SMT control sysfs file, False otherwise.
+    """
+
+    return path == "/sys/devices/system/cpu/smt/control"
+
+def _is_accessed_directly(path: str) -> bool:
+    """
+    Check whether other emulated file objects access a file directly in the base directory.
+
+    Args:
+        path: Path to check.
+
+    Returns:
+        True if the file must be backed by a file in the base directory, False otherwise.
+    """
+
+    return is_tpmi_file(path, "mem_dump") or bool(_CPU_ONLINE_REGEX.search(path))
 
 def get_emul_file(path: str,
                   basepath: Path,
                   data: Any = "",
-                  readonly: bool = False) -> EmulFileType:
+                  readonly: bool = False,
+                  inmem: bool = False) -> EmulFileType:
     """
     Create and return an emulated file object for the specified path.
 
@@ -40,14 +103,24 @@ def get_emul_file(path: str,
         basepath: Directory where emulated files should be created.
         data: Data to populate the emulated file with.
         readonly: Whether the emulated file should be read-only.
+        inmem: Whether to serve read-only files and general sysfs read-write files from memory
+               instead of creating them in the base directory. Files with a custom emulation
+               behavior and files that other emulated files access in the base directory are always
+               created in the base directory.
 
     Returns:
         An emulated file object representing the specified file.
     """
 
-    if path == "/proc/cpuinfo" or path.endswith("/sys/devices/system/cpu/online"):
+    if is_cpu_online_file(path):
         return _CPUOnlineEmulFile.CPUOnlineEmulFile(Path(path), basepath, readonly=readonly,
                                                     data=data)
+    if is_smt_control_file(path):
+        return _SMTControlEmulFile.SMTControlEmulFile(Path(path), basepath, readonly=readonly,
+                                                      data=data)
+    if _CPU_ONLINE_REGEX.search(path):
+        return _PerCPUOnlineEmulFile.PerCPUOnlineEmulFile(Path(path), basepath, readonly=readonly,
+                                                          data=data)
     if path.endswith("/energy_perf_bias"):
         return _EPBEmulFile.EPBEmulFile(Path(path), basepath, readonly=readonly, data=data)
     if path.endswith("pcie_aspm/parameters/policy"):
@@ -55,6 +128,8 @@ def get_emul_file(path: str,
                                                       data=data)
     if path.endswith("mem_write") and path.startswith("/sys/kernel/debug/tpmi-"):
         return _TPMIEmulFile.TPMIEmulFile(Path(path), basepath, readonly=readonly, data=data)
+    if inmem and (readonly or path.startswith("/sys/")) and not _is_accessed_directly(path):
+        return _MemEmulFile.MemEmulFile(Path(path), basepath, readonly=readonly, data=data)
     if path.startswith("/sys/"):
         return _GeneralRWSysfsEmulFile.GeneralRWSysfsEmulFile(Path(path), basepath,
                                                               readonly=readonly, data=data)
@@ -55,6 +55,16 @@ class EmulFileBase:
         # ensures the file is placed under the base path.
         self.fullpath = self.basepath / str(self.path).lstrip("/")
 
+        self._create(data)
+
+    def _create(self, data: str):
+        """
+        Create the emulated file in the base directory and populate it with data.
+
+        Args:
+            data: The initial data to populate the emulated file with.
+        """
+
         try:
             self.fullpath.parent.mkdir(parents=True, exist_ok=True)
             with self._open("w") as fobj:
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Provide the 'MemEmulFile' class for emulating files served from memory.
+
+Unlike other emulated files, these files are not backed by a file in the base directory. This saves
+a write to the base directory for every emulated file that is accessed. Writes to read-write files
+follow the general sysfs file semantics: every write replaces the entire file contents.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import io
+import typing
+import types
+from pepclibs.helperlibs.Exceptions import ErrorPermissionDenied
+from pepclibs.helperlibs.emul import _EmulFileBase
+
+if typing.TYPE_CHECKING:
+    from typing import IO, Callable
+
+def _mem_emul_file_write(self: IO, data: str | bytes) -> int:
+    """
+    The 'write()' method for in-memory file objects. Replace the emulated file contents.
+
+    Args:
+        self: The in-memory file object to write to.
+        data: The data to write.
+
+    Returns:
+        The number of characters or bytes written.
+
+    Raises:
+        ErrorPermissionDenied: Write to a read-only file.
+    """
+
+    emul_file: MemEmulFile = getattr(self, "__emul_file")
+    if emul_file.readonly:
+        raise ErrorPermissionDenied(f"Cannot write to a read-only file '{emul_file.fullpath}'")
+
+    self.seek(0)
+    self.truncate(0)
+
+    orig_write: Callable[[str | bytes], int] = getattr(self, "__orig_write")
+    written = orig_write(data)
+
+    if isinstance(data, bytes):
+        emul_file.set_data(data.decode("utf-8"))
+    else:
+        emul_file.set_data(data)
+
+    return written
+
+class MemEmulFile(_EmulFileBase.EmulFileBase):
+    """
+    Emulate a file with contents kept in memory.
+
+    Public methods overview.
+        - 'open()' - open the emulated file.
+        - 'set_data()' - replace the emulated file contents.
+    """
+
+    def _create(self, data: str):
+        """
+        Save the file contents in memory instead of writing them to the base directory.
+
+        Args:
+            data: The file contents.
+        """
+
+        self._data = data
+
+    def set_data(self, data: str):
+        """
+        Replace the emulated file contents.
+
+        Args:
+            data: The new file contents.
+        """
+
+        self._data = data
+
+    def open(self, mode: str) -> IO:
+        """
+        Open the emulated file.
+
+        Args:
+            mode: The mode in which to open the file, similar to 'mode' argument the built-in Python
+                  'open()' function.
+
+        Returns:
+            An in-memory file object with a snapshot of the file contents and a patched 'write()'
+            method, which replaces the emulated file contents (or fails for read-only files).
+        """
+
+        fobj: IO
+        if "b" in mode:
+            fobj = io.BytesIO(self._data.encode("utf-8"))
+        else:
+            fobj = io.StringIO(self._data)
+
+        setattr(fobj, "__emul_file", self)
+        setattr(fobj, "__orig_write", fobj.write)
+        setattr(fobj, "write", types.MethodType(_mem_emul_file_write, fobj))
+
+        return fobj
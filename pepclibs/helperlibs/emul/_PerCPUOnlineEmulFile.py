@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Provide 'PerCPUOnlineEmulFile' class to emulate per-CPU online sysfs files, for example
+'/sys/devices/system/cpu/cpu10/online'.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import re
+import typing
+import types
+from pathlib import Path
+from pepclibs.helperlibs.Exceptions import Error, ErrorPermissionDenied
+from pepclibs.helperlibs.emul import _EmulFileBase, _SMTControlEmulFile
+
+if typing.TYPE_CHECKING:
+    from typing import IO, Callable
+
+def _is_smt_disabled(basepath: Path) -> bool:
+    """
+    Check whether SMT is disabled via the emulated SMT control sysfs file.
+
+    Args:
+        basepath: The base directory where the emulated files are located.
+
+    Returns:
+        True if SMT is disabled, False otherwise. The SMT control sysfs file is created in the base
+        directory on first access, so if it does not exist, SMT has not been disabled.
+    """
+
+    path = basepath / "sys" / "devices" / "system" / "cpu" / "smt" / "control"
+    try:
+        with open(path, "r", encoding="utf-8") as fobj:
+            state = fobj.read().strip()
+    except FileNotFoundError:
+        return False
+    except OSError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise Error(f"Failed to read '{path}':\n{errmsg}") from err
+
+    return state in ("off", "forceoff")
+
+def _per_cpu_online_emul_file_write(self: IO[str], data: str) -> int:
+    """
+    Write data to an emulated per-CPU online sysfs file. Refuse onlining a non-first SMT sibling
+    while SMT is disabled, like the kernel does.
+
+    Args:
+        self: The file object of the per-CPU online sysfs file to write to.
+        data: The string to write to the per-CPU online sysfs file.
+
+    Returns:
+        The number of characters written to the file.
+    """
+
+    if data.strip() == "1":
+        basepath = Path(getattr(self, "__emul_basepath"))
+        cpu: int = getattr(self, "__cpu")
+        if _is_smt_disabled(basepath) and cpu in _SMTControlEmulFile.get_smt_siblings(basepath):
+            raise ErrorPermissionDenied(f"Cannot online CPU{cpu}: SMT is disabled")
+
+    self.truncate(len(data))
+    self.seek(0)
+
+    orig_write: Callable[[str], int] = getattr(self, "__orig_write")
+    return orig_write(data)
+
+class PerCPUOnlineEmulFile(_EmulFileBase.EmulFileBase):
+    """
+    Emulate per-CPU online sysfs files, for example '/sys/devices/system/cpu/cpu10/online'.
+    """
+
+    def open(self, mode: str) -> IO[str]:
+        """
+        Open the emulated per-CPU online sysfs file.
+
+        Args:
+            mode: The mode in which to open the file, similar to 'mode' argument the built-in Python
+                  'open()' function.
+
+        Returns:
+            An emulated file object with a patched 'write()' method.
+        """
+
+        fobj = super().open(mode)
+
+        match = re.search(r"/cpu(\d+)/online$", str(self.path))
+        if not match:
+            raise Error(f"BUG: Bad per-CPU online file path '{self.path}'")
+
+        # Save the base directory path and the CPU number in the file object.
+        setattr(fobj, "__emul_basepath", self.basepath)
+        setattr(fobj, "__cpu", int(match.group(1)))
+
+        # Save the original 'write()' method and set up the new 'write()' method by monkey-patching
+        # the file object.
+        setattr(fobj, "__orig_write", fobj.write)
+        setattr(fobj, "write", types.MethodType(_per_cpu_online_emul_file_write, fobj))
+
+        return fobj
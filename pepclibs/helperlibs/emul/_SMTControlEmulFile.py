@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Provide 'SMTControlEmulFile' class to emulate the SMT control sysfs file
+('/sys/devices/system/cpu/smt/control').
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import typing
+import types
+from pathlib import Path
+from pepclibs.helperlibs import Trivial
+from pepclibs.helperlibs.Exceptions import Error
+from pepclibs.helperlibs.emul import _EmulFileBase
+
+if typing.TYPE_CHECKING:
+    from typing import IO, Callable
+
+def get_smt_siblings(basepath: Path) -> list[int]:
+    """
+    Parse the '/proc/cpuinfo' file in the base directory and return all CPUs except for the first
+    CPU of every core.
+
+    Args:
+        basepath: The base directory where the '/proc/cpuinfo' file is located.
+
+    Returns:
+        A list of non-first SMT sibling CPU numbers.
+    """
+
+    path = basepath / "proc" / "cpuinfo"
+    try:
+        with open(path, "r", encoding="utf-8") as fobj:
+            data = fobj.read()
+    except OSError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise Error(f"Failed to read '{path}':\n{errmsg}") from err
+
+    # CPUs of every core: {(package, core): [cpu1, cpu2, ...]}.
+    cores: dict[tuple[int, int], list[int]] = {}
+    for block in data.strip().split("\n\n"):
+        info: dict[str, int] = {}
+        for line in block.split("\n"):
+            key, _, val = line.partition(":")
+            key = key.strip()
+            if key in ("processor", "physical id", "core id"):
+                info[key] = Trivial.str_to_int(val.strip(), what=f"'{key}' in '{path}'")
+
+        cores.setdefault((info["physical id"], info["core id"]), []).append(info["processor"])
+
+    siblings: list[int] = []
+    for cpus in cores.values():
+        siblings += sorted(cpus)[1:]
+
+    return siblings
+
+def _smt_control_emul_file_write(self: IO[str], data: str) -> int:
+    """
+    Write data to the emulated SMT control sysfs file and online or offline the SMT siblings.
+
+    Args:
+        self: The file object of the SMT control sysfs file to write to.
+        data: The SMT control state to write ("on", "off", or "forceoff").
+
+    Returns:
+        The number of characters written to the file.
+    """
+
+    state = data.strip()
+    if state == "on":
+        online = "1"
+    elif state in ("off", "forceoff"):
+        online = "0"
+    else:
+        raise Error(f"Invalid SMT control state '{state}'")
+
+    cur_state: str = getattr(self, "__smt_state")
+    if cur_state not in ("on", "off"):
+        raise Error(f"Cannot change SMT control state '{cur_state}' to '{state}'")
+
+    basepath = Path(getattr(self, "__emul_basepath"))
+    cpus_dirpath = basepath / "sys" / "devices" / "system" / "cpu"
+    for cpu in get_smt_siblings(basepath):
+        path = cpus_dirpath / f"cpu{cpu}" / "online"
+        if not path.exists():
+            # The CPU does not support hotplugging.
+            continue
+
+        try:
+            with open(path, "w", encoding="utf-8") as fobj:
+                fobj.write(online)
+        except OSError as err:
+            errmsg = Error(str(err)).indent(2)
+            raise Error(f"Failed to write to '{path}':\n{errmsg}") from err
+
+    self.truncate(len(data))
+    self.seek(0)
+
+    orig_write: Callable[[str], int] = getattr(self, "__orig_write")
+    return orig_write(data)
+
+class SMTControlEmulFile(_EmulFileBase.EmulFileBase):
+    """
+    Emulate the SMT control sysfs file ('/sys/devices/system/cpu/smt/control'). Writing "off" to
+    the file offlines all CPUs except for the first CPU of every core, writing "on" onlines them.
+    """
+
+    def open(self, mode: str) -> IO[str]:
+        """
+        Open the emulated SMT control sysfs file.
+
+        Args:
+            mode: The mode in which to open the file, similar to 'mode' argument the built-in Python
+                  'open()' function.
+
+        Returns:
+            An emulated file object with a patched 'write()' method.
+        """
+
+        # Read the current SMT control state before opening the file, which may truncate it.
+        with self._open("r") as fobj:
+            state = fobj.read().strip()
+
+        fobj = super().open(mode)
+
+        # Save the base directory path and the current SMT control state in the file object.
+        setattr(fobj, "__emul_basepath", self.basepath)
+        setattr(fobj, "__smt_state", state)
+
+        # Save the original 'write()' method and set up the new 'write()' method by monkey-patching
+        # the file object.
+        setattr(fobj, "__orig_write", fobj.write)
+        setattr(fobj, "write", types.MethodType(_smt_control_emul_file_write, fobj))
+
+        return fobj
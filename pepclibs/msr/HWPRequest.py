@@ -24,7 +24,7 @@ if typing.TYPE_CHECKING:
     from typing import Final, Generator, Sequence
     from pepclibs import CPUInfo
     from pepclibs.msr import MSR
-    from pepclibs.msr._FeaturedMSR import PartialFeatureTypedDict
+    from pepclibs.msr._FeaturedMSR import PartialFeatureTypedDict, FeatureValueType
     from pepclibs.helperlibs.ProcessManager import ProcessManagerType
 
 # The Hardware Power Management Request Model Specific Register.
@@ -171,6 +171,57 @@ class HWPRequest(_FeaturedMSR.FeaturedMSR):
                 for cpu in unsupported_cpus:
                     finfo["supported"][cpu] = False
 
+    def read_features_pkg_controlled(self, fname: str, fnames: Sequence[str],
+                                     cpus: Sequence[int]) -> \
+                        Generator[tuple[int, bool, dict[str, FeatureValueType]], None, None]:
+        """
+        Read features from 'MSR_HWP_REQUEST' and check whether the specified HWP feature is managed
+        by the package-level MSR ('MSR_HWP_REQUEST_PKG') or by the per-CPU MSR ('MSR_HWP_REQUEST').
+        The MSR is read only once for both. Refer to 'is_feature_pkg_controlled()' for the package
+        control logic.
+
+        Args:
+            fname: Name of the feature to check the package control for.
+            fnames: Names of the features to read (may be empty).
+            cpus: CPU numbers to check and read the features for.
+
+        Yields:
+            Tuples of (cpu, pkg_controlled, vals), where 'cpu' is the CPU number, 'pkg_controlled'
+            is True if 'fname' is controlled by the package-level MSR, and 'vals' is a dictionary
+            mapping the 'fnames' feature names to their values for the CPU.
+        """
+
+        valid_fname = f"{fname}_valid"
+        read_fnames = list(fnames)
+
+        try:
+            self.validate_feature_supported("pkg_control", cpus=cpus)
+        except ErrorNotSupported:
+            # If package control is not supported, 'fname' is controlled on a per-CPU basis.
+            pass
+        else:
+            for pctl_fname in ("pkg_control", valid_fname):
+                if pctl_fname in read_fnames:
+                    continue
+                try:
+                    self.validate_feature_supported(pctl_fname, cpus=cpus)
+                    read_fnames.append(pctl_fname)
+                except ErrorNotSupported:
+                    pass
+
+        if not read_fnames:
+            for cpu in cpus:
+                yield cpu, False, {}
+            return
+
+        for cpu, vals in self.read_features(read_fnames, cpus=cpus):
+            pkg_controlled = vals.get("pkg_control") in {"on", "enabled"}
+            if pkg_controlled and valid_fname in vals:
+                # The valid bit is set, so per-CPU control overrides package control.
+                pkg_controlled = vals[valid_fname] not in {"on", "enabled"}
+
+            yield cpu, pkg_controlled, {name: vals[name] for name in fnames}
+
     def is_feature_pkg_controlled(self, fname: str, cpus: Sequence[int]) -> \
                                                             Generator[tuple[int, bool], None, None]:
         """
@@ -188,43 +239,8 @@ class HWPRequest(_FeaturedMSR.FeaturedMSR):
             True if the feature is controlled by the package-level MSR, False if controlled per-CPU.
         """
 
-        # Check if pkg_control is supported.
-        try:
-            self.validate_feature_supported("pkg_control", cpus=cpus)
-        except ErrorNotSupported:
-            # If package control is not supported, 'fname' is controlled on a per-CPU basis.
-            for cpu in cpus:
-                yield cpu, False
-            return
-
-        # Determine which features to read.
-        valid_fname = f"{fname}_valid"
-        fnames = ["pkg_control"]
-
-        try:
-            self.validate_feature_supported(valid_fname, cpus=cpus)
-            fnames.append(valid_fname)
-        except ErrorNotSupported:
-            pass
-
-        # Read features in bulk.
-        for cpu, vals in self.read_features(fnames, cpus=cpus):
-            pkg_control = vals["pkg_control"] in {"on", "enabled"}
-            if not pkg_control:
-                yield cpu, False
-                continue
-
-            # Package control is enabled. Check if it can be overridden by the valid bit.
-            if valid_fname in vals:
-                valid = vals[valid_fname] in {"on", "enabled"}
-                if valid:
-                    # The valid bit is set, so per-CPU control overrides package control.
-                    yield cpu, False
-                else:
-                    yield cpu, True
-            else:
-                # No valid bit exists for this feature, so package control applies.
-                yield cpu, True
+        for cpu, pkg_controlled, _ in self.read_features_pkg_controlled(fname, (), cpus):
+            yield cpu, pkg_controlled
 
     def is_cpu_feature_pkg_controlled(self, fname: str, cpu: int) -> bool:
         """
@@ -18,11 +18,12 @@ import os
 import re
 import typing
 import pprint
+import threading
 from pathlib import Path
 from pepclibs import _PerCPUCache
 from pepclibs.helperlibs import ClassHelpers, Trivial, Logging
 from pepclibs.helperlibs.Exceptions import Error, ErrorPerCPUPath, ErrorVerifyFailedPerCPUPath
-from pepclibs.helperlibs.Exceptions import ErrorPermissionDenied
+from pepclibs.helperlibs.Exceptions import ErrorPermissionDenied, ErrorNotFound
 from pepclibs.msr import _SimpleMSR
 from pepclibs.msr._SimpleMSR import _CPU_BYTEORDER
 
@@ -68,6 +69,7 @@ class MSR(_SimpleMSR.SimpleMSR):
 
     1. Multi-CPU I/O.
         - 'read()' - read an MSR.
+        - 'read_many()' - read multiple MSRs in one pass.
         - 'read_bits()' - read an MSR bits range.
         - 'write()' - write to an MSR.
         - 'write_bits()' - write MSR bits range.
@@ -116,6 +118,8 @@ class MSR(_SimpleMSR.SimpleMSR):
 
         self._cpuinfo = cpuinfo
         self._enable_cache = enable_cache
+        # The CPU hotplug event count at the time the MSR device file descriptors were last valid.
+        self._hotplug_count = cpuinfo.get_hotplug_count()
         self._enable_scope = True
 
         if typing.TYPE_CHECKING:
@@ -138,6 +142,8 @@ class MSR(_SimpleMSR.SimpleMSR):
         self._transaction_buffer: dict[int, dict[int, _TransactionBufferItemTypedDict]] = {}
         # Whether there is an ongoing transaction.
         self._in_transaction = False
+        # Serializes access to the transaction buffer and the transaction state.
+        self._transaction_lock = threading.RLock()
 
     def close(self):
         """Uninitialize the class object."""
@@ -148,6 +154,25 @@ class MSR(_SimpleMSR.SimpleMSR):
 
         super().close()
 
+    def _get_fd(self, cpu: int, write: bool = False) -> int:
+        """
+        Return an open file descriptor for the MSR device file of a CPU. Refer to
+        'SimpleMSR._get_fd()' for more information.
+
+        Close all the cached MSR device file descriptors first if CPUs have been hotplugged since
+        they were opened.
+        """
+
+        with self._fds_lock:
+            hotplug_count = self._cpuinfo.get_hotplug_count()
+            if hotplug_count != self._hotplug_count:
+                _LOG.debug("CPUs were hotplugged, closing MSR device file descriptors%s",
+                           self._pman.hostmsg)
+                self._hotplug_count = hotplug_count
+                self.cpus_hotplugged()
+
+            return super()._get_fd(cpu, write=write)
+
     def _add_for_transaction(self,
                              regaddr: int,
                              regval: int,
@@ -166,28 +191,29 @@ class MSR(_SimpleMSR.SimpleMSR):
             iosname: The I/O scope name associated with the MSR.
         """
 
-        if cpu not in self._transaction_buffer:
-            self._transaction_buffer[cpu] = {}
+        with self._transaction_lock:
+            if cpu not in self._transaction_buffer:
+                self._transaction_buffer[cpu] = {}
 
-        if regaddr in self._transaction_buffer[cpu]:
-            tinfo = self._transaction_buffer[cpu][regaddr]
+            if regaddr in self._transaction_buffer[cpu]:
+                tinfo = self._transaction_buffer[cpu][regaddr]
 
-            if "iosname" in tinfo and tinfo["iosname"] != iosname:
-                raise Error(f"BUG: Inconsistent I/O scope name for MSR {regaddr:#x}:\n"
-                            f"  old: {tinfo['iosname']}, new: {iosname}")
-            if "verify" in tinfo and tinfo["verify"] != verify:
-                raise Error(f"BUG: Inconsistent verification flag value for MSR {regaddr:#x}:\n"
-                            f"  old: {tinfo['verify']}, new: {verify}")
-        else:
-            if typing.TYPE_CHECKING:
-                _empty_dict = cast(_TransactionBufferItemTypedDict, {})
+                if "iosname" in tinfo and tinfo["iosname"] != iosname:
+                    raise Error(f"BUG: Inconsistent I/O scope name for MSR {regaddr:#x}:\n"
+                                f"  old: {tinfo['iosname']}, new: {iosname}")
+                if "verify" in tinfo and tinfo["verify"] != verify:
+                    raise Error(f"BUG: Inconsistent verification flag value for MSR {regaddr:#x}:\n"
+                                f"  old: {tinfo['verify']}, new: {verify}")
             else:
-                _empty_dict = {}
-            tinfo = self._transaction_buffer[cpu][regaddr] = _empty_dict
+                if typing.TYPE_CHECKING:
+                    _empty_dict = cast(_TransactionBufferItemTypedDict, {})
+                else:
+                    _empty_dict = {}
+                tinfo = self._transaction_buffer[cpu][regaddr] = _empty_dict
 
-        tinfo["regval"] = regval
-        tinfo["verify"] = verify
-        tinfo["iosname"] = iosname
+            tinfo["regval"] = regval
+            tinfo["verify"] = verify
+            tinfo["iosname"] = iosname
 
     def start_transaction(self):
         """
@@ -200,14 +226,15 @@ class MSR(_SimpleMSR.SimpleMSR):
         writes.
         """
 
-        if not self._enable_cache:
-            _LOG.debug("Transactions support requires caching to be enabled")
-            return
+        with self._transaction_lock:
+            if not self._enable_cache:
+                _LOG.debug("Transactions support requires caching to be enabled")
+                return
 
-        if self._in_transaction:
-            raise Error("Cannot start a new transaction: A transaction is already in progress")
+            if self._in_transaction:
+                raise Error("Cannot start a new transaction: A transaction is already in progress")
 
-        self._in_transaction = True
+            self._in_transaction = True
 
     def _verify(self, regaddr: int, regval: int, cpus: Sequence[int], iosname: ScopeNameType):
         """
@@ -241,34 +268,43 @@ class MSR(_SimpleMSR.SimpleMSR):
     def _transaction_write_local(self):
         """Write MSR transactions on a local host."""
 
-        for cpu, cpus_info in self._transaction_buffer.items():
-            path = self.format_msr_device_path(cpu)
-            try:
-                with open(path, "r+b") as fobj:
-                    for regaddr, regval_info in cpus_info.items():
-                        regval = regval_info["regval"]
-                        _LOG.debug("Transaction: Local: Write: CPU%d: MSR 0x%x: 0x%x to '%s'%s",
-                                   cpu, regaddr, regval, path, self._pman.hostmsg)
-                        try:
-                            regval_bytes = regval.to_bytes(self.regbytes, byteorder=_CPU_BYTEORDER)
-                            os.pwrite(fobj.fileno(), regval_bytes, regaddr)
-                        except PermissionError as err:
-                            errmsg = Error(str(err)).indent(2)
-                            raise ErrorPermissionDenied(f"No permissions to write '{regval:#x}' to "
-                                                        f"MSR '{regaddr:#x}' of CPU {cpu}"
-                                                        f"{self._pman.hostmsg} (file '{path}'):\n"
-                                                        f"{errmsg}") from err
-                        except OSError as err:
-                            errmsg = Error(str(err)).indent(2)
-                            raise ErrorPerCPUPath(f"Failed to write '{regval:#x}' to MSR "
-                                                  f"'{regaddr:#x}' of CPU {cpu}"
-                                                  f"{self._pman.hostmsg} (file '{path}'):\n"
-                                                  f"{errmsg}", cpu=cpu, path=path) from err
-            except PermissionError as err:
-                errmsg = Error(str(err)).indent(2)
-                raise ErrorPermissionDenied(f"No permissions to write to MSR of CPU {cpu}"
-                                            f"{self._pman.hostmsg} (file '{path}'):\n"
-                                            f"{errmsg}") from err
+        # Hold the lock while using the descriptors, because other threads may close them.
+        with self._fds_lock:
+            for cpu, cpus_info in self._transaction_buffer.items():
+                path = self.format_msr_device_path(cpu)
+                try:
+                    fd = self._get_fd(cpu, write=True)
+                except PermissionError as err:
+                    errmsg = Error(str(err)).indent(2)
+                    raise ErrorPermissionDenied(f"No permissions to write to MSR of CPU {cpu}"
+                                                f"{self._pman.hostmsg} (file '{path}'):\n"
+                                                f"{errmsg}") from err
+                except OSError as err:
+                    errmsg = Error(str(err)).indent(2)
+                    raise ErrorPerCPUPath(f"Failed to open MSR device file of CPU {cpu}"
+                                          f"{self._pman.hostmsg} (file '{path}'):\n{errmsg}",
+                                          cpu=cpu, path=path) from err
+
+                for regaddr, regval_info in cpus_info.items():
+                    regval = regval_info["regval"]
+                    _LOG.debug("Transaction: Local: Write: CPU%d: MSR 0x%x: 0x%x to '%s'%s",
+                               cpu, regaddr, regval, path, self._pman.hostmsg)
+                    try:
+                        regval_bytes = regval.to_bytes(self.regbytes, byteorder=_CPU_BYTEORDER)
+                        os.pwrite(fd, regval_bytes, regaddr)
+                    except PermissionError as err:
+                        errmsg = Error(str(err)).indent(2)
+                        raise ErrorPermissionDenied(f"No permissions to write '{regval:#x}' to MSR "
+                                                    f"'{regaddr:#x}' of CPU {cpu}"
+                                                    f"{self._pman.hostmsg} (file '{path}'):\n"
+                                                    f"{errmsg}") from err
+                    except OSError as err:
+                        self._close_fd(cpu)
+                        errmsg = Error(str(err)).indent(2)
+                        raise ErrorPerCPUPath(f"Failed to write '{regval:#x}' to MSR "
+                                              f"'{regaddr:#x}' of CPU {cpu}{self._pman.hostmsg} "
+                                              f"(file '{path}'):\n{errmsg}",
+                                              cpu=cpu, path=path) from err
 
     def _transaction_write_optimized(self, su: bool = False):
         """
@@ -288,16 +324,10 @@ class MSR(_SimpleMSR.SimpleMSR):
                     _LOG.debug("Transaction: Optimized: Write: CPU%d: MSR 0x%x: 0x%x%s",
                                cpu, regaddr, regval, self._pman.hostmsg)
 
-        python_path = self._pman.get_python_path()
-
         printer = pprint.PrettyPrinter(compact=True, sort_dicts=False)
         transaction_buffer_str = printer.pformat(self._transaction_buffer)
 
-        # The code passed to "python -c '<code>'" uses single quotes as delimiters.
-        # Replace single quotes in the transaction buffer string with double quotes.
-        transaction_buffer_str = transaction_buffer_str.replace("'", "\"")
-
-        cmd = f"""{python_path} -c '
+        script = f"""
 import os
 transaction_buffer = {transaction_buffer_str}
 for cpu, cpus_info in transaction_buffer.items():
@@ -314,13 +344,13 @@ for cpu, cpus_info in transaction_buffer.items():
     except Exception as err:
         print("ERROR: Write: CPU: %d: Path: %s: Error: %s" % (cpu, path, err))
         raise SystemExit(0)
-'"""
+"""
 
         _LOG.debug("Transaction: Optimized: Write: Executing command%s", self._pman.hostmsg)
 
         regex = re.compile(r"ERROR: (Permission|Write): CPU: (\d+): Path: (.+): Error: (.+)")
 
-        stdout, _ = self._pman.run_verify_join(cmd, su=su)
+        stdout, _ = self._pman.run_python_verify_join(script, su=su)
         for line in stdout.splitlines():
             if not line.startswith("ERROR: "):
                 continue
@@ -380,46 +410,47 @@ for cpu, cpus_info in transaction_buffer.items():
             transaction data to flush or if caching or transaction mode is disabled.
         """
 
-        if not self._enable_cache:
-            return False
-        if not self._in_transaction:
-            return False
-        if not self._transaction_buffer:
-            return False
+        with self._transaction_lock:
+            if not self._enable_cache:
+                return False
+            if not self._in_transaction:
+                return False
+            if not self._transaction_buffer:
+                return False
 
-        _LOG.debug("Flushing the MSR transaction buffer")
+            _LOG.debug("Flushing the MSR transaction buffer")
 
-        if self._pman.is_remote or self._use_sudo:
-            self._transaction_write_optimized(su=self._use_sudo)
-        elif self._pman.is_emulated:
-            self._transaction_write_emulation()
-        else:
-            self._transaction_write_local()
+            if self._pman.is_remote or self._use_sudo:
+                self._transaction_write_optimized(su=self._use_sudo)
+            elif self._pman.is_emulated:
+                self._transaction_write_emulation()
+            else:
+                self._transaction_write_local()
 
-        # Form a temporary dictionary for verifying the contents of the MSRs written to by the
-        # transaction.
-        verify_info: dict[int, dict[int, _TransactionVerifyItemTypedDict]] = {}
+            # Form a temporary dictionary for verifying the contents of the MSRs written to by the
+            # transaction.
+            verify_info: dict[int, dict[int, _TransactionVerifyItemTypedDict]] = {}
 
-        for cpu, cpus_info in self._transaction_buffer.items():
-            for regaddr, regval_info in cpus_info.items():
-                verify = regval_info["verify"]
-                if not verify:
-                    continue
-                regval = regval_info["regval"]
-                if regval not in verify_info:
-                    verify_info[regval] = {}
-                if regaddr not in verify_info[regval]:
-                    verify_info[regval][regaddr] = {"cpus": []}
-                verify_info[regval][regaddr]["iosname"] = regval_info["iosname"]
-                verify_info[regval][regaddr]["cpus"].append(cpu)
+            for cpu, cpus_info in self._transaction_buffer.items():
+                for regaddr, regval_info in cpus_info.items():
+                    verify = regval_info["verify"]
+                    if not verify:
+                        continue
+                    regval = regval_info["regval"]
+                    if regval not in verify_info:
+                        verify_info[regval] = {}
+                    if regaddr not in verify_info[regval]:
+                        verify_info[regval][regaddr] = {"cpus": []}
+                    verify_info[regval][regaddr]["iosname"] = regval_info["iosname"]
+                    verify_info[regval][regaddr]["cpus"].append(cpu)
 
-        self._transaction_buffer.clear()
+            self._transaction_buffer.clear()
 
-        for regval, regaddr_info in verify_info.items():
-            for regaddr, vinfo in regaddr_info.items():
-                self._verify(regaddr, regval, vinfo["cpus"], vinfo["iosname"])
+            for regval, regaddr_info in verify_info.items():
+                for regaddr, vinfo in regaddr_info.items():
+                    self._verify(regaddr, regval, vinfo["cpus"], vinfo["iosname"])
 
-        return True
+            return True
 
     def commit_transaction(self):
         """
@@ -430,15 +461,44 @@ for cpu, cpus_info in transaction_buffer.items():
         reduce the number of MSR I/O operations.
         """
 
-        if not self._in_transaction:
-            raise Error("Cannot commit transaction: no transaction is currently in progress")
+        with self._transaction_lock:
+            if not self._in_transaction:
+                raise Error("Cannot commit transaction: no transaction is currently in progress")
 
-        flushed = self.flush_transaction()
-        self._in_transaction = False
-        if flushed:
-            _LOG.debug("MSR transaction has been committed")
-        else:
-            _LOG.debug("MSR transaction has been committed, but it was empty")
+            flushed = self.flush_transaction()
+            self._in_transaction = False
+            if flushed:
+                _LOG.debug("MSR transaction has been committed")
+            else:
+                _LOG.debug("MSR transaction has been committed, but it was empty")
+
+    def _get_cpus_to_read(self,
+                          regaddr: int,
+                          cpus: Sequence[int],
+                          iosname: ScopeNameType) -> tuple[list[int], set[int]]:
+        """
+        Split CPU numbers into the ones to read an MSR from and the ones to skip reading.
+
+        Skip CPUs that have the MSR value cached, and read only one CPU per 'iosname' scope, because
+        sibling CPUs share the same MSR value.
+
+        Args:
+            regaddr: The address of the MSR to read.
+            cpus: CPU numbers to read the MSR from.
+            iosname: The name of the I/O scope, used to determine sibling CPUs.
+
+        Returns:
+            A tuple of (do_read, dont_read), where 'do_read' is a list of CPU numbers to read the
+            MSR from, and 'dont_read' is a set of CPU numbers the MSR should not be read for,
+            because the values are available from the cache, or will be available from the cache
+            when a sibling CPU from 'do_read' is read.
+        """
+
+        cached, do_read, siblings = self._cache.split_cached(regaddr, cpus, sname=iosname)
+        dont_read = set(cached)
+        dont_read.update(siblings)
+
+        return do_read, dont_read
 
     def _read_optimized(self,
                         regaddr: int,
@@ -465,47 +525,17 @@ for cpu, cpus_info in transaction_buffer.items():
             yield from super()._cpus_read_optimized(regaddr, cpus, su=self._use_sudo)
             return
 
-        # CPU numbers to read the MSR for (subset of 'cpus').
-        do_read = []
-        # CPU numbers the MSR should not be read for. Instead, the MSR values for these CPU numbers
-        # are available from the cache, or will be available from the cache when a sibling CPU from
-        # 'do_read' is read.
-        dont_read = set()
+        do_read, dont_read = self._get_cpus_to_read(regaddr, cpus, iosname)
 
-        for cpu in cpus:
-            if cpu in dont_read:
-                continue
+        if do_read:
+            regvals_iter = super()._cpus_read_optimized(regaddr, do_read, su=self._use_sudo)
+            self._cache.add_many(regaddr, regvals_iter, sname=iosname)
 
-            if self._cache.is_cached(regaddr, cpu):
-                dont_read.add(cpu)
-                continue
-
-            if not self._enable_scope:
-                do_read.append(cpu)
-                continue
+        if dont_read:
+            _LOG.debug("Cached: Read: %d CPUs: MSR 0x%x%s",
+                       len(dont_read), regaddr, self._pman.hostmsg)
 
-            # Read only one CPU per 'iosname' scope, because sibling CPUs share the same MSR value.
-            for sibling in self._cpuinfo.get_cpu_siblings(cpu, iosname):
-                if sibling == cpu:
-                    do_read.append(sibling)
-                else:
-                    dont_read.add(sibling)
-
-        if not do_read:
-            for cpu in cpus:
-                _LOG.debug("Cached: Read: CPU%d: MSR 0x%x%s", cpu, regaddr, self._pman.hostmsg)
-                regval = self._cache.get(regaddr, cpu)
-                yield cpu, regval
-            return
-
-        for cpu, regval in super()._cpus_read_optimized(regaddr, do_read, su=self._use_sudo):
-            self._cache.add(regaddr, cpu, regval, sname=iosname)
-
-        for cpu in cpus:
-            regval = self._cache.get(regaddr, cpu)
-            if cpu in dont_read:
-                _LOG.debug("Cached: Read: CPU%d: MSR 0x%x%s", cpu, regaddr, self._pman.hostmsg)
-            yield cpu, regval
+        yield from zip(cpus, self._cache.get_many(regaddr, cpus))
 
     def read(self,
              regaddr: int,
@@ -536,14 +566,92 @@ for cpu, cpus_info in transaction_buffer.items():
             return
 
         for cpu in cpus:
-            if self._cache.is_cached(regaddr, cpu):
-                _LOG.debug("Cached: Read: CPU%d: MSR 0x%x%s", cpu, regaddr, self._pman.hostmsg)
+            # Do not check 'is_cached()' before 'get()', because another thread may remove the
+            # cached value in between.
+            try:
                 regval = self._cache.get(regaddr, cpu)
-            else:
+            except ErrorNotFound:
                 regval = super().cpu_read(regaddr, cpu)
                 self._cache.add(regaddr, cpu, regval, sname=iosname)
+            else:
+                _LOG.debug("Cached: Read: CPU%d: MSR 0x%x%s", cpu, regaddr, self._pman.hostmsg)
             yield cpu, regval
 
+    def read_many(self,
+                  regaddrs: Sequence[int],
+                  cpus: Sequence[int],
+                  iosnames: Sequence[ScopeNameType] | None = None) -> \
+                                            Generator[tuple[int, dict[int, int]], None, None]:
+        """
+        Read multiple MSRs from specified CPUs in one pass and yield the results.
+
+        Collect all the (MSR, CPU) pairs that are not cached yet, and read them in a single
+        operation: one script execution for remote hosts and hosts accessed via 'sudo', or one pass
+        over MSR device files, opening each device file once, for the local host.
+
+        Args:
+            regaddrs: Addresses of the MSRs to read.
+            cpus: CPU numbers to read the MSRs from (the caller must validate CPU numbers).
+            iosnames: Scope names for the MSRs (e.g. "package", "core"), one per MSR address in
+                      'regaddrs'. Used for skipping unnecessary reads of sibling CPUs. Defaults to
+                      "CPU" for all MSRs.
+
+        Yields:
+            Tuple of (cpu, regvals):
+                cpu: CPU number from which the MSRs were read.
+                regvals: A dictionary indexed by MSR address, values are the MSR values.
+
+        Raises:
+            ErrorPermissionDenied: No permissions to access the MSR device file.
+            ErrorPerCPUPath: An I/O error occurred while reading the MSR (includes CPU and path
+                             information).
+        """
+
+        if iosnames is None:
+            iosnames = ["CPU"] * len(regaddrs)
+        elif len(iosnames) != len(regaddrs):
+            raise Error(f"BUG: {len(regaddrs)} MSR addresses, but {len(iosnames)} scope names")
+
+        iosnames_map: dict[int, ScopeNameType] = {}
+        for regaddr, iosname in zip(regaddrs, iosnames):
+            if iosnames_map.setdefault(regaddr, iosname) != iosname:
+                raise Error(f"BUG: MSR {regaddr:#x} is specified with different scope names: "
+                            f"'{iosnames_map[regaddr]}' and '{iosname}'")
+
+        # The MSR addresses to read for every CPU.
+        reads: dict[int, list[int]] = {}
+        for regaddr, iosname in iosnames_map.items():
+            if self._enable_cache:
+                do_read, _ = self._get_cpus_to_read(regaddr, cpus, iosname)
+            else:
+                do_read = list(cpus)
+
+            for cpu in do_read:
+                if cpu not in reads:
+                    reads[cpu] = []
+                reads[cpu].append(regaddr)
+
+        if not self._enable_cache:
+            results: dict[int, dict[int, int]] = {cpu: {} for cpu in cpus}
+            for cpu, regaddr, regval in self.cpus_read_many(reads):
+                results[cpu][regaddr] = regval
+            for cpu in cpus:
+                yield cpu, results[cpu]
+            return
+
+        # Group the read results by MSR address to add them to the cache in bulk.
+        readvals: dict[int, list[tuple[int, int]]] = {regaddr: [] for regaddr in iosnames_map}
+        for cpu, regaddr, regval in self.cpus_read_many(reads):
+            readvals[regaddr].append((cpu, regval))
+
+        columns: list[list[int]] = []
+        for regaddr, iosname in iosnames_map.items():
+            self._cache.add_many(regaddr, readvals[regaddr], sname=iosname)
+            columns.append(self._cache.get_many(regaddr, cpus))
+
+        for cpu, regvals in zip(cpus, zip(*columns)):
+            yield cpu, dict(zip(iosnames_map, regvals))
+
     def read_cpu(self, regaddr: int, cpu: int, iosname: ScopeNameType = "CPU") -> int:
         """
         Read an MSR value from a specific CPU.
@@ -13,7 +13,8 @@ MSR I/O Performance Note:
     Using Python's built-in 'open()' followed by 'seek()' and 'read()'/'write()' is ~130 times
     slower than using 'os.open()' with 'os.pread()'/'os.pwrite()' for MSR operations. The exact
     reason is not fully understood, but is likely related to how the MSR kernel driver handles
-    these operations. This module uses 'os.pread()'/'os.pwrite()' for optimal performance.
+    these operations. This module uses 'os.pread()'/'os.pwrite()' for optimal performance, and keeps
+    the MSR device files open across operations to avoid repeated 'open()'/'close()' system calls.
 """
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
@@ -21,6 +22,8 @@ from __future__ import annotations # Remove when switching to Python 3.10+.
 import os
 import re
 import typing
+import resource
+import threading
 from pathlib import Path
 from pepclibs.helperlibs import ClassHelpers, FSHelpers, Trivial, Logging, KernelModule
 from pepclibs.helperlibs import LocalProcessManager
@@ -35,6 +38,9 @@ _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
 
 _CPU_BYTEORDER: Final[Literal["little", "big"]] = "little"
 
+# The minimum amount of MSR device file descriptors to keep open.
+_MIN_OPEN_FDS: Final[int] = 16
+
 class SimpleMSR(ClassHelpers.SimpleCloseContext):
     """
     Provide a capability to read and write CPU Model Specific Registers.
@@ -66,6 +72,17 @@ class SimpleMSR(ClassHelpers.SimpleCloseContext):
 
         self._msr_drv: KernelModule.KernelModule | None = None
 
+        # Open MSR device file descriptors, indexed by CPU number. The values are '(fd, writable)'
+        # tuples. The descriptors are opened lazily and kept open across MSR reads and writes. The
+        # dictionary is ordered from the least to the most recently used descriptor.
+        self._fds: dict[int, tuple[int, bool]] = {}
+        # Protects '_fds' and the I/O on the descriptors when MSRs are accessed from multiple
+        # threads: a descriptor may be closed by another thread once the lock is released.
+        self._fds_lock = threading.RLock()
+        # Maximum count of MSR device file descriptors to keep open. Use at most half of the open
+        # files limit, because there may be more CPUs than the process is allowed to open files.
+        self._max_fds = self._get_max_fds()
+
         try:
             self._ensure_dev_msr()
         except ErrorPermissionDenied as err:
@@ -86,6 +103,9 @@ class SimpleMSR(ClassHelpers.SimpleCloseContext):
     def close(self):
         """Uninitialize the class object."""
 
+        if getattr(self, "_fds", None):
+            self._close_fds()
+
         if self._msr_drv:
             try:
                 self._msr_drv.unload()
@@ -109,6 +129,100 @@ class SimpleMSR(ClassHelpers.SimpleCloseContext):
 
         return Path(f"/dev/cpu/{cpu}/msr")
 
+    @staticmethod
+    def _get_max_fds() -> int:
+        """
+        Return the maximum count of MSR device file descriptors to keep open.
+
+        Returns:
+            Half of the soft limit for the count of open files, but at least '_MIN_OPEN_FDS'.
+        """
+
+        try:
+            limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        except (OSError, ValueError) as err:
+            _LOG.debug("Failed to get the open files limit: %s", err)
+            return _MIN_OPEN_FDS
+
+        if limit == resource.RLIM_INFINITY:
+            # Not a real limit, but there are no systems with so many CPUs.
+            limit = 2 ** 20
+
+        return max(limit // 2, _MIN_OPEN_FDS)
+
+    def _get_fd(self, cpu: int, write: bool = False) -> int:
+        """
+        Return an open file descriptor for the MSR device file of a CPU, opening it if necessary.
+
+        If the maximum count of open descriptors is reached, close the least recently used one. The
+        caller must hold '_fds_lock' while using the returned descriptor.
+
+        Args:
+            cpu: The CPU number to get the MSR device file descriptor for.
+            write: If 'True', the file descriptor must be open for writing.
+
+        Returns:
+            The file descriptor.
+
+        Raises:
+            OSError: Failed to open the MSR device file.
+        """
+
+        with self._fds_lock:
+            if cpu in self._fds:
+                fd, writable = self._fds.pop(cpu)
+                # Re-insert to mark the descriptor as the most recently used one.
+                self._fds[cpu] = (fd, writable)
+                if writable or not write:
+                    return fd
+                # The MSR device file was opened read-only, re-open it for writing.
+                self._close_fd(cpu)
+
+            while len(self._fds) >= self._max_fds:
+                self._close_fd(next(iter(self._fds)))
+
+            path = self.format_msr_device_path(cpu)
+            _LOG.debug("Opening '%s' for %s%s",
+                       path, "writing" if write else "reading", self._pman.hostmsg)
+            fd = os.open(path, os.O_RDWR if write else os.O_RDONLY)
+            self._fds[cpu] = (fd, write)
+            return fd
+
+    def _close_fd(self, cpu: int):
+        """
+        Close the MSR device file descriptor of a CPU, if it is open.
+
+        Args:
+            cpu: The CPU number to close the MSR device file descriptor for.
+        """
+
+        with self._fds_lock:
+            if cpu not in self._fds:
+                return
+            fd, _ = self._fds.pop(cpu)
+
+        try:
+            os.close(fd)
+        except OSError as err:
+            _LOG.debug("Failed to close MSR device file descriptor of CPU%d%s: %s",
+                       cpu, self._pman.hostmsg, err)
+
+    def _close_fds(self):
+        """Close all open MSR device file descriptors."""
+
+        for cpu in list(self._fds):
+            self._close_fd(cpu)
+
+    def cpus_hotplugged(self):
+        """
+        Handle CPU hotplug events by closing all open MSR device file descriptors.
+
+        Call this method whenever a CPU is brought online or taken offline. The MSR device files of
+        offline CPUs disappear, and the descriptors have to be re-opened when the CPUs come back.
+        """
+
+        self._close_fds()
+
     def _ensure_dev_msr(self):
         """
         Ensure that device nodes for accessing Model-Specific Registers (MSRs) are available.
@@ -220,14 +334,15 @@ class SimpleMSR(ClassHelpers.SimpleCloseContext):
             _LOG.debug("Local: Read: CPU%d: MSR 0x%x from '%s'%s",
                        cpu, regaddr, path, self._pman.hostmsg)
             try:
-                with open(path, "rb") as fobj:
-                    regval_bytes = os.pread(fobj.fileno(), self.regbytes, regaddr)
+                with self._fds_lock:
+                    regval_bytes = os.pread(self._get_fd(cpu), self.regbytes, regaddr)
             except PermissionError as err:
                 errmsg = Error(str(err)).indent(2)
                 raise ErrorPermissionDenied(f"No permissions to read MSR '{regaddr:#x}' from "
                                             f"file '{path}'{self._pman.hostmsg}:\n"
                                             f"{errmsg}") from err
             except OSError as err:
+                self._close_fd(cpu)
                 raise ErrorPerCPUPath(f"Failed to read MSR '{regaddr:#x}' from file '{path}'"
                                       f"{self._pman.hostmsg}: {err}", cpu=cpu, path=path) from err
             regval = int.from_bytes(regval_bytes, byteorder=_CPU_BYTEORDER)
@@ -253,7 +368,6 @@ class SimpleMSR(ClassHelpers.SimpleCloseContext):
             from the MSR.
         """
 
-        python_path = self._pman.get_python_path()
         cpus_list = list(cpus)
         cpus_str = ",".join([str(cpu) for cpu in cpus_list])
 
@@ -262,7 +376,7 @@ class SimpleMSR(ClassHelpers.SimpleCloseContext):
             _LOG.debug("Optimized: Read: MSR 0x%x from CPUs %s%s",
                        regaddr, cpus_range, self._pman.hostmsg)
 
-        cmd = f"""{python_path} -c '
+        script = f"""
 import os
 cpus = [{cpus_str}]
 for cpu in cpus:
@@ -278,10 +392,10 @@ for cpu in cpus:
     except Exception as err:
         print("ERROR: Read: CPU: %d: Path: %s: Error: %s" % (cpu, path, err))
         raise SystemExit(0)
-'"""
+"""
 
         try:
-            stdout, stderr = self._pman.run_verify_join(cmd, su=su)
+            stdout, stderr = self._pman.run_python_verify_join(script, su=su)
         except Error as err:
             raise type(err)(f"Failed to read MSR '{regaddr:#x}' on CPUs {cpus_str}"
                             f"{self._pman.hostmsg}:\n{err.indent(2)}") from err
@@ -392,6 +506,204 @@ for cpu in cpus:
         else:
             yield from self._cpus_read_local(regaddr, cpus)
 
+    def _cpus_read_many_local(self,
+                              reads: dict[int, list[int]]) -> \
+                                        Generator[tuple[int, int, int], None, None]:
+        """
+        Read multiple MSRs from multiple CPUs on a local host.
+
+        Args:
+            reads: A dictionary indexed by CPU number, values are lists of MSR addresses to read.
+
+        Yields:
+            Tuples of (cpu, regaddr, regval).
+        """
+
+        for cpu, regaddrs in reads.items():
+            path = self.format_msr_device_path(cpu)
+            regaddr = regaddrs[0]
+            regvals: list[tuple[int, int]] = []
+            try:
+                with self._fds_lock:
+                    fd = self._get_fd(cpu)
+                    for regaddr in regaddrs:
+                        _LOG.debug("Local: Read: CPU%d: MSR 0x%x from '%s'%s",
+                                   cpu, regaddr, path, self._pman.hostmsg)
+                        regval_bytes = os.pread(fd, self.regbytes, regaddr)
+                        regval = int.from_bytes(regval_bytes, byteorder=_CPU_BYTEORDER)
+                        regvals.append((regaddr, regval))
+            except PermissionError as err:
+                errmsg = Error(str(err)).indent(2)
+                raise ErrorPermissionDenied(f"No permissions to read MSR '{regaddr:#x}' from "
+                                            f"file '{path}'{self._pman.hostmsg}:\n"
+                                            f"{errmsg}") from err
+            except OSError as err:
+                self._close_fd(cpu)
+                raise ErrorPerCPUPath(f"Failed to read MSR '{regaddr:#x}' from file '{path}'"
+                                      f"{self._pman.hostmsg}: {err}", cpu=cpu, path=path) from err
+
+            for regaddr, regval in regvals:
+                yield cpu, regaddr, regval
+
+    def _cpus_read_many_optimized(self,
+                                  reads: dict[int, list[int]],
+                                  su: bool = False) -> Generator[tuple[int, int, int], None, None]:
+        """
+        Read multiple MSRs from multiple CPUs using optimized I/O.
+
+        Execute a small Python script in a single operation to read all the specified MSRs on all
+        the specified CPUs.
+
+        Args:
+            reads: A dictionary indexed by CPU number, values are lists of MSR addresses to read.
+            su: If 'True', run the script as superuser (root).
+
+        Yields:
+            Tuples of (cpu, regaddr, regval).
+        """
+
+        reads_str = ", ".join(f"{cpu}: [{', '.join(f'{regaddr:#x}' for regaddr in regaddrs)}]"
+                              for cpu, regaddrs in reads.items())
+
+        if _LOG.getEffectiveLevel() == Logging.DEBUG:
+            cpus_range = Trivial.rangify(list(reads))
+            _LOG.debug("Optimized: Read: Multiple MSRs from CPUs %s%s",
+                       cpus_range, self._pman.hostmsg)
+
+        script = f"""
+import os
+reads = {{{reads_str}}}
+for cpu, regaddrs in reads.items():
+    path = "/dev/cpu/%d/msr" % cpu
+    regaddr = regaddrs[0]
+    try:
+        with open(path, "rb") as fobj:
+            for regaddr in regaddrs:
+                regval = os.pread(fobj.fileno(), {self.regbytes}, regaddr)
+                regval = int.from_bytes(regval, byteorder="{_CPU_BYTEORDER}")
+                print("%d,%d,%d" % (cpu, regaddr, regval))
+    except PermissionError as err:
+        print("ERROR: Permission: CPU: %d: MSR: %#x: Path: %s: Error: %s" % (cpu, regaddr, path,
+                                                                            err))
+        raise SystemExit(0)
+    except Exception as err:
+        print("ERROR: Read: CPU: %d: MSR: %#x: Path: %s: Error: %s" % (cpu, regaddr, path, err))
+        raise SystemExit(0)
+"""
+
+        try:
+            stdout, stderr = self._pman.run_python_verify_join(script, su=su)
+        except Error as err:
+            raise type(err)(f"Failed to read MSRs{self._pman.hostmsg}:\n"
+                            f"{err.indent(2)}") from err
+
+        if stderr:
+            # Nothing is expected on stderr, if there is any output, treat it as an error.
+            raise Error(f"Failed to read MSRs{self._pman.hostmsg}:\nUnexpected output on "
+                        f"stderr:\n{stderr}")
+
+        regex = re.compile(r"ERROR: (Permission|Read): CPU: (\d+): MSR: (\w+): Path: ([^:]+): "
+                           r"Error: (.+)")
+
+        for line in stdout.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            if line.startswith("ERROR: "):
+                mobj = regex.match(line)
+                if not mobj:
+                    raise Error(f"Failed to read MSRs{self._pman.hostmsg}:\n{line}")
+
+                errtype = mobj.group(1)
+                cpu = Trivial.str_to_int(mobj.group(2), what="CPU number")
+                regaddr_str = mobj.group(3)
+                path = Path(mobj.group(4))
+                errmsg = mobj.group(5)
+
+                if errtype == "Permission":
+                    raise ErrorPermissionDenied(f"No permissions to read MSR '{regaddr_str}' from "
+                                                f"CPU {cpu}{self._pman.hostmsg} (file '{path}'):\n"
+                                                f"{Error(errmsg).indent(2)}")
+                raise ErrorPerCPUPath(f"Failed to read MSR '{regaddr_str}' from CPU {cpu}"
+                                      f"{self._pman.hostmsg} (file '{path}'):\n"
+                                      f"{Error(errmsg).indent(2)}", cpu=cpu, path=path)
+
+            # Normal output: CPU,address,value
+            split = Trivial.split_csv_line(line)
+            if len(split) != 3:
+                raise Error(f"BUG: bad MSR read script line '{line}'")
+
+            cpu = Trivial.str_to_int(split[0], what="CPU number")
+            regaddr = Trivial.str_to_int(split[1], what="MSR address")
+            regval = Trivial.str_to_int(split[2], what=f"MSR {regaddr:#x} value on CPU {cpu}")
+            yield cpu, regaddr, regval
+
+    def _cpus_read_many_pman(self,
+                             reads: dict[int, list[int]]) -> \
+                                        Generator[tuple[int, int, int], None, None]:
+        """
+        Read multiple MSRs from multiple CPUs using the process manager object.
+
+        Args:
+            reads: A dictionary indexed by CPU number, values are lists of MSR addresses to read.
+
+        Yields:
+            Tuples of (cpu, regaddr, regval).
+        """
+
+        for cpu, regaddrs in reads.items():
+            path = self.format_msr_device_path(cpu)
+            regaddr = regaddrs[0]
+            try:
+                with self._pman.openb(path, "rb") as fobj:
+                    for regaddr in regaddrs:
+                        _LOG.debug("Emulation: Read: CPU%d: MSR 0x%x from '%s'%s",
+                                   cpu, regaddr, path, self._pman.hostmsg)
+                        fobj.seek(regaddr)
+                        regval_bytes = fobj.read(self.regbytes)
+                        regval = int.from_bytes(regval_bytes, byteorder=_CPU_BYTEORDER)
+                        yield cpu, regaddr, regval
+            except ErrorPermissionDenied as err:
+                raise type(err)(f"No permissions to read MSR '{regaddr:#x}' from "
+                                f"file '{path}'{self._pman.hostmsg}:\n"
+                                f"{err.indent(2)}") from err
+            except Error as err:
+                raise type(err)(f"Failed to read MSR '{regaddr:#x}' from file '{path}'"
+                                f"{self._pman.hostmsg}:\n{err.indent(2)}") from err
+
+    def cpus_read_many(self,
+                       reads: dict[int, list[int]]) -> Generator[tuple[int, int, int], None, None]:
+        """
+        Read multiple MSRs from multiple CPUs in one pass and yield the results.
+
+        Args:
+            reads: A dictionary indexed by CPU number, values are lists of MSR addresses to read on
+                   that CPU. The CPU numbers have to be validated and normalized by the caller.
+
+        Yields:
+            Tuple of (cpu, regaddr, regval):
+                cpu: CPU number from which the MSR was read.
+                regaddr: Address of the MSR that was read.
+                regval: Value read from the MSR.
+
+        Raises:
+            ErrorPermissionDenied: No permissions to access the MSR device file.
+            ErrorPerCPUPath: An I/O error occurred while reading the MSR (includes CPU and path
+                             information).
+        """
+
+        reads = {cpu: regaddrs for cpu, regaddrs in reads.items() if regaddrs}
+        if not reads:
+            return
+
+        if self._pman.is_emulated:
+            yield from self._cpus_read_many_pman(reads)
+        elif self._pman.is_remote or self._use_sudo:
+            yield from self._cpus_read_many_optimized(reads, su=self._use_sudo)
+        else:
+            yield from self._cpus_read_many_local(reads)
+
     def cpu_read(self, regaddr: int, cpu: int) -> int:
         """
         Read an MSR at the specified address for a given CPU.
@@ -466,14 +778,15 @@ for cpu in cpus:
             _LOG.debug("Local: Write: CPU%d: MSR 0x%x: 0x%x to '%s'%s",
                        cpu, regaddr, regval, path, self._pman.hostmsg)
             try:
-                with open(path, "r+b") as fobj:
-                    os.pwrite(fobj.fileno(), regval_bytes, regaddr)
+                with self._fds_lock:
+                    os.pwrite(self._get_fd(cpu, write=True), regval_bytes, regaddr)
             except PermissionError as err:
                 errmsg = Error(str(err)).indent(2)
                 raise ErrorPermissionDenied(f"No permissions to write '{regval:#x}' to MSR "
                                             f"'{regaddr:#x}' of CPU {cpu}{self._pman.hostmsg} "
                                             f"(file '{path}'):\n{errmsg}") from err
             except OSError as err:
+                self._close_fd(cpu)
                 raise ErrorPerCPUPath(f"Failed to write '{regval:#x}' to MSR '{regaddr:#x}' of CPU "
                                       f"{cpu}{self._pman.hostmsg} (file '{path}'): {err}",
                                       cpu=cpu, path=path) from err
@@ -496,11 +809,10 @@ for cpu in cpus:
             su: If 'True', run the script as superuser (root).
         """
 
-        python_path = self._pman.get_python_path()
         cpus_list = list(cpus)
         cpus_str = ",".join([str(cpu) for cpu in cpus_list])
 
-        cmd = f"""{python_path} -c '
+        script = f"""
 import os
 cpus = [{cpus_str}]
 regval = {regval:#x}
@@ -516,13 +828,13 @@ for cpu in cpus:
     except Exception as err:
         print("ERROR: Write: CPU: %d: Path: %s: Error: %s" % (cpu, path, err))
         raise SystemExit(0)
-'"""
+"""
 
         _LOG.debug("Optimized: Write: MSR 0x%x: 0x%x%s",
                    regaddr, regval, self._pman.hostmsg)
 
         try:
-            stdout, stderr = self._pman.run_verify_join(cmd, su=su)
+            stdout, stderr = self._pman.run_python_verify_join(script, su=su)
         except Error as err:
             errmsg = err.indent(2)
             raise type(err)(f"Failed to write '{regval:#x}' to MSR '{regaddr:#x}' on CPUs "
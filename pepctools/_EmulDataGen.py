@@ -146,6 +146,10 @@ _SYSFS_INLINE_CMDS: list[_SysfsInlineCmdTypedDict] = [
     {"command": r"grep -Z -H '.*' "
                 r"/sys/devices/system/cpu/cpu[0-9]*/online",
      "readonly": False},
+    # SMT control.
+    {"command": r"grep -Z -H '.*' "
+                r"/sys/devices/system/cpu/smt/control",
+     "readonly": False},
     # C-state sysfs files.
     {"command": r"grep -Z -H --directories=skip '.*' "
                 r"/sys/devices/system/cpu/cpu[0-9]*/cpuidle/state[0-9]/* "
@@ -362,7 +366,7 @@ def _get_msr_data(cpuinfo: CPUInfo.CPUInfo,
         '{cpu: hex_val}' dictionary for that address.
     """
 
-    seen_addrs: set[int] = set()
+    addrs: list[int] = []
 
     with MSR.MSR(cpuinfo, pman=pman) as msr:
         for cls in _discover_msr_classes():
@@ -372,16 +376,18 @@ def _get_msr_data(cpuinfo: CPUInfo.CPUInfo,
             except ErrorNotSupported:
                 continue
 
-            if addr in seen_addrs:
+            if addr in addrs:
                 raise Error(f"BUG: MSR address {addr:#x} is covered by multiple classes")
 
-            seen_addrs.add(addr)
+            addrs.append(addr)
 
-            vals: dict[int, str] = {}
-            for cpu, regval in msr.read(addr, cpus):
-                vals[cpu] = f"{regval:x}"
+        # Read all the MSRs in one pass.
+        data: dict[int, dict[int, str]] = {addr: {} for addr in addrs}
+        for cpu, regvals in msr.read_many(addrs, cpus):
+            for addr, regval in regvals.items():
+                data[addr][cpu] = f"{regval:x}"
 
-            yield addr, vals
+    yield from data.items()
 
 def _copy_tpmi_dir(pman: ProcessManagerType, srcdir: Path, dstdir: Path):
     """
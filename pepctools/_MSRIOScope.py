@@ -128,63 +128,131 @@ def _get_existing_snames(cpuinfo: CPUInfo.CPUInfo) -> list[ScopeNameType]:
         raise Error("Could not find any scope on the target system")
     return snames
 
-def _is_sibling(snames: list[ScopeNameType],
-                sname: ScopeNameType,
-                tline1: dict[ScopeNameType, int],
-                tline2: dict[ScopeNameType, int]) -> bool:
+def _get_sibling_sets(cpuinfo: CPUInfo.CPUInfo,
+                      snames: list[ScopeNameType],
+                      cpu: int) -> dict[ScopeNameType, set[int]]:
     """
-    Check if two topology lines are siblings at the given scope.
+    Return sets of CPUs sharing each scope element with a CPU.
 
     Args:
+        cpuinfo: The target system CPU information object.
         snames: All MSR scope names on the target system, sorted from the smallest to the largest.
-        sname: The scope name to check for sibling relationship.
-        tline1: The first topology line.
-        tline2: The second topology line.
+        cpu: The CPU to return the sibling sets for.
 
     Returns:
-        True if the two topology lines are siblings at the given scope, False otherwise.
+        A dictionary mapping scope names to sets of sibling CPU numbers, including 'cpu'.
     """
 
-    # The scopes to check are the 'sname' and all the higher scopes.
-    idx = snames.index(sname)
-    for _sname in snames[idx:]:
-        if tline1[_sname] != tline2[_sname]:
-            return False
-    return True
+    return {sname: set(cpuinfo.get_cpu_siblings(cpu, sname)) for sname in snames}
 
-def _check_ioscope(cpuinfo: CPUInfo.CPUInfo,
-                   snames: list[ScopeNameType],
-                   sname: ScopeNameType,
-                   vals: dict[int, int],
-                   cpu: int,
-                   val: int) -> bool:
+def _check_ioscope(siblings: set[int], vals: dict[int, int], val: int) -> bool:
     """
-    Check if the given scope name is the I/O scope of an MSR bits range.
+    Check if a scope is the I/O scope of an MSR bits range.
 
     Args:
-        cpuinfo: The target system CPU information object.
-        snames: All MSR scope names on the target system, sorted from the smallest to the largest.
-                Scope names irrelevant to MSRs (e.g., "node") must not be included.
-        sname: The scope name to check.
+        siblings: CPUs sharing the scope element with the CPU 'val' was written on (refer to
+                  '_get_sibling_sets()').
         vals: A dictionary mapping CPU numbers to their MSR bit-range values.
-        cpu: The CPU on which the value 'val' was written.
         val: The value that was written to one of the CPUs.
 
     Returns:
-        True if the given scope name is the I/O scope of the MSR bits range, False otherwise.
+        True if the scope is the I/O scope of the MSR bits range, False otherwise.
     """
 
-    tline = cpuinfo.get_tline_by_cpu(cpu)
+    # The scope matches if exactly the sibling CPUs observe the written value.
+    return {_cpu for _cpu, _val in vals.items() if _val == val} == siblings
 
-    for _tline in cpuinfo.get_topology():
-        if _is_sibling(snames, sname, tline, _tline):
-            if vals[_tline["CPU"]] != val:
-                return False
-        else:
-            if vals[_tline["CPU"]] == val:
-                return False
+def _group_cpus_by_regval(regvals: dict[int, int]) -> dict[int, list[int]]:
+    """
+    Group CPUs by MSR value.
 
-    return True
+    Args:
+        regvals: A dictionary mapping CPU numbers to MSR values.
+
+    Returns:
+        A dictionary mapping MSR values to lists of CPU numbers.
+    """
+
+    groups: dict[int, list[int]] = {}
+    for _cpu, regval in regvals.items():
+        groups.setdefault(regval, []).append(_cpu)
+    return groups
+
+def _detect_msr_ioscopes(cpuinfo: CPUInfo.CPUInfo,
+                         msr: MSR.MSR,
+                         addr: int,
+                         probes: Sequence[tuple[list[int], list[int]]],
+                         cpu: int) -> list[ScopeNameType | None]:
+    """
+    Detect I/O scope of several non-overlapping bit ranges of an MSR in a single pass.
+
+    Set up all the bit ranges with one bulk MSR write per distinct MSR value, read the MSR back
+    once, then detect I/O scope of each bit range.
+
+    Args:
+        cpuinfo: The target system CPU information object.
+        msr: The target system MSR object.
+        addr: The MSR address.
+        probes: A sequence of (bits, values) tuples, where 'bits' is a bit range to test in the
+                format [msb, lsb], and 'values' are two unique values to write for detecting I/O
+                scope of the bit range. The bit ranges must not overlap.
+        cpu: The CPU number to write to.
+
+    Returns:
+        A list of detected I/O scope names, one per element of 'probes'. The list elements are
+        'None' for bit ranges I/O scope of which could not be detected.
+    """
+
+    allcpus = cpuinfo.get_cpus()
+    snames = _get_existing_snames(cpuinfo)
+    siblings = _get_sibling_sets(cpuinfo, snames, cpu)
+
+    # Save the initial MSR values.
+    initial_regvals: dict[int, int] = dict(msr.read(addr, allcpus))
+
+    # The I/O scope detection setup: set every bit range to 'values[0]' on all CPUs and to
+    # 'values[1]' on one of the CPUs.
+    cpus_to_write = set(cpuinfo.normalize_cpus([cpu, 0]))
+    new_regvals: dict[int, int] = {}
+    for _cpu, regval in initial_regvals.items():
+        idx = 1 if _cpu in cpus_to_write else 0
+        for bits, values in probes:
+            regval = msr.set_bits(regval, bits, values[idx])
+        new_regvals[_cpu] = regval
+
+    try:
+        # Write 'values[0]' to the CPUs first and 'values[1]' to the probed CPUs last. The MSR may
+        # be shared between CPUs, in which case the last write to it wins.
+        for probed in (False, True):
+            regvals_subset = {_cpu: regval for _cpu, regval in new_regvals.items()
+                              if (_cpu in cpus_to_write) == probed}
+            for regval, regval_cpus in _group_cpus_by_regval(regvals_subset).items():
+                msr.write(addr, regval, regval_cpus, verify=True)
+
+        # MSR values on all CPUs after the I/O scope detection setup.
+        regvals: dict[int, int] = dict(msr.read(addr, allcpus))
+
+        result: list[ScopeNameType | None] = []
+        for bits, values in probes:
+            vals = {_cpu: msr.get_bits(regval, bits) for _cpu, regval in regvals.items()}
+            bits_str = ":".join([str(bit) for bit in bits])
+
+            # Iterate scopes from the largest to the smallest.
+            for sname in reversed(snames):
+                _LOG.debug("Checking scope '%s' for MSR %#x bits %s", sname, addr, bits_str)
+                if _check_ioscope(siblings[sname], vals, values[1]):
+                    _LOG.debug("  Matched")
+                    result.append(sname)
+                    break
+                _LOG.debug("  Not matched")
+            else:
+                result.append(None)
+    finally:
+        # Restore the MSR to the initial value.
+        for regval, regval_cpus in _group_cpus_by_regval(initial_regvals).items():
+            msr.write(addr, regval, regval_cpus, verify=True)
+
+    return result
 
 def _detect_msr_bits_range_ioscope(cpuinfo: CPUInfo.CPUInfo,
                                    msr: MSR.MSR,
@@ -207,42 +275,10 @@ def _detect_msr_bits_range_ioscope(cpuinfo: CPUInfo.CPUInfo,
         The detected I/O scope name.
     """
 
-    allcpus = cpuinfo.get_cpus()
-
-    # Save the initial MSR values.
-    initial_vals: dict[int, int] = {}
-    for _cpu, val in msr.read_bits(addr, bits, allcpus):
-        initial_vals[_cpu] = val
-
-    snames = _get_existing_snames(cpuinfo)
-
-    # The I/O scope detection setup: set the MSR bits range to 'values[0]' on all CPUs and to
-    # 'values[1]' on one of the CPUs.
-    msr.write_bits(addr, bits, values[0], allcpus, verify=True)
-    cpus_to_write = cpuinfo.normalize_cpus([cpu, 0])
-    msr.write_bits(addr, bits, values[1], cpus_to_write, verify=True)
-
-    # MSR values on all CPUs after the I/O scope detection setup.
-    vals: dict[int, int] = {}
-    for _cpu, val in msr.read_bits(addr, bits, allcpus):
-        vals[_cpu] = val
-
-    bits_str = ":".join([str(bit) for bit in bits])
-
-    try:
-        # Iterate scopes from the largest to the smallest.
-        for sname in reversed(snames):
-            _LOG.debug("Checking scope '%s' for MSR %#x bits %s", sname, addr, bits_str)
-            if _check_ioscope(cpuinfo, snames, sname, vals, cpu, values[1]):
-                _LOG.debug("  Matched")
-                break
-            _LOG.debug("  Not matched")
-        else:
-            raise Error(f"Failed to detect I/O scope of MSR {addr:#x} bits {bits_str}")
-    finally:
-        # Restore the MSR to the initial value.
-        for _cpu, val in initial_vals.items():
-            msr.write_bits(addr, bits, val, (_cpu,), verify=True)
+    sname = _detect_msr_ioscopes(cpuinfo, msr, addr, ((bits, values),), cpu)[0]
+    if sname is None:
+        bits_str = ":".join([str(bit) for bit in bits])
+        raise Error(f"Failed to detect I/O scope of MSR {addr:#x} bits {bits_str}")
 
     return sname
 
@@ -383,6 +419,128 @@ def _get_featured_msrs(pman: ProcessManagerType,
 
             yield fmsr, fname
 
+def _get_feature_test_values(fmsr: _FeaturedMSR.FeaturedMSR, fname: str) -> list[int]:
+    """
+    Return two unique values to write to a featured MSR feature for detecting its I/O scope.
+
+    Args:
+        fmsr: The featured MSR object.
+        fname: The name of the feature.
+
+    Returns:
+        A list of two unique feature bits range values.
+    """
+
+    finfo = fmsr.features[fname]
+    bits = finfo["bits"]
+    bits_str = ":".join([str(bit) for bit in bits])
+
+    if "vals" in finfo:
+        values = list(finfo["vals"].values())
+        if len(values) < 2:
+            raise Error(f"BUG: Feature '{fname}' (bits {bits_str}) in MSR '{fmsr.regname}' "
+                        f"({fmsr.regaddr:#x}) has less than 2 unique values")
+        return values[:2]
+
+    expected_types = ("bool", "int")
+    if finfo["type"] not in expected_types:
+        expected_str = ", ".join(expected_types)
+        raise Error(f"BUG: Writable feature '{fname}' (bits {bits_str}) in MSR "
+                    f"'{fmsr.regname}' ({fmsr.regaddr:#x}) has unexpected type "
+                    f"'{finfo['type']}'. Expected one of: {expected_str}.")
+
+    max_val = (1 << (bits[0] - bits[1] + 1)) - 1
+    return [max_val // 2, max_val // 2 + 1]
+
+def _split_features(fmsr: _FeaturedMSR.FeaturedMSR, fnames: list[str]) -> list[list[str]]:
+    """
+    Split features of a featured MSR into groups of features with non-overlapping bit ranges.
+
+    Args:
+        fmsr: The featured MSR object.
+        fnames: Names of the features to split.
+
+    Returns:
+        A list of feature name groups.
+    """
+
+    groups: list[list[str]] = []
+    groups_masks: list[int] = []
+
+    for fname in fnames:
+        bits = fmsr.features[fname]["bits"]
+        mask = ((1 << (bits[0] - bits[1] + 1)) - 1) << bits[1]
+        for idx, groups_mask in enumerate(groups_masks):
+            if not groups_mask & mask:
+                groups[idx].append(fname)
+                groups_masks[idx] |= mask
+                break
+        else:
+            groups.append([fname])
+            groups_masks.append(mask)
+
+    return groups
+
+def _detect_features_ioscope(cpuinfo: CPUInfo.CPUInfo,
+                             msr: MSR.MSR,
+                             fmsr: _FeaturedMSR.FeaturedMSR,
+                             fnames: list[str],
+                             cpu: int) -> dict[str, ScopeNameType]:
+    """
+    Detect I/O scope of features of a featured MSR. Probe all the features in a single pass, and if
+    this fails, probe the features one by one.
+
+    Args:
+        cpuinfo: The target system CPU information object.
+        msr: The target system MSR object.
+        fmsr: The featured MSR object.
+        fnames: Names of the features to detect I/O scope for. The feature bit ranges must not
+                overlap.
+        cpu: The CPU number to write to.
+
+    Returns:
+        A dictionary mapping feature names to the detected I/O scope names. Features I/O scope of
+        which could not be detected are not included.
+    """
+
+    addr = fmsr.regaddr
+    probes = [(list(fmsr.features[fname]["bits"]), _get_feature_test_values(fmsr, fname))
+              for fname in fnames]
+
+    for fname, (bits, _) in zip(fnames, probes):
+        bits_str = ":".join([str(bit) for bit in bits])
+        _LOG.info("Running I/O scope detection for feature '%s' (bits %s) in MSR '%s' (%#x)",
+                  fname, bits_str, fmsr.regname, addr)
+
+    snames: list[ScopeNameType | None]
+    try:
+        snames = _detect_msr_ioscopes(cpuinfo, msr, addr, probes, cpu)
+    except Error as err:
+        if len(fnames) == 1:
+            _LOG.error("Failed to detect I/O scope of feature '%s' in MSR '%s' (%#x):\n%s",
+                       fnames[0], fmsr.regname, addr, err.indent(2))
+            return {}
+
+        # One of the features may reject the test values. Probe the features one by one to find out
+        # which one.
+        _LOG.debug("Failed to probe features of MSR '%s' (%#x) in a single pass, probing them one "
+                   "by one:\n%s", fmsr.regname, addr, err.indent(2))
+        result: dict[str, ScopeNameType] = {}
+        for fname in fnames:
+            result.update(_detect_features_ioscope(cpuinfo, msr, fmsr, [fname], cpu))
+        return result
+
+    result = {}
+    for fname, (bits, _), sname in zip(fnames, probes, snames):
+        if sname is None:
+            bits_str = ":".join([str(bit) for bit in bits])
+            _LOG.error("Failed to detect I/O scope of feature '%s' (bits %s) in MSR '%s' (%#x)",
+                       fname, bits_str, fmsr.regname, addr)
+            continue
+        result[fname] = sname
+
+    return result
+
 def _print_ioscope_all(pman: ProcessManagerType,
                         cpuinfo: CPUInfo.CPUInfo,
                         msr: MSR.MSR,
@@ -400,50 +558,35 @@ def _print_ioscope_all(pman: ProcessManagerType,
 
     cpu = cmdl["cpu"]
 
-    info: dict[str, dict[str, _FeatureInfoTypedDict]] = {}
+    # The features to test: {regname: (fmsr, [fname1, fname2, ...])}.
+    features: dict[str, tuple[_FeaturedMSR.FeaturedMSR, list[str]]] = {}
 
     for fmsr, fname in _get_featured_msrs(pman, cpuinfo, msr):
-        finfo = fmsr.features[fname]
-        addr = fmsr.regaddr
-        bits = list(finfo["bits"])
-        bits_str = ":".join([str(bit) for bit in bits])
+        if fmsr.regname not in features:
+            features[fmsr.regname] = (fmsr, [])
+        fnames = features[fmsr.regname][1]
+        if fname in fnames:
+            bits_str = ":".join([str(bit) for bit in fmsr.features[fname]["bits"]])
+            raise Error(f"BUG: Feature '{fname}' (bits {bits_str}) in MSR '{fmsr.regname}' "
+                        f"({fmsr.regaddr:#x}) was met twice")
+        fnames.append(fname)
 
-        if "vals" in finfo:
-            values = list(finfo["vals"].values())
-            if len(values) < 2:
-                raise Error(f"BUG: Feature '{fname}' (bits {bits_str}) in MSR '{fmsr.regname}' "
-                            f"({addr:#x}) has less than 2 unique values")
-            values = values[:2]
-        else:
-            expected_types = ("bool", "int")
-            if finfo["type"] not in expected_types:
-                expected_str = ", ".join(expected_types)
-                raise Error(f"BUG: Writable feature '{fname}' (bits {bits_str}) in MSR "
-                            f"'{fmsr.regname}' ({fmsr.regaddr:#x}) has unexpected type "
-                            f"'{finfo['type']}'. Expected one of: {expected_str}.")
+    info: dict[str, dict[str, _FeatureInfoTypedDict]] = {}
 
-            max_val = (1 << (bits[0] - bits[1] + 1)) - 1
-            values = [max_val // 2, max_val // 2 + 1]
+    for regname, (fmsr, fnames) in features.items():
+        for group in _split_features(fmsr, fnames):
+            snames = _detect_features_ioscope(cpuinfo, msr, fmsr, group, cpu)
+            for fname in group:
+                if fname not in snames:
+                    continue
 
-        try:
-            _LOG.info("Running I/O scope detection for feature '%s' (bits %s) in MSR '%s' (%#x)",
-                      fname, bits_str, fmsr.regname, addr)
-            sname = _detect_msr_bits_range_ioscope(cpuinfo, msr, addr, bits, values, cpu)
-            if fmsr.regname not in info:
-                info[fmsr.regname] = {}
-            if fname in info[fmsr.regname]:
-                raise Error(f"BUG: Feature '{fname}' (bits {bits_str}) in MSR '{fmsr.regname}' "
-                            f"({addr:#x}) was met twice")
-
-            info[fmsr.regname][fname] = {"bits_str": bits_str,
-                                         "addr": addr,
-                                         "sname": sname,
-                                         "expected_sname": finfo["sname"]}
-        except Error as err:
-            errmsg = err.indent(2)
-            _LOG.error("Failed to detect I/O scope of feature '%s' (bits %s) in MSR '%s' "
-                       "(%#x):\n%s", fname, bits_str, fmsr.regname, addr, errmsg)
-            continue
+                finfo = fmsr.features[fname]
+                if regname not in info:
+                    info[regname] = {}
+                info[regname][fname] = {"bits_str": ":".join([str(bit) for bit in finfo["bits"]]),
+                                        "addr": fmsr.regaddr,
+                                        "sname": snames[fname],
+                                        "expected_sname": finfo["sname"]}
 
     if not info:
         _LOG.info("No successful I/O scope detection results")
@@ -53,6 +53,33 @@ _DATASET_OPTION: Final[ArgTypedDict] = {
     },
 }
 
+_HOSTS_OPTIONS: Final[tuple[ArgTypedDict, ...]] = (
+    {
+        "short": None,
+        "long": "--hosts",
+        "argcomplete": None,
+        "kwargs": {
+            "dest": "hosts",
+            "metavar": "HOSTNAMES",
+            "help": """Comma-separated list of host names or IP addresses to run the command on
+                       concurrently over SSH. The results are printed as a single YAML document
+                       keyed by host name."""
+        },
+    },
+    {
+        "short": None,
+        "long": "--hosts-file",
+        "argcomplete": "FilesCompleter",
+        "kwargs": {
+            "dest": "hosts_file",
+            "metavar": "PATH",
+            "help": """Path to a file with host names or IP addresses to run the command on, one
+                       per line. Empty lines and lines starting with '#' are ignored. Can be
+                       combined with '--hosts'."""
+        },
+    },
+)
+
 _OVERRIDE_CPU_OPTION: Final[ArgTypedDict] = {
     "short": None,
     "long": "--override-cpu-model",
@@ -193,6 +220,19 @@ def _get_prop_info_subcommand_help_text(prop: PropertyTypedDict) -> str:
 
     return text
 
+def _add_jobs_argument(subpars: ArgParse.ArgsParser):
+    """
+    Add the '--jobs' command-line option to an "info" sub-command.
+
+    Args:
+        subpars: The sub-command parser to add the option to.
+    """
+
+    text = """Maximum number of properties to read concurrently (1 by default, meaning that properties
+              are read one after another). Reading properties concurrently speeds up the command on
+              remote hosts, where most of the time is spent waiting for the network."""
+    subpars.add_argument("--jobs", default="1", help=text)
+
 def _add_prop_info_subcommand_options(props: dict[str, PropertyTypedDict],
                                       subpars: ArgParse.ArgsParser):
     """
@@ -300,7 +340,7 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
                tool."""
     parser.add_argument("--print-man-path", action=_PrintManPathAction, nargs=0, help=text)
 
-    ssh_options = (*ArgParse.SSH_OPTIONS, _DATASET_OPTION)
+    ssh_options = (*ArgParse.SSH_OPTIONS, *_HOSTS_OPTIONS, _DATASET_OPTION)
     ssh_and_mechanisms_options = (*ssh_options, *_MECHANISMS_OPTIONS)
     override_cpu_options = (_OVERRIDE_CPU_OPTION,)
 
@@ -334,6 +374,8 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
 
     _add_prop_info_subcommand_options(PStatesVars.PROPS, subpars2)
 
+    _add_jobs_argument(subpars2)
+
     text = """Display information in YAML format."""
     subpars2.add_argument("--yaml", action="store_true", help=text)
 
@@ -395,6 +437,8 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
 
     _add_prop_info_subcommand_options(CStatesVars.PROPS, subpars2)
 
+    _add_jobs_argument(subpars2)
+
     #
     # Create parser for the 'cstates config' command.
     #
@@ -457,6 +501,8 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
 
     _add_prop_info_subcommand_options(UncoreVars.PROPS, subpars2)
 
+    _add_jobs_argument(subpars2)
+
     #
     # Create parser for the 'uncore config' command.
     #
@@ -599,6 +645,8 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
 
     _add_prop_info_subcommand_options(PMQoSVars.PROPS, subpars2)
 
+    _add_jobs_argument(subpars2)
+
     text = """Display information in YAML format."""
     subpars2.add_argument("--yaml", action="store_true", help=text)
 
@@ -1189,6 +1237,19 @@ def do_main(pman: ProcessManagerType | None = None):
     if cmdl["hostname"] != "localhost" and dataset:
         raise Error("The '--dataset' option cannot be used with '--host'")
 
+    hosts: str | None = getattr(args, "hosts", None)
+    hosts_file: str | None = getattr(args, "hosts_file", None)
+    multihost = bool(hosts or hosts_file)
+    if multihost:
+        optname = "--hosts" if hosts else "--hosts-file"
+        if cmdl["hostname"] != "localhost":
+            raise Error(f"The '{optname}' option cannot be used with '--host'")
+        if dataset:
+            raise Error(f"The '{optname}' option cannot be used with '--dataset'")
+        if pman:
+            raise Error(f"The '{optname}' option cannot be used when a process manager is "
+                        f"provided externally")
+
     # Handle the 'no_pman_opts' attribute: If any of the listed attributes (options) is set,
     # then, do not create the process manager, pass 'None' to 'args.func' instead.
     no_pman = False
@@ -1203,6 +1264,9 @@ def do_main(pman: ProcessManagerType | None = None):
                 raise Error(f"The '{optname}' option cannot be used with '--dataset'")
             if cmdl["hostname"] != "localhost":
                 raise Error(f"The '{optname}' option cannot be used with '--host'")
+            if multihost:
+                raise Error(f"The '{optname}' option cannot be used with '--hosts' and "
+                            f"'--hosts-file'")
             if pman:
                 raise Error(f"The '{optname}' option cannot be used when a process manager is "
                             f"provided externally")
@@ -1210,6 +1274,12 @@ def do_main(pman: ProcessManagerType | None = None):
 
     if pman:
         args.func(args, pman)
+    elif multihost:
+        # pylint: disable-next=import-outside-toplevel
+        from pepctools import _PepcMultiHost
+
+        hostnames = _PepcMultiHost.get_hostnames(hosts, hosts_file)
+        _PepcMultiHost.run(args, hostnames, cmdl)
     elif dataset:
         if no_pman:
             args.func(args, None)
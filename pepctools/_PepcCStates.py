@@ -34,6 +34,7 @@ if typing.TYPE_CHECKING:
 
         Attributes:
             yaml: Whether to output results in YAML format.
+            jobs: Maximum number of properties to read concurrently.
             override_cpu_model: Override the CPU model with a custom value.
             mechanisms: Mechanism names to use for accessing C-state properties.
             cpus: CPU numbers to operate on.
@@ -48,6 +49,7 @@ if typing.TYPE_CHECKING:
         """
 
         yaml: bool
+        jobs: int
         override_cpu_model: str
         mechanisms: str
         cpus: str
@@ -85,6 +87,7 @@ def _get_config_cmdline_args(args: argparse.Namespace) -> _ConfigCmdlineArgsType
     """
     cmdl: _ConfigCmdlineArgsTypedDict = {}
     cmdl["yaml"] = getattr(args, "yaml", False)
+    cmdl["jobs"] = _PepcCommon.parse_jobs(getattr(args, "jobs", "1"))
     cmdl["override_cpu_model"] = args.override_cpu_model
     cmdl["mechanisms"] = args.mechanisms
     cmdl["cpus"] = args.cpus
@@ -154,7 +157,7 @@ def cstates_info_command(args: argparse.Namespace, pman: ProcessManagerType):
         pobj = CStates.CStates(pman=pman, cpuinfo=cpuinfo)
         stack.enter_context(pobj)
 
-        pprinter = _PepcPrinter.CStatesPrinter(pobj, cpuinfo, fmt=fmt)
+        pprinter = _PepcPrinter.CStatesPrinter(pobj, cpuinfo, fmt=fmt, jobs=cmdl["jobs"])
         stack.enter_context(pprinter)
 
         mnames: Sequence[MechanismNameType] = []
@@ -46,6 +46,26 @@ def check_tuned_presence(pman: ProcessManagerType):
     except Error as err:
         _LOG.warning("Failed to check for 'tuned' presence:\n%s", err.indent(2))
 
+def parse_jobs(jobs: str) -> int:
+    """
+    Parse and validate the '--jobs' command-line option value.
+
+    Args:
+        jobs: The '--jobs' option value to parse.
+
+    Returns:
+        The maximum number of properties to read concurrently.
+
+    Raises:
+        Error: If 'jobs' is not a positive integer.
+    """
+
+    njobs = Trivial.str_to_int(jobs, what="'--jobs' option value")
+    if njobs < 1:
+        raise Error(f"Bad '--jobs' option value '{jobs}': should be a positive integer")
+
+    return njobs
+
 def override_cpu_model(cpuinfo: CPUInfo.CPUInfo, user_vfm: str):
     """
     Override the CPU model in the provided 'CPUInfo' object.
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""
+Implement the multi-host mode of 'pepc': run the same command on many hosts concurrently and print
+the results as a single YAML document keyed by host name.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import io
+import copy
+import typing
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from pepclibs.helperlibs import Logging, Trivial, YAML, ProcessManager
+from pepclibs.helperlibs.Exceptions import Error
+
+if typing.TYPE_CHECKING:
+    import argparse
+    from typing import Final, Any
+    from pepclibs.helperlibs.ArgParse import SSHArgsTypedDict
+
+# Maximum number of hosts to run the command on concurrently.
+MAX_WORKERS: Final[int] = 16
+
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
+
+def get_hostnames(hosts: str | None, hosts_file: str | None) -> list[str]:
+    """
+    Build the list of host names from the '--hosts' and '--hosts-file' command-line options.
+
+    Args:
+        hosts: Comma-separated list of host names ('--hosts' option value).
+        hosts_file: Path to a file with host names, one per line ('--hosts-file' option value).
+                    Empty lines and lines starting with '#' are ignored.
+
+    Returns:
+        The de-duplicated list of host names in the order of appearance.
+    """
+
+    hostnames: list[str] = []
+
+    if hosts:
+        hostnames += Trivial.split_csv_line(hosts)
+
+    if hosts_file:
+        path = Path(hosts_file)
+        try:
+            with open(path, "r", encoding="utf-8") as fobj:
+                lines = fobj.readlines()
+        except OSError as err:
+            errmsg = Error(str(err)).indent(2)
+            raise Error(f"Failed to read hosts file '{path}':\n{errmsg}") from err
+
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                hostnames.append(line)
+
+    hostnames = Trivial.list_dedup(hostnames)
+    if not hostnames:
+        raise Error("No host names specified")
+
+    return hostnames
+
+def _run_on_host(args: argparse.Namespace,
+                 hostname: str,
+                 cmdl: SSHArgsTypedDict) -> dict[str, Any]:
+    """
+    Run the command on a single host and capture its output.
+
+    Args:
+        args: Parsed command-line arguments.
+        hostname: Name of the host to run the command on.
+        cmdl: The formatted SSH command-line arguments (user name and private key path).
+
+    Returns:
+        The host result dictionary. If the command succeeded and produced YAML output, the parsed
+        YAML document. If the command succeeded and produced other output, the "output" key with
+        the list of output lines. If the command failed, including failures due to unexpected
+        exceptions, the "error" key with the error message, and the "output" key with the output
+        lines produced before the failure, if any.
+    """
+
+    host_args = copy.copy(args)
+    host_args.hostname = hostname
+
+    output = io.StringIO()
+    _LOG.set_thread_info_stream(output)
+
+    result: dict[str, Any] = {}
+    try:
+        with ProcessManager.get_pman(hostname, username=cmdl["username"],
+                                     privkeypath=cmdl["privkey"]) as pman:
+            args.func(host_args, pman)
+    except Error as err:
+        result["error"] = str(err)
+    except Exception as err: # pylint: disable=broad-except
+        # An unexpected exception on one host must not discard the results of the other hosts.
+        _LOG.debug_print_stacktrace()
+        result["error"] = f"Unexpected {type(err).__name__} exception: {err}"
+    finally:
+        _LOG.set_thread_info_stream(None)
+
+    text = output.getvalue()
+    if "error" not in result and getattr(args, "yaml", False) and text.strip():
+        try:
+            return YAML.load(f"<{hostname} output>", fobj=io.StringIO(text))
+        except Error as err:
+            _LOG.debug("Failed to parse YAML output of host '%s':\n%s", hostname, err.indent(2))
+
+    if text:
+        result["output"] = text.splitlines()
+    return result
+
+def run(args: argparse.Namespace, hostnames: list[str], cmdl: SSHArgsTypedDict):
+    """
+    Run the command on multiple hosts concurrently and print the results.
+
+    Args:
+        args: Parsed command-line arguments.
+        hostnames: Names of the hosts to run the command on.
+        cmdl: The formatted SSH command-line arguments (user name and private key path).
+
+    Notes:
+        - Results are printed as a single YAML document, keyed by host name, in the order of
+          'hostnames'.
+        - A failure on one host does not stop the command on other hosts. The error is reported in
+          the result of the host, and an exception is raised after all results are printed.
+    """
+
+    max_workers = min(MAX_WORKERS, len(hostnames))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_on_host, args, hostname, cmdl) for hostname in hostnames]
+        results = {hostname: future.result() for hostname, future in zip(hostnames, futures)}
+
+    YAML.dump(results, _LOG.get_info_stream())
+
+    failed = [hostname for hostname, result in results.items() if "error" in result]
+    if failed:
+        raise Error(f"The command failed on {len(failed)} of {len(hostnames)} hosts: "
+                    f"{', '.join(failed)}")
@@ -34,6 +34,7 @@ if typing.TYPE_CHECKING:
 
         Attributes:
             yaml: Whether to output results in YAML format.
+            jobs: Maximum number of properties to read concurrently.
             mechanisms: Mechanism names to use for accessing P-state properties.
             cpus: CPU numbers to operate on.
             cores: Core numbers to operate on.
@@ -47,6 +48,7 @@ if typing.TYPE_CHECKING:
         """
 
         yaml: bool
+        jobs: int
         mechanisms: str
         cpus: str
         cores: str
@@ -72,6 +74,7 @@ def _get_cmdline_args(args: argparse.Namespace) -> _CmdlineArgsTypedDict:
 
     cmdl: _CmdlineArgsTypedDict = {}
     cmdl["yaml"] = getattr(args, "yaml", False)
+    cmdl["jobs"] = _PepcCommon.parse_jobs(getattr(args, "jobs", "1"))
     cmdl["mechanisms"] = args.mechanisms
     cmdl["cpus"] = args.cpus
     cmdl["cores"] = args.cores
@@ -105,7 +108,7 @@ def pmqos_info_command(args: argparse.Namespace, pman: ProcessManagerType):
         pobj = PMQoS.PMQoS(pman=pman, cpuinfo=cpuinfo)
         stack.enter_context(pobj)
 
-        pprinter = _PepcPrinter.PMQoSPrinter(pobj, cpuinfo, fmt=fmt)
+        pprinter = _PepcPrinter.PMQoSPrinter(pobj, cpuinfo, fmt=fmt, jobs=cmdl["jobs"])
         stack.enter_context(pprinter)
 
         optar = _OpTarget.OpTarget(pman=pman, cpuinfo=cpuinfo, cpus=args.cpus, cores=args.cores,
@@ -34,6 +34,7 @@ if typing.TYPE_CHECKING:
 
         Attributes:
             yaml: Whether to output results in YAML format.
+            jobs: Maximum number of properties to read concurrently.
             override_cpu_model: Override the CPU model with a custom value.
             mechanisms: Mechanism names to use for accessing P-state properties.
             cpus: CPU numbers to operate on.
@@ -48,6 +49,7 @@ if typing.TYPE_CHECKING:
         """
 
         yaml: bool
+        jobs: int
         override_cpu_model: str
         mechanisms: str
         cpus: str
@@ -74,6 +76,7 @@ def _get_cmdline_args(args: argparse.Namespace) -> _CmdlineArgsTypedDict:
 
     cmdl: _CmdlineArgsTypedDict = {}
     cmdl["yaml"] = getattr(args, "yaml", False)
+    cmdl["jobs"] = _PepcCommon.parse_jobs(getattr(args, "jobs", "1"))
     cmdl["override_cpu_model"] = args.override_cpu_model
     cmdl["mechanisms"] = args.mechanisms
     cmdl["cpus"] = args.cpus
@@ -111,7 +114,7 @@ def pstates_info_command(args: argparse.Namespace, pman: ProcessManagerType):
         pobj = PStates.PStates(pman=pman, cpuinfo=cpuinfo)
         stack.enter_context(pobj)
 
-        pprinter = _PepcPrinter.PStatesPrinter(pobj, cpuinfo, fmt=fmt)
+        pprinter = _PepcPrinter.PStatesPrinter(pobj, cpuinfo, fmt=fmt, jobs=cmdl["jobs"])
         stack.enter_context(pprinter)
 
         mnames = []
@@ -14,8 +14,8 @@ Provide API for printing properties.
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
-import sys
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pepctools import _PepcCommon
 from pepctools._OpTarget import ErrorNoCPUTarget
 from pepclibs import CPUInfo
@@ -134,7 +134,8 @@ class _PropsPrinter(ClassHelpers.SimpleCloseContext):
                  pobj: PropsClassType,
                  cpuinfo: CPUInfo.CPUInfo,
                  fobj: IO[str] | None = None,
-                 fmt: PrintFormatType = "human"):
+                 fmt: PrintFormatType = "human",
+                 jobs: int = 1):
         """
         Initialize the class instance.
 
@@ -144,17 +145,23 @@ class _PropsPrinter(ClassHelpers.SimpleCloseContext):
             fobj: File object to print output to. Defaults to standard output.
             fmt: Output format. Supported values are 'human' (human-readable) and 'yaml' (YAML
                  format).
+            jobs: Maximum number of properties to read concurrently. The default is 1, which means
+                  that properties are read one after another.
         """
 
         self._pobj = pobj
         self._cpuinfo = cpuinfo
         self._fobj = fobj
         self._fmt = fmt
+        self._jobs = jobs
 
         if self._fmt not in SUPPORTED_PRINT_FORMATS:
             formats = ", ".join(SUPPORTED_PRINT_FORMATS)
             raise Error(f"Unsupported format '{self._fmt}', supported formats are: {formats}")
 
+        if self._jobs < 1:
+            raise Error(f"Bad number of jobs '{self._jobs}': should be a positive integer")
+
     def close(self):
         """Uninitialize the class instance."""
 
@@ -559,7 +566,7 @@ class _PropsPrinter(ClassHelpers.SimpleCloseContext):
 
         fobj = self._fobj
         if not fobj:
-            fobj = sys.stdout
+            fobj = _LOG.get_info_stream()
 
         YAML.dump(yaml_pinfo, fobj)
 
@@ -596,7 +603,11 @@ class _PropsPrinter(ClassHelpers.SimpleCloseContext):
                         yaml_pinfo[pname]["values"] = []
 
                     if sname != "die":
-                        ragified_str = Trivial.rangify(cast(list[int], nums))
+                        if typing.TYPE_CHECKING:
+                            nums_list = cast(list[int], nums)
+                        else:
+                            nums_list = nums
+                        ragified_str = Trivial.rangify(nums_list)
                         if typing.TYPE_CHECKING:
                             sname_wa = cast(Literal["CPU"], sname)
                         else:
@@ -846,6 +857,43 @@ class _PropsPrinter(ClassHelpers.SimpleCloseContext):
 
         return apinfo
 
+    def _build_aggr_pinfo_one_pname(self,
+                                    pname: str,
+                                    optar: _OpTarget.OpTarget,
+                                    mnames: Sequence[MechanismNameType],
+                                    skip_unsupp_props: bool,
+                                    skip_unsupp_mechanisms: bool) -> _AggrPinfoType | None:
+        """
+        Build and return an aggregate properties dictionary for a single property, falling back to
+        per-CPU access if the property value is inconsistent across package or die siblings.
+
+        Args:
+            pname: Name of the property to aggregate.
+            optar: Operation target specifying the hardware scope.
+            mnames: Mechanism names to use for property retrieval. Use all available mechanisms in
+                    case of an empty sequence.
+            skip_unsupp_props: Whether to skip unsupported properties.
+            skip_unsupp_mechanisms: If True, return 'None' for a property that cannot be retrieved
+                                    using the mechanisms in 'mnames'. Otherwise, raise an exception.
+
+        Returns:
+            The aggregate properties dictionary for the property, or 'None' if the property should
+            be skipped.
+        """
+
+        try:
+            return self._build_aggr_pinfo_pname(pname, optar, mnames, skip_unsupp_props)
+        except ErrorTryAnotherMechanism as err:
+            _LOG.debug(err)
+            if skip_unsupp_mechanisms:
+                return None
+            raise
+        except ErrorUsePerCPU as err:
+            # Inconsistent property value across package or die siblings. Use per-CPU access.
+            _LOG.warning(err)
+            return self._build_aggr_pinfo_pname(pname, optar, mnames, skip_unsupp_props,
+                                                override_sname="CPU")
+
     def _build_aggr_pinfo(self,
                           pnames: Iterable[str],
                           optar: _OpTarget.OpTarget,
@@ -902,23 +950,36 @@ class _PropsPrinter(ClassHelpers.SimpleCloseContext):
         _LOG.debug("Build aggregate properties information dictionary for: %s",
                    ", ".join(pnames))
 
-        for pname in pnames:
-            prop = self._pobj.props[pname]
-            if skip_ro_props and not prop["writable"]:
-                continue
+        pnames = [pname for pname in pnames
+                  if not skip_ro_props or self._pobj.props[pname]["writable"]]
 
-            try:
-                apinfo = self._build_aggr_pinfo_pname(pname, optar, mnames, skip_unsupp_props)
-            except ErrorTryAnotherMechanism as err:
-                _LOG.debug(err)
-                if skip_unsupp_mechanisms:
-                    continue
-                raise
-            except ErrorUsePerCPU as err:
-                # Inconsistent property value across package or die siblings. Use per-CPU access.
-                _LOG.warning(err)
-                apinfo = self._build_aggr_pinfo_pname(pname, optar, mnames, skip_unsupp_props,
-                                                      override_sname="CPU")
+        # Read the sysfs files needed for all the properties in one go, instead of accessing the
+        # target host separately for every property.
+        try:
+            cpus = optar.get_cpus()
+        except ErrorNoCPUTarget:
+            pass
+        else:
+            self._pobj.prefetch_props(pnames, cpus=cpus, mnames=mnames)
+
+        def _build(pname: str) -> _AggrPinfoType | None:
+            """Build the aggregate properties dictionary for property 'pname'."""
+
+            return self._build_aggr_pinfo_one_pname(pname, optar, mnames, skip_unsupp_props,
+                                                    skip_unsupp_mechanisms)
+
+        if self._jobs > 1 and len(pnames) > 1:
+            # Read the properties concurrently. The 'map()' method yields results (or re-raises
+            # exceptions) in the order of 'pnames', so the output is the same as in the sequential
+            # case.
+            with ThreadPoolExecutor(max_workers=min(self._jobs, len(pnames))) as executor:
+                apinfos = list(executor.map(_build, pnames))
+        else:
+            apinfos = [_build(pname) for pname in pnames]
+
+        for apinfo in apinfos:
+            if apinfo is None:
+                continue
 
             # Merge 'apinfo' to 'aggr_pinfo'.
             for mname, info in apinfo.items():
@@ -1007,10 +1068,11 @@ class PStatesPrinter(_PropsPrinter):
                  pobj: PStates.PStates,
                  cpuinfo: CPUInfo.CPUInfo,
                  fobj: IO[str] | None = None,
-                 fmt: PrintFormatType = "human"):
+                 fmt: PrintFormatType = "human",
+                 jobs: int = 1):
         """Refer to '_PropsPrinter.__init__()'."""
 
-        super().__init__(pobj, cpuinfo, fobj=fobj, fmt=fmt)
+        super().__init__(pobj, cpuinfo, fobj=fobj, fmt=fmt, jobs=jobs)
 
         self._pobj: PStates.PStates
 
@@ -1021,10 +1083,11 @@ class UncorePrinter(_PropsPrinter):
                  pobj: Uncore.Uncore,
                  cpuinfo: CPUInfo.CPUInfo,
                  fobj: IO[str] | None = None,
-                 fmt: PrintFormatType = "human"):
+                 fmt: PrintFormatType = "human",
+                 jobs: int = 1):
         """Refer to '_PropsPrinter.__init__()'."""
 
-        super().__init__(pobj, cpuinfo, fobj=fobj, fmt=fmt)
+        super().__init__(pobj, cpuinfo, fobj=fobj, fmt=fmt, jobs=jobs)
 
         self._pobj: Uncore.Uncore
 
@@ -1035,10 +1098,11 @@ class PMQoSPrinter(_PropsPrinter):
                  pobj: PMQoS.PMQoS,
                  cpuinfo: CPUInfo.CPUInfo,
                  fobj: IO[str] | None = None,
-                 fmt: PrintFormatType = "human"):
+                 fmt: PrintFormatType = "human",
+                 jobs: int = 1):
         """Refer to '_PropsPrinter.__init__()'."""
 
-        super().__init__(pobj, cpuinfo, fobj=fobj, fmt=fmt)
+        super().__init__(pobj, cpuinfo, fobj=fobj, fmt=fmt, jobs=jobs)
 
         self._pobj: PMQoS.PMQoS
 
@@ -1075,10 +1139,11 @@ class CStatesPrinter(_PropsPrinter):
                  pobj: CStates.CStates,
                  cpuinfo: CPUInfo.CPUInfo,
                  fobj: IO[str] | None = None,
-                 fmt: PrintFormatType = "human"):
+                 fmt: PrintFormatType = "human",
+                 jobs: int = 1):
         """Refer to '_PropsPrinter.__init__()'."""
 
-        super().__init__(pobj, cpuinfo, fobj=fobj, fmt=fmt)
+        super().__init__(pobj, cpuinfo, fobj=fobj, fmt=fmt, jobs=jobs)
 
         self._pobj: CStates.CStates
 
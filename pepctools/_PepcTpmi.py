@@ -13,7 +13,6 @@ Implement the 'pepc tpmi' command.
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
-import sys
 import typing
 import contextlib
 from pathlib import Path
@@ -411,7 +410,7 @@ def _list_specs(sdicts: dict[str, SDictTypedDict],
 
     if yaml:
         info = {"sdds": sdds, "specs": sdicts}
-        YAML.dump(info, sys.stdout)
+        YAML.dump(info, _LOG.get_info_stream())
         return
 
     _LOG.info("TPMI spec directories information:")
@@ -481,7 +480,7 @@ def _tpmi_ls_flat(cmdl: _LsCmdlineArgsTypedDict, tpmi: TPMI.TPMI):
         info["unknown"] = tpmi.get_unknown_features()
 
     if cmdl["yaml"]:
-        YAML.dump(info, sys.stdout)
+        YAML.dump(info, _LOG.get_info_stream())
         return
 
     if not info["supported"]:
@@ -543,7 +542,7 @@ def _tpmi_ls_topology(cmdl: _LsCmdlineArgsTypedDict, tpmi: TPMI.TPMI):
         topology[fname] = _get_ls_topology(tpmi, fname, cmdl["unimplemented"])
 
     if cmdl["yaml"]:
-        YAML.dump(info, sys.stdout)
+        YAML.dump(info, _LOG.get_info_stream())
         return
 
     _LOG.info("Supported TPMI features")
@@ -571,13 +570,15 @@ def _tpmi_ls_topology(cmdl: _LsCmdlineArgsTypedDict, tpmi: TPMI.TPMI):
 
 @contextlib.contextmanager
 def _get_tpmi(cmdl: _CommonCmdlineArgsTypedDict,
-              pman: ProcessManagerType | None) -> Generator[TPMI.TPMI, None, None]:
+              pman: ProcessManagerType | None,
+              snapshot: bool = False) -> Generator[TPMI.TPMI, None, None]:
     """
     Create and yield a 'TPMI.TPMI' object based on common command-line arguments.
 
     Args:
         cmdl: Common command-line arguments dictionary.
         pman: Process manager object for the target host (if available).
+        snapshot: Whether to enable the TPMI 'mem_dump' snapshot mode.
 
     Yields:
         A 'TPMI.TPMI' object.
@@ -585,7 +586,7 @@ def _get_tpmi(cmdl: _CommonCmdlineArgsTypedDict,
 
     if not cmdl["base"]:
         assert pman is not None
-        with TPMI.TPMI(pman=pman) as tpmi:
+        with TPMI.TPMI(pman=pman, snapshot=snapshot) as tpmi:
             yield tpmi
     else:
         assert pman is None
@@ -596,7 +597,7 @@ def _get_tpmi(cmdl: _CommonCmdlineArgsTypedDict,
             vfm = TPMI.DEFAULT_VFM
             _LOG.notice("No VFM provided, assuming VFM %#x (%s) for decoding TPMI debugfs dump",
                         vfm, TPMI.DEFAULT_PLATFORM_NAME)
-        with TPMI.TPMI(vfm=vfm, base=cmdl["base"]) as tpmi:
+        with TPMI.TPMI(vfm=vfm, base=cmdl["base"], snapshot=snapshot) as tpmi:
             yield tpmi
 
 def tpmi_ls_command(args: argparse.Namespace, pman: ProcessManagerType | None):
@@ -694,7 +695,8 @@ def tpmi_read_command(args: argparse.Namespace, pman: ProcessManagerType | None)
 
     cmdl = _get_read_cmdline_args(args)
 
-    with _get_tpmi(cmdl, pman) as tpmi:
+    # The command only reads registers, so read each 'mem_dump' file once.
+    with _get_tpmi(cmdl, pman, snapshot=True) as tpmi:
         sdicts = tpmi.get_known_features()
 
         fnames = cmdl["fnames"] or sdicts
@@ -759,7 +761,7 @@ def tpmi_read_command(args: argparse.Namespace, pman: ProcessManagerType | None)
             raise Error("BUG: no TPMI data collected, this should not happen")
 
         if cmdl["yaml"]:
-            YAML.dump(info, sys.stdout, int_format="%#x")
+            YAML.dump(info, _LOG.get_info_stream(), int_format="%#x")
         else:
             _print_tpmi_info(tpmi, info)
 
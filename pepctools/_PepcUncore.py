@@ -12,7 +12,6 @@ Implement the 'pepc uncore' command.
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
-import sys
 import typing
 import contextlib
 
@@ -47,6 +46,7 @@ if typing.TYPE_CHECKING:
             module_siblings: Module sibling indices to operate on.
             dies_info: Display detailed non-compute dies information.
             yaml: Whether to output results in YAML format.
+            jobs: Maximum number of properties to read concurrently.
             oargs: Dictionary of command line argument names and values matching the order of
                    appearance in the command line.
         """
@@ -63,6 +63,7 @@ if typing.TYPE_CHECKING:
         oargs: dict[str, str]
         dies_info: bool
         yaml: bool
+        jobs: int
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
 
@@ -89,6 +90,7 @@ def _get_cmdline_args(args: argparse.Namespace) -> _CmdlineArgsTypedDict:
     cmdl["module_siblings"] = args.module_siblings
     cmdl["dies_info"] = getattr(args, "dies_info", False)
     cmdl["yaml"] = getattr(args, "yaml", False)
+    cmdl["jobs"] = _PepcCommon.parse_jobs(getattr(args, "jobs", "1"))
     cmdl["oargs"] = getattr(args, "oargs", {})
 
     return cmdl
@@ -132,7 +134,7 @@ def _display_dies_info(cmdl: _CmdlineArgsTypedDict,
                     _die_info["instance"] = die_info["instance"]
                     _die_info["cluster"] = die_info["cluster"]
                 _dies_info[package][die] = _die_info
-        YAML.dump(_dies_info, sys.stdout)
+        YAML.dump(_dies_info, _LOG.get_info_stream())
         return
 
     for package, pkg_dies in dies_info.items():
@@ -176,7 +178,7 @@ def uncore_info_command(args: argparse.Namespace, pman: ProcessManagerType):
         pobj = Uncore.Uncore(pman=pman, cpuinfo=cpuinfo)
         stack.enter_context(pobj)
 
-        pprinter = _PepcPrinter.UncorePrinter(pobj, cpuinfo, fmt=fmt)
+        pprinter = _PepcPrinter.UncorePrinter(pobj, cpuinfo, fmt=fmt, jobs=cmdl["jobs"])
         stack.enter_context(pprinter)
 
         mnames = []
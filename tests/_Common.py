@@ -16,6 +16,7 @@ from pathlib import Path
 import typing
 from pepclibs import CPUInfo, CPUOnline
 from pepclibs.helperlibs import ProcessManager, EmulProcessManager
+from pepclibs.helperlibs.emul import EmulDataset
 
 if typing.TYPE_CHECKING:
     from typing import TypedDict, cast, Generator
@@ -67,6 +68,26 @@ def _get_emul_data_path(dataset: str) -> Path:
 
     return Path(__file__).parent.resolve() / "emul-data" / dataset
 
+# Dataset images shared by all emulated process managers of the test session: {dataset path: image}.
+# Dataset images are read-only, and every process manager keeps its own emulated files, so tests
+# do not see each other's writes.
+_DATASETS: dict[Path, EmulDataset.EmulDataset] = {}
+
+def _get_emul_dataset(dspath: Path) -> EmulDataset.EmulDataset:
+    """
+    Return the image of an emulation dataset, load it on first use.
+
+    Args:
+        dspath: Path to the dataset directory.
+
+    Returns:
+        The dataset image shared by all emulated process managers of the test session.
+    """
+
+    if dspath not in _DATASETS:
+        _DATASETS[dspath] = EmulDataset.EmulDataset(dspath)
+    return _DATASETS[dspath]
+
 def get_pman(hostspec: str, username: str = "") -> ProcessManagerType:
     """
     Create and return a process manager for the specified host.
@@ -93,7 +114,7 @@ def get_pman(hostspec: str, username: str = "") -> ProcessManagerType:
         if typing.TYPE_CHECKING:
             pman = cast(EmulProcessManager.EmulProcessManager, pman)
         try:
-            pman.init_emul_data(dspath)
+            pman.init_emul_data(dspath, dataset=_get_emul_dataset(dspath))
         except:
             pman.close()
             raise
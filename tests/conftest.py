@@ -63,6 +63,7 @@ import typing
 import logging
 from pathlib import Path
 import pytest
+from pepclibs import _TPMISpecCache
 from pepclibs.helperlibs import Logging
 from pepclibs.helperlibs.emul.EmulCommon import EMUL_CONFIG_FNAME
 
@@ -71,9 +72,11 @@ if typing.TYPE_CHECKING:
 
 # Host-independent tests.
 _HOST_INDEPENDENT_MODULES: Final[frozenset[str]] = frozenset({
+    "tests.test_emul_process_manager",
     "tests.test_human",
     "tests.test_kernel_version",
     "tests.test_logging_cmdl",
+    "tests.test_multihost_cmdl",
     "tests.test_tpmi_nohost",
     "tests.test_wrap_exceptions",
     "tests.test_yaml",
@@ -117,6 +120,9 @@ _DEFAULT_DATASETS: Final[dict[str, tuple[str, ...]]] = {
     "tests.test_percpucache": ("bdwup0", "srf2"),
     # PM QoS is a Linux kernel feature, not CPU-architecture specific. One dataset is enough.
     "tests.test_pmqos_cmdl": ("bdwup0",),
+    # MSR I/O scope detection depends on topology only. 'spr1' has no dies and 'gnr0' has dies,
+    # so core, die, and package scopes are all covered.
+    "tests.test_msr_ioscope": ("spr1", "gnr0"),
 }
 
 def pytest_addoption(parser: pytest.Parser):
@@ -266,3 +272,20 @@ def pytest_configure(config: pytest.Config):
 
         if not path.exists():
             raise pytest.exit(f"Did not find dataset '{dataset}'.")
+
+@pytest.fixture(autouse=True, scope="session")
+def _tpmi_spec_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[None, None, None]:
+    """
+    Make all tests use a temporary TPMI spec files cache directory instead of the user's one.
+
+    Args:
+        tmp_path_factory: The pytest temporary directory factory.
+
+    Yields:
+        Nothing.
+    """
+
+    with pytest.MonkeyPatch.context() as mpatch:
+        cache_path = tmp_path_factory.mktemp("tpmi-spec-cache")
+        mpatch.setenv(_TPMISpecCache.CACHE_DIR_ENVVAR, str(cache_path))
+        yield
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2022-2025 Intel Corporation
+# Copyright (C) 2022-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Authors: Antti Laakso <antti.laakso@linux.intel.com>
@@ -15,9 +15,10 @@ from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import typing
 import contextlib
+from pathlib import Path
 import pytest
 from tests import _Common, _PropsCommonCmdl
-from pepclibs.helperlibs.Exceptions import Error
+from pepclibs.helperlibs.Exceptions import Error, ErrorPermissionDenied
 from pepclibs import CPUInfo, CPUOnline
 
 if typing.TYPE_CHECKING:
@@ -398,6 +399,96 @@ def test_cpuhotplug_offline_core_siblings(params: _TestParamsTypedDict):
         with contextlib.suppress(Error):
             _online_all_cpus(pman)
 
+def _test_cpuhotplug_smt_control(params: _TestParamsTypedDict):
+    """
+    Test onlining and offlining CPUs via the SMT control sysfs file.
+
+    Args:
+        params: The test parameters.
+    """
+
+    pman = params["pman"]
+    onl = params["cpuonline"]
+    cpuinfo = params["cpuinfo"]
+    all_cpus = params["cpus"]
+
+    path = Path("/sys/devices/system/cpu/smt/control")
+    if not pman.exists(path) or pman.read_file(path).strip() != "on":
+        pytest.skip("SMT control is not available or SMT is not enabled")
+
+    # All CPUs except for the first CPU of every core. Offlining them is the same as disabling SMT.
+    siblings = set(all_cpus) - set(cpuinfo.select_core_siblings(all_cpus, (0,)))
+    if not siblings:
+        pytest.skip("No core has more than one CPU, cannot test SMT control")
+
+    cpus_str = ",".join(str(cpu) for cpu in sorted(siblings))
+    _PropsCommonCmdl.run_pepc(f"cpu-hotplug offline --cpus {cpus_str}", pman)
+    assert pman.read_file(path).strip() == "off"
+
+    for cpu in all_cpus:
+        assert onl.is_online(cpu) == (cpu not in siblings)
+
+    # Offline and online a first SMT sibling individually while SMT is disabled. This must not
+    # enable SMT.
+    cpu = max(set(all_cpus) - siblings)
+    if cpu != all_cpus[0]:
+        _PropsCommonCmdl.run_pepc(f"cpu-hotplug offline --cpus {cpu}", pman)
+        assert not onl.is_online(cpu)
+
+        _PropsCommonCmdl.run_pepc(f"cpu-hotplug online --cpus {cpu}", pman)
+        assert pman.read_file(path).strip() == "off"
+
+        for _cpu in all_cpus:
+            assert onl.is_online(_cpu) == (_cpu not in siblings)
+
+    # Onlining a single SMT sibling while SMT is disabled must fail with the original error if SMT
+    # cannot be enabled, and must not enable SMT if onlining failed for another reason.
+    cpu = min(siblings)
+    with pytest.MonkeyPatch.context() as mp:
+        def _set_smt_control(state: str):
+            """Fail to write the SMT control sysfs file."""
+            raise Error(f"Failed to write '{state}' to '{path}'")
+
+        mp.setattr(onl, "_set_smt_control", _set_smt_control)
+        with pytest.raises(ErrorPermissionDenied):
+            onl.online(cpus=(cpu,))
+
+    with pytest.MonkeyPatch.context() as mp:
+        def _write_paths(*_args, **_kwargs):
+            """Fail to write CPU online state sysfs files."""
+            raise Error("Device or resource busy")
+
+        mp.setattr(onl._sysfs_io, "write_paths", _write_paths) # pylint: disable=protected-access
+        with pytest.raises(Error):
+            onl.online(cpus=(cpu,))
+
+    assert pman.read_file(path).strip() == "off"
+    assert not onl.is_online(cpu)
+
+    # Online a single SMT sibling while SMT is disabled.
+    _PropsCommonCmdl.run_pepc(f"cpu-hotplug online --cpus {cpu}", pman)
+    assert pman.read_file(path).strip() == "on"
+
+    for _cpu in all_cpus:
+        assert onl.is_online(_cpu) == (_cpu not in siblings or _cpu == cpu)
+
+def test_cpuhotplug_smt_control(params: _TestParamsTypedDict):
+    """
+    Test the 'pepc cpu-hotplug' commands with the SMT control sysfs file.
+
+    Args:
+        params: The test parameters.
+    """
+
+    pman = params["pman"]
+    _online_all_cpus(pman)
+
+    try:
+        _test_cpuhotplug_smt_control(params)
+    finally:
+        with contextlib.suppress(Error):
+            _online_all_cpus(pman)
+
 def _test_cpuhotplug_offline_module_siblings(params: _TestParamsTypedDict):
     """
     Test CPU offline functionality with module sibling index targeting.
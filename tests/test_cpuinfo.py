@@ -14,15 +14,17 @@ from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import typing
 import random
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from tests import _Common
-from pepclibs import CPUInfoVars
+from pepclibs import CPUInfo, CPUInfoVars, ProcCpuinfo, _TopologyCache
 from pepclibs.helperlibs import Trivial
+from pepclibs.helperlibs.Exceptions import Error
 
 if typing.TYPE_CHECKING:
     from typing import Generator, cast, TypedDict
+    from pathlib import Path
     from tests._Common import CommonTestParamsTypedDict
-    from pepclibs import CPUInfo
     from pepclibs.helperlibs.ProcessManager import ProcessManagerType
     from pepclibs.CPUInfoTypes import AbsNumsType, RelNumsType, ScopeNameType
 
@@ -669,13 +671,13 @@ def test_delayed_init(params: CommonTestParamsTypedDict):
         # A newly created 'CPUInfo' object should not have any topology initialized.
         assert "CPU" not in cpuinfo._initialized_snames, "'CPU' scope should not be initialized"
         assert "die" not in cpuinfo._initialized_snames, "'die' scope should not be initialized"
-        assert not cpuinfo._topology, "Topology should not be initialized"
+        assert not cpuinfo._topo_table, "Topology should not be initialized"
 
         # The 'get_cpus()' does not initialize topology either.
         cpuinfo.get_cpus()
         assert "CPU" not in cpuinfo._initialized_snames, "'CPU' scope should not be initialized"
         assert "die" not in cpuinfo._initialized_snames, "'die' scope should not be initialized"
-        assert not cpuinfo._topology, "Topology should not be initialized"
+        assert not cpuinfo._topo_table, "Topology should not be initialized"
 
         # But it initializes the '_cpus' member.
         assert cpuinfo._cpus, "'_cpus' member should be initialized"
@@ -685,7 +687,7 @@ def test_delayed_init(params: CommonTestParamsTypedDict):
         assert "CPU" in cpuinfo._initialized_snames, "'CPU' scope should be initialized"
         assert "core" in cpuinfo._initialized_snames, "'core' scope should be initialized"
         assert "package" in cpuinfo._initialized_snames, "'package' scope should be initialized"
-        assert cpuinfo._topology, "Topology should be initialized"
+        assert cpuinfo._topo_table, "Topology should be initialized"
 
         # But 'module' and 'die' scopes remain uninitialized.
         assert "module" not in cpuinfo._initialized_snames, \
@@ -701,6 +703,11 @@ def test_delayed_init(params: CommonTestParamsTypedDict):
         cpuinfo.get_compute_dies()
         assert "die" in cpuinfo._initialized_snames, "'die' scope should be initialized"
 
+        # The topology list is derived from the topology table only when it is requested.
+        assert not cpuinfo._topology, "Topology list should not be initialized"
+        cpuinfo.get_topology()
+        assert cpuinfo._topology, "Topology list should be initialized"
+
 def test_cpuinfo_order(params: CommonTestParamsTypedDict):
     """
     Test that conversion methods like cores_to_cpus() preserve the correct topology order.
@@ -816,3 +823,160 @@ def test_cpuinfo_noncomp_dies(params: CommonTestParamsTypedDict):
                 assert cpus == [], \
                        f"dies_to_cpus() with non-compute die {die} returned {cpus}, " \
                        f"expected empty list"
+
+def test_topology_cache(params: CommonTestParamsTypedDict, tmp_path: Path,
+                        monkeypatch: pytest.MonkeyPatch):
+    """
+    Test the on-disk topology cache: the topology is saved on close, reused by a new 'CPUInfo'
+    object, and rebuilt when the cache validation key or the code that created it does not match.
+
+    Args:
+        params: The test parameters.
+        tmp_path: Temporary directory path for the cache files.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    # pylint: disable=protected-access
+
+    pman = params["pman"]
+    monkeypatch.setenv(_TopologyCache.CACHE_DIR_ENVVAR, str(tmp_path))
+
+    key = {"boot_id": "boot-id-1", "online": "", "osrelease": "1.0"}
+
+    def _read_key(self) -> dict[str, str]:
+        """Emulated hosts do not provide the boot ID file, so use a fake key."""
+
+        key["online"] = self._pman.read_file("/sys/devices/system/cpu/online").strip()
+        return dict(key)
+
+    if pman.is_emulated:
+        monkeypatch.setattr(_TopologyCache.TopologyCache, "_read_key", _read_key)
+
+    with CPUInfo.CPUInfo(pman=pman) as cpuinfo:
+        topology = cpuinfo.get_topology(order="package")
+        proc_cpuinfo = cpuinfo.get_proc_cpuinfo()
+        proc_percpuinfo = cpuinfo.get_proc_percpuinfo()
+        dies = cpuinfo.get_all_dies()
+        dies_info = cpuinfo.get_all_dies_info()
+
+    if not list(tmp_path.iterdir()):
+        # The validation key could not be read from the target host.
+        return
+
+    def _fail(*args, **kwargs):
+        """Fail if the topology is being rebuilt."""
+
+        raise AssertionError("'/proc/cpuinfo' was parsed despite a valid topology cache")
+
+    with monkeypatch.context() as mpatch:
+        mpatch.setattr(ProcCpuinfo, "get_proc_cpuinfo", _fail)
+        mpatch.setattr(ProcCpuinfo, "get_proc_percpuinfo", _fail)
+        mpatch.setattr(ProcCpuinfo, "get_proc_cpuinfo_all", _fail)
+
+        with CPUInfo.CPUInfo(pman=pman) as cpuinfo:
+            assert cpuinfo.get_topology(order="package") == topology
+            assert cpuinfo.get_proc_cpuinfo() == proc_cpuinfo
+            assert cpuinfo.get_proc_percpuinfo() == proc_percpuinfo
+            assert cpuinfo.get_all_dies() == dies
+            assert cpuinfo.get_all_dies_info() == dies_info
+
+    if not pman.is_emulated:
+        return
+
+    # A cache file with a different validation key must be ignored.
+    key["boot_id"] = "boot-id-2"
+    with CPUInfo.CPUInfo(pman=pman) as cpuinfo:
+        assert cpuinfo._topo_cache_data == {}, "Stale topology cache data was used"
+        assert cpuinfo.get_topology(order="package") == topology
+
+    # A cache file created by a different version of the code must be ignored.
+    monkeypatch.setattr(_TopologyCache, "_CODE_MODNAMES", ("pepclibs._TopologyCache",))
+    with CPUInfo.CPUInfo(pman=pman) as cpuinfo:
+        assert cpuinfo._topo_cache_data == {}, "Topology cache data of different code was used"
+        assert cpuinfo.get_topology(order="package") == topology
+
+def test_cpu_siblings(params: CommonTestParamsTypedDict):
+    """
+    Test 'get_tline_by_cpu()' and 'get_cpu_siblings()' against the topology table.
+
+    Args:
+        params: The test parameters.
+    """
+
+    for cpuinfo in _Common.get_cpuinfos(params["pman"]):
+        topology = cpuinfo.get_topology()
+
+        for sname in ("core", "module", "die", "node", "package"):
+            # Core and die numbers are relative to the package.
+            if sname in ("core", "die"):
+                key_snames: tuple[ScopeNameType, ...] = ("package", sname)
+            else:
+                key_snames = (sname,)
+
+            groups: dict[tuple[int, ...], list[int]] = {}
+            for tline in topology:
+                key = tuple(tline[key_sname] for key_sname in key_snames)
+                groups.setdefault(key, []).append(tline["CPU"])
+
+            for tline in topology:
+                cpu = tline["CPU"]
+                assert cpuinfo.get_tline_by_cpu(cpu) == tline, \
+                       f"Bad topology line for CPU {cpu}"
+
+                key = tuple(tline[key_sname] for key_sname in key_snames)
+                siblings = cpuinfo.get_cpu_siblings(cpu, sname)
+                assert siblings == sorted(groups[key]), \
+                       f"Bad {sname} siblings for CPU {cpu}: {siblings}"
+
+        offline_cpus = cpuinfo.get_offline_cpus()
+        if offline_cpus:
+            with pytest.raises(Error):
+                cpuinfo.get_cpu_siblings(offline_cpus[0], "core")
+
+def test_cpuinfo_threads(params: CommonTestParamsTypedDict):
+    """
+    Test that a 'CPUInfo' object used from multiple threads concurrently returns the same results
+    as when used from a single thread.
+
+    Args:
+        params: The test parameters.
+    """
+
+    pman = params["pman"]
+    snames: tuple[ScopeNameType, ...] = ("core", "module", "die", "node", "package")
+
+    def _get_siblings(cpuinfo: CPUInfo.CPUInfo, cpu: int) -> list[list[int]]:
+        """Return siblings of CPU 'cpu' for all scopes in 'snames'."""
+
+        return [cpuinfo.get_cpu_siblings(cpu, sname) for sname in snames]
+
+    with CPUInfo.CPUInfo(pman=pman) as cpuinfo:
+        cpus = cpuinfo.get_cpus()
+        expected = [_get_siblings(cpuinfo, cpu) for cpu in cpus]
+
+    # Use a new object, so that the lazily built information is built by the worker threads.
+    with CPUInfo.CPUInfo(pman=pman) as cpuinfo, ThreadPoolExecutor(max_workers=8) as executor:
+        result = list(executor.map(lambda cpu: _get_siblings(cpuinfo, cpu), cpus))
+
+    assert result == expected, "Concurrent 'CPUInfo' usage produced different results"
+
+def test_proc_cpuinfo(params: CommonTestParamsTypedDict):
+    """
+    Test that 'ProcCpuinfo.get_proc_cpuinfo_all()' returns the same information as
+    'ProcCpuinfo.get_proc_cpuinfo()' and 'ProcCpuinfo.get_proc_percpuinfo()', and that identical
+    CPU flag sets are shared.
+
+    Args:
+        params: The test parameters.
+    """
+
+    pman = params["pman"]
+
+    proc_cpuinfo, proc_percpuinfo = ProcCpuinfo.get_proc_cpuinfo_all(pman)
+    assert proc_cpuinfo == ProcCpuinfo.get_proc_cpuinfo(pman)
+    assert proc_percpuinfo == ProcCpuinfo.get_proc_percpuinfo(pman)
+
+    flagsets: dict[frozenset[str], frozenset[str]] = {}
+    for cpu, cpu_flags in proc_percpuinfo["flags"].items():
+        flagset = flagsets.setdefault(cpu_flags, cpu_flags)
+        assert flagset is cpu_flags, f"CPU {cpu} flags set is not shared with other CPUs"
@@ -19,7 +19,7 @@ import contextlib
 import pytest
 from tests import _Common, _PropsCommon
 from pepclibs import CPUInfo, CStates
-from pepclibs.helperlibs.Exceptions import ErrorNotSupported
+from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported
 
 if typing.TYPE_CHECKING:
     from typing import Generator, cast
@@ -155,3 +155,18 @@ def test_req_cstates(params: PropsTestParamsTypedDict):
     csinfo = pobj.get_cpu_cstates_info(cpu, csnames=("POLL",))
     assert csinfo["POLL"]["disable"], "'POLL' C-state is not disabled"
     assert len(csinfo) == 1, "More C-states returned than requested"
+
+    # Disable all C-states on all CPUs, verify the returned C-state names and the result.
+    toggled = pobj.disable_cstates(csnames="all", cpus="all")
+    for cpu_num, csinfo in pobj.get_cstates_info():
+        csnames = toggled[cpu_num]["csnames"] if csinfo else []
+        assert csnames == list(csinfo), \
+               f"Disabled C-states {csnames} of CPU {cpu_num} differ from its C-states " \
+               f"{list(csinfo)}"
+        for csname, info in csinfo.items():
+            assert info["disable"], f"C-state '{csname}' is not disabled on CPU {cpu_num}"
+
+    with pytest.raises(Error):
+        pobj.disable_cstates(csnames=("NO_SUCH_CSTATE",), cpus=[cpu])
+
+    pobj.enable_cstates(csnames="all", cpus="all")
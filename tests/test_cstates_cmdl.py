@@ -104,6 +104,21 @@ def test_cstates_info(params: TestParamsTypedDict):
     # Cover '--list-mechanisms'.
     _PropsCommonCmdl.run_pepc("cstates info --list-mechanisms", pman)
 
+def test_cstates_info_jobs(params: TestParamsTypedDict):
+    """
+    Test that reading properties concurrently with '--jobs' produces the same output as reading
+    them sequentially.
+
+    Args:
+        params: The test parameters dictionary.
+    """
+
+    pman = params["pman"]
+
+    stdout1, _ = _PropsCommonCmdl.run_pepc("cstates info", pman, capture_output=True)
+    stdout4, _ = _PropsCommonCmdl.run_pepc("cstates info --jobs 4", pman, capture_output=True)
+    assert stdout1 == stdout4, "Output of 'cstates info' depends on '--jobs'"
+
 def _get_good_config_opts(params: TestParamsTypedDict,
                           sname: ScopeNameType = "package") -> Generator[str, None, None]:
     """
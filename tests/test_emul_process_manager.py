@@ -0,0 +1,116 @@
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""Test the lazy and shared dataset image modes of 'EmulProcessManager'."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+from pathlib import Path
+import pytest
+from pepclibs.helperlibs import EmulProcessManager
+from pepclibs.helperlibs.emul import EmulDataset
+from pepclibs.helperlibs.Exceptions import ErrorNotFound, ErrorPermissionDenied
+
+# A small dataset, so that the non-lazy mode initializes quickly.
+_DSPATH: Path = Path(__file__).parent.resolve() / "emul-data" / "bdwup0"
+
+def _walk(pman: EmulProcessManager.EmulProcessManager,
+          dirpath: Path) -> dict[str, tuple[bool, str]]:
+    """
+    Recursively read an emulated directory.
+
+    Args:
+        pman: The emulated process manager to read the directory with.
+        dirpath: Path to the directory to read.
+
+    Returns:
+        A dictionary mapping paths to (is directory, file contents) tuples.
+    """
+
+    result: dict[str, tuple[bool, str]] = {}
+    for entry in pman.lsdir(dirpath, sort_by="alphabetic"):
+        path = dirpath / entry["name"]
+        if pman.is_dir(path):
+            result[str(path)] = (True, "")
+            result.update(_walk(pman, path))
+        else:
+            assert pman.is_file(path), f"'{path}' is neither a file nor a directory"
+            with pman.open(path, "r") as fobj:
+                result[str(path)] = (False, fobj.read())
+
+    return result
+
+def test_lazy_vs_eager():
+    """
+    Verify that the lazy emulated filesystem has the same layout and contents as the non-lazy one.
+    """
+
+    with EmulProcessManager.EmulProcessManager() as eager_pman, \
+         EmulProcessManager.EmulProcessManager() as lazy_pman:
+        eager_pman.init_emul_data(_DSPATH, lazy=False)
+        lazy_pman.init_emul_data(_DSPATH)
+
+        for dirpath in (Path("/sys/devices/system/cpu"), Path("/proc")):
+            eager = _walk(eager_pman, dirpath)
+            lazy = _walk(lazy_pman, dirpath)
+            assert eager, f"No emulated files under '{dirpath}'"
+            assert eager == lazy, f"Lazy and non-lazy emulation of '{dirpath}' differ"
+
+        assert not lazy_pman.exists("/sys/no/such/file")
+        with pytest.raises(ErrorNotFound):
+            list(lazy_pman.lsdir("/sys/no/such/dir"))
+
+def test_lazy_cpu_online():
+    """
+    Verify that CPU online state changes are visible via '/sys/devices/system/cpu/online' in the
+    lazy mode, and that read-only files cannot be written to.
+    """
+
+    with EmulProcessManager.EmulProcessManager() as pman:
+        pman.init_emul_data(_DSPATH)
+
+        online = pman.read_file("/sys/devices/system/cpu/online").strip()
+        assert online.startswith("0-"), f"Unexpected online CPUs: {online}"
+        last_cpu = online.split("-")[-1]
+
+        with pman.open(f"/sys/devices/system/cpu/cpu{last_cpu}/online", "r+") as fobj:
+            fobj.write("0")
+        new_online = pman.read_file("/sys/devices/system/cpu/online").strip()
+        assert new_online != online, "Offlining a CPU did not change the online CPUs list"
+
+        with pytest.raises(ErrorPermissionDenied):
+            with pman.open("/sys/devices/system/cpu/present", "r+") as fobj:
+                fobj.write("0")
+
+def test_shared_dataset():
+    """
+    Verify that process managers sharing a dataset image do not see each other's writes.
+    """
+
+    dataset = EmulDataset.EmulDataset(_DSPATH)
+    path = "/sys/devices/system/cpu/cpu0/cpuidle/state1/disable"
+
+    with EmulProcessManager.EmulProcessManager() as pman1, \
+         EmulProcessManager.EmulProcessManager() as pman2:
+        pman1.init_emul_data(_DSPATH, dataset=dataset)
+        pman2.init_emul_data(_DSPATH, dataset=dataset)
+
+        orig = pman1.read_file(path).strip()
+        new = "0" if orig == "1" else "1"
+
+        with pman1.open(path, "r+") as fobj:
+            fobj.write(f"{new}\n")
+
+        assert pman1.read_file(path).strip() == new, f"Write to '{path}' was lost"
+        assert pman2.read_file(path).strip() == orig, \
+               f"Write to '{path}' leaked to another process manager"
+
+    with EmulProcessManager.EmulProcessManager() as pman:
+        pman.init_emul_data(_DSPATH, dataset=dataset)
+        assert pman.read_file(path).strip() == orig, f"Write to '{path}' leaked to the image"
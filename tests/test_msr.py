@@ -13,10 +13,12 @@
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import typing
+from pathlib import Path
 import pytest
 from tests import _MSRCommon
 from tests._MSRCommon import get_params # pylint: disable=unused-import
 
+from pepclibs.msr import MSR
 from pepclibs.msr.TurboRatioLimit import MSR_TURBO_RATIO_LIMIT
 from pepclibs.msr.TurboRatioLimit1 import MSR_TURBO_RATIO_LIMIT1
 from pepclibs.helperlibs.Exceptions import Error
@@ -107,6 +109,74 @@ def test_msr_read_good(params: FeaturedMSRTestParamsTypedDict):
                 read_cpus.append(cpu)
             assert read_cpus == params["cpus"]
 
+def test_msr_read_many_good(params: FeaturedMSRTestParamsTypedDict):
+    """
+    Test the 'read_many()' method with valid values.
+
+    Args:
+        params: The test parameters dictionary.
+    """
+
+    regaddrs: list[int] = []
+    iosnames: list[ScopeNameType] = []
+    for tp in _get_msr_test_params(params):
+        if tp["addr"] not in regaddrs:
+            regaddrs.append(tp["addr"])
+            iosnames.append(tp["sname"])
+
+    if not regaddrs:
+        return
+
+    # Use an MSR object with caching disabled for reference reads, so that they do not come from
+    # the cache populated by 'read_many()'.
+    with MSR.MSR(params["cpuinfo"], pman=params["pman"], enable_cache=False) as ref_msr:
+        for msr in _MSRCommon.get_msr_objs(params):
+            read_cpus = []
+            for cpu, regvals in msr.read_many(regaddrs, params["cpus"], iosnames=iosnames):
+                read_cpus.append(cpu)
+                assert list(regvals) == regaddrs
+                for regaddr, regval in regvals.items():
+                    assert regval == ref_msr.read_cpu(regaddr, cpu)
+            assert read_cpus == params["cpus"]
+
+def test_msr_read_many_bad(params: FeaturedMSRTestParamsTypedDict):
+    """
+    Test the 'read_many()' method with bad input.
+
+    Args:
+        params: The test parameters dictionary.
+    """
+
+    for msr in _MSRCommon.get_msr_objs(params):
+        with pytest.raises(Error):
+            list(msr.read_many([MSR_TURBO_RATIO_LIMIT], params["cpus"], iosnames=[]))
+
+        # The same MSR with different I/O scope names.
+        with pytest.raises(Error):
+            list(msr.read_many([MSR_TURBO_RATIO_LIMIT, MSR_TURBO_RATIO_LIMIT], params["cpus"],
+                               iosnames=["CPU", "package"]))
+
+def test_msr_read_hotplugged(params: FeaturedMSRTestParamsTypedDict):
+    """
+    Test that MSR reads return the same values after a CPU hotplug event is reported.
+
+    Args:
+        params: The test parameters dictionary.
+    """
+
+    cpuinfo = params["cpuinfo"]
+
+    for msr in _MSRCommon.get_msr_objs(params):
+        for tp in _get_msr_test_params(params):
+            vals = dict(msr.read(tp["addr"], cpus=params["testcpus"], iosname=tp["sname"]))
+
+            hotplug_count = cpuinfo.get_hotplug_count()
+            cpuinfo.cpus_hotplugged()
+            assert cpuinfo.get_hotplug_count() == hotplug_count + 1
+
+            for cpu, val in msr.read(tp["addr"], cpus=params["testcpus"], iosname=tp["sname"]):
+                assert val == vals[cpu]
+
 def test_msr_write_good(params: FeaturedMSRTestParamsTypedDict):
     """
     Test the 'write()' method with valid values.
@@ -362,3 +432,38 @@ def test_msr_write_cpu_bits_bad(params: FeaturedMSRTestParamsTypedDict):
             # Repeating this negative test for every CPU is an overkill.
             break
         break
+
+def test_msr_fds_limit(params: FeaturedMSRTestParamsTypedDict, tmp_path: Path,
+                       monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that the count of open MSR device file descriptors is limited and that the least recently
+    used descriptor is closed first.
+
+    Args:
+        params: The test parameters dictionary.
+        tmp_path: Temporary directory path for the fake MSR device files.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    # pylint: disable=protected-access
+
+    cpus = params["cpus"][:3]
+    if len(cpus) < 3:
+        pytest.skip("The test requires at least 3 CPUs")
+
+    with MSR.MSR(params["cpuinfo"], pman=params["pman"], enable_cache=False) as msr:
+        for cpu in cpus:
+            (tmp_path / str(cpu)).write_bytes(bytes(8))
+
+        monkeypatch.setattr(msr, "format_msr_device_path", lambda cpu: tmp_path / str(cpu))
+        monkeypatch.setattr(msr, "_max_fds", 2)
+
+        fd = msr._get_fd(cpus[0])
+        msr._get_fd(cpus[1])
+        # Make the descriptor of the first CPU the most recently used one.
+        assert msr._get_fd(cpus[0]) == fd
+
+        # The descriptor of the second CPU is the least recently used one and must be closed.
+        msr._get_fd(cpus[2], write=True)
+        assert list(msr._fds) == [cpus[0], cpus[2]]
+        assert msr._fds[cpus[2]][1], "MSR device file was not opened for writing"
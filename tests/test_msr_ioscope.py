@@ -0,0 +1,159 @@
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""Test MSR I/O scope detection of the 'msr-ioscope' tool."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import typing
+import pytest
+from tests import _Common
+from pepclibs import CPUInfo
+from pepclibs.msr import MSR
+from pepclibs.helperlibs import Logging
+from pepclibs.msr.TurboRatioLimit import MSR_TURBO_RATIO_LIMIT
+
+if typing.TYPE_CHECKING:
+    from types import ModuleType
+    from typing import Generator, Iterable, cast
+    from tests._Common import CommonTestParamsTypedDict
+    from pepclibs.CPUInfoTypes import ScopeNameType
+
+    class _TestParamsTypedDict(CommonTestParamsTypedDict, total=False):
+        """
+        The test parameters dictionary.
+
+        Attributes:
+            cpuinfo: A 'CPUInfo.CPUInfo' object.
+            msr: An 'MSR.MSR' object.
+            msrioscope: The '_MSRIOScope' module.
+        """
+
+        cpuinfo: CPUInfo.CPUInfo
+        msr: MSR.MSR
+        msrioscope: ModuleType
+
+class _SharedMSR:
+    """
+    Wrap an 'MSR.MSR' object and emulate an MSR shared by all CPUs of a scope element: a write to
+    the MSR on a CPU is a write to the MSR on all the sibling CPUs of the CPU.
+    """
+
+    def __init__(self, msr: MSR.MSR, cpuinfo: CPUInfo.CPUInfo, sname: ScopeNameType):
+        """
+        Initialize a class instance.
+
+        Args:
+            msr: The MSR object to wrap.
+            cpuinfo: The CPU information object.
+            sname: Name of the scope the emulated MSR is shared in.
+        """
+
+        self._msr = msr
+        self._cpuinfo = cpuinfo
+        self._sname = sname
+
+        self.read = msr.read
+        self.set_bits = msr.set_bits
+        self.get_bits = msr.get_bits
+
+    def write(self, addr: int, regval: int, cpus: Iterable[int], verify: bool = False):
+        """Write 'regval' to the MSR on 'cpus' and all their siblings."""
+
+        sibling_cpus: set[int] = set()
+        for cpu in cpus:
+            sibling_cpus.update(self._cpuinfo.get_cpu_siblings(cpu, self._sname))
+
+        self._msr.write(addr, regval, sorted(sibling_cpus), verify=verify)
+
+def _import_msrioscope() -> ModuleType:
+    """
+    Import the '_MSRIOScope' module and restore the 'pepc' logger configuration.
+
+    Returns:
+        The '_MSRIOScope' module.
+
+    Notes:
+        - The module configures the 'pepc' logger on import, using the pytest command line
+          arguments (e.g., '-q' sets the 'WARNING' level). This would break log capturing in the
+          tests that run later, so restore the configuration made in 'conftest.py'.
+    """
+
+    logger = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc")
+    level = logger.level
+
+    # pylint: disable-next=import-outside-toplevel
+    from pepctools import _MSRIOScope
+
+    logger.configure(prefix="pepc", level=level, argv=[])
+    return _MSRIOScope
+
+@pytest.fixture(name="params", scope="module")
+def get_params(hostspec: str, username: str) -> Generator[_TestParamsTypedDict, None, None]:
+    """
+    Generate a dictionary with testing parameters.
+
+    Args:
+        hostspec: Host specification used to establish the connection.
+        username: The username to use when connecting to a remote host.
+
+    Yields:
+        A dictionary containing test parameters.
+    """
+
+    with _Common.get_pman(hostspec, username=username) as pman, \
+         CPUInfo.CPUInfo(pman=pman) as cpuinfo, \
+         MSR.MSR(cpuinfo, pman=pman, enable_cache=False) as msr:
+        params = _Common.build_params(pman)
+
+        if typing.TYPE_CHECKING:
+            params = cast(_TestParamsTypedDict, params)
+
+        params["cpuinfo"] = cpuinfo
+        params["msr"] = msr
+        params["msrioscope"] = _import_msrioscope()
+
+        yield params
+
+def test_msr_ioscope_shared(params: _TestParamsTypedDict):
+    """
+    Test that I/O scope of MSRs shared by all CPUs of a core, a die, or a package is detected
+    correctly.
+
+    Args:
+        params: The test parameters.
+    """
+
+    if not params["pman"].is_emulated:
+        pytest.skip("The test writes arbitrary values to an MSR, run it only on emulation")
+
+    cpuinfo = params["cpuinfo"]
+    msr = params["msr"]
+    msrioscope = params["msrioscope"]
+    addr = MSR_TURBO_RATIO_LIMIT
+    probes = (([7, 0], [0x11, 0x22]), ([15, 8], [0x33, 0x44]))
+
+    # pylint: disable=protected-access
+    snames = msrioscope._get_existing_snames(cpuinfo)
+    for sname in ("core", "die", "package"):
+        if sname not in snames:
+            continue
+
+        initial_regvals = dict(msr.read(addr, cpuinfo.get_cpus()))
+
+        shared_msr = _SharedMSR(msr, cpuinfo, sname)
+        if typing.TYPE_CHECKING:
+            shared_msr = cast(MSR.MSR, shared_msr)
+
+        result = msrioscope._detect_msr_ioscopes(cpuinfo, shared_msr, addr, probes, 0)
+        assert result == [sname, sname], \
+               f"Expected scope '{sname}' for MSR {addr:#x}, detected: {result}"
+
+        assert dict(msr.read(addr, cpuinfo.get_cpus())) == initial_regvals, \
+               f"MSR {addr:#x} was not restored after I/O scope detection"
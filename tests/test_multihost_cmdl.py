@@ -0,0 +1,129 @@
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
+
+"""Test the multi-host mode command-line options '--hosts' and '--hosts-file'."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import io
+import typing
+import argparse
+import threading
+from pathlib import Path
+import pytest
+from tests import _Common
+from pepclibs.helperlibs import Logging, TestRunner, LocalProcessManager
+from pepclibs.helperlibs.Exceptions import Error
+from pepctools import _Pepc, _PepcMultiHost
+
+if typing.TYPE_CHECKING:
+    from pepclibs.helperlibs.ArgParse import SSHArgsTypedDict
+    from pepclibs.helperlibs.ProcessManager import ProcessManagerType
+
+# Path to the TPMI debugfs dump test data directory.
+_TPMI_DEBUGFS_DUMP: Path = _Common.get_test_data_base() / "test_tpmi_nohost" / "debugfs-dump"
+
+def test_get_hostnames(tmp_path: Path):
+    """
+    Test building the host names list from the '--hosts' and '--hosts-file' option values.
+    """
+
+    hosts_file = tmp_path / "hosts"
+    hosts_file.write_text("# Lab hosts.\nhost2\n\n  host3  \nhost1\n", encoding="utf-8")
+
+    hostnames = _PepcMultiHost.get_hostnames("host1,host2", str(hosts_file))
+    assert hostnames == ["host1", "host2", "host3"], f"Unexpected host names: {hostnames}"
+
+    hostnames = _PepcMultiHost.get_hostnames(None, str(hosts_file))
+    assert hostnames == ["host2", "host3", "host1"], f"Unexpected host names: {hostnames}"
+
+    with pytest.raises(Error):
+        _PepcMultiHost.get_hostnames(None, str(tmp_path / "nonexistent"))
+
+    hosts_file.write_text("# No hosts.\n", encoding="utf-8")
+    with pytest.raises(Error):
+        _PepcMultiHost.get_hostnames(None, str(hosts_file))
+
+def test_options_conflicts():
+    """
+    Test that the multi-host options cannot be combined with options selecting a single target.
+    """
+
+    for arguments in ("topology info --hosts host1,host2 -H host3",
+                      "topology info --hosts host1 -D spr0",
+                      f"tpmi ls --base {_TPMI_DEBUGFS_DUMP} --hosts host1"):
+        TestRunner.run_tool(_Pepc, _Pepc.TOOLNAME, arguments, exp_exc=Error)
+
+def test_thread_info_stream():
+    """
+    Test that the per-thread info stream captures output of the current thread only.
+    """
+
+    log = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.test")
+    main_stream = log.get_info_stream()
+    thread_streams: list[io.StringIO] = []
+
+    def _thread():
+        """Redirect the info stream of the thread and check it."""
+
+        stream = io.StringIO()
+        log.set_thread_info_stream(stream)
+        thread_streams.append(stream)
+        try:
+            assert log.get_info_stream() is stream
+        finally:
+            log.set_thread_info_stream(None)
+        assert log.get_info_stream() is not stream
+
+    thread = threading.Thread(target=_thread)
+    thread.start()
+    thread.join()
+
+    assert thread_streams, "The thread did not run"
+    assert log.get_info_stream() is main_stream
+
+def test_unexpected_exception(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that an unexpected exception on one host is reported in the result of the host and does
+    not discard the results of the other hosts.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    log = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.test")
+
+    def _func(args: argparse.Namespace, _: ProcessManagerType):
+        """Fail on host 'host2' with a non-'Error' exception, print a message on other hosts."""
+
+        if args.hostname == "host2":
+            raise ValueError("Bad value")
+        log.info("Hello from %s", args.hostname)
+
+    monkeypatch.setattr(_PepcMultiHost.ProcessManager, "get_pman",
+                        lambda *_, **__: LocalProcessManager.LocalProcessManager())
+
+    args = argparse.Namespace(func=_func, hostname="", yaml=False)
+    cmdl: SSHArgsTypedDict = {"username": "", "privkey": ""}
+
+    # pylint: disable-next=protected-access
+    result = _PepcMultiHost._run_on_host(args, "host2", cmdl)
+    assert "ValueError" in result.get("error", ""), f"Unexpected host2 result: {result}"
+
+    stream = io.StringIO()
+    log.add_info_stream(stream)
+    try:
+        with pytest.raises(Error, match="1 of 3 hosts: host2"):
+            _PepcMultiHost.run(args, ["host1", "host2", "host3"], cmdl)
+    finally:
+        log.remove_info_stream(stream)
+
+    output = stream.getvalue()
+    for hostname in ("host1", "host3"):
+        assert f"Hello from {hostname}" in output, f"No output of '{hostname}':\n{output}"
@@ -192,3 +192,46 @@ def test_percpucache_scope_disabled(params: _TestParamsTypedDict):
             assert not pcache.is_cached(key, cpu), \
                 f"CPU {cpu} should not be cached when scope is disabled"
             break  # Found at least one sibling to test.
+
+def test_percpucache_many(params: _TestParamsTypedDict):
+    """
+    Test the bulk 'PerCPUCache' methods: 'split_cached()', 'add_many()', and 'get_many()'.
+
+    Args:
+        params: The test parameters.
+    """
+
+    cpuinfo = params["cpuinfo"]
+    cpus = cpuinfo.get_cpus()
+    pcache = _PerCPUCache.PerCPUCache(cpuinfo=cpuinfo)
+
+    for sname in CPUInfo.SCOPE_NAMES:
+        key = (sname, "many_test")
+
+        cached, uncached, siblings = pcache.split_cached(key, cpus, sname=sname)
+        assert not cached, f"No CPUs should be cached in scope '{sname}'"
+        assert sorted(uncached + siblings) == cpus, \
+            f"All CPUs should be split into uncached CPUs and siblings in scope '{sname}'"
+
+        # One CPU per scope element should be selected for reading.
+        for cpu in uncached:
+            for sibling in cpuinfo.get_cpu_siblings(cpu, sname=sname):
+                assert sibling == cpu or sibling not in uncached, \
+                    f"CPUs {cpu} and {sibling} share the same scope element '{sname}'"
+
+        vals = {cpu: object() for cpu in uncached}
+        pcache.add_many(key, vals.items(), sname=sname)
+
+        cached, uncached, siblings = pcache.split_cached(key, cpus, sname=sname)
+        assert cached == cpus and not uncached and not siblings, \
+            f"All CPUs should be cached in scope '{sname}'"
+
+        for cpu, val in zip(cpus, pcache.get_many(key, cpus)):
+            assert val is pcache.get(key, cpu), \
+                f"'get_many()' and 'get()' returned different values for CPU {cpu}"
+            assert any(val is vals.get(sibling)
+                       for sibling in cpuinfo.get_cpu_siblings(cpu, sname=sname)), \
+                f"CPU {cpu} should have the value of a sibling CPU in scope '{sname}'"
+
+    with pytest.raises(ErrorNotFound):
+        pcache.get_many(("CPU", "no_such_key"), cpus)
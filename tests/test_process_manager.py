@@ -16,16 +16,19 @@ import stat
 import time
 from pathlib import Path
 import typing
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from tests import _Common
-from pepclibs.helperlibs import Trivial, LocalProcessManager
+from pepclibs.helperlibs import Logging, Trivial, LocalProcessManager, SSHProcessManager, _SudoIO
 from pepclibs.helperlibs.Exceptions import Error, ErrorExists, ErrorNotFound, ErrorPermissionDenied
 
 if typing.TYPE_CHECKING:
-    from typing import Generator
+    from typing import Callable, Generator
     from tests._Common import CommonTestParamsTypedDict
     from pepclibs.helperlibs.ProcessManager import ProcessManagerType
 
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.pepc.{__name__}")
+
 @pytest.fixture(name="params", scope="module")
 def get_params(hostspec: str, username: str) -> Generator[CommonTestParamsTypedDict, None, None]:
     """
@@ -265,6 +268,74 @@ def test_run_verify_fail(params: CommonTestParamsTypedDict):
     with pytest.raises(ErrorNotFound):
         pman.run_verify(cmd, timeout=_TIMEOUT)
 
+def test_run_python_verify(params: CommonTestParamsTypedDict):
+    """Test the 'run_python_verify()' method and its 'join'/'nojoin' variants."""
+
+    pman = params["pman"]
+    script = """
+import sys
+print("1: hello")
+print("2: world")
+print("1: hello-x", file=sys.stderr)
+"""
+
+    # Run the script several times to make sure the same interpreter can be re-used.
+    for _ in range(3):
+        stdout, stderr = pman.run_python_verify_join(script, timeout=_TIMEOUT)
+        assert stdout == "1: hello\n2: world\n"
+        assert stderr == "1: hello-x\n"
+
+    stdout_lines, stderr_lines = pman.run_python_verify_nojoin(script, timeout=_TIMEOUT)
+    assert stdout_lines == ["1: hello\n", "2: world\n"]
+    assert stderr_lines == ["1: hello-x\n"]
+
+    # The script may use single quotes and 'raise SystemExit(0)' without breaking anything.
+    stdout, _ = pman.run_python_verify_join("print('hello')\nraise SystemExit(0)\nprint('bye')",
+                                            timeout=_TIMEOUT)
+    assert stdout == "hello\n"
+
+    with pytest.raises(Error) as excinfo:
+        pman.run_python_verify("print('hello')\nraise SystemExit(7)", timeout=_TIMEOUT)
+    assert "exit code 7" in str(excinfo.value)
+
+    # A failed script must not break the following scripts.
+    stdout, _ = pman.run_python_verify_join("print('hello')", timeout=_TIMEOUT)
+    assert stdout == "hello\n"
+
+def test_run_python_concurrent(params: CommonTestParamsTypedDict):
+    """
+    Test that Python scripts run from multiple threads execute concurrently. Every script creates a
+    file and waits for the other scripts to create theirs, which succeeds only if the scripts
+    overlap.
+    """
+
+    pman = params["pman"]
+    count = 4
+    tmpdir = pman.mkdtemp()
+
+    script = f"""
+import os, time
+open(os.path.join({str(tmpdir)!r}, "{{idx}}"), "w").close()
+deadline = time.time() + {_TIMEOUT / 2}
+while len(os.listdir({str(tmpdir)!r})) < {count} and time.time() < deadline:
+    time.sleep(0.05)
+print(len(os.listdir({str(tmpdir)!r})))
+"""
+
+    def _run(idx: int) -> str | list[str]:
+        """Run the script and return its output."""
+
+        stdout, _ = pman.run_python_verify(script.replace("{idx}", str(idx)), timeout=_TIMEOUT)
+        return stdout
+
+    try:
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            results = list(executor.map(_run, range(count)))
+    finally:
+        pman.rmtree(tmpdir)
+
+    assert results == [f"{count}\n"] * count, "Concurrent Python scripts did not overlap"
+
 def test_run_fail(params: CommonTestParamsTypedDict):
     """Test the 'run()' method. Cover 'get_cmd_failure_msg()' too."""
 
@@ -992,6 +1063,157 @@ def test_compound_command(params: CommonTestParamsTypedDict):
             assert stdout == "", f"intsh={intsh}, su={su}"
             assert stderr == "", f"intsh={intsh}, su={su}"
 
+def test_run_output(params: CommonTestParamsTypedDict):
+    """
+    Test that the output of many short commands, large interleaved outputs, which are read with
+    growing read sizes, and multi-byte UTF-8 characters split across reads are captured correctly.
+    """
+
+    pman = params["pman"]
+
+    for intsh in (True, False):
+        for idx in range(16):
+            stdout, stderr = pman.run_verify(f"printf '{idx}\\n'; printf 'e{idx}\\n' >&2",
+                                             timeout=_TIMEOUT, intsh=intsh)
+            assert stdout == f"{idx}\n", f"intsh={intsh}"
+            assert stderr == f"e{idx}\n", f"intsh={intsh}"
+
+        # About 4MiB of stdout interleaved with stderr.
+        cmd = "i=0; while [ $i -lt 64 ]; do head -c 65536 /dev/zero | tr '\\0' 'a'; " \
+              "echo; echo $i >&2; i=$((i+1)); done"
+        stdout, stderr = pman.run_verify_nojoin(cmd, timeout=_TIMEOUT, intsh=intsh)
+        assert len(stdout) == 64, f"intsh={intsh}"
+        assert all(line == "a" * 65536 + "\n" for line in stdout), f"intsh={intsh}"
+        assert stderr == [f"{idx}\n" for idx in range(64)], f"intsh={intsh}"
+
+        # The euro sign (3 bytes in UTF-8) split across two reads.
+        stdout, _ = pman.run_verify("printf '\\342\\202'; sleep 0.2; printf '\\254\\n'",
+                                    timeout=_TIMEOUT, intsh=intsh)
+        assert stdout == "\u20ac\n", f"intsh={intsh}"
+
+        # A command ending with an incomplete UTF-8 character must not affect the output of the
+        # next command.
+        pman.run_verify("printf 'x\\342'", timeout=_TIMEOUT, intsh=intsh)
+        stdout, _ = pman.run_verify("echo ok", timeout=_TIMEOUT, intsh=intsh)
+        assert stdout == "ok\n", f"intsh={intsh}"
+
+def test_run_overhead(params: CommonTestParamsTypedDict,
+                      record_property: Callable[[str, object], None]):
+    """
+    Benchmark the per-command overhead of running many short commands. Report the results instead
+    of checking them, because they depend on the host and on the load.
+
+    Args:
+        params: The test parameters.
+        record_property: The pytest fixture for adding properties to the test report.
+    """
+
+    pman = params["pman"]
+
+    count = 64
+    for intsh in (True, False):
+        start_time = time.time()
+        for idx in range(count):
+            stdout, _ = pman.run_verify(f"printf '{idx}\\n'", timeout=_TIMEOUT, intsh=intsh)
+            assert stdout == f"{idx}\n", f"intsh={intsh}"
+        per_cmd = (time.time() - start_time) / count
+
+        _LOG.info("Running a short command%s took %.2fms on average (intsh=%s)",
+                  pman.hostmsg, per_cmd * 1000, intsh)
+        record_property(f"per_cmd_overhead_intsh_{intsh}", per_cmd)
+
+def test_run_concurrent(params: CommonTestParamsTypedDict):
+    """Test running commands concurrently from multiple threads."""
+
+    pman = params["pman"]
+
+    def _run(idx: int) -> tuple[str, str]:
+        """Run a command that takes a little time and return its output."""
+
+        return pman.run_verify(f"sleep 0.2; printf '{idx}\\n'; printf 'e{idx}\\n' >&2",
+                               timeout=_TIMEOUT, intsh=True)
+
+    count = 8
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        results = list(executor.map(_run, range(count)))
+
+    for idx, (stdout, stderr) in enumerate(results):
+        assert stdout == f"{idx}\n"
+        assert stderr == f"e{idx}\n"
+
+    # The interactive shells must be usable after concurrent use.
+    stdout, _ = pman.run_verify("printf 'done\\n'", timeout=_TIMEOUT, intsh=True)
+    assert stdout == "done\n"
+
+def _check_intsh_pool_idle(pman: SSHProcessManager.SSHProcessManager):
+    """
+    Check that the interactive shells pool of an SSH process manager is consistent and all the
+    interactive shells in it are idle.
+
+    Args:
+        pman: The SSH process manager to check the interactive shells pool of.
+    """
+
+    # pylint: disable=protected-access
+    with pman._intsh_lock:
+        assert pman._intshs_starting == 0, "Interactive shells are still being started"
+        assert 0 < len(pman._intshs) <= pman._intsh_count, \
+               f"Bad interactive shells count {len(pman._intshs)}"
+        assert sorted(map(id, pman._intshs_idle)) == sorted(map(id, pman._intshs)), \
+               "Not all interactive shells were returned to the pool"
+        assert not any(intsh._intsh_busy for intsh in pman._intshs), \
+               "An idle interactive shell is marked as busy"
+
+def test_intsh_pool(params: CommonTestParamsTypedDict):
+    """
+    Test the interactive shells pool bookkeeping when commands are run from multiple threads, and
+    some of them are closed before they finish.
+    """
+
+    pman = params["pman"]
+    if not isinstance(pman, SSHProcessManager.SSHProcessManager):
+        pytest.skip("The interactive shells pool is specific to 'SSHProcessManager'")
+
+    # pylint: disable=protected-access
+    count = pman._intsh_count
+
+    def _run(idx: int) -> str:
+        """
+        Run a command in an interactive shell. For odd 'idx' values, close the process before the
+        command finishes, which must return the interactive shell to the pool.
+        """
+
+        if idx % 2:
+            proc = pman.run_async("sleep 10", intsh=True)
+            try:
+                with pman._intsh_lock:
+                    if proc in pman._intshs:
+                        assert proc._intsh_busy, "A checked out interactive shell is not busy"
+                        assert proc not in pman._intshs_idle, \
+                               "A checked out interactive shell is in the idle list"
+            finally:
+                proc.close()
+            return f"{idx}\n"
+
+        stdout, _ = pman.run_verify(f"sleep 0.2; printf '{idx}\\n'", timeout=_TIMEOUT,
+                                    intsh=True)
+        return stdout
+
+    # Use more threads than interactive shells, so that some commands find the pool exhausted.
+    threads = count * 2
+    for _ in range(2):
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(_run, range(threads)))
+
+        assert results == [f"{idx}\n" for idx in range(threads)]
+        _check_intsh_pool_idle(pman)
+
+    # All the interactive shells in the pool must be usable.
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        results = list(executor.map(_run, range(0, count * 2, 2)))
+    assert results == [f"{idx}\n" for idx in range(0, count * 2, 2)]
+    _check_intsh_pool_idle(pman)
+
 def test_su_available(params: CommonTestParamsTypedDict):
     """Test that 'su=True' succeeds when root access or passwordless sudo is available."""
 
@@ -1177,6 +1399,91 @@ def test_open_su(params: CommonTestParamsTypedDict):
     # Cleanup.
     pman.rmtree(tmpdir)
 
+def test_sudo_file(params: CommonTestParamsTypedDict, monkeypatch: pytest.MonkeyPatch):
+    """Test the '_SudoIO.SudoFile' class, which implements 'open()' with 'su=True' via sudo."""
+
+    pman = params["pman"]
+    if pman.is_emulated:
+        pytest.skip("Emulated process manager does not support running Python scripts")
+
+    # Skip the test if 'su=True' is not available.
+    try:
+        pman.run_verify_join("true", su=True)
+    except ErrorPermissionDenied as err:
+        pytest.skip(str(err))
+
+    tmpdir = pman.mkdtemp()
+    test_file = tmpdir / "test_sudo_file.txt"
+
+    lines = [f"Line {idx}\n" for idx in range(64)]
+    with _SudoIO.SudoFile(pman, test_file, "w") as fobj:
+        fobj.write("".join(lines))
+
+    with _SudoIO.SudoFile(pman, test_file, "r") as fobj:
+        assert list(fobj) == lines
+
+    with _SudoIO.SudoFile(pman, test_file, "r") as fobj:
+        assert fobj.readline() == lines[0]
+        assert fobj.readlines() == lines[1:]
+
+    # Test positional reads and reads from the cache.
+    with _SudoIO.SudoFile(pman, test_file, "rb") as fobj:
+        fobj.seek(len(lines[0]))
+        assert fobj.read(4) == b"Line"
+        assert fobj.read(3) == b" 1\n"
+        fobj.seek(-3, 1)
+        assert fobj.read(3) == b" 1\n"
+        fobj.seek(0)
+        assert fobj.read() == "".join(lines).encode("utf-8")
+        assert fobj.read() == b""
+        assert fobj.read(1) == b""
+
+    # Test writing at an offset, appending, and truncating.
+    with _SudoIO.SudoFile(pman, test_file, "r+") as fobj:
+        fobj.truncate(len(lines[0]) + len(lines[1]))
+        fobj.seek(5)
+        fobj.write("X")
+        fobj.seek(0)
+        assert fobj.read() == "Line X\nLine 1\n"
+
+    with _SudoIO.SudoFile(pman, test_file, "a") as fobj:
+        fobj.write("Line 2\n")
+
+    with _SudoIO.SudoFile(pman, test_file, "r") as fobj:
+        assert fobj.read() == "Line X\nLine 1\nLine 2\n"
+
+    with pytest.raises(ErrorNotFound):
+        with _SudoIO.SudoFile(pman, tmpdir / "non-existent", "r") as fobj:
+            fobj.read()
+
+    with pytest.raises(ErrorNotFound):
+        with _SudoIO.SudoFile(pman, tmpdir / "non-existent", "rb") as fobj:
+            fobj.read(1)
+
+    # Reading a directory fails for a reason other than a missing file or denied access.
+    with pytest.raises(Error) as excinfo:
+        with _SudoIO.SudoFile(pman, tmpdir, "r") as fobj:
+            fobj.read()
+    assert not isinstance(excinfo.value, (ErrorNotFound, ErrorPermissionDenied))
+
+    # Reading an entire text file must not require running a Python script.
+    def _fail(*args, **kwargs):
+        """Fail if a Python script is executed."""
+
+        raise AssertionError("Python script was executed to read an entire text file")
+
+    with _SudoIO.SudoFile(pman, test_file, "r") as fobj:
+        with monkeypatch.context() as mpatch:
+            mpatch.setattr(pman, "run_python_join", _fail)
+            assert fobj.read() == "Line X\nLine 1\nLine 2\n"
+
+        # The data is cached.
+        fobj.seek(5)
+        assert fobj.read(1) == "X"
+
+    # Cleanup.
+    pman.rmtree(tmpdir)
+
 def test_read_short(params: CommonTestParamsTypedDict):
     """Test reading a file char by char, validating that read data matches written data."""
 
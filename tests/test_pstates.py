@@ -14,12 +14,15 @@ Test for the 'PStates' module.
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+import io
 import typing
 import contextlib
+from pathlib import Path
 import pytest
 from tests import _Common, _PropsCommon
-from pepclibs import CPUInfo, PStates
-from pepclibs.helperlibs.Exceptions import ErrorNotSupported
+from pepclibs import CPUInfo, PStates, _HWPPerf
+from pepclibs.msr import MSR, HWPRequest, HWPRequestPkg
+from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported
 
 if typing.TYPE_CHECKING:
     from typing import Generator, cast
@@ -122,6 +125,83 @@ def test_pstates_get_all_props(params: PropsTestParamsTypedDict):
 
     _PropsCommon.verify_get_all_props(params, 0)
 
+def test_pstates_prefetch_props(params: PropsTestParamsTypedDict,
+                                monkeypatch: pytest.MonkeyPatch):
+    """
+    Verify that 'prefetch_props()' reads the sysfs files of multiple properties in a single bulk
+    read, and that the following 'get_prop_cpus()' calls are served from the cache.
+
+    Args:
+        params: The test parameters.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    pman = params["pman"]
+    if not pman.is_emulated:
+        pytest.skip("The test replaces process manager methods, run it only on emulation")
+
+    cpuinfo = params["cpuinfo"]
+    cpus = cpuinfo.get_cpus()[:4]
+
+    scripts: list[str] = []
+    orig_open = pman.open
+
+    def _run_python_verify_nojoin(script: str, **_) -> tuple[list[str], list[str]]:
+        """Execute the bulk read script locally, reading the emulated sysfs files."""
+
+        scripts.append(script)
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            # pylint: disable-next=exec-used
+            exec(script, {"open": lambda path, mode: orig_open(path, mode)})
+        return stdout.getvalue().splitlines(keepends=True), []
+
+    # Use a new object to start with an empty cache.
+    with PStates.PStates(pman=pman, cpuinfo=cpuinfo, enable_cache=True) as pobj:
+        # pylint: disable=protected-access
+        sysfs_io = pobj._get_sysfs_io()
+
+        pnames_paths: dict[str, list[Path]] = {}
+        for pname in pobj.props:
+            with contextlib.suppress(Error):
+                paths = list(pobj._get_prefetch_paths(pname, cpus, "sysfs"))
+                if paths:
+                    pnames_paths[pname] = paths
+
+        if not pnames_paths:
+            pytest.skip("No properties support prefetching")
+
+        # Force the optimized I/O path, which is normally used only for remote hosts.
+        monkeypatch.setattr(sysfs_io, "_optimize_io", True)
+        monkeypatch.setattr(pman, "run_python_verify_nojoin", _run_python_verify_nojoin)
+
+        pobj.prefetch_props(pnames_paths, cpus=cpus, mnames=("sysfs",))
+        assert len(scripts) == 1, f"Expected a single bulk read, got {len(scripts)}"
+
+        # Only the properties with all the files readable are fully served from the cache.
+        pnames = [pname for pname, paths in pnames_paths.items()
+                  if all(path in sysfs_io._cache for path in paths)]
+        assert pnames, "No sysfs files were prefetched"
+
+        prefetched = {path for pname in pnames for path in pnames_paths[pname]}
+
+        def _open(path: Path, mode: str, **kwargs):
+            """Fail if a prefetched file is read again."""
+
+            assert Path(path) not in prefetched, f"File '{path}' was read after prefetching"
+            return orig_open(path, mode, **kwargs)
+
+        # A property may still turn out to be not supported, for example because of a bad value in
+        # its sysfs file, but its files must not be read again.
+        monkeypatch.setattr(pman, "open", _open)
+        for pname in pnames:
+            with contextlib.suppress(ErrorNotSupported):
+                for _ in pobj.get_prop_cpus(pname, cpus=cpus, mnames=("sysfs",)):
+                    pass
+
+            assert len(scripts) == 1, f"Sysfs files of property '{pname}' were read in bulk " \
+                                      f"after prefetching"
+
 def test_pstates_set_props_mechanisms_bool(params: PropsTestParamsTypedDict):
     """
     Verify correct behavior of 'get_prop_cpus()' when using the 'mname' argument for boolean
@@ -287,3 +367,69 @@ def test_hwp_perf_vs_freq(params: PropsTestParamsTypedDict):
            f"'hwp_min_perf' ({hwp_min_perf}) != max_freq / bus_clock ({expected_perf}) on CPU {cpu}"
     assert hwp_max_perf == expected_perf, \
            f"'hwp_max_perf' ({hwp_max_perf}) != max_freq / bus_clock ({expected_perf}) on CPU {cpu}"
+
+def test_hwp_perf_pkg_control(params: PropsTestParamsTypedDict):
+    """
+    Verify that HWP min/max performance levels are read from 'MSR_HWP_REQUEST_PKG' for the CPUs
+    where the package control is enabled and not overridden by the "valid" bit, and from
+    'MSR_HWP_REQUEST' for the other CPUs.
+
+    Args:
+        params: The test parameters.
+    """
+
+    pman = params["pman"]
+    cpuinfo = params["cpuinfo"]
+
+    if not pman.is_emulated:
+        pytest.skip("The test writes arbitrary values to MSRs, run it only on emulation")
+
+    cpus = cpuinfo.get_cpus()
+    regaddrs = (HWPRequest.MSR_HWP_REQUEST, HWPRequestPkg.MSR_HWP_REQUEST_PKG)
+
+    try:
+        msr = MSR.MSR(cpuinfo, pman=pman, enable_cache=False)
+    except ErrorNotSupported:
+        pytest.skip("MSR access is not supported")
+
+    with msr:
+        try:
+            hwpreq = HWPRequest.HWPRequest(cpuinfo, pman=pman, msr=msr)
+            hwpreq.validate_feature_supported("pkg_control", cpus=cpus)
+            hwpreq_pkg = HWPRequestPkg.HWPRequestPkg(cpuinfo, pman=pman, msr=msr)
+        except ErrorNotSupported:
+            pytest.skip("HWP package control is not supported")
+
+        initial_regvals = {regaddr: dict(msr.read(regaddr, cpus)) for regaddr in regaddrs}
+
+        pkg_cpus = cpus[::2]
+        percpu_cpus = cpus[1::2]
+
+        try:
+            for fname, percpu_val, pkg_val in (("min_perf", 1, 2), ("max_perf", 3, 4)):
+                hwpreq.write_feature(fname, percpu_val, cpus=cpus)
+                hwpreq_pkg.write_feature(fname, pkg_val, cpus=cpus)
+                hwpreq.write_feature("pkg_control", "on", cpus=cpus)
+                hwpreq.write_feature(f"{fname}_valid", "off", cpus=pkg_cpus)
+                if percpu_cpus:
+                    hwpreq.write_feature(f"{fname}_valid", "on", cpus=percpu_cpus)
+
+                for cpu, pkg_controlled in hwpreq.is_feature_pkg_controlled(fname, cpus):
+                    assert pkg_controlled == (cpu in pkg_cpus), \
+                           f"Bad '{fname}' package control status on CPU {cpu}"
+
+                with _HWPPerf.HWPPerf(pman=pman, cpuinfo=cpuinfo, msr=msr) as hwpperf:
+                    if fname == "min_perf":
+                        perf_vals = dict(hwpperf.get_min_perf(cpus))
+                    else:
+                        perf_vals = dict(hwpperf.get_max_perf(cpus))
+
+                assert list(perf_vals) == cpus
+                for cpu, val in perf_vals.items():
+                    expected = pkg_val if cpu in pkg_cpus else percpu_val
+                    assert val == expected, \
+                           f"Bad '{fname}' value {val} on CPU {cpu}, expected {expected}"
+        finally:
+            for regaddr, regvals in initial_regvals.items():
+                for cpu, regval in regvals.items():
+                    msr.write(regaddr, regval, [cpu])
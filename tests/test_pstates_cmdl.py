@@ -110,6 +110,24 @@ def test_pstates_info(params: PropsCmdlTestParamsTypedDict):
     # Cover '--list-mechanisms'.
     _PropsCommonCmdl.run_pepc("pstates info --list-mechanisms", pman)
 
+def test_pstates_info_jobs(params: PropsCmdlTestParamsTypedDict):
+    """
+    Test that reading properties concurrently with '--jobs' produces the same output as reading
+    them sequentially.
+
+    Args:
+        params: The test parameters dictionary.
+    """
+
+    pman = params["pman"]
+
+    stdout1, _ = _PropsCommonCmdl.run_pepc("pstates info", pman, capture_output=True)
+    stdout4, _ = _PropsCommonCmdl.run_pepc("pstates info --jobs 4", pman, capture_output=True)
+    assert stdout1 == stdout4, "Output of 'pstates info' depends on '--jobs'"
+
+    for jobs in ("0", "-1", "many"):
+        _PropsCommonCmdl.run_pepc(f"pstates info --jobs {jobs}", pman, exp_exc=Error)
+
 def _get_good_config_freq_opts(sname: ScopeNameType = "CPU") -> Generator[str, None, None]:
     """
     Yield valid frequency configuration options for testing the 'pepc pstates config' command.
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2025 Intel Corporation
+# Copyright (C) 2025-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -26,7 +26,9 @@ import shutil
 
 import pytest
 from tests import _Common
-from pepclibs import TPMI
+from pepclibs import TPMI, _TPMISpecCache
+from pepclibs.TPMIVars import UFS_HEADER_REGNAMES
+from pepclibs.helperlibs import ProjectFiles
 from pepclibs.helperlibs.Exceptions import Error
 
 def _get_tpmi_instance() -> TPMI.TPMI:
@@ -230,3 +232,214 @@ def test_no_tpmi_info(tmp_path: Path):
     # Check that readint 'tpmi_info' feature raises an exception.
     with pytest.raises(Error):
         tpmi.read_register("tpmi_info", "0000:00:02.1", 0, "TPMI_INFO_HEADER")
+
+def test_read_register_snapshot(tmp_path: Path):
+    """
+    Test reading TPMI registers in the 'mem_dump' snapshot mode.
+
+    Args:
+        tmp_path: A temporary directory path for testing (provided by the pytest framework).
+    """
+
+    debugfs_dump_path = _Common.get_test_data_base() / "test_tpmi_nohost" / "debugfs-dump"
+    test_dump_path = tmp_path / Path("debugfs-dump-snapshot")
+    shutil.copytree(debugfs_dump_path, test_dump_path)
+
+    tpmi = TPMI.TPMI(base=test_dump_path)
+    tpmi_snapshot = TPMI.TPMI(base=test_dump_path, snapshot=True)
+
+    # Verify that the snapshot mode reads the same values as the regular mode.
+    for fname in ("ufs", "rapl", "tpmi_info"):
+        fdict = tpmi.get_fdict(fname)
+        for _, addr, instance, cluster in tpmi.iter_feature_cluster(fname):
+            for regname in fdict:
+                if cluster > 0 and regname in UFS_HEADER_REGNAMES:
+                    continue
+                value = tpmi.read_register_cluster(fname, addr, instance, cluster, regname)
+                value_snapshot = tpmi_snapshot.read_register_cluster(fname, addr, instance,
+                                                                     cluster, regname)
+                assert value == value_snapshot, \
+                       f"Snapshot value {value_snapshot:#x} of '{fname}' register '{regname}' " \
+                       f"differs from the regular value {value:#x}"
+
+    # Modify the lower 32 bits of the UFS_STATUS register in the dump, verify that the snapshot
+    # serves the old value until the snapshots are dropped.
+    mem_dump_path = test_dump_path / "tpmi-0000:00:02.1" / "tpmi-id-02" / "mem_dump"
+    mem_dump = mem_dump_path.read_text(encoding="utf-8")
+    mem_dump_path.write_text(mem_dump.replace("04092008", "04092009"), encoding="utf-8")
+
+    value = tpmi_snapshot.read_register("ufs", "0000:00:02.1", 2, "UFS_STATUS")
+    assert value == 0xa52fc5f04092008, f"Unexpected UFS_STATUS register value: {value:#x}"
+
+    tpmi_snapshot.drop_snapshots()
+
+    value = tpmi_snapshot.read_register("ufs", "0000:00:02.1", 2, "UFS_STATUS")
+    assert value == 0xa52fc5f04092009, f"Unexpected UFS_STATUS register value: {value:#x}"
+
+def test_spec_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that parsed spec files are cached, and that the cache is invalidated when a spec file
+    changes.
+
+    Args:
+        tmp_path: A temporary directory path for testing (provided by the pytest framework).
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    cache_path = tmp_path / "cache"
+    monkeypatch.setenv(_TPMISpecCache.CACHE_DIR_ENVVAR, str(cache_path))
+
+    idxpath = ProjectFiles.find_project_data("pepc", "tpmi/index.yml")
+    specdir = tmp_path / "tpmi"
+    shutil.copytree(idxpath.parent, specdir)
+
+    debugfs_dump_path = _Common.get_test_data_base() / "test_tpmi_nohost" / "debugfs-dump"
+
+    def _get_fdict() -> dict[str, TPMI.RegDictTypedDict]:
+        """Create a TPMI instance using the copied spec files and return the UFS fdict."""
+
+        with TPMI.TPMI(base=debugfs_dump_path, specdirs=[specdir]) as tpmi:
+            return tpmi.get_fdict("ufs")
+
+    fdict = _get_fdict()
+    assert any(cache_path.iterdir()), "No TPMI spec cache entries were created"
+
+    # The second run uses the cache and must produce the same result.
+    assert _get_fdict() == fdict, "The cached UFS fdict differs from the parsed one"
+
+    # Change the spec file and verify that the change is not masked by the cache.
+    ufs_path = specdir / "gnr" / "ufs.yml"
+    ufs_path.write_text(ufs_path.read_text(encoding="utf-8").replace(
+                        "Instantaenous fabric frequency ratio", "Current fabric frequency ratio"),
+                        encoding="utf-8")
+
+    desc = _get_fdict()["UFS_STATUS"]["fields"]["CURRENT_RATIO"]["desc"]
+    assert desc == "Current fabric frequency ratio", f"Stale cached description: {desc}"
+
+    # Cache entries created by a different code (e.g., a different version of 'pepc') must not be
+    # used.
+    srchash = _TPMISpecCache.get_hash(ufs_path.read_bytes())
+    sdict = _TPMISpecCache.load(ufs_path, "sdict", srchash)
+    assert sdict is not None, f"No TPMI spec cache entry for '{ufs_path}'"
+
+    monkeypatch.setattr(_TPMISpecCache, "_CODE_MODNAMES", ("pepclibs._TPMISpecCache",))
+    sdict = _TPMISpecCache.load(ufs_path, "sdict", srchash)
+    assert sdict is None, "TPMI spec cache entry created by a different code was used"
+
+def _create_pci_resources(dump_path: Path, pci_path: Path):
+    """
+    Create PCI 'resource' and 'resource0' files for all TPMI devices in a debugfs dump. The
+    'resource0' file contains the TPMI instances memory found in the 'mem_dump' files, placed at
+    their physical addresses relative to the BAR start.
+
+    Args:
+        dump_path: Path to the TPMI debugfs dump.
+        pci_path: Path to the directory to create the PCI device sub-directories in.
+    """
+
+    for devpath in dump_path.iterdir():
+        # The physical address -> 32-bit value map for all features of the TPMI device.
+        words: dict[int, int] = {}
+        for mem_dump_path in devpath.glob("tpmi-id-*/mem_dump"):
+            physaddr = 0
+            for line in mem_dump_path.read_text(encoding="utf-8").splitlines():
+                if line.startswith("TPMI Instance:"):
+                    physaddr = int(line.split("offset:")[1], 16)
+                    continue
+                offset, vals = line.strip(" []").split(" ", 1)
+                offset = offset.strip(":]")
+                for idx, val in enumerate(vals.split()):
+                    words[physaddr + int(offset, 16) + idx * 4] = int(val, 16)
+
+        start = min(words) & ~0xfff
+        end = (max(words) | 0xfff) + 1
+        image = bytearray(end - start)
+        for physaddr, val in words.items():
+            image[physaddr - start:physaddr - start + 4] = val.to_bytes(4, byteorder="little")
+
+        addr = devpath.name[len("tpmi-"):]
+        (pci_path / addr).mkdir(parents=True)
+        (pci_path / addr / "resource0").write_bytes(image)
+        (pci_path / addr / "resource").write_text(f"{start:#018x} {end - 1:#018x} 0x40200\n" +
+                                                  "0x0 0x0 0x0\n" * 5, encoding="utf-8")
+
+def test_mmio(tmp_path: Path):
+    """
+    Test reading and writing TPMI registers in the MMIO mode using emulated PCI BAR resource files.
+
+    Args:
+        tmp_path: A temporary directory path for testing (provided by the pytest framework).
+    """
+
+    debugfs_dump_path = _Common.get_test_data_base() / "test_tpmi_nohost" / "debugfs-dump"
+    pci_path = tmp_path / "pci"
+    _create_pci_resources(debugfs_dump_path, pci_path)
+
+    tpmi = _get_tpmi_instance()
+
+    with TPMI.TPMI(base=debugfs_dump_path, mmio=True, pci_path=pci_path) as tpmi_mmio:
+        # Verify that the MMIO mode reads the same values as the regular mode.
+        for fname in ("ufs", "rapl", "tpmi_info"):
+            fdict = tpmi.get_fdict(fname)
+            for _, addr, instance, cluster in tpmi.iter_feature_cluster(fname):
+                for regname in fdict:
+                    if cluster > 0 and regname in UFS_HEADER_REGNAMES:
+                        continue
+                    value = tpmi.read_register_cluster(fname, addr, instance, cluster, regname)
+                    value_mmio = tpmi_mmio.read_register_cluster(fname, addr, instance, cluster,
+                                                                 regname)
+                    assert value == value_mmio, \
+                           f"MMIO value {value_mmio:#x} of '{fname}' register '{regname}' " \
+                           f"differs from the regular value {value:#x}"
+
+        # Write a bit field of a 64-bit register and verify that only the bit field has changed.
+        tpmi_mmio.write_register(0x10, "ufs", "0000:00:02.1", 2, "UFS_CONTROL", bfname="MAX_RATIO")
+        value = tpmi_mmio.read_register("ufs", "0000:00:02.1", 2, "UFS_CONTROL")
+        assert value == 0x788d02041001, f"Unexpected UFS_CONTROL register value: {value:#x}"
+
+        # Write a whole 64-bit register.
+        tpmi_mmio.write_register(0x1122334455667788, "ufs", "0000:00:02.1", 2, "UFS_CONTROL")
+        value = tpmi_mmio.read_register("ufs", "0000:00:02.1", 2, "UFS_CONTROL")
+        assert value == 0x1122334455667788, f"Unexpected UFS_CONTROL register value: {value:#x}"
+
+    # The debugfs dump must not be modified by MMIO writes.
+    value = tpmi.read_register("ufs", "0000:00:02.1", 2, "UFS_CONTROL")
+    assert value == 0x788d02040801, f"Unexpected UFS_CONTROL register value: {value:#x}"
+
+def test_transaction(tmp_path: Path):
+    """
+    Test TPMI transactions: writes are buffered until committed, reads return buffered values, and
+    bit field writes to the same register are merged.
+
+    Args:
+        tmp_path: A temporary directory path for testing (provided by the pytest framework).
+    """
+
+    debugfs_dump_path = _Common.get_test_data_base() / "test_tpmi_nohost" / "debugfs-dump"
+    pci_path = tmp_path / "pci"
+    _create_pci_resources(debugfs_dump_path, pci_path)
+
+    addr = "0000:00:02.1"
+    with TPMI.TPMI(base=debugfs_dump_path, mmio=True, pci_path=pci_path) as tpmi, \
+         TPMI.TPMI(base=debugfs_dump_path, mmio=True, pci_path=pci_path) as tpmi_observer:
+        tpmi.start_transaction()
+
+        tpmi.write_register(0x10, "ufs", addr, 2, "UFS_CONTROL", bfname="MAX_RATIO")
+        tpmi.write_register(0x5, "ufs", addr, 2, "UFS_CONTROL", bfname="MIN_RATIO")
+        tpmi.write_register(0x20, "ufs", addr, 0, "UFS_CONTROL", bfname="MAX_RATIO")
+
+        # The writes are buffered, but visible to the reads of the same TPMI object.
+        value = tpmi.read_register("ufs", addr, 2, "UFS_CONTROL")
+        assert value == 0x788d02029001, f"Unexpected buffered UFS_CONTROL value: {value:#x}"
+        value = tpmi_observer.read_register("ufs", addr, 2, "UFS_CONTROL")
+        assert value == 0x788d02040801, f"UFS_CONTROL was written before commit: {value:#x}"
+
+        tpmi.commit_transaction()
+
+        value = tpmi_observer.read_register("ufs", addr, 2, "UFS_CONTROL")
+        assert value == 0x788d02029001, f"Unexpected committed UFS_CONTROL value: {value:#x}"
+        value = tpmi_observer.read_register("ufs", addr, 0, "UFS_CONTROL", bfname="MAX_RATIO")
+        assert value == 0x20, f"Unexpected committed MAX_RATIO value: {value:#x}"
+
+        with pytest.raises(Error):
+            tpmi.commit_transaction()
@@ -95,6 +95,21 @@ def test_uncore_info(params: PropsCmdlTestParamsTypedDict):
     # Cover '--list-mechanisms'.
     _PropsCommonCmdl.run_pepc("uncore info --list-mechanisms", pman)
 
+def test_uncore_info_jobs(params: PropsCmdlTestParamsTypedDict):
+    """
+    Test that reading properties concurrently with '--jobs' produces the same output as reading
+    them sequentially.
+
+    Args:
+        params: The test parameters dictionary.
+    """
+
+    pman = params["pman"]
+
+    stdout1, _ = _PropsCommonCmdl.run_pepc("uncore info", pman, capture_output=True)
+    stdout4, _ = _PropsCommonCmdl.run_pepc("uncore info --jobs 4", pman, capture_output=True)
+    assert stdout1 == stdout4, "Output of 'uncore info' depends on '--jobs'"
+
 def _get_good_config_opts() -> Generator[str, None, None]:
     """
     Yield valid configuration options for testing the 'pepc uncore config' command.
@@ -13,11 +13,12 @@ from __future__ import annotations # Remove when switching to Python 3.10+.
 import typing
 import pytest
 from tests import _Common
-from pepclibs import CPUInfo, _UncoreFreqSysfs, _UncoreFreqTPMI
+from pepclibs import CPUInfo, _SysfsIO, _UncoreFreqSysfs, _UncoreFreqTPMI
 from pepclibs.helperlibs.Exceptions import Error, ErrorBadOrder, ErrorNotSupported, ErrorOutOfRange
 
 if typing.TYPE_CHECKING:
     from typing import Union, Generator, cast
+    from pathlib import Path
     from tests._Common import CommonTestParamsTypedDict
     from pepclibs.CPUInfoTypes import RelNumsType
 
@@ -705,3 +706,96 @@ def test_freq_cross_mechanisms(params: _TestParamsTypedDict):
                     assert rd_freq == min_freq, \
                            f"Set min. uncore frequency to {min_freq} for ({package}, {die}) via " \
                            f"{uncfreq_obj0.mname} but got {rd_freq} via {uncfreq_obj1.mname}"
+
+def _test_unlock_new_sysfs_api(params: _TestParamsTypedDict,
+                               sysfs_io: _SysfsIO.SysfsIO,
+                               uncfreq_obj: _UncoreFreqSysfs.UncoreFreqSysfs,
+                               monkeypatch: pytest.MonkeyPatch):
+    """
+    Implement 'test_unlock_new_sysfs_api()' for an uncore frequency sysfs object.
+
+    Args:
+        params: The test parameters.
+        sysfs_io: The sysfs I/O object used by 'uncfreq_obj'.
+        uncfreq_obj: The uncore frequency sysfs object to test.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    pman = params["pman"]
+
+    # pylint: disable=protected-access
+    if not uncfreq_obj._use_new_sysfs_api() or not uncfreq_obj._has_sysfs_legacy_api:
+        pytest.skip("Both the new and the legacy uncore frequency sysfs APIs are required")
+
+    dies = params["cpuinfo"].get_all_dies()
+    package = min(dies)
+    die = dies[package][0]
+
+    path_legacy = uncfreq_obj._construct_legacy_freq_path("max", package, 0)
+    path_legacy_limit = uncfreq_obj._construct_legacy_freq_path("max", package, 0, limit=True)
+    path_new = uncfreq_obj._construct_new_freq_path("max", package, die)
+
+    legacy_limit = sysfs_io.read_int(path_legacy_limit)
+    max_freqs = {(pkg, _die): freq for pkg, _die, freq in uncfreq_obj.get_max_freq_dies(dies)}
+    min_freq = next(freq for _, _, freq in uncfreq_obj.get_min_freq_dies({package: [die]}))
+    mid_freq = _get_mid_freq(min_freq, max_freqs[(package, die)])
+
+    # Make the legacy sysfs API a limiting factor for the max. uncore frequency.
+    with pman.open(path_legacy, "w") as fobj:
+        fobj.write(f"{legacy_limit - 100000}\n")
+    sysfs_io.cache_flush()
+
+    writes: list[tuple[Path, str]] = []
+    write = sysfs_io._write
+
+    def _write(path: Path, val: str, what: str, su: bool = False):
+        """Record the write and perform it."""
+
+        writes.append((path, val.strip()))
+        write(path, val, what, su=su)
+
+    monkeypatch.setattr(sysfs_io, "_write", _write)
+
+    sysfs_io.start_transaction()
+    sysfs_io.write_int(path_new, mid_freq // 1000)
+    uncfreq_obj.set_max_freq_dies(max_freqs[(package, die)], {package: [die]})
+    sysfs_io.commit_transaction()
+
+    monkeypatch.undo()
+
+    legacy_idx = writes.index((path_legacy, str(legacy_limit)))
+    new_idxs = [idx for idx, (path, _) in enumerate(writes) if path == path_new]
+    assert new_idxs[0] < legacy_idx < new_idxs[-1], \
+           f"Writes to '{path_new}' were re-ordered with unlocking the new sysfs API: {writes}"
+
+    sysfs_io.cache_flush()
+    assert sysfs_io.read_int(path_legacy) == legacy_limit, \
+           f"The legacy sysfs API was not unlocked, '{path_legacy}' was not restored"
+    for pkg, _die, freq in uncfreq_obj.get_max_freq_dies(dies):
+        assert freq == max_freqs[(pkg, _die)], \
+               f"Bad max. uncore frequency for package {pkg} die {_die}: {freq}"
+
+def test_unlock_new_sysfs_api(params: _TestParamsTypedDict, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that the new uncore frequency sysfs API is unlocked by restoring the legacy sysfs API
+    frequency limits, and that the writes buffered in a transaction before unlocking are not
+    re-ordered with the unlock writes.
+
+    Args:
+        params: The test parameters.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    pman = params["pman"]
+    if not pman.is_emulated:
+        pytest.skip("The test modifies legacy sysfs API files directly, run it only on emulation")
+
+    with _SysfsIO.SysfsIO(pman=pman) as sysfs_io:
+        try:
+            uncfreq_obj = _UncoreFreqSysfs.UncoreFreqSysfs(params["cpuinfo"], pman=pman,
+                                                           sysfs_io=sysfs_io)
+        except ErrorNotSupported:
+            pytest.skip("Uncore frequency sysfs interface is not supported")
+
+        with uncfreq_obj:
+            _test_unlock_new_sysfs_api(params, sysfs_io, uncfreq_obj, monkeypatch)